@@ -38,6 +38,7 @@ _this_module = _sys.modules[__name__]
 from .globale import gndarray  # noqa: E402,F401
 from .globale import free_all  # noqa: E402,F401
 from . import globale_ufunc as _ufunc  # noqa: E402,F401
+from .globale_expr import lazy, lazy_mode, evaluate  # noqa: E402,F401
 
 from . import globale_creation as _creation  # noqa: E402,F401
 for s in _creation.__all__:
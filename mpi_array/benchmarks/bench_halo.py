@@ -0,0 +1,78 @@
+"""
+Benchmarks for halo (ghost element) exchange.
+"""
+from __future__ import absolute_import
+from ..license import license as _license, copyright as _copyright, version as _version
+
+from .core import Bench as _Bench
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class HaloUpdateBench(_Bench):
+    """
+    Benchmarks for :meth:`mpi_array.globale.gndarray.update` comparing
+    the halo exchange engines.
+    """
+
+    #: Number of repetitions to run each benchmark
+    repeat = 8
+
+    #: The set of (locale) array-shape and halo-engine parameters.
+    params = [[(64, 64, 64,), (256, 256, 256,)], ["rma", "p2p", "rma_rget"]]
+
+    #: The name of the array-shape and halo-engine parameters.
+    param_names = ["shape", "halo_engine"]
+
+    # Goal time (seconds) for a single repeat.
+    goal_time = 1.0
+
+    # Execute benchmark for this time (seconds) as a *warm-up* prior to real timing.
+    warmup_time = 0.5
+
+    #: The halo width on each axis.
+    halo = 2
+
+    def __init__(self):
+        """
+        Initialise.
+        """
+        _Bench.__init__(self)
+        self.ary = None
+
+    def setup(self, shape, halo_engine):
+        """
+        Creates a block distributed array (one locale per process) with :attr:`halo`
+        ghost elements and sets its :attr:`mpi_array.globale.gndarray.halo_engine`.
+        """
+        self.module = self.try_import_for_setup("mpi_array")
+        self.ary = \
+            self.module.zeros(
+                self.get_globale_shape(shape),
+                dtype="float64",
+                distrib_type="block",
+                locale_type="process",
+                halo=self.halo
+            )
+        self.ary.halo_engine = halo_engine
+        # Plan creation (first update) is not included in the timing.
+        self.ary.update()
+
+    def teardown(self, shape, halo_engine):
+        """
+        Free array allocated during :meth:`setup`.
+        """
+        self.free_mpi_array_obj(self.ary)
+        self.ary = None
+
+    def time_update(self, shape, halo_engine):
+        """
+        Time halo exchange.
+        """
+        self.ary.update()
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
@@ -195,6 +195,35 @@ class CommsCache(object):
             self._rank_logger.debug("No match for:\n%s", (key,))
         return value
 
+    def collective_find(self, key, comm=None):
+        """
+        Collective (over :samp:`{comm}`) version of :meth:`find`. The
+        :samp:`inter_locale_comm` element of a key is :attr:`mpi4py.MPI.COMM_NULL`
+        on the non-root ranks of a locale, so a look-up can succeed on some processes
+        and fail on others. This method returns :samp:`None` on all processes
+        if the look-up fails on any process, so that all processes
+        subsequently call the same collective comms-creation functions.
+
+        :type key: sequence of :obj:`object`
+        :param key: Key for look-up, see :meth:`find`.
+        :type comm: :obj:`mpi4py.MPI.Comm`
+        :param comm: Communicator over which the look-up result is agreed,
+           if :samp:`None` uses :attr:`mpi4py.MPI.COMM_WORLD`.
+        :rtype: :obj:`object` or :samp:`None`
+        :return: The object associated with the key :samp:`{key}`,
+           or :samp:`None` if the key :samp:`{key}` is not found on any process.
+        """
+        if comm is None:
+            comm = _mpi.COMM_WORLD
+        value = self.find(key)
+        self._rank_logger.debug("BEG: comm.allreduce for cache look-up...")
+        found = comm.allreduce(value is not None, op=_mpi.LAND)
+        self._rank_logger.debug("END: comm.allreduce for cache look-up.")
+        if not found:
+            value = None
+
+        return value
+
     def add(self, key, value):
         """
         Adds a :samp:`({key}, {value})` pair to this cache.
@@ -677,7 +706,7 @@ def get_locale_comms_info(
     global _comms_info_cache
 
     key = (peer_comm, intra_locale_comm, inter_locale_comm)
-    comms_info = _comms_info_cache.find(key)
+    comms_info = _comms_info_cache.collective_find(key, peer_comm)
     if comms_info is None:
         comms_info = \
             create_locale_comms_info(
@@ -685,7 +714,8 @@ def get_locale_comms_info(
                 intra_locale_comm=intra_locale_comm,
                 inter_locale_comm=inter_locale_comm
             )
-        _comms_info_cache.add(key, comms_info)
+        if _comms_info_cache.find(key) is None:
+            _comms_info_cache.add(key, comms_info)
         key = (comms_info.peer_comm, comms_info.intra_locale_comm, comms_info.inter_locale_comm)
         if _comms_info_cache.find(key) is None:
             _comms_info_cache.add(key, comms_info)
@@ -1093,7 +1123,7 @@ def get_cart_locale_comms_info(
     global _comms_info_cache
 
     key = (ndims, dims, peer_comm, intra_locale_comm, inter_locale_comm, cart_comm)
-    comms_info = _comms_info_cache.find(key)
+    comms_info = _comms_info_cache.collective_find(key, peer_comm)
     if comms_info is None:
         comms_info = \
             create_cart_locale_comms_info(
@@ -1104,7 +1134,8 @@ def get_cart_locale_comms_info(
                 inter_locale_comm=inter_locale_comm,
                 cart_comm=cart_comm
             )
-        _comms_info_cache.add(key, comms_info)
+        if _comms_info_cache.find(key) is None:
+            _comms_info_cache.add(key, comms_info)
         key = \
             (
                 len(comms_info.dims),
@@ -1500,7 +1531,8 @@ def create_block_distribution(
     peer_comm=None,
     intra_locale_comm=None,
     inter_locale_comm=None,
-    cart_comm=None
+    cart_comm=None,
+    periods=None
 ):
     """
     Factory function for creating :obj:`mpi_array.distrbution.BlockPartition`
@@ -1522,6 +1554,10 @@ def create_block_distribution(
     :param inter_locale_comm: See :obj:`LocaleComms`.
     :type cart_comm: :obj:`mpi4py.MPI.Comm`
     :param cart_comm: See :obj:`CartLocaleComms`.
+    :type periods: :obj:`bool` or sequence of :obj:`bool`
+    :param periods: Per-axis periodicity of the globale array, halos
+       on periodic axes wrap around the globale boundary.
+       See :obj:`mpi_array.distribution.BlockPartition`.
     :rtype: :obj:`CommsAndDistribution`
     :return: A :obj:`CommsAndDistribution` :obj:`collections.namedtuple`.
     """
@@ -1561,7 +1597,8 @@ def create_block_distribution(
             dims=cart_locale_comms.dims,
             cart_coord_to_cart_rank=cart_coord_to_cart_rank,
             inter_locale_rank_to_peer_rank=cart_rank_to_peer_rank,
-            halo=halo
+            halo=halo,
+            periods=periods
         )
     block_distrib.peer_ranks_per_locale = cart_locale_comms.peer_ranks_per_locale
 
@@ -1639,6 +1676,9 @@ def create_distribution(shape, distrib_type=None, locale_type=LT_NODE, **kwargs)
     :type cart_comm: :obj:`mpi4py.MPI.Comm`
     :param cart_comm: Only relevant when :samp:`{distrib_type} == DT_BLOCK`
         or :samp:`{distrib_type} == DT_SLAB`. See :obj:`CartLocaleComms`.
+    :type periods: sequence of :obj:`bool`
+    :param periods: Only relevant when :samp:`{distrib_type} == DT_BLOCK`
+        or :samp:`{distrib_type} == DT_SLAB`. See :func:`create_block_distribution`.
     :rtype: :obj:`CommsAndDistribution`
     :return: A :obj:`CommsAndDistribution` :obj:`collections.namedtuple`.
 
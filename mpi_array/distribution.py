@@ -594,7 +594,8 @@ class Distribution(object):
         halo=0,
         globale_extent_type=GlobaleExtent,
         locale_extent_type=LocaleExtent,
-        inter_locale_rank_to_peer_rank=None
+        inter_locale_rank_to_peer_rank=None,
+        periods=None
     ):
         """
         Construct.
@@ -620,6 +621,10 @@ class Distribution(object):
         :param inter_locale_rank_to_peer_rank: A :obj:`dict`
            of :samp:`(inter_locale_rank, peer_rank)` pairs. If a sequence,
            then :samp:`{inter_locale_rank_to_peer_rank}[inter_locale_rank] = peer_rank`.
+        :type periods: sequence of :obj:`bool`
+        :param periods: Per-axis periodicity, locale extent halos are not trimmed
+           (at the globale extent boundary) on periodic axes. If :samp:`None`, no
+           axes are periodic.
 
         .. todo::
 
@@ -635,6 +640,7 @@ class Distribution(object):
         ndim = self._globale_extent.ndim
         self._halo = \
             _convert_halo_to_array_form(halo=_copy.deepcopy(halo), ndim=ndim)
+        self._periods = convert_periods_to_array_form(periods, ndim)
         num_locales = len(locale_extents)
 
         self._struct_locale_extents = \
@@ -770,6 +776,7 @@ class Distribution(object):
     def initialise_struct_locale_extents_halos(self, struct_locale_extents, globale_extent, halo):
         """
         Trim locale extent halos so they don't extend beyond the :samp:`{globale_extent}` halo.
+        Halos are not trimmed on the :attr:`periods` axes.
         """
         START_N_STR = self._locale_extent_type.START_N_STR
         STOP_N_STR = self._locale_extent_type.STOP_N_STR
@@ -778,20 +785,29 @@ class Distribution(object):
         ge_stop_h = globale_extent.stop_h
 
         msk = struct_locale_extents[STOP_N_STR] > struct_locale_extents[START_N_STR]
+        periods = self._periods
         struct_locale_extents[HALO_STR][:, :, self.LO] = \
-            _np.maximum(
-                0,
-                _np.minimum(
-                    _np.where(msk, struct_locale_extents[START_N_STR] - ge_start_h, 0),
-                    halo[:, self.LO]
+            _np.where(
+                periods,
+                _np.where(msk, halo[:, self.LO], 0),
+                _np.maximum(
+                    0,
+                    _np.minimum(
+                        _np.where(msk, struct_locale_extents[START_N_STR] - ge_start_h, 0),
+                        halo[:, self.LO]
+                    )
                 )
         )
         struct_locale_extents[HALO_STR][:, :, self.HI] = \
-            _np.maximum(
-                0,
-                _np.minimum(
-                    _np.where(msk, ge_stop_h - struct_locale_extents[STOP_N_STR], 0),
-                    halo[:, self.HI]
+            _np.where(
+                periods,
+                _np.where(msk, halo[:, self.HI], 0),
+                _np.maximum(
+                    0,
+                    _np.minimum(
+                        _np.where(msk, ge_stop_h - struct_locale_extents[STOP_N_STR], 0),
+                        halo[:, self.HI]
+                    )
                 )
         )
 
@@ -907,6 +923,14 @@ class Distribution(object):
         """
         return self._halo
 
+    @property
+    def periods(self):
+        """
+        A :samp:`(ndim,)` shaped array of :obj:`bool` indicating the periodic axes. Halo
+        regions on periodic axes wrap around the :attr:`globale_extent` boundary.
+        """
+        return self._periods
+
     @property
     def globale_extent(self):
         """
@@ -1040,8 +1064,37 @@ class SingleLocaleDistribution(Distribution):
         )
 
 
-def convert_slice_split_to_struct(splt, globale_extent, halo):
+def convert_periods_to_array_form(periods, ndim):
     """
+    Converts :samp:`{periods}` to a :samp:`(ndim,)` shaped array of :obj:`bool`.
+
+    :type periods: :obj:`bool` or sequence of :obj:`bool`
+    :param periods: Per-axis periodicity, a single :obj:`bool` applies to all axes.
+       If :samp:`None`, no axes are periodic.
+    :type ndim: :obj:`int`
+    :param ndim: Number of axes.
+    :rtype: :obj:`numpy.ndarray`
+    :return: A :samp:`(ndim,)` shaped array of :obj:`bool`.
+    """
+    if periods is None:
+        periods = False
+    periods = _np.array(periods, dtype="bool")
+    if periods.ndim == 0:
+        periods = _np.zeros((ndim,), dtype="bool") + periods
+    if periods.shape != (ndim,):
+        raise ValueError(
+            "Got periods=%s with len(periods)=%s, expected len(periods)=%s."
+            %
+            (periods.tolist(), len(periods), ndim)
+        )
+    return periods
+
+
+def convert_slice_split_to_struct(splt, globale_extent, halo, periods=None):
+    """
+    Converts an :obj:`array_split.ShapeSplitter` split (array of slice tuples)
+    to a structured array of :obj:`HaloIndexingExtent` elements. The halo
+    is trimmed at the :samp:`{globale_extent}` boundary for non-periodic axes.
     """
     LO = HaloIndexingExtent.LO
     HI = HaloIndexingExtent.HI
@@ -1066,23 +1119,32 @@ def convert_slice_split_to_struct(splt, globale_extent, halo):
     ge_stop_h = globale_extent.stop_h
 
     halo = _convert_halo_to_array_form(halo, ndim)
+    periods = convert_periods_to_array_form(periods, ndim)
     msk = splt_ary[STOP_N_STR] > splt_ary[START_N_STR]
     slice_lo = (slice(None),) * ndim + (slice(None), LO)
     splt_ary[HALO_STR][slice_lo] = \
-        _np.maximum(
-            0,
-            _np.minimum(
-                _np.where(msk, splt_ary[START_N_STR] - ge_start_h, 0),
-                halo[:, LO]
+        _np.where(
+            periods,
+            _np.where(msk, halo[:, LO], 0),
+            _np.maximum(
+                0,
+                _np.minimum(
+                    _np.where(msk, splt_ary[START_N_STR] - ge_start_h, 0),
+                    halo[:, LO]
+                )
             )
     )
     slice_hi = (slice(None),) * ndim + (slice(None), HI)
     splt_ary[HALO_STR][slice_hi] = \
-        _np.maximum(
-            0,
-            _np.minimum(
-                _np.where(msk, ge_stop_h - splt_ary[STOP_N_STR], 0),
-                halo[:, HI]
+        _np.where(
+            periods,
+            _np.where(msk, halo[:, HI], 0),
+            _np.maximum(
+                0,
+                _np.minimum(
+                    _np.where(msk, ge_stop_h - splt_ary[STOP_N_STR], 0),
+                    halo[:, HI]
+                )
             )
     )
     return splt_ary
@@ -1103,7 +1165,8 @@ class BlockPartition(Distribution):
         cart_coord_to_cart_rank,
         halo=0,
         order="C",
-        inter_locale_rank_to_peer_rank=None
+        inter_locale_rank_to_peer_rank=None,
+        periods=None
     ):
         """
         Creates a block-partitioning of :samp:`{shape}` over locales.
@@ -1122,14 +1185,31 @@ class BlockPartition(Distribution):
         :param cart_coord_to_cart_rank: Mapping between cartesian
            communicator coordinate (:meth:`mpi4py.MPI.CartComm.Get_coords`)
            and cartesian communicator rank.
+        :type periods: :obj:`bool` or sequence of :obj:`bool`
+        :param periods: Per-axis periodicity. On periodic axes the locale halos
+           wrap around the globale extent boundary (halos of boundary locales
+           are updated from the opposite-face locale).
         """
         self._globale_extent_type = GlobaleExtent
         globale_extent = self.create_globale_extent(globale_extent, halo)
         self._dims = dims
         ndim = len(self._dims)
         halo = _convert_halo_to_array_form(halo, ndim)
+        periods = convert_periods_to_array_form(periods, ndim)
+        if _np.any(periods[:, _np.newaxis] & (halo > globale_extent.shape_n[:, _np.newaxis])):
+            raise ValueError(
+                "Got halo=%s larger than globale shape=%s on periodic axis (periods=%s)."
+                %
+                (halo.tolist(), tuple(globale_extent.shape_n), periods.tolist())
+            )
 
-        key = (globale_extent.to_tuple(), tuple(self._dims), tuple(tuple(row) for row in halo))
+        key = \
+            (
+                globale_extent.to_tuple(),
+                tuple(self._dims),
+                tuple(tuple(row) for row in halo),
+                tuple(periods)
+            )
         splt = self._split_cache[key]
         if splt is None:
             shape_splitter = \
@@ -1143,7 +1223,8 @@ class BlockPartition(Distribution):
                 convert_slice_split_to_struct(
                     shape_splitter.calculate_split(),
                     globale_extent,
-                    halo
+                    halo,
+                    periods
                 )
             self._split_cache[key] = splt
 
@@ -1170,7 +1251,8 @@ class BlockPartition(Distribution):
             inter_locale_rank_to_peer_rank=inter_locale_rank_to_peer_rank,
             halo=halo,
             locale_extent_type=CartLocaleExtent,
-            globale_extent_type=self._globale_extent_type
+            globale_extent_type=self._globale_extent_type,
+            periods=periods
         )
 
     def initialise_struct_locale_extents(self, struct_locale_extents, locale_extents_descr):
@@ -1037,6 +1037,65 @@ class BlockPartitionTest(_unittest.TestCase):
         """
         self.do_test_construct_2d_with_halo(halo=[[1, 2], [3, 4]])
 
+    def test_construct_2d_periodic(self):
+        """
+        Test :obj:`mpi_array.distribution.BlockPartition` construction
+        with periodic axes, halos are not trimmed on periodic axes.
+        """
+        halo = [[1, 2], [3, 4]]
+        dims = (2, 3)
+        distrib = \
+            BlockPartition(
+                globale_extent=(16, 18),
+                dims=dims,
+                cart_coord_to_cart_rank={
+                    (i, j): i * dims[1] + j for i in range(dims[0]) for j in range(dims[1])
+                },
+                halo=halo,
+                periods=(True, False)
+            )
+        self.assertSequenceEqual([True, False], distrib.periods.tolist())
+        for extent in distrib.locale_extents:
+            self.assertSequenceEqual([1, 2], extent.halo[0].tolist())
+            if extent.cart_coord[1] == 0:
+                self.assertEqual(0, extent.halo[1, extent.LO])
+                self.assertEqual(4, extent.halo[1, extent.HI])
+            elif extent.cart_coord[1] == (dims[1] - 1):
+                self.assertEqual(3, extent.halo[1, extent.LO])
+                self.assertEqual(0, extent.halo[1, extent.HI])
+            if extent.cart_coord[0] == 0:
+                self.assertEqual(-1, extent.start_h[0])
+
+        distrib = \
+            BlockPartition(
+                globale_extent=(16, 18),
+                dims=dims,
+                cart_coord_to_cart_rank={
+                    (i, j): i * dims[1] + j for i in range(dims[0]) for j in range(dims[1])
+                },
+                halo=halo
+            )
+        self.assertSequenceEqual([False, False], distrib.periods.tolist())
+
+        self.assertRaises(
+            ValueError,
+            BlockPartition,
+            globale_extent=(1, 18),
+            dims=(1, 1),
+            cart_coord_to_cart_rank={(0, 0): 0},
+            halo=halo,
+            periods=True
+        )
+        self.assertRaises(
+            ValueError,
+            BlockPartition,
+            globale_extent=(16, 18),
+            dims=(1, 1),
+            cart_coord_to_cart_rank={(0, 0): 0},
+            halo=halo,
+            periods=(True, True, False)
+        )
+
 
 _unittest.main(__name__)
 
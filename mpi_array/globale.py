@@ -13,7 +13,19 @@ Classes
    :toctree: generated/
 
    gndarray - A :obj:`numpy.ndarray` like distributed array.
+   PlanCache - Bounded (least recently used) cache of communication plans.
+   HaloUpdateHandle - Handle for split-phase halo update.
+   HaloGroup - Batched halo update for multiple arrays sharing a distribution.
    PerAxisRmaHaloUpdater - Helper class for performing ghost element updates.
+   HaloUpdatePlan - Base class for persistent halo exchange plans.
+   RmaHaloUpdatePlan - Persistent (pre-committed) halo exchange plan.
+   RmaRgetHaloUpdatePlan - Persistent halo exchange plan with multiple request-based gets in flight.
+   PerAxisRmaRgetHaloUpdater - Ghost element updates using passive target request-based gets.
+   PerAxisP2pHaloUpdater - Two-sided (send/receive) ghost element updates.
+   P2pHaloUpdatePlan - Persistent (pre-committed) two-sided halo exchange plan.
+   HaloGroupUpdatePlan - Halo exchange plan for a group of arrays.
+   RmaRgetHaloGroupUpdatePlan - Request-based RMA halo exchange plan for a group of arrays.
+   P2pHaloGroupUpdatePlan - Two-sided halo exchange plan for a group of arrays (combined messages).
    RmaRedistributeUpdater - Helper class for redistributing elements between distributions.
 
 Functions
@@ -23,6 +35,15 @@ Functions
    :toctree: generated/
 
    copyto - Copy elements of one array to another array.
+   calc_redistribute_plan_key - Cache key for the redistribution plan of a pair of arrays.
+   update_halos - Update the halos of multiple arrays in a batch.
+   clear_plan_caches - Frees all cached communication plans.
+   get_default_halo_engine - Returns the default halo exchange engine.
+   set_default_halo_engine - Sets the default halo exchange engine.
+   get_default_redistribute_engine - Returns the default redistribution engine.
+   set_default_redistribute_engine - Sets the default redistribution engine.
+   get_default_redistribute_sync - Returns the default redistribution synchronisation.
+   set_default_redistribute_sync - Sets the default redistribution synchronisation.
 
 
 """
@@ -31,18 +52,25 @@ from __future__ import absolute_import
 
 import mpi4py.MPI as _mpi
 import numpy as _np
+import collections as _collections
 from numpy.lib.mixins import NDArrayOperatorsMixin as _NDArrayOperatorsMixin
+from array_split.split import convert_halo_to_array_form as _convert_halo_to_array_form
 
 from .license import license as _license, copyright as _copyright, version as _version
 from .update import UpdatesForRedistribute as _UpdatesForRedistribute
 from .update import MpiUpdatesForGet as _MpiUpdatesForGet
 from .update import MpiHalosUpdate as _MpiHalosUpdate
+from .update import MpiSingleEpochHalosUpdate as _MpiSingleEpochHalosUpdate
+from .update import PairExtentUpdate as _PairExtentUpdate
 from .update import MpiPairExtentUpdate as _MpiPairExtentUpdate
 from .update import MpiPairExtentUpdateDifferentDtypes as _MpiPairExtentUpdateDifferentDtypes
+from .update import MpiPairExtentUpdateGroup as _MpiPairExtentUpdateGroup
+from .update import iter_pair_extent_updates as _iter_pair_extent_updates
 from .update import RmaUpdateExecutor as _RmaUpdateExecutor
 from .locale import win_lndarray as _win_lndarray
 from .distribution import LocaleExtent as _LocaleExtent
 from .indexing import HaloIndexingExtent as _HaloIndexingExtent
+from .indexing import IndexingExtent as _IndexingExtent
 
 __author__ = "Shane J. Latham"
 __license__ = _license()
@@ -78,6 +106,316 @@ class CommLogger:
         self._root_logger = logger
 
 
+class PlanCache(object):
+
+    """
+    Bounded, least recently used (LRU), cache of communication plans
+    (e.g. :obj:`HaloUpdatePlan` and :obj:`RmaRedistributeUpdater` objects).
+    Plans hold committed MPI data types (and groups), so the :samp:`free` method
+    of a plan is called when it is evicted from the cache (or when the cache is
+    cleared). The number of cached plans is bounded by :attr:`max_size`.
+    """
+
+    def __init__(self, max_size=32):
+        """
+        Initialise.
+
+        :type max_size: :obj:`int`
+        :param max_size: Maximum number of plans held in the cache.
+        """
+        object.__init__(self)
+        self._plans = _collections.OrderedDict()
+        self._max_size = None
+        self.max_size = max_size
+
+    @property
+    def max_size(self):
+        """
+        An :obj:`int`, the maximum number of plans held in the cache, least
+        recently used plans are evicted (and freed) when this size is exceeded.
+        """
+        return self._max_size
+
+    @max_size.setter
+    def max_size(self, max_size):
+        if max_size < 1:
+            raise ValueError("Got max_size=%s, require max_size >= 1." % (max_size,))
+        self._max_size = max_size
+        self.evict()
+
+    def __len__(self):
+        """
+        The number of cached plans.
+        """
+        return len(self._plans)
+
+    def find(self, key):
+        """
+        Returns the plan cached on :samp:`{key}` (and marks it as most recently used).
+
+        :type key: hashable
+        :param key: Plan key.
+        :rtype: :obj:`object`
+        :return: The plan, :samp:`None` if there is no plan cached on :samp:`{key}`.
+        """
+        plan = self._plans.pop(key, None)
+        if plan is not None:
+            self._plans[key] = plan
+        return plan
+
+    def add(self, key, plan):
+        """
+        Caches :samp:`{plan}` on :samp:`{key}`, evicts (and frees) least recently
+        used plans when the cache holds more than :attr:`max_size` plans.
+
+        :type key: hashable
+        :param key: Plan key.
+        :type plan: :obj:`object`
+        :param plan: Plan with a :samp:`free` method.
+        """
+        prev_plan = self._plans.pop(key, None)
+        if (prev_plan is not None) and (prev_plan is not plan):
+            prev_plan.free()
+        self._plans[key] = plan
+        self.evict()
+
+    def evict(self):
+        """
+        Removes (and frees) least recently used plans until
+        the cache holds no more than :attr:`max_size` plans.
+        """
+        while len(self._plans) > self._max_size:
+            self._plans.popitem(last=False)[1].free()
+
+    def clear(self):
+        """
+        Removes (and frees) all cached plans.
+        """
+        plans = list(self._plans.values())
+        self._plans = _collections.OrderedDict()
+        for plan in plans:
+            plan.free()
+
+
+class HaloUpdatePlan(object):
+
+    """
+    Base class for persistent halo exchange plans. The exchange proceeds
+    axis-by-axis (so that edge and corner halo elements are propagated), or,
+    for single-epoch plans, as a single group of transfers. A
+    plan can be executed in a single call (:meth:`execute`) or
+    in split-phase (:meth:`begin` followed by :meth:`end`).
+    """
+
+    def __init__(self, axis_transfers):
+        """
+        Initialise.
+
+        :type axis_transfers: sequence
+        :param axis_transfers: Sequence of length :samp:`ndim`, :samp:`axis_transfers[a]`
+           is :samp:`None` when no halo exchange is required on axis :samp:`a`
+           (for *all* ranks), otherwise :samp:`axis_transfers[a]` describes the
+           transfers for axis :samp:`a` (see sub-classes).
+        """
+        object.__init__(self)
+        self._axis_transfers = tuple(axis_transfers)
+        self._exchange_axes = \
+            tuple(
+                a for a in range(len(self._axis_transfers)) if self._axis_transfers[a] is not None
+            )
+        self._data_types = []
+        self._freed = False
+
+    def own_data_type(self, data_type):
+        """
+        Returns a duplicate of :samp:`{data_type}` which is owned (and freed
+        by :meth:`free`) by this plan.
+
+        :type data_type: :obj:`mpi4py.MPI.Datatype`
+        :param data_type: Committed data type.
+        :rtype: :obj:`mpi4py.MPI.Datatype`
+        :return: Committed duplicate of :samp:`{data_type}`.
+        """
+        data_type = data_type.Dup()
+        self._data_types.append(data_type)
+        return data_type
+
+    @property
+    def is_freed(self):
+        """
+        A :obj:`bool`, :samp:`True` if :meth:`free` has been called for this plan.
+        """
+        return self._freed
+
+    def free(self):
+        """
+        Frees the MPI data types owned by this plan, the plan can no longer be executed.
+        """
+        for data_type in self._data_types:
+            data_type.Free()
+        self._data_types = []
+        self._freed = True
+
+    @property
+    def axis_transfers(self):
+        """
+        Sequence of per-axis transfers, see :meth:`__init__`.
+        """
+        return self._axis_transfers
+
+    @property
+    def exchange_axes(self):
+        """
+        A :obj:`tuple` of axis indices for which halo exchange is performed.
+        """
+        return self._exchange_axes
+
+    def begin_axis(self, axis, comm, dst_buffer, rank_logger):
+        """
+        Initiates the halo exchange for axis :samp:`{axis}`, over-ridden in sub-classes.
+
+        :rtype: :obj:`object`
+        :return: State which is passed to :meth:`end_axis`.
+        """
+        raise NotImplementedError()
+
+    def end_axis(self, axis, state, comm, rank_logger):
+        """
+        Completes the halo exchange for axis :samp:`{axis}`, over-ridden in sub-classes.
+        """
+        raise NotImplementedError()
+
+    def begin(self, comm, dst_buffer, rank_logger):
+        """
+        Initiates the halo exchange of the first axis of :attr:`exchange_axes`. Local
+        computation which does not read the halo elements (nor write
+        the non-halo elements) of :samp:`{dst_buffer}` can be performed
+        before calling :meth:`end`.
+
+        :type comm: :obj:`mpi4py.MPI.Win` or :obj:`mpi4py.MPI.Comm`
+        :param comm: The window or communicator used to exchange halo element data.
+        :type dst_buffer: :obj:`memoryview`
+        :param dst_buffer: The buffer into which the halo elements are written.
+        :type rank_logger: :obj:`logging.Logger`
+        :param rank_logger: Logger for debug messages.
+        :rtype: :obj:`object`
+        :return: State which is passed to :meth:`end`.
+        """
+        state = None
+        if len(self._exchange_axes) > 0:
+            state = self.begin_axis(self._exchange_axes[0], comm, dst_buffer, rank_logger)
+        return state
+
+    def end(self, state, comm, dst_buffer, rank_logger):
+        """
+        Completes the halo exchange initiated by :meth:`begin`, the
+        exchange for the remaining axes of :attr:`exchange_axes` is
+        performed (blocking).
+
+        :type state: :obj:`object`
+        :param state: The object returned by :meth:`begin`.
+        :type comm: :obj:`mpi4py.MPI.Win` or :obj:`mpi4py.MPI.Comm`
+        :param comm: The window or communicator used to exchange halo element data.
+        :type dst_buffer: :obj:`memoryview`
+        :param dst_buffer: The buffer into which the halo elements are written.
+        :type rank_logger: :obj:`logging.Logger`
+        :param rank_logger: Logger for debug messages.
+        """
+        if len(self._exchange_axes) > 0:
+            self.end_axis(self._exchange_axes[0], state, comm, rank_logger)
+            for a in self._exchange_axes[1:]:
+                axis_state = self.begin_axis(a, comm, dst_buffer, rank_logger)
+                self.end_axis(a, axis_state, comm, rank_logger)
+
+    def execute(self, comm, dst_buffer, rank_logger):
+        """
+        Replays the plan, performs the (blocking) halo exchange.
+        Should be called :samp:`inter_locale_comm` collectively.
+
+        :type comm: :obj:`mpi4py.MPI.Win` or :obj:`mpi4py.MPI.Comm`
+        :param comm: The window or communicator used to exchange halo element data.
+        :type dst_buffer: :obj:`memoryview`
+        :param dst_buffer: The buffer into which the halo elements are written.
+        :type rank_logger: :obj:`logging.Logger`
+        :param rank_logger: Logger for debug messages.
+        """
+        self.end(self.begin(comm, dst_buffer, rank_logger), comm, dst_buffer, rank_logger)
+
+
+class RmaHaloUpdatePlan(HaloUpdatePlan):
+
+    """
+    Persistent halo exchange plan for a single rank of the :samp:`inter_locale_comm`.
+    Holds the target ranks and the committed :obj:`mpi4py.MPI.Datatype` objects
+    (for destination and source halo regions) so that repeated halo
+    exchanges are a replay of :meth:`mpi4py.MPI.Win.Get` calls.
+    """
+
+    def __init__(self, axis_transfers):
+        """
+        Initialise.
+
+        :type axis_transfers: sequence
+        :param axis_transfers: Sequence of length :samp:`ndim`, :samp:`axis_transfers[a]`
+           is :samp:`None` when no halo exchange is required on axis :samp:`a`
+           (for *all* ranks), otherwise :samp:`axis_transfers[a]` is a
+           sequence of :samp:`(target_rank, dst_data_type, src_data_type)` tuples.
+           The plan holds duplicates of the data types, see :meth:`HaloUpdatePlan.own_data_type`.
+        """
+        HaloUpdatePlan.__init__(self, axis_transfers)
+        self._axis_transfers = \
+            tuple(
+                None if transfers is None else
+                tuple(
+                    (rank, self.own_data_type(dst_data_type), self.own_data_type(src_data_type))
+                    for rank, dst_data_type, src_data_type in transfers
+                )
+                for transfers in self._axis_transfers
+            )
+
+    @property
+    def num_transfers(self):
+        """
+        An :obj:`int` indicating the total number of RMA fetches in this plan.
+        """
+        return sum(len(t) for t in self._axis_transfers if t is not None)
+
+    def begin_axis(self, axis, inter_locale_win, dst_buffer, rank_logger):
+        """
+        Opens the :meth:`mpi4py.MPI.Win.Fence` epoch and issues
+        the :meth:`mpi4py.MPI.Win.Get` fetches for axis :samp:`{axis}`.
+        """
+        rank_logger.debug("BEG: Fence(_mpi.MODE_NOPUT | _mpi.MODE_NOPRECEDE)...")
+        inter_locale_win.Fence(_mpi.MODE_NOPUT | _mpi.MODE_NOPRECEDE)
+        rank_logger.debug("END: Fence(_mpi.MODE_NOPUT | _mpi.MODE_NOPRECEDE)...")
+        for target_rank, dst_data_type, src_data_type in self._axis_transfers[axis]:
+            inter_locale_win.Get(
+                [dst_buffer, 1, dst_data_type],
+                target_rank,
+                [0, 1, src_data_type]
+            )
+        return None
+
+    def end_axis(self, axis, state, inter_locale_win, rank_logger):
+        """
+        Closes the :meth:`mpi4py.MPI.Win.Fence` epoch for axis :samp:`{axis}`.
+        """
+        rank_logger.debug("BEG: Fence(_mpi.MODE_NOSUCCEED).")
+        inter_locale_win.Fence(_mpi.MODE_NOSUCCEED)
+        rank_logger.debug("END: Fence(_mpi.MODE_NOSUCCEED).")
+
+
+def _calc_depth_key(depth):
+    """
+    Returns a hashable key for the halo :samp:`{depth}` array (or :samp:`None`).
+    """
+    return None if depth is None else tuple(_np.asarray(depth).flatten().tolist())
+
+
+#: Cache of :obj:`HaloUpdatePlan` objects, shared by arrays with same distribution.
+_halo_update_plan_cache = PlanCache(max_size=64)
+
+
 class PerAxisRmaHaloUpdater(CommLogger):
 
     """
@@ -91,7 +429,17 @@ class PerAxisRmaHaloUpdater(CommLogger):
     #: Halo "high index" indices.
     HI = _HaloIndexingExtent.HI
 
-    def __init__(self, locale_extents, dtype, order, inter_locale_win, dst_buffer):
+    def __init__(
+        self,
+        locale_extents,
+        dtype,
+        order,
+        inter_locale_win,
+        dst_buffer,
+        single_epoch=False,
+        max_message_bytes=None,
+        periods=None
+    ):
         """
         Initialise.
 
@@ -107,6 +455,18 @@ class PerAxisRmaHaloUpdater(CommLogger):
         :param inter_locale_win: The window used to exchange halo element data.
         :type dst_buffer: :obj:`memoryview`
         :param dst_buffer: The buffer into which the halo elements are written.
+        :type single_epoch: :obj:`bool`
+        :param single_epoch: If :samp:`True`, all halo regions (including edge and
+           corner regions) are fetched directly from the owning locale in a single
+           exchange (see :obj:`mpi_array.update.SingleEpochHalosUpdate`), otherwise the
+           halo regions are exchanged axis-by-axis.
+        :type max_message_bytes: :obj:`int`
+        :param max_message_bytes: Halo regions larger than this many bytes are
+           split into multiple transfers (chunks), :samp:`None` for no splitting.
+        :type periods: sequence of :obj:`bool`
+        :param periods: Per-axis periodicity, halo regions on periodic axes are
+           updated from the periodic image (opposite face) locales.
+           If :samp:`None`, no axes are periodic.
         """
         CommLogger.__init__(self)
         self._locale_extents = locale_extents
@@ -114,8 +474,15 @@ class PerAxisRmaHaloUpdater(CommLogger):
         self._order = order
         self._inter_locale_win = inter_locale_win
         self._dst_buffer = dst_buffer
+        self._single_epoch = single_epoch
+        self._max_message_bytes = max_message_bytes
+        if periods is None:
+            periods = _np.zeros((locale_extents[0].ndim,), dtype="bool")
+        self._periods = _np.array(periods, dtype="bool")
         self._halo_updates = None
         self._have_axis_updates = None
+        self._halo_update_plan_key = None
+        self._halo_update_plans = dict()
 
     @property
     def locale_extents(self):
@@ -139,11 +506,89 @@ class PerAxisRmaHaloUpdater(CommLogger):
         """
         return self._order
 
-    def calc_halo_updates(self):
+    @property
+    def single_epoch(self):
+        """
+        A :obj:`bool`, if :samp:`True` all halo regions are exchanged in a
+        single epoch, otherwise halo regions are exchanged axis-by-axis.
+        """
+        return self._single_epoch
+
+    @property
+    def max_message_bytes(self):
+        """
+        An :obj:`int` (or :samp:`None`), the maximum number of bytes in
+        a single halo region transfer.
+        """
+        return self._max_message_bytes
+
+    @property
+    def periods(self):
+        """
+        A :samp:`(ndim,)` shaped array of :obj:`bool` indicating the periodic axes.
+        """
+        return self._periods
+
+    @property
+    def max_message_elements(self):
+        """
+        An :obj:`int` (or :samp:`None`), the maximum number of array
+        elements in a single halo region transfer, calculated from :attr:`max_message_bytes`.
+        """
+        max_elements = None
+        if self.max_message_bytes is not None:
+            max_elements = max(1, self.max_message_bytes // _np.dtype(self.dtype).itemsize)
+        return max_elements
+
+    def have_halo(self):
+        """
+        Returns :samp:`True` if any locale extent has a non-zero halo. Same
+        result on all ranks.
+
+        :rtype: :obj:`bool`
+        :return: :samp:`True` if there are any halo elements to exchange.
+        """
+        return any(_np.any(extent.halo > 0) for extent in self.locale_extents)
+
+    def calc_single_epoch_halo_updates(self, inter_locale_rank, depth=None):
+        """
+        Calculates the (edge and corner inclusive) halo region updates
+        for rank :samp:`{inter_locale_rank}`.
+
+        :type inter_locale_rank: :obj:`int`
+        :param inter_locale_rank: Rank (of :samp:`inter_locale_comm`) for
+           which the updates are calculated.
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :rtype: :obj:`mpi_array.update.MpiSingleEpochHalosUpdate`
+        :return: The updates for halo regions of :samp:`{inter_locale_rank}` and
+           the updates of other rank halo regions sourced from :samp:`{inter_locale_rank}`.
+        """
+        return \
+            _MpiSingleEpochHalosUpdate(
+                inter_locale_rank,
+                self.locale_extents,
+                max_elements=self.max_message_elements,
+                periods=self.periods,
+                depth=depth
+            )
+
+    @property
+    def inter_locale_rank(self):
+        """
+        An :obj:`int`, the rank of this process in the :samp:`inter_locale_comm`.
+        """
+        return self._inter_locale_win.group.rank
+
+    def calc_halo_updates(self, depth=None):
         """
         Calculates the per-axis halo-region updates for
         all inter-locale ranks (of the :samp:`inter_locale_comm`).
 
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
         :rtype: :obj:`tuple` pair
         :return: A :samp:`(rank_2_updates_dict, bool_sequence)` pair
            where `rank_2_updates` is a :obj:`dict` of :samp:`{inter_locale_rank, halos_update}`,
@@ -161,7 +606,10 @@ class PerAxisRmaHaloUpdater(CommLogger):
             rank_inter_locale_updates = \
                 _MpiHalosUpdate(
                     inter_locale_rank,
-                    self.locale_extents
+                    self.locale_extents,
+                    max_elements=self.max_message_elements,
+                    periods=self.periods,
+                    depth=depth
                 )
             halo_updates_dict[inter_locale_rank] = rank_inter_locale_updates
             have_axis_updates = \
@@ -190,96 +638,1067 @@ class PerAxisRmaHaloUpdater(CommLogger):
         else:
             halo_updates_dict = None
 
-        return halo_updates_dict, have_axis_updates
+        return halo_updates_dict, have_axis_updates
+
+    @property
+    def dst_buffer(self):
+        """
+        A :obj:`memoryview` which provides the buffer
+        into which the halo data is written.
+        """
+        return self._dst_buffer
+
+    @property
+    def halo_updates(self):
+        """
+        The :samp:`(rank_2_updates_dict, bool_sequence)` pair calculated
+        by :meth:`calc_halo_updates`.
+        """
+        if self._halo_updates is None:
+            self._halo_updates, self._have_axis_updates = self.calc_halo_updates()
+
+        return self._halo_updates
+
+    def calc_have_axis_updates(self, depth=None):
+        """
+        Returns the per-axis flags which indicate the axes on which halo regions may
+        require update (on any rank). Calculated from the locale extents only (same
+        result on all ranks), an axis is flagged when some locale has (depth limited)
+        halo elements on the axis and the axis is periodic or has multiple locales.
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :rtype: :obj:`numpy.ndarray`
+        :return: A :samp:`(ndim,)` shaped array of :obj:`bool`.
+        """
+        halo = _np.max([extent.halo for extent in self.locale_extents], axis=0)
+        if depth is not None:
+            halo = _np.minimum(halo, depth)
+        return \
+            _np.logical_and(
+                _np.any(halo > 0, axis=1),
+                _np.logical_or(_np.array(self.locale_extents[0].cart_shape) > 1, self.periods)
+            )
+
+    def calc_rank_halo_updates(self, inter_locale_rank, depth=None):
+        """
+        Calculates the per-axis halo region updates for
+        the single rank :samp:`{inter_locale_rank}`.
+
+        :type inter_locale_rank: :obj:`int`
+        :param inter_locale_rank: Rank (of :samp:`inter_locale_comm`) for
+           which the updates are calculated.
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :rtype: :obj:`mpi_array.update.MpiHalosUpdate`
+        :return: The updates for the halo regions of :samp:`{inter_locale_rank}`.
+        """
+        return \
+            _MpiHalosUpdate(
+                inter_locale_rank,
+                self.locale_extents,
+                max_elements=self.max_message_elements,
+                periods=self.periods,
+                depth=depth
+            )
+
+    def calc_halo_update_plan(self, inter_locale_rank, depth=None):
+        """
+        Calculates the persistent halo exchange plan for
+        rank :samp:`{inter_locale_rank}`, only the halo region updates
+        of :samp:`{inter_locale_rank}` are calculated. The MPI data types of
+        the updates are committed, duplicated by the plan and then freed.
+
+        :type inter_locale_rank: :obj:`int`
+        :param inter_locale_rank: Rank (of :samp:`inter_locale_comm`) for
+           which the plan is calculated.
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :rtype: :obj:`RmaHaloUpdatePlan`
+        :return: Plan which can be replayed to perform halo exchange.
+        """
+        if self.single_epoch:
+            axis_transfers = [None, ]
+            rank_updates = None
+            if self.have_halo():
+                transfers = []
+                rank_updates = self.calc_single_epoch_halo_updates(inter_locale_rank, depth)
+                for single_update in rank_updates.updates:
+                    single_update.initialise_data_types(self.dtype, self.order)
+                    transfers.append(
+                        (
+                            single_update.src_extent.cart_rank,
+                            single_update.dst_data_type,
+                            single_update.src_data_type
+                        )
+                    )
+                axis_transfers[0] = tuple(transfers)
+            plan = RmaHaloUpdatePlan(axis_transfers)
+            if rank_updates is not None:
+                # The plan holds duplicates of the data types.
+                rank_updates.free_data_types()
+            return plan
+
+        axis_transfers = [None, ] * self.locale_extents[0].ndim
+        have_axis_updates = self.calc_have_axis_updates(depth)
+        rank_updates = None
+        if _np.any(have_axis_updates):
+            rank_updates = self.calc_rank_halo_updates(inter_locale_rank, depth)
+            for a in range(len(axis_transfers)):
+                if have_axis_updates[a]:
+                    lo_hi_updates_pair = rank_updates.updates_per_axis[a]
+                    transfers = []
+                    for single_update in lo_hi_updates_pair[self.LO] + lo_hi_updates_pair[self.HI]:
+                        single_update.initialise_data_types(self.dtype, self.order)
+                        transfers.append(
+                            (
+                                single_update.src_extent.cart_rank,
+                                single_update.dst_data_type,
+                                single_update.src_data_type
+                            )
+                        )
+                    axis_transfers[a] = tuple(transfers)
+
+        plan = RmaHaloUpdatePlan(axis_transfers)
+        if rank_updates is not None:
+            # The plan holds duplicates of the data types.
+            rank_updates.free_data_types()
+        return plan
+
+    def calc_halo_update_plan_key(self, inter_locale_rank):
+        """
+        Returns the key under which the plans of :samp:`{inter_locale_rank}`
+        are cached, the (hashable) halo depth is appended to this key
+        to identify a particular plan (see :meth:`get_halo_update_plan`).
+
+        :type inter_locale_rank: :obj:`int`
+        :param inter_locale_rank: Rank (of :samp:`inter_locale_comm`).
+        :rtype: :obj:`tuple`
+        :return: Hashable key which identifies the plans.
+        """
+        return \
+            (
+                type(self),
+                self.single_epoch,
+                self.max_message_bytes,
+                tuple(self.periods),
+                inter_locale_rank,
+                tuple(extent.to_tuple() for extent in self.locale_extents),
+                _np.dtype(self.dtype),
+                self.order
+            )
+
+    @property
+    def halo_update_plan_key(self):
+        """
+        The :meth:`calc_halo_update_plan_key` key for this rank of
+        the :samp:`inter_locale_comm`, calculated once (the locale extents
+        of an updater do not change).
+        """
+        if self._halo_update_plan_key is None:
+            self._halo_update_plan_key = self.calc_halo_update_plan_key(self.inter_locale_rank)
+        return self._halo_update_plan_key
+
+    @property
+    def halo_update_plan(self):
+        """
+        The (full halo) :obj:`RmaHaloUpdatePlan` for this rank of the :samp:`inter_locale_comm`,
+        see :meth:`get_halo_update_plan`.
+        """
+        return self.get_halo_update_plan()
+
+    def get_halo_update_plan(self, depth=None):
+        """
+        Returns the :obj:`RmaHaloUpdatePlan` for this rank of the :samp:`inter_locale_comm`
+        which updates the halo elements within :samp:`{depth}`.
+        Plans are held by the updater (per depth) and are also cached (and shared
+        between updater instances of the same type) on the :attr:`halo_update_plan_key`
+        key in a bounded :obj:`PlanCache`, plans which have been evicted (freed)
+        from the cache are re-calculated.
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :rtype: :obj:`HaloUpdatePlan`
+        :return: The (cached) plan.
+        """
+        depth_key = _calc_depth_key(depth)
+        plan = self._halo_update_plans.get(depth_key, None)
+        if (plan is None) or plan.is_freed:
+            key = self.halo_update_plan_key + (depth_key,)
+            plan = _halo_update_plan_cache.find(key)
+            if plan is None:
+                plan = self.calc_halo_update_plan(self.inter_locale_rank, depth)
+                _halo_update_plan_cache.add(key, plan)
+            self._halo_update_plans[depth_key] = plan
+
+        return plan
+
+    @property
+    def halo_comm(self):
+        """
+        The :obj:`mpi4py.MPI.Win` (:samp:`inter_locale_win`) used to exchange halo data.
+        """
+        return self._inter_locale_win
+
+    def calc_group_member_plan(self, depth=None):
+        """
+        Calculates (not cached) the plan of this updater for inclusion
+        in a group plan (see :meth:`calc_halo_group_update_plan`), the group
+        plan owns (and frees) the plan, so that it is not affected by evictions
+        from the :obj:`PlanCache`.
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :rtype: :obj:`HaloUpdatePlan`
+        :return: Plan for this rank of the :samp:`inter_locale_comm`.
+        """
+        return self.calc_halo_update_plan(self.inter_locale_rank, depth)
+
+    def calc_halo_group_update_plan(self, updaters, depth=None):
+        """
+        Creates the plan which exchanges the halos of a group of arrays (which
+        share the distribution of this updater).
+
+        :type updaters: sequence of :obj:`PerAxisRmaHaloUpdater`
+        :param updaters: The (per array) updaters, all of the same type as :samp:`{self}`.
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :rtype: :obj:`tuple`
+        :return: A :samp:`(plan, comm, dst_buffer)` triple, where :samp:`plan`
+           is a :obj:`HaloGroupUpdatePlan` and :samp:`comm` and :samp:`dst_buffer`
+           are the arguments for :meth:`HaloUpdatePlan.execute`.
+        """
+        return \
+            (
+                HaloGroupUpdatePlan([u.calc_group_member_plan(depth) for u in updaters]),
+                [u.halo_comm for u in updaters],
+                [u.dst_buffer for u in updaters]
+            )
+
+    def update_halos(self, depth=None):
+        """
+        Performs the data exchange required to update the halo (ghost)
+        elements of the array buffer :attr:`dst_buffer`:samp:`.buffer`.
+        Should be called :samp:`inter_locale_comm` collectively. Replays the
+        cached plan (see :meth:`get_halo_update_plan`).
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        """
+        self.get_halo_update_plan(depth).execute(
+            self.halo_comm,
+            self._dst_buffer,
+            self.rank_logger
+        )
+
+    def update_halos_begin(self, depth=None):
+        """
+        Initiates the halo exchange, see :meth:`HaloUpdatePlan.begin`.
+        Should be called :samp:`inter_locale_comm` collectively.
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :rtype: :obj:`object`
+        :return: State which is to be passed to :meth:`update_halos_end`.
+        """
+        return \
+            self.get_halo_update_plan(depth).begin(
+                self.halo_comm,
+                self._dst_buffer,
+                self.rank_logger
+            )
+
+    def update_halos_end(self, state, depth=None):
+        """
+        Completes the halo exchange initiated by :meth:`update_halos_begin`.
+        Should be called :samp:`inter_locale_comm` collectively.
+
+        :type state: :obj:`object`
+        :param state: The object returned by :meth:`update_halos_begin`.
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: The :samp:`{depth}` which was passed to :meth:`update_halos_begin`.
+        """
+        self.get_halo_update_plan(depth).end(
+            state,
+            self.halo_comm,
+            self._dst_buffer,
+            self.rank_logger
+        )
+
+
+class P2pHaloUpdatePlan(HaloUpdatePlan):
+
+    """
+    Persistent two-sided halo exchange plan for a single rank of the :samp:`inter_locale_comm`.
+    Holds, per axis, the matched receive and send (rank, committed :obj:`mpi4py.MPI.Datatype`)
+    pairs, so that only neighbouring locales synchronise during the exchange.
+    """
+
+    def __init__(self, axis_transfers):
+        """
+        Initialise.
+
+        :type axis_transfers: sequence
+        :param axis_transfers: Sequence of length :samp:`ndim`, :samp:`axis_transfers[a]`
+           is :samp:`None` when no halo exchange is required on axis :samp:`a`
+           (for *all* ranks), otherwise :samp:`axis_transfers[a]` is
+           a :samp:`(recvs, sends)` pair, where :samp:`recvs` is a sequence
+           of :samp:`(src_rank, dst_data_type)` pairs and :samp:`sends` is
+           a sequence of :samp:`(dst_rank, src_data_type)` pairs.
+           The plan holds duplicates of the data types, see :meth:`HaloUpdatePlan.own_data_type`.
+        """
+        HaloUpdatePlan.__init__(self, axis_transfers)
+        self._axis_transfers = \
+            tuple(
+                None if transfers is None else
+                tuple(
+                    tuple((rank, self.own_data_type(data_type)) for rank, data_type in rank_types)
+                    for rank_types in transfers
+                )
+                for transfers in self._axis_transfers
+            )
+
+    @property
+    def num_transfers(self):
+        """
+        An :obj:`int` indicating the total number of receives in this plan.
+        """
+        return sum(len(t[0]) for t in self._axis_transfers if t is not None)
+
+    def begin_axis(self, axis, inter_locale_comm, dst_buffer, rank_logger):
+        """
+        Posts the :meth:`mpi4py.MPI.Comm.Irecv` and :meth:`mpi4py.MPI.Comm.Isend`
+        requests for axis :samp:`{axis}`.
+
+        :rtype: :obj:`list`
+        :return: The :obj:`mpi4py.MPI.Request` objects.
+        """
+        recvs, sends = self._axis_transfers[axis]
+        requests = \
+            [
+                inter_locale_comm.Irecv([dst_buffer, 1, data_type], source=rank, tag=axis)
+                for rank, data_type in recvs
+            ]
+        requests += \
+            [
+                inter_locale_comm.Isend([dst_buffer, 1, data_type], dest=rank, tag=axis)
+                for rank, data_type in sends
+            ]
+        return requests
+
+    def end_axis(self, axis, requests, inter_locale_comm, rank_logger):
+        """
+        Waits for completion of the :samp:`{requests}` of axis :samp:`{axis}`.
+        """
+        rank_logger.debug("BEG: Waitall axis=%s, num requests=%s...", axis, len(requests))
+        _mpi.Request.Waitall(requests)
+        rank_logger.debug("END: Waitall axis=%s, num requests=%s.", axis, len(requests))
+
+
+class PerAxisP2pHaloUpdater(PerAxisRmaHaloUpdater):
+
+    """
+    Helper class for performing halo data transfer using two-sided
+    (:meth:`mpi4py.MPI.Comm.Isend` and :meth:`mpi4py.MPI.Comm.Irecv`)
+    communication over the :samp:`inter_locale_comm`. Over-rides
+    the plan creation of :obj:`PerAxisRmaHaloUpdater`.
+    """
+
+    def __init__(
+        self,
+        locale_extents,
+        dtype,
+        order,
+        inter_locale_comm,
+        dst_buffer,
+        single_epoch=False,
+        max_message_bytes=None,
+        periods=None
+    ):
+        """
+        Initialise.
+
+        :type locale_extents: sequence of :obj:`mpi_array.distributon.LocaleExtent`
+        :param locale_extents: :samp:`locale_extents[r]` is the extent of the array
+           elements which reside on rank :samp:`r` of the :samp:`inter_locale_comm`
+           communicator.
+        :type dtype: :obj:`numpy.dtype`
+        :param dtype: Data type of elements in array.
+        :type order: :obj:`str`
+        :param order: The array order, :samp:`'C'` for C memory layout.
+        :type inter_locale_comm: :obj:`mpi4py.MPI.Comm`
+        :param inter_locale_comm: The communicator used to exchange halo element data.
+        :type dst_buffer: :obj:`memoryview`
+        :param dst_buffer: The buffer into which the halo elements are written.
+        :type single_epoch: :obj:`bool`
+        :param single_epoch: See :meth:`PerAxisRmaHaloUpdater.__init__`.
+        :type max_message_bytes: :obj:`int`
+        :param max_message_bytes: See :meth:`PerAxisRmaHaloUpdater.__init__`.
+        :type periods: sequence of :obj:`bool`
+        :param periods: See :meth:`PerAxisRmaHaloUpdater.__init__`.
+        """
+        PerAxisRmaHaloUpdater.__init__(
+            self,
+            locale_extents=locale_extents,
+            dtype=dtype,
+            order=order,
+            inter_locale_win=None,
+            dst_buffer=dst_buffer,
+            single_epoch=single_epoch,
+            max_message_bytes=max_message_bytes,
+            periods=periods
+        )
+        self._inter_locale_comm = inter_locale_comm
+
+    @property
+    def inter_locale_rank(self):
+        """
+        An :obj:`int`, the rank of this process in the :samp:`inter_locale_comm`.
+        """
+        return self._inter_locale_comm.rank
+
+    def calc_halo_update_plan(self, inter_locale_rank, depth=None):
+        """
+        Calculates the persistent two-sided halo exchange plan for
+        rank :samp:`{inter_locale_rank}`. The receives are the halo updates
+        of :samp:`{inter_locale_rank}` and the sends are the halo updates
+        (of the neighbouring ranks) for which :samp:`{inter_locale_rank}` is the source.
+
+        :type inter_locale_rank: :obj:`int`
+        :param inter_locale_rank: Rank (of :samp:`inter_locale_comm`) for
+           which the plan is calculated.
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: See :meth:`PerAxisRmaHaloUpdater.calc_halo_update_plan`.
+        :rtype: :obj:`P2pHaloUpdatePlan`
+        :return: Plan which can be replayed to perform halo exchange.
+        """
+        if self.single_epoch:
+            axis_transfers = [None, ]
+            rank_updates = None
+            if self.have_halo():
+                rank_updates = self.calc_single_epoch_halo_updates(inter_locale_rank, depth)
+                recvs = []
+                for single_update in rank_updates.updates:
+                    single_update.initialise_data_types(self.dtype, self.order)
+                    recvs.append((single_update.src_extent.cart_rank, single_update.dst_data_type))
+                sends = []
+                for single_update in rank_updates.remote_updates:
+                    single_update.initialise_data_types(self.dtype, self.order)
+                    sends.append((single_update.dst_extent.cart_rank, single_update.src_data_type))
+                axis_transfers[0] = (tuple(recvs), tuple(sends))
+            plan = P2pHaloUpdatePlan(axis_transfers)
+            if rank_updates is not None:
+                # The plan holds duplicates of the data types.
+                rank_updates.free_data_types()
+            return plan
+
+        ndim = self.locale_extents[0].ndim
+        axis_transfers = [None, ] * ndim
+        have_axis_updates = self.calc_have_axis_updates(depth)
+        rank_updates = dict()
+        if _np.any(have_axis_updates):
+            cart_coord_to_rank = \
+                {
+                    tuple(self.locale_extents[r].cart_coord): r
+                    for r in range(len(self.locale_extents))
+                }
+            cart_coord = _np.array(self.locale_extents[inter_locale_rank].cart_coord)
+            cart_shape = self.locale_extents[inter_locale_rank].cart_shape
+            for a in range(ndim):
+                if have_axis_updates[a]:
+                    # The axis a halo regions are only sourced from the locales
+                    # which differ (in cartesian coordinate) on axis a.
+                    axis_ranks = []
+                    for i in range(cart_shape[a]):
+                        axis_cart_coord = cart_coord.copy()
+                        axis_cart_coord[a] = i
+                        axis_ranks.append(cart_coord_to_rank[tuple(axis_cart_coord)])
+                    recvs = []
+                    sends = []
+                    # Iterate over ranks in order, so that the order of the sends
+                    # to a particular rank matches the order of the receives.
+                    for dst_rank in sorted(axis_ranks):
+                        if dst_rank not in rank_updates:
+                            rank_updates[dst_rank] = self.calc_rank_halo_updates(dst_rank, depth)
+                        lo_hi_updates_pair = rank_updates[dst_rank].updates_per_axis[a]
+                        axis_inter_locale_rank_updates = \
+                            lo_hi_updates_pair[self.LO] + lo_hi_updates_pair[self.HI]
+                        for single_update in axis_inter_locale_rank_updates:
+                            src_rank = single_update.src_extent.cart_rank
+                            if (dst_rank == inter_locale_rank) or (src_rank == inter_locale_rank):
+                                single_update.initialise_data_types(self.dtype, self.order)
+                            if dst_rank == inter_locale_rank:
+                                recvs.append((src_rank, single_update.dst_data_type))
+                            if src_rank == inter_locale_rank:
+                                sends.append((dst_rank, single_update.src_data_type))
+                    axis_transfers[a] = (tuple(recvs), tuple(sends))
+
+        plan = P2pHaloUpdatePlan(axis_transfers)
+        # The plan holds duplicates of the data types.
+        for updates in rank_updates.values():
+            updates.free_data_types()
+        return plan
+
+    @property
+    def halo_comm(self):
+        """
+        The :obj:`mpi4py.MPI.Comm` (:samp:`inter_locale_comm`) used to exchange halo data.
+        """
+        return self._inter_locale_comm
+
+    def calc_halo_group_update_plan(self, updaters, depth=None):
+        """
+        Over-rides :meth:`PerAxisRmaHaloUpdater.calc_halo_group_update_plan` to
+        return a :obj:`P2pHaloGroupUpdatePlan` which sends a single message
+        per neighbour (per axis) for all arrays of the group.
+        """
+        return \
+            (
+                P2pHaloGroupUpdatePlan(
+                    [u.calc_group_member_plan(depth) for u in updaters],
+                    [u.dst_buffer for u in updaters]
+                ),
+                self.halo_comm,
+                _mpi.BOTTOM
+            )
+
+
+class RmaRgetHaloUpdatePlan(RmaHaloUpdatePlan):
+
+    """
+    Persistent halo exchange plan which fetches halo regions with
+    request-based :meth:`mpi4py.MPI.Win.Rget` calls inside a passive
+    target (:meth:`mpi4py.MPI.Win.Lock_all`) epoch. Up to :attr:`max_requests_in_flight`
+    fetches are outstanding at any one time, so that many (chunked) halo
+    transfers are overlapped without exhausting MPI request resources.
+    The :samp:`comm` argument of :meth:`begin_axis` and :meth:`end_axis` is
+    an :samp:`(inter_locale_win, inter_locale_comm)` pair, the :samp:`inter_locale_comm`
+    is used to synchronise ranks at the end of each axis epoch.
+    """
+
+    def __init__(self, axis_transfers, max_requests_in_flight=16):
+        """
+        Initialise.
+
+        :type axis_transfers: sequence
+        :param axis_transfers: See :meth:`RmaHaloUpdatePlan.__init__`.
+        :type max_requests_in_flight: :obj:`int`
+        :param max_requests_in_flight: Maximum number of outstanding :meth:`mpi4py.MPI.Win.Rget`
+           requests.
+        """
+        RmaHaloUpdatePlan.__init__(self, axis_transfers)
+        if max_requests_in_flight < 1:
+            raise ValueError(
+                "Got max_requests_in_flight=%s, require max_requests_in_flight >= 1."
+                %
+                (max_requests_in_flight,)
+            )
+        self._max_requests_in_flight = max_requests_in_flight
+
+    @property
+    def max_requests_in_flight(self):
+        """
+        An :obj:`int`, the maximum number of outstanding :meth:`mpi4py.MPI.Win.Rget` requests.
+        """
+        return self._max_requests_in_flight
+
+    def begin_axis(self, axis, comm, dst_buffer, rank_logger):
+        """
+        Opens the :meth:`mpi4py.MPI.Win.Lock_all` epoch and issues
+        the :meth:`mpi4py.MPI.Win.Rget` fetches for axis :samp:`{axis}`. Waits
+        for a request to complete whenever :attr:`max_requests_in_flight`
+        requests are outstanding.
+
+        :rtype: :obj:`list`
+        :return: The outstanding :obj:`mpi4py.MPI.Request` objects.
+        """
+        inter_locale_win = comm[0]
+        rank_logger.debug("BEG: Lock_all(_mpi.MODE_NOCHECK)...")
+        inter_locale_win.Lock_all(_mpi.MODE_NOCHECK)
+        rank_logger.debug("END: Lock_all(_mpi.MODE_NOCHECK).")
+        requests = []
+        for target_rank, dst_data_type, src_data_type in self._axis_transfers[axis]:
+            if len(requests) >= self.max_requests_in_flight:
+                requests.pop(_mpi.Request.Waitany(requests))
+            requests.append(
+                inter_locale_win.Rget(
+                    [dst_buffer, 1, dst_data_type],
+                    target_rank,
+                    [0, 1, src_data_type]
+                )
+            )
+        return requests
+
+    def end_axis(self, axis, requests, comm, rank_logger):
+        """
+        Waits for the outstanding :samp:`{requests}`, closes the passive target epoch
+        and synchronises (barrier) the :samp:`inter_locale_comm` ranks.
+        """
+        inter_locale_win, inter_locale_comm = comm
+        rank_logger.debug("BEG: Waitall axis=%s, num requests=%s...", axis, len(requests))
+        _mpi.Request.Waitall(requests)
+        rank_logger.debug("END: Waitall axis=%s, num requests=%s.", axis, len(requests))
+        inter_locale_win.Unlock_all()
+        rank_logger.debug("BEG: inter_locale_comm.barrier()...")
+        inter_locale_comm.barrier()
+        rank_logger.debug("END: inter_locale_comm.barrier().")
+
+
+class PerAxisRmaRgetHaloUpdater(PerAxisRmaHaloUpdater):
+
+    """
+    Helper class for performing halo data transfer using
+    request-based RMA (:meth:`mpi4py.MPI.Win.Rget`) in passive
+    target epochs, see :obj:`RmaRgetHaloUpdatePlan`.
+    """
+
+    def __init__(
+        self,
+        locale_extents,
+        dtype,
+        order,
+        inter_locale_win,
+        inter_locale_comm,
+        dst_buffer,
+        single_epoch=False,
+        max_message_bytes=None,
+        max_requests_in_flight=16,
+        periods=None
+    ):
+        """
+        Initialise.
+
+        :type locale_extents: sequence of :obj:`mpi_array.distributon.LocaleExtent`
+        :param locale_extents: See :meth:`PerAxisRmaHaloUpdater.__init__`.
+        :type dtype: :obj:`numpy.dtype`
+        :param dtype: Data type of elements in array.
+        :type order: :obj:`str`
+        :param order: The array order, :samp:`'C'` for C memory layout.
+        :type inter_locale_win: :obj:`mpi4py.MPI.Win`
+        :param inter_locale_win: The window used to exchange halo element data.
+        :type inter_locale_comm: :obj:`mpi4py.MPI.Comm`
+        :param inter_locale_comm: The communicator used to synchronise the epochs.
+        :type dst_buffer: :obj:`memoryview`
+        :param dst_buffer: The buffer into which the halo elements are written.
+        :type single_epoch: :obj:`bool`
+        :param single_epoch: See :meth:`PerAxisRmaHaloUpdater.__init__`.
+        :type max_message_bytes: :obj:`int`
+        :param max_message_bytes: See :meth:`PerAxisRmaHaloUpdater.__init__`.
+        :type max_requests_in_flight: :obj:`int`
+        :param max_requests_in_flight: See :meth:`RmaRgetHaloUpdatePlan.__init__`.
+        :type periods: sequence of :obj:`bool`
+        :param periods: See :meth:`PerAxisRmaHaloUpdater.__init__`.
+        """
+        PerAxisRmaHaloUpdater.__init__(
+            self,
+            locale_extents=locale_extents,
+            dtype=dtype,
+            order=order,
+            inter_locale_win=inter_locale_win,
+            dst_buffer=dst_buffer,
+            single_epoch=single_epoch,
+            max_message_bytes=max_message_bytes,
+            periods=periods
+        )
+        self._inter_locale_comm = inter_locale_comm
+        self._max_requests_in_flight = max_requests_in_flight
+
+    @property
+    def max_requests_in_flight(self):
+        """
+        An :obj:`int`, the maximum number of outstanding :meth:`mpi4py.MPI.Win.Rget` requests.
+        """
+        return self._max_requests_in_flight
+
+    def calc_halo_update_plan_key(self, inter_locale_rank):
+        """
+        Extends :meth:`PerAxisRmaHaloUpdater.calc_halo_update_plan_key`
+        with :attr:`max_requests_in_flight`.
+        """
+        return \
+            (
+                PerAxisRmaHaloUpdater.calc_halo_update_plan_key(self, inter_locale_rank)
+                +
+                (self.max_requests_in_flight,)
+            )
+
+    def calc_halo_update_plan(self, inter_locale_rank, depth=None):
+        """
+        Calculates the persistent request-based RMA halo exchange plan for
+        rank :samp:`{inter_locale_rank}`.
+
+        :type inter_locale_rank: :obj:`int`
+        :param inter_locale_rank: Rank (of :samp:`inter_locale_comm`) for
+           which the plan is calculated.
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: See :meth:`PerAxisRmaHaloUpdater.calc_halo_update_plan`.
+        :rtype: :obj:`RmaRgetHaloUpdatePlan`
+        :return: Plan which can be replayed to perform halo exchange.
+        """
+        rma_plan = PerAxisRmaHaloUpdater.calc_halo_update_plan(self, inter_locale_rank, depth)
+        plan = \
+            RmaRgetHaloUpdatePlan(
+                rma_plan.axis_transfers,
+                max_requests_in_flight=self.max_requests_in_flight
+            )
+        # The plan holds duplicates of the (intermediate plan) data types.
+        rma_plan.free()
+        return plan
+
+    @property
+    def halo_comm(self):
+        """
+        The :samp:`(inter_locale_win, inter_locale_comm)` pair used to exchange halo data.
+        """
+        return (self._inter_locale_win, self._inter_locale_comm)
+
+    def calc_halo_group_update_plan(self, updaters, depth=None):
+        """
+        Over-rides :meth:`PerAxisRmaHaloUpdater.calc_halo_group_update_plan` to
+        return a :obj:`RmaRgetHaloGroupUpdatePlan`.
+        """
+        return \
+            (
+                RmaRgetHaloGroupUpdatePlan([u.calc_group_member_plan(depth) for u in updaters]),
+                [u.halo_comm for u in updaters],
+                [u.dst_buffer for u in updaters]
+            )
+
+
+class HaloGroupUpdatePlan(HaloUpdatePlan):
+
+    """
+    Halo exchange plan for a group of arrays which share a distribution. For each
+    exchange axis, the transfers of all arrays are initiated before any are
+    completed, so the arrays are exchanged within a common epoch. The :samp:`comm`
+    and :samp:`dst_buffer` arguments of :meth:`begin_axis` and :meth:`end_axis` are
+    sequences with one element per array.
+    """
 
-    @property
-    def dst_buffer(self):
+    def __init__(self, plans):
         """
-        A :obj:`memoryview` which provides the buffer
-        into which the halo data is written.
+        Initialise.
+
+        :type plans: sequence of :obj:`HaloUpdatePlan`
+        :param plans: The (per array) plans, all with the same :attr:`exchange_axes`.
         """
-        return self._dst_buffer
+        self._plans = tuple(plans)
+        axis_transfers = \
+            [
+                tuple(p.axis_transfers[a] for p in self._plans)
+                if any(p.axis_transfers[a] is not None for p in self._plans) else None
+                for a in range(len(self._plans[0].axis_transfers))
+            ]
+        HaloUpdatePlan.__init__(self, axis_transfers)
 
     @property
-    def halo_updates(self):
+    def plans(self):
         """
-        The :samp:`(rank_2_updates_dict, bool_sequence)` pair calculated
-        by :meth:`calc_halo_updates`.
+        The :obj:`tuple` of per-array :obj:`HaloUpdatePlan` objects.
         """
-        if self._halo_updates is None:
-            self._halo_updates, self._have_axis_updates = self.calc_halo_updates()
+        return self._plans
 
-        return self._halo_updates
+    def begin_axis(self, axis, comm, dst_buffer, rank_logger):
+        """
+        Initiates the halo exchange for axis :samp:`{axis}` of all plans.
 
-    def update_halos(self):
+        :rtype: :obj:`list`
+        :return: The per-plan states.
         """
-        Performs the data exchange required to update the halo (ghost)
-        elements of the array buffer :attr:`dst_buffer`:samp:`.buffer`.
-        Can be called :samp:`peer_comm` collectively.
+        return \
+            [
+                p.begin_axis(axis, c, b, rank_logger)
+                if p.axis_transfers[axis] is not None else None
+                for p, c, b in zip(self._plans, comm, dst_buffer)
+            ]
+
+    def end_axis(self, axis, state, comm, rank_logger):
+        """
+        Completes the halo exchange for axis :samp:`{axis}` of all plans.
         """
-        self.do_update_halos(self.halo_updates)
+        for p, s, c in zip(self._plans, state, comm):
+            if p.axis_transfers[axis] is not None:
+                p.end_axis(axis, s, c, rank_logger)
 
-    def do_update_halos(self, halo_updates):
+    def free(self):
         """
-        Performs the data exchange required to update the halo (ghost)
-        elements of the array buffer :attr:`dst_buffer`:samp:`.buffer`.
-        Can be called :samp:`peer_comm` collectively.
-
-        :type halo_updates: :obj:`mpi_array.update.MpiHalosUpdate`
-        :param halo_updates: A :obj:`dict` of per :samp:`inter_locale_rank`
-           halo region updates. See :meth:`calc_halo_updates`.
-        """
-        if halo_updates is not None:
-            # Get the halo updates for this rank
-            rank_inter_locale_updates = halo_updates[self._inter_locale_win.group.rank]
-            # Get the updates separated into per-axis (hyper-slab) updates
-            rank_updates_per_axis = rank_inter_locale_updates.updates_per_axis
-
-            # rank_updates_per_axis is None, on *all* inter_locale_win.group ranks,
-            # when there are no halos on any axis.
-            if rank_updates_per_axis is not None:
-                for a in range(len(rank_updates_per_axis)):
-                    lo_hi_updates_pair = rank_updates_per_axis[a]
-
-                    # When axis doesn't have a halo then lo_hi_updates_pair
-                    # is None on all inter_locale_comm ranks, and we avoid calling the Fence
-                    # in this case
-                    if lo_hi_updates_pair is not None:
-                        axis_inter_locale_rank_updates = \
-                            lo_hi_updates_pair[rank_inter_locale_updates.LO] + \
-                            lo_hi_updates_pair[rank_inter_locale_updates.HI]
-                        self.rank_logger.debug(
-                            "BEG: Fence(_mpi.MODE_NOPUT | _mpi.MODE_NOPRECEDE)..."
-                        )
-                        self._inter_locale_win.Fence(
-                            _mpi.MODE_NOPUT | _mpi.MODE_NOPRECEDE)
-                        self.rank_logger.debug(
-                            "END: Fence(_mpi.MODE_NOPUT | _mpi.MODE_NOPRECEDE)..."
-                        )
-                        for single_update in axis_inter_locale_rank_updates:
-                            single_update.initialise_data_types(self.dtype, self.order)
-                            self.rank_logger.debug(
-                                "BEG: Getting update:\n%s\n%s",
-                                single_update._header_str,
-                                single_update
-                            )
-                            self._inter_locale_win.Get(
-                                [self._dst_buffer, 1, single_update.dst_data_type],
-                                single_update.src_extent.cart_rank,
-                                [0, 1, single_update.src_data_type]
-                            )
-                            self.rank_logger.debug(
-                                "END: Getting update:\n%s\n%s",
-                                single_update._header_str,
-                                single_update
-                            )
-                        self.rank_logger.debug(
-                            "BEG: Fence(_mpi.MODE_NOSUCCEED)."
-                        )
-                        self._inter_locale_win.Fence(_mpi.MODE_NOSUCCEED)
-                        self.rank_logger.debug(
-                            "END: Fence(_mpi.MODE_NOSUCCEED)."
-                        )
+        Releases resources held by this plan, including the (owned) per-array :attr:`plans`.
+        """
+        for p in self._plans:
+            p.free()
+        HaloUpdatePlan.free(self)
+
+
+class RmaRgetHaloGroupUpdatePlan(HaloGroupUpdatePlan):
+
+    """
+    Group plan for :obj:`RmaRgetHaloUpdatePlan` plans. The passive target epochs
+    of all the windows are completed with a single :samp:`inter_locale_comm`
+    barrier per exchange axis.
+    """
+
+    def end_axis(self, axis, state, comm, rank_logger):
+        """
+        Waits for all outstanding requests, closes the passive target epoch
+        of each window and synchronises (barrier) the :samp:`inter_locale_comm` ranks.
+        """
+        requests = sum([s for s in state if s is not None], [])
+        rank_logger.debug("BEG: Waitall axis=%s, num requests=%s...", axis, len(requests))
+        _mpi.Request.Waitall(requests)
+        rank_logger.debug("END: Waitall axis=%s, num requests=%s.", axis, len(requests))
+        for p, (inter_locale_win, inter_locale_comm) in zip(self._plans, comm):
+            if p.axis_transfers[axis] is not None:
+                inter_locale_win.Unlock_all()
+        rank_logger.debug("BEG: inter_locale_comm.barrier()...")
+        comm[0][1].barrier()
+        rank_logger.debug("END: inter_locale_comm.barrier().")
+
+
+class P2pHaloGroupUpdatePlan(P2pHaloUpdatePlan):
+
+    """
+    Group plan for :obj:`P2pHaloUpdatePlan` plans. The (per axis) transfers to/from
+    each neighbour rank, of all arrays, are combined into a
+    single :meth:`mpi4py.MPI.Datatype.Create_struct` data type (with absolute
+    addresses), so there is a single message per neighbour. The plan is
+    executed with :samp:`dst_buffer=mpi4py.MPI.BOTTOM`.
+    """
+
+    def __init__(self, plans, dst_buffers):
+        """
+        Initialise.
+
+        :type plans: sequence of :obj:`P2pHaloUpdatePlan`
+        :param plans: The (per array) plans, all with the same :attr:`exchange_axes`,
+           the plans are freed once the struct data types have been created.
+        :type dst_buffers: sequence of :obj:`memoryview`
+        :param dst_buffers: The (per array) buffers, :samp:`dst_buffers[i]` is the
+           buffer for :samp:`plans[i]`.
+        """
+        addresses = [_mpi.Get_address(b) for b in dst_buffers]
+        struct_data_types = []
+        axis_transfers = [None, ] * len(plans[0].axis_transfers)
+        for a in range(len(axis_transfers)):
+            if any(p.axis_transfers[a] is not None for p in plans):
+                recvs = _collections.OrderedDict()
+                sends = _collections.OrderedDict()
+                for p, address in zip(plans, addresses):
+                    if p.axis_transfers[a] is not None:
+                        for rank, data_type in p.axis_transfers[a][0]:
+                            recvs.setdefault(rank, []).append((address, data_type))
+                        for rank, data_type in p.axis_transfers[a][1]:
+                            sends.setdefault(rank, []).append((address, data_type))
+                recvs = tuple((r, self.create_struct_data_type(recvs[r])) for r in recvs.keys())
+                sends = tuple((r, self.create_struct_data_type(sends[r])) for r in sends.keys())
+                axis_transfers[a] = (recvs, sends)
+                struct_data_types += [dt for _, dt in recvs + sends]
+        for p in plans:
+            p.free()
+        # The struct data types are created by (and owned by) this plan, no duplicates.
+        HaloUpdatePlan.__init__(self, axis_transfers)
+        self._data_types = struct_data_types
+
+    def create_struct_data_type(self, address_data_type_pairs):
+        """
+        Returns a committed :obj:`mpi4py.MPI.Datatype` which combines
+        the :samp:`(address, data_type)` pairs.
+
+        :type address_data_type_pairs: sequence of :obj:`tuple`
+        :param address_data_type_pairs: The :samp:`(address, data_type)` pairs.
+        :rtype: :obj:`mpi4py.MPI.Datatype`
+        :return: Struct data type, addresses are absolute (relative to :attr:`mpi4py.MPI.BOTTOM`).
+        """
+        data_type = \
+            _mpi.Datatype.Create_struct(
+                [1, ] * len(address_data_type_pairs),
+                [address for address, _ in address_data_type_pairs],
+                [dt for _, dt in address_data_type_pairs]
+            )
+        data_type.Commit()
+
+        return data_type
+
+
+#: Halo exchange engine, :meth:`mpi4py.MPI.Win.Fence` epochs and :meth:`mpi4py.MPI.Win.Get`.
+HALO_ENGINE_RMA = "rma"
+
+#: Halo exchange engine, :meth:`mpi4py.MPI.Comm.Isend` and :meth:`mpi4py.MPI.Comm.Irecv`.
+HALO_ENGINE_P2P = "p2p"
+
+#: Halo exchange engine, :meth:`mpi4py.MPI.Win.Lock_all` epochs and :meth:`mpi4py.MPI.Win.Rget`.
+HALO_ENGINE_RMA_RGET = "rma_rget"
+
+#: Maps halo engine name to :obj:`PerAxisRmaHaloUpdater` (sub-)class.
+_halo_engine_to_updater_type = \
+    {
+        HALO_ENGINE_RMA: PerAxisRmaHaloUpdater,
+        HALO_ENGINE_P2P: PerAxisP2pHaloUpdater,
+        HALO_ENGINE_RMA_RGET: PerAxisRmaRgetHaloUpdater,
+    }
+
+_default_halo_engine = HALO_ENGINE_RMA
+
+
+def check_halo_engine(halo_engine):
+    """
+    Raises :obj:`ValueError` if :samp:`{halo_engine}` is not a valid halo engine name.
+
+    :type halo_engine: :obj:`str`
+    :param halo_engine: One of :attr:`HALO_ENGINE_RMA`, :attr:`HALO_ENGINE_P2P`
+       or :attr:`HALO_ENGINE_RMA_RGET`.
+    """
+    if halo_engine not in _halo_engine_to_updater_type.keys():
+        raise ValueError(
+            "Got halo_engine=%s, expected one of %s."
+            %
+            (halo_engine, sorted(_halo_engine_to_updater_type.keys()))
+        )
+
+
+def get_default_halo_engine():
+    """
+    Returns the default halo engine used by :meth:`gndarray.update`.
+
+    :rtype: :obj:`str`
+    :return: One of :attr:`HALO_ENGINE_RMA`, :attr:`HALO_ENGINE_P2P`
+       or :attr:`HALO_ENGINE_RMA_RGET`.
+    """
+    return _default_halo_engine
+
+
+def set_default_halo_engine(halo_engine):
+    """
+    Sets the default halo engine used by :meth:`gndarray.update` (for
+    arrays which do not have an explicit :attr:`gndarray.halo_engine` set).
+
+    :type halo_engine: :obj:`str`
+    :param halo_engine: One of :attr:`HALO_ENGINE_RMA`, :attr:`HALO_ENGINE_P2P`
+       or :attr:`HALO_ENGINE_RMA_RGET`.
+    """
+    global _default_halo_engine
+    check_halo_engine(halo_engine)
+    _default_halo_engine = halo_engine
+
+
+#: Redistribution engine, passive target :meth:`mpi4py.MPI.Win.Get` of remote regions.
+REDISTRIBUTE_ENGINE_RMA = "rma"
+
+#: Redistribution engine, single :meth:`mpi4py.MPI.Comm.Alltoallw` of remote regions.
+REDISTRIBUTE_ENGINE_ALLTOALLW = "alltoallw"
+
+#: Redistribution engine, :attr:`REDISTRIBUTE_ENGINE_ALLTOALLW` for dense
+#: communication graphs, :attr:`REDISTRIBUTE_ENGINE_RMA` otherwise.
+REDISTRIBUTE_ENGINE_AUTO = "auto"
+
+_redistribute_engines = \
+    (REDISTRIBUTE_ENGINE_RMA, REDISTRIBUTE_ENGINE_ALLTOALLW, REDISTRIBUTE_ENGINE_AUTO)
+
+_default_redistribute_engine = REDISTRIBUTE_ENGINE_AUTO
+
+
+def check_redistribute_engine(redistribute_engine):
+    """
+    Raises :obj:`ValueError` if :samp:`{redistribute_engine}` is not
+    a valid redistribution engine name.
+
+    :type redistribute_engine: :obj:`str`
+    :param redistribute_engine: One of :attr:`REDISTRIBUTE_ENGINE_RMA`,
+       :attr:`REDISTRIBUTE_ENGINE_ALLTOALLW` or :attr:`REDISTRIBUTE_ENGINE_AUTO`.
+    """
+    if redistribute_engine not in _redistribute_engines:
+        raise ValueError(
+            "Got redistribute_engine=%s, expected one of %s."
+            %
+            (redistribute_engine, sorted(_redistribute_engines))
+        )
+
+
+def get_default_redistribute_engine():
+    """
+    Returns the default redistribution engine used by :meth:`gndarray.copyfrom`.
+
+    :rtype: :obj:`str`
+    :return: One of :attr:`REDISTRIBUTE_ENGINE_RMA`,
+       :attr:`REDISTRIBUTE_ENGINE_ALLTOALLW` or :attr:`REDISTRIBUTE_ENGINE_AUTO`.
+    """
+    return _default_redistribute_engine
+
+
+def set_default_redistribute_engine(redistribute_engine):
+    """
+    Sets the default redistribution engine used by :meth:`gndarray.copyfrom` (for
+    plans which do not have an explicit :attr:`RmaRedistributeUpdater.engine` set).
+
+    :type redistribute_engine: :obj:`str`
+    :param redistribute_engine: One of :attr:`REDISTRIBUTE_ENGINE_RMA`,
+       :attr:`REDISTRIBUTE_ENGINE_ALLTOALLW` or :attr:`REDISTRIBUTE_ENGINE_AUTO`.
+    """
+    global _default_redistribute_engine
+    check_redistribute_engine(redistribute_engine)
+    _default_redistribute_engine = redistribute_engine
+
+
+#: Redistribution synchronisation, :samp:`peer_comm` barriers around the copy phases.
+REDISTRIBUTE_SYNC_BARRIER = "barrier"
+
+#: Redistribution synchronisation, generalized active
+#: target (:meth:`mpi4py.MPI.Win.Post`, :meth:`mpi4py.MPI.Win.Start`,
+#: :meth:`mpi4py.MPI.Win.Complete`, :meth:`mpi4py.MPI.Win.Wait`) between
+#: only the ranks which exchange elements, plus :samp:`intra_locale_comm` barriers.
+REDISTRIBUTE_SYNC_PSCW = "pscw"
+
+_redistribute_syncs = (REDISTRIBUTE_SYNC_BARRIER, REDISTRIBUTE_SYNC_PSCW)
+
+_default_redistribute_sync = REDISTRIBUTE_SYNC_BARRIER
+
+
+def check_redistribute_sync(redistribute_sync):
+    """
+    Raises :obj:`ValueError` if :samp:`{redistribute_sync}` is not
+    a valid redistribution synchronisation name.
+
+    :type redistribute_sync: :obj:`str`
+    :param redistribute_sync: One of :attr:`REDISTRIBUTE_SYNC_BARRIER`
+       or :attr:`REDISTRIBUTE_SYNC_PSCW`.
+    """
+    if redistribute_sync not in _redistribute_syncs:
+        raise ValueError(
+            "Got redistribute_sync=%s, expected one of %s."
+            %
+            (redistribute_sync, sorted(_redistribute_syncs))
+        )
+
+
+def get_default_redistribute_sync():
+    """
+    Returns the default redistribution synchronisation used by :meth:`gndarray.copyfrom`.
+
+    :rtype: :obj:`str`
+    :return: One of :attr:`REDISTRIBUTE_SYNC_BARRIER` or :attr:`REDISTRIBUTE_SYNC_PSCW`.
+    """
+    return _default_redistribute_sync
+
+
+def set_default_redistribute_sync(redistribute_sync):
+    """
+    Sets the default redistribution synchronisation used by :meth:`gndarray.copyfrom` (for
+    plans which do not have an explicit :attr:`RmaRedistributeUpdater.sync` set).
+
+    :type redistribute_sync: :obj:`str`
+    :param redistribute_sync: One of :attr:`REDISTRIBUTE_SYNC_BARRIER`
+       or :attr:`REDISTRIBUTE_SYNC_PSCW`.
+    """
+    global _default_redistribute_sync
+    check_redistribute_sync(redistribute_sync)
+    _default_redistribute_sync = redistribute_sync
 
 
 class RankTranslator(object):
@@ -326,6 +1745,65 @@ class RankTranslator(object):
         return self._src_group
 
 
+def _calc_distribution_key(distribution):
+    """
+    Returns a hashable key for the locale extents (and locale peer ranks)
+    of :samp:`{distribution}`.
+    """
+    return \
+        (
+            tuple(extent.to_tuple() for extent in distribution.locale_extents),
+            tuple(
+                tuple(_np.asarray(peer_ranks).tolist())
+                for peer_ranks in distribution.peer_ranks_per_locale
+            )
+        )
+
+
+def _calc_comm_key(comm):
+    """
+    Returns a hashable key for the processes (:samp:`COMM_WORLD` ranks) of :samp:`{comm}`.
+    """
+    return \
+        tuple(
+            _mpi.Group.Translate_ranks(comm.group, range(comm.size), _mpi.COMM_WORLD.group)
+        )
+
+
+def calc_redistribute_plan_key(dst, src, casting="same_kind"):
+    """
+    Returns the key under which the :obj:`RmaRedistributeUpdater` plan
+    which copies elements from :samp:`{src}` to :samp:`{dst}` is cached,
+    see :meth:`gndarray.get_copyfrom_plan`.
+
+    :type dst: :obj:`gndarray`
+    :param dst: Array which receives elements.
+    :type src: :obj:`gndarray`
+    :param src: Array from which elements are copied.
+    :type casting: :obj:`str`
+    :param casting: See :samp:`{casting}` parameter in :func:`numpy.copyto`.
+    :rtype: :obj:`tuple`
+    :return: Hashable key which identifies the plan.
+    """
+    return \
+        (
+            type(dst),
+            casting,
+            _np.dtype(dst.dtype),
+            _np.dtype(src.dtype),
+            dst.lndarray_proxy.md.order,
+            src.lndarray_proxy.md.order,
+            _calc_distribution_key(dst.distribution),
+            _calc_distribution_key(src.distribution),
+            _calc_comm_key(dst.locale_comms.peer_comm),
+            _calc_comm_key(src.locale_comms.peer_comm)
+        )
+
+
+#: Cache of :obj:`RmaRedistributeUpdater` plans, see :meth:`gndarray.get_copyfrom_plan`.
+_redistribute_plan_cache = PlanCache(max_size=16)
+
+
 class RmaRedistributeUpdater(_UpdatesForRedistribute):
 
     """
@@ -333,6 +1811,9 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
     Calculates sequence of :obj:`mpi_array.distribution.ExtentUpdate`
     objects which are used to copy elements from
     remote :samp:`{src}` locales to local :samp:`{dst}` locales.
+    The updates (and MPI data types) only depend on the distributions,
+    so an instance can be re-used as a plan for copying between any
+    pair of arrays with the same :meth:`plan_key`, see :meth:`bind`.
     """
 
     def __init__(self, dst, src, casting="same_kind"):
@@ -341,22 +1822,39 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
         self._dst = dst
         self._src = src
         self._casting = casting
+        self._plan_key = calc_redistribute_plan_key(dst, src, casting)
         self._mpi_pair_extent_update_type = _MpiPairExtentUpdate
         self._max_outstanding_requests = 32 * 32
         self._min_outstanding_requests_per_proc = 2
         self._max_ranks_per_inter_locale_sub_group = 128
+        self._engine = None
+        self._alltoallw_min_density = 0.5
+        self._rma_lock_all = True
+        self._alltoallw_data_types = None
+        self._alltoallw_struct_data_types = []
+        self._max_chunk_elements = _MpiPairExtentUpdateDifferentDtypes.default_max_chunk_elements
+        self._sync = None
+        self._pscw_groups = None
         if self._dst.dtype != self._src.dtype:
             self._mpi_pair_extent_update_type = _MpiPairExtentUpdateDifferentDtypes
 
+        peer_rank_translator = \
+            RankTranslator(
+                self._dst.locale_comms.peer_comm.group,
+                self._src.locale_comms.peer_comm.group
+            )
         _UpdatesForRedistribute.__init__(
             self,
             dst.comms_and_distrib.distribution,
             src.comms_and_distrib.distribution,
-            peer_rank_translator=RankTranslator(
-                self._dst.locale_comms.peer_comm.group,
-                self._src.locale_comms.peer_comm.group
-            )
+            peer_rank_translator=peer_rank_translator
         )
+        # The src peer_comm rank of the dst locale process which receives
+        # the remote updates (for each dst inter_locale_rank).
+        self._dst_receiver_src_peer_ranks = \
+            peer_rank_translator.dst_to_src(
+                [extent.peer_rank for extent in self._dst_distrib.locale_extents]
+            )
         self._inter_win = self._src.rma_window_buffer.peer_win
         self._max_outstanding_requests_per_proc = \
             _np.max(
@@ -371,6 +1869,217 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
         seed_str = seed_str[0:-len(rank_str)] + rank_str[::-1]
         self._random_state = _np.random.RandomState(seed=int(seed_str))
 
+    @property
+    def plan_key(self):
+        """
+        The :obj:`tuple` key (see :func:`calc_redistribute_plan_key`) of
+        the arrays for which this plan was calculated.
+        """
+        return self._plan_key
+
+    @property
+    def casting(self):
+        """
+        A :obj:`str`, the :samp:`{casting}` argument of :func:`numpy.copyto`.
+        """
+        return self._casting
+
+    @property
+    def engine(self):
+        """
+        A :obj:`str`, the redistribution engine (:attr:`REDISTRIBUTE_ENGINE_RMA`,
+        :attr:`REDISTRIBUTE_ENGINE_ALLTOALLW` or :attr:`REDISTRIBUTE_ENGINE_AUTO`),
+        :samp:`None` indicates :func:`get_default_redistribute_engine`.
+        """
+        return self._engine
+
+    @engine.setter
+    def engine(self, engine):
+        if engine is not None:
+            check_redistribute_engine(engine)
+        self._engine = engine
+
+    @property
+    def sync(self):
+        """
+        A :obj:`str`, the synchronisation used by :meth:`do_update`
+        (:attr:`REDISTRIBUTE_SYNC_BARRIER` or :attr:`REDISTRIBUTE_SYNC_PSCW`),
+        :samp:`None` indicates :func:`get_default_redistribute_sync`.
+        """
+        return self._sync
+
+    @sync.setter
+    def sync(self, sync):
+        if sync is not None:
+            check_redistribute_sync(sync)
+        self._sync = sync
+
+    def calc_sync(self):
+        """
+        Returns the synchronisation used by :meth:`do_update`. Plans for
+        arrays with different :samp:`dtype` fetch (cast) remote regions
+        using request-based gets (see :obj:`mpi_array.update.MpiPairExtentUpdateDifferentDtypes`)
+        which require passive target epochs, these
+        plans always use :attr:`REDISTRIBUTE_SYNC_BARRIER`.
+        Same result on all ranks.
+
+        :rtype: :obj:`str`
+        :return: :attr:`REDISTRIBUTE_SYNC_BARRIER` or :attr:`REDISTRIBUTE_SYNC_PSCW`.
+        """
+        sync = self._sync
+        if sync is None:
+            sync = get_default_redistribute_sync()
+        if self._mpi_pair_extent_update_type is not _MpiPairExtentUpdate:
+            sync = REDISTRIBUTE_SYNC_BARRIER
+
+        return sync
+
+    def calc_pscw_groups(self):
+        """
+        Returns the :samp:`(access_group, exposure_group)` pair
+        of :obj:`mpi4py.MPI.Group` (of the :samp:`src` :samp:`peer_comm`) for
+        this rank. The access group contains the ranks from which this
+        rank fetches remote regions, the exposure group contains the ranks which
+        fetch remote regions from this rank. Calculated (from the remote updates)
+        once and stored with the plan.
+
+        :rtype: :obj:`tuple`
+        :return: :samp:`(access_group, exposure_group)` pair.
+        """
+        if self._pscw_groups is None:
+            my_src_peer_rank = self._src.locale_comms.peer_comm.rank
+            access_ranks = set()
+            exposure_ranks = set()
+            for dst_rank in self._dst_rget_updates.keys():
+                receiver_rank = self._dst_receiver_src_peer_ranks[dst_rank]
+                for update in self._dst_rget_updates[dst_rank]:
+                    if receiver_rank == my_src_peer_rank:
+                        access_ranks.add(update.src_extent.peer_rank)
+                    if update.src_extent.peer_rank == my_src_peer_rank:
+                        exposure_ranks.add(receiver_rank)
+            group = self._src.locale_comms.peer_comm.group
+            self._pscw_groups = \
+                (
+                    group.Incl(sorted(access_ranks)),
+                    group.Incl(sorted(exposure_ranks))
+                )
+            group.Free()
+
+        return self._pscw_groups
+
+    @property
+    def rma_lock_all(self):
+        """
+        A :obj:`bool`, the :attr:`mpi_array.update.RmaUpdateExecutor.lock_all`
+        mode used by :meth:`do_locale_rma_update`, default :samp:`True`.
+        """
+        return self._rma_lock_all
+
+    @rma_lock_all.setter
+    def rma_lock_all(self, lock_all):
+        self._rma_lock_all = bool(lock_all)
+
+    @property
+    def max_chunk_elements(self):
+        """
+        An :obj:`int` (or :samp:`None`), the
+        :attr:`mpi_array.update.MpiPairExtentUpdateDifferentDtypes.max_chunk_elements`
+        of the (casting) remote updates, only relevant when the :samp:`dtype` of
+        the source and destination arrays differ.
+        """
+        return self._max_chunk_elements
+
+    @max_chunk_elements.setter
+    def max_chunk_elements(self, max_chunk_elements):
+        if (max_chunk_elements is not None) and (max_chunk_elements < 1):
+            raise ValueError(
+                "Got max_chunk_elements=%s, require max_chunk_elements >= 1."
+                %
+                (max_chunk_elements,)
+            )
+        self._max_chunk_elements = max_chunk_elements
+        for updates in self._dst_rget_updates.values():
+            for update in _iter_pair_extent_updates(updates):
+                if isinstance(update, _MpiPairExtentUpdateDifferentDtypes):
+                    update.max_chunk_elements = max_chunk_elements
+
+    def calc_communication_density(self):
+        """
+        Returns the fraction of (dst locale, src locale) pairs which
+        exchange (remote) elements, pairs which are updated by direct
+        (shared memory) copy are excluded.
+
+        :rtype: :obj:`float`
+        :return: Density of the communication graph, in the range :samp:`[0, 1]`.
+        """
+        def calc_pairs(updates_dict):
+            return \
+                set(
+                    (dst_rank, update.src_extent.inter_locale_rank)
+                    for dst_rank in updates_dict.keys()
+                    for update in updates_dict[dst_rank]
+                )
+        num_pairs = \
+            (
+                len(self._dst_distrib.locale_extents) * len(self._src_distrib.locale_extents)
+                -
+                len(calc_pairs(self._dst_cpy2_updates))
+            )
+
+        return len(calc_pairs(self._dst_rget_updates)) / float(max((num_pairs, 1)))
+
+    def calc_engine(self):
+        """
+        Returns the redistribution engine used by :meth:`do_update`, resolves
+        :attr:`REDISTRIBUTE_ENGINE_AUTO` to :attr:`REDISTRIBUTE_ENGINE_ALLTOALLW`
+        when :meth:`calc_communication_density` is at least :samp:`0.5`.
+        The :attr:`REDISTRIBUTE_ENGINE_ALLTOALLW` engine is only used when
+        the source and destination arrays have the same :samp:`dtype`.
+        Same result on all ranks.
+
+        :rtype: :obj:`str`
+        :return: :attr:`REDISTRIBUTE_ENGINE_RMA` or :attr:`REDISTRIBUTE_ENGINE_ALLTOALLW`.
+        """
+        engine = self._engine
+        if engine is None:
+            engine = get_default_redistribute_engine()
+        if engine == REDISTRIBUTE_ENGINE_AUTO:
+            engine = REDISTRIBUTE_ENGINE_RMA
+            if self.calc_communication_density() >= self._alltoallw_min_density:
+                engine = REDISTRIBUTE_ENGINE_ALLTOALLW
+        if self._mpi_pair_extent_update_type is not _MpiPairExtentUpdate:
+            engine = REDISTRIBUTE_ENGINE_RMA
+
+        return engine
+
+    def bind(self, dst, src):
+        """
+        Binds this plan to the :samp:`{dst}` and :samp:`{src}` arrays,
+        so that :meth:`do_update` copies elements from :samp:`{src}` to :samp:`{dst}`.
+
+        :type dst: :obj:`gndarray`
+        :param dst: Array which receives elements.
+        :type src: :obj:`gndarray`
+        :param src: Array from which elements are copied.
+        :raises ValueError: If :samp:`{dst}` and :samp:`{src}` do not match
+           the :meth:`plan_key` of this plan.
+        """
+        if calc_redistribute_plan_key(dst, src, self._casting) != self._plan_key:
+            raise ValueError(
+                "Arrays are incompatible with plan, mismatching distribution, dtype or order."
+            )
+        self._dst = dst
+        self._src = src
+        self._inter_win = self._src.rma_window_buffer.peer_win
+
+    def unbind(self):
+        """
+        Releases the references to the arrays passed to :meth:`bind`.
+        """
+        self._dst = None
+        self._src = None
+        self._inter_win = None
+
     def calc_can_use_existing_src_peer_comm(self):
         """
         Returns :samp:`True` if :samp:`self._src.locale_comms.peer_comm`
@@ -418,13 +2127,17 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
         Factory method which creates sequence of
         of :obj:`mpi_array.distribution.MpiPairExtentUpdate` objects.
         """
+        kwargs = dict()
+        if self._mpi_pair_extent_update_type is _MpiPairExtentUpdateDifferentDtypes:
+            kwargs["max_chunk_elements"] = self._max_chunk_elements
         updates = \
             [
                 self._mpi_pair_extent_update_type(
                     self._dst.distribution.locale_extents[dst_extent.inter_locale_rank],
                     self._src.distribution.locale_extents[src_extent.inter_locale_rank],
                     intersection_extent,
-                    intersection_extent
+                    intersection_extent,
+                    **kwargs
                 ),
             ]
         for update in updates:
@@ -438,6 +2151,19 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
 
         return updates
 
+    def create_pair_extent_update_group(self, updates):
+        """
+        Factory method which combines the :samp:`{updates}` into a
+        single :obj:`mpi_array.update.MpiPairExtentUpdateGroup` (one :samp:`Get`
+        per source-destination locale pair). Updates which require a
+        casting copy (different :samp:`dtype`) are returned un-grouped.
+        """
+        if self._mpi_pair_extent_update_type is _MpiPairExtentUpdate:
+            updates = [_MpiPairExtentUpdateGroup(updates), ]
+        else:
+            updates = list(updates)
+        return updates
+
     def wait_all(self, req_list):
         """
         """
@@ -453,41 +2179,41 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
 
     def do_locale_cpy2_update(self):
         """
-        Performs direct copy updates.
+        Performs direct copy updates. Each update region is split into
+        slabs (see :func:`mpi_array.update.calc_slab_extent`) which are copied in parallel
+        by the processes which are members of both the source and the destination locales
+        (i.e. the processes which have both locale arrays in shared memory).
         """
         updates = self._dst_cpy2_updates[self._dst.this_locale.inter_locale_rank]
-        my_dst_peer_rank = self._dst.locale_comms.peer_comm.rank
         my_src_peer_rank = self._src.locale_comms.peer_comm.rank
         src_lndarray = self._src.lndarray_proxy.lndarray
         dst_lndarray = self._dst.lndarray_proxy.lndarray
         for update in updates:
-            src_translated_peer_ranks = \
-                self._src_translated_peer_ranks[update.src_extent.inter_locale_rank]
             dst_translated_peer_ranks = \
                 self._dst_translated_peer_ranks[update.dst_extent.inter_locale_rank]
-            if (
-                (
-                    (my_src_peer_rank == update.src_extent.peer_rank)
-                    and
-                    (update.src_extent.peer_rank in dst_translated_peer_ranks)
-                )
-                or
-                (
-                    (my_dst_peer_rank == update.dst_extent.peer_rank)
-                    and
-                    (update.dst_extent.peer_rank in src_translated_peer_ranks)
+            copy_peer_ranks = \
+                _np.intersect1d(
+                    dst_translated_peer_ranks,
+                    self._src_peer_ranks[update.src_extent.inter_locale_rank]
                 )
-            ):
+            if my_src_peer_rank in copy_peer_ranks:
+                slab_rank = int(_np.searchsorted(copy_peer_ranks, my_src_peer_rank))
                 self._dst.rank_logger.debug(
-                    "Copying update: mdpr=%s, mspr=%s\nsrc_t_ranks=%s\ndst_t_ranks=%s\n%s\n%s",
-                    my_dst_peer_rank,
+                    "Copying update slab %s of %s: mspr=%s, copy_peer_ranks=%s\n%s\n%s",
+                    slab_rank,
+                    len(copy_peer_ranks),
                     my_src_peer_rank,
-                    src_translated_peer_ranks,
-                    dst_translated_peer_ranks,
+                    copy_peer_ranks,
                     update._header_str,
                     update
                 )
-                update.copyto(dst_lndarray, src_lndarray, casting=self._casting)
+                update.copyto(
+                    dst_lndarray,
+                    src_lndarray,
+                    casting=self._casting,
+                    slab_rank=slab_rank,
+                    num_slabs=len(copy_peer_ranks)
+                )
 
     def do_locale_rma_update(self):
         """
@@ -514,7 +2240,9 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
                     inter_win=inter_win,
                     dst_lndarray=self._dst.lndarray_proxy.lndarray,
                     src_inter_win_rank_attr="peer_rank",
-                    rank_logger=self._dst.rank_logger
+                    rank_logger=self._dst.rank_logger,
+                    lock_all=self._rma_lock_all,
+                    peer_ranks_per_locale=self._src_distrib.peer_ranks_per_locale
                 )
 
             # Fetch remote data.
@@ -532,11 +2260,212 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
             )
         self._dst.locale_comms.intra_locale_comm.barrier()
 
+    def do_locale_pscw_update(self):
+        """
+        Fetches elements from remote locales using
+        generalized active target synchronisation, only the ranks of
+        the :meth:`calc_pscw_groups` groups are synchronised with this rank.
+        """
+        can_use_existing_src_peer_comm = self.calc_can_use_existing_src_peer_comm()
+        if not can_use_existing_src_peer_comm:
+            raise RuntimeError(
+                (
+                    "can_use_existing_src_peer_comm=%s: "
+                    +
+                    "incompatible dst inter_locale_comma and src peer_comm."
+                )
+                %
+                (can_use_existing_src_peer_comm,)
+            )
+        access_group, exposure_group = self.calc_pscw_groups()
+        if exposure_group.size > 0:
+            self._dst.rank_logger.debug(
+                "BEG: Post, exposure_group.size=%s...", exposure_group.size
+            )
+            self._inter_win.Post(exposure_group, _mpi.MODE_NOPUT)
+        if self._dst.locale_comms.have_valid_inter_locale_comm and (access_group.size > 0):
+            update_executor = \
+                _RmaUpdateExecutor(
+                    inter_win=self._inter_win,
+                    dst_lndarray=self._dst.lndarray_proxy.lndarray,
+                    src_inter_win_rank_attr="peer_rank",
+                    rank_logger=self._dst.rank_logger,
+                    peer_ranks_per_locale=self._src_distrib.peer_ranks_per_locale
+                )
+            updates = self._dst_rget_updates[self._dst.this_locale.inter_locale_rank]
+            update_executor.do_locale_pscw_update(updates, access_group)
+        if exposure_group.size > 0:
+            self._inter_win.Wait()
+            self._dst.rank_logger.debug(
+                "END: Wait, exposure_group.size=%s.", exposure_group.size
+            )
+
+    def create_alltoallw_data_type(self, data_types):
+        """
+        Returns a single :obj:`mpi4py.MPI.Datatype` which combines
+        the (buffer relative) :samp:`{data_types}` regions.
+
+        :type data_types: sequence of :obj:`mpi4py.MPI.Datatype`
+        :param data_types: Sub-array data types.
+        :rtype: :obj:`mpi4py.MPI.Datatype`
+        :return: Struct data type (or the single element of :samp:`{data_types}`).
+        """
+        if len(data_types) == 1:
+            return data_types[0]
+        data_type = \
+            _mpi.Datatype.Create_struct(
+                [1, ] * len(data_types),
+                [0, ] * len(data_types),
+                list(data_types)
+            )
+        data_type.Commit()
+        self._alltoallw_struct_data_types.append(data_type)
+
+        return data_type
+
+    def calc_alltoallw_data_types(self):
+        """
+        Returns the :samp:`(send_counts, send_data_types, recv_counts, recv_data_types)`
+        arguments (for this rank of the :samp:`src` :samp:`peer_comm`) for
+        the :meth:`mpi4py.MPI.Comm.Alltoallw` call which transfers the remote updates.
+        Calculated once and stored with the plan.
+
+        :rtype: :obj:`tuple`
+        :return: Counts and data types, indexed by the rank of the :samp:`src` :samp:`peer_comm`.
+        """
+        if self._alltoallw_data_types is None:
+            comm = self._src.locale_comms.peer_comm
+            my_src_peer_rank = comm.rank
+            send_dict = _collections.defaultdict(list)
+            recv_dict = _collections.defaultdict(list)
+            for dst_rank in sorted(self._dst_rget_updates.keys()):
+                receiver_rank = self._dst_receiver_src_peer_ranks[dst_rank]
+                for update in self._dst_rget_updates[dst_rank]:
+                    if update.src_extent.peer_rank == my_src_peer_rank:
+                        send_dict[receiver_rank].append(update.src_data_type)
+                    if receiver_rank == my_src_peer_rank:
+                        recv_dict[update.src_extent.peer_rank].append(update.dst_data_type)
+
+            send_counts = [0, ] * comm.size
+            send_data_types = [_mpi.BYTE, ] * comm.size
+            recv_counts = [0, ] * comm.size
+            recv_data_types = [_mpi.BYTE, ] * comm.size
+            for rank in send_dict.keys():
+                send_counts[rank] = 1
+                send_data_types[rank] = self.create_alltoallw_data_type(send_dict[rank])
+            for rank in recv_dict.keys():
+                recv_counts[rank] = 1
+                recv_data_types[rank] = self.create_alltoallw_data_type(recv_dict[rank])
+            self._alltoallw_data_types = \
+                (send_counts, send_data_types, recv_counts, recv_data_types)
+
+        return self._alltoallw_data_types
+
+    def do_locale_alltoallw_update(self):
+        """
+        Performs a (two-sided) :meth:`mpi4py.MPI.Comm.Alltoallw` over
+        the :samp:`src` :samp:`peer_comm` to transfer elements from remote locales to
+        update the locale extent array. The update regions are the
+        same as those fetched by :meth:`do_locale_rma_update`.
+        """
+        can_use_existing_src_peer_comm = self.calc_can_use_existing_src_peer_comm()
+        if not can_use_existing_src_peer_comm:
+            raise RuntimeError(
+                (
+                    "can_use_existing_src_peer_comm=%s: "
+                    +
+                    "incompatible dst inter_locale_comma and src peer_comm."
+                )
+                %
+                (can_use_existing_src_peer_comm,)
+            )
+        comm = self._src.locale_comms.peer_comm
+        send_counts, send_data_types, recv_counts, recv_data_types = \
+            self.calc_alltoallw_data_types()
+        displacements = [0, ] * comm.size
+        self._dst.rank_logger.debug("BEG: self._src.locale_comms.peer_comm.Alltoallw...")
+        comm.Alltoallw(
+            [self._src.lndarray_proxy.lndarray, send_counts, displacements, send_data_types],
+            [self._dst.lndarray_proxy.lndarray, recv_counts, displacements, recv_data_types]
+        )
+        self._dst.rank_logger.debug("END: self._src.locale_comms.peer_comm.Alltoallw.")
+        self._dst.locale_comms.intra_locale_comm.barrier()
+
+    def do_locale_remote_update(self):
+        """
+        Transfers elements from remote locales using the engine
+        selected by :meth:`calc_engine`.
+        """
+        if self.calc_engine() == REDISTRIBUTE_ENGINE_ALLTOALLW:
+            self.do_locale_alltoallw_update()
+        else:
+            self.do_locale_rma_update()
+
+    def free(self):
+        """
+        Frees the struct data types created for :meth:`do_locale_alltoallw_update`,
+        the data types of the remote updates
+        (and :obj:`mpi_array.update.MpiPairExtentUpdateGroup` groups)
+        and the groups of :meth:`calc_pscw_groups`. The resources are re-created
+        on demand, so a freed plan can still be executed.
+        """
+        for data_type in self._alltoallw_struct_data_types:
+            data_type.Free()
+        self._alltoallw_struct_data_types = []
+        self._alltoallw_data_types = None
+        if self._pscw_groups is not None:
+            for group in self._pscw_groups:
+                group.Free()
+            self._pscw_groups = None
+        for updates in self._dst_rget_updates.values():
+            for update in updates:
+                if isinstance(update, _MpiPairExtentUpdateGroup):
+                    update.free()
+                else:
+                    update.free_data_types()
+
     def do_locale_update(self):
-        self.do_locale_rma_update()
+        self.do_locale_remote_update()
+        self.do_locale_cpy2_update()
+
+    def do_pscw_update(self):
+        """
+        Performs the redistribution with :attr:`REDISTRIBUTE_SYNC_PSCW` synchronisation,
+        the :samp:`peer_comm` barriers are replaced by :samp:`intra_locale_comm` barriers
+        (for the shared memory direct copies) and by the generalized active
+        target epochs of :meth:`do_locale_pscw_update`.
+        """
+        src_intra_locale_comm = self._src.locale_comms.intra_locale_comm
+        dst_intra_locale_comm = self._dst.locale_comms.intra_locale_comm
+
+        src_intra_locale_comm.barrier()
+        dst_intra_locale_comm.barrier()
+        self._dst.locale_comms.rank_logger.debug(
+            "%s: BEG: do_locale_cpy2_update()...", self.__class__.__name__
+        )
         self.do_locale_cpy2_update()
+        self._dst.locale_comms.rank_logger.debug(
+            "%s: END: do_locale_cpy2_update().", self.__class__.__name__
+        )
+
+        self._dst.locale_comms.rank_logger.debug(
+            "%s: BEG: do_locale_pscw_update()...", self.__class__.__name__
+        )
+        if self.calc_engine() == REDISTRIBUTE_ENGINE_ALLTOALLW:
+            self.do_locale_alltoallw_update()
+        else:
+            self.do_locale_pscw_update()
+        self._dst.locale_comms.rank_logger.debug(
+            "%s: END: do_locale_pscw_update().", self.__class__.__name__
+        )
+        src_intra_locale_comm.barrier()
+        dst_intra_locale_comm.barrier()
 
     def do_update(self):
+        if self.calc_sync() == REDISTRIBUTE_SYNC_PSCW:
+            self.do_pscw_update()
+            return
+
         self.barrier()
 
         self._dst.locale_comms.rank_logger.debug(
@@ -550,11 +2479,11 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
         self.barrier()
 
         self._dst.locale_comms.rank_logger.debug(
-            "%s: BEG: do_locale_rma_update()...", self.__class__.__name__
+            "%s: BEG: do_locale_remote_update()...", self.__class__.__name__
         )
-        self.do_locale_rma_update()
+        self.do_locale_remote_update()
         self._dst.locale_comms.rank_logger.debug(
-            "%s: END: do_locale_rma_update().", self.__class__.__name__
+            "%s: END: do_locale_remote_update().", self.__class__.__name__
         )
 
         self.barrier()
@@ -572,6 +2501,70 @@ class RmaRedistributeUpdater(_UpdatesForRedistribute):
         )
 
 
+class HaloUpdateHandle(object):
+
+    """
+    Handle returned by :meth:`gndarray.update_begin`, to be
+    passed to :meth:`gndarray.update_end`.
+    """
+
+    def __init__(self, array, state, active, depth=None):
+        """
+        Initialise.
+
+        :type array: :obj:`gndarray`
+        :param array: The array whose halo is being updated.
+        :type state: :obj:`object`
+        :param state: State returned by :meth:`PerAxisRmaHaloUpdater.update_halos_begin`.
+        :type active: :obj:`bool`
+        :param active: If :samp:`False`, no communication was initiated
+           (e.g. single locale).
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: The halo depth being updated, :samp:`None` for the full halo.
+        """
+        object.__init__(self)
+        self._array = array
+        self._state = state
+        self._active = active
+        self._depth = depth
+        self.complete = False
+
+    @property
+    def array(self):
+        """
+        The :obj:`gndarray` whose halo is being updated.
+        """
+        return self._array
+
+    @property
+    def state(self):
+        """
+        The halo updater state, passed to :meth:`PerAxisRmaHaloUpdater.update_halos_end`.
+        """
+        return self._state
+
+    @property
+    def active(self):
+        """
+        A :obj:`bool`, :samp:`True` when communication was initiated.
+        """
+        return self._active
+
+    @property
+    def depth(self):
+        """
+        A :samp:`(ndim, 2)` shaped array (or :samp:`None`) indicating the
+        halo depth being updated, see :meth:`gndarray.calc_halo_depth`.
+        """
+        return self._depth
+
+    def wait(self):
+        """
+        Completes the halo update, equivalent to :samp:`self.array.update_end(self)`.
+        """
+        self._array.update_end(self)
+
+
 class gndarray(_NDArrayOperatorsMixin):
 
     """
@@ -597,6 +2590,12 @@ class gndarray(_NDArrayOperatorsMixin):
         self._rma_window_buffer = rma_window_buffer
         self._lndarray_proxy = lndarray_proxy
         self._halo_updater = None
+        self._halo_engine = None
+        self._halo_single_epoch = False
+        self._halo_max_message_bytes = None
+        self._halo_dirty_tracking = False
+        self._write_epoch = 0
+        self._halo_update_epochs = dict()
 
         return self
 
@@ -641,8 +2640,28 @@ class gndarray(_NDArrayOperatorsMixin):
 
     def __setitem__(self, i, v):
         """
+        Assignment to the whole array (:samp:`a[...] = v` or :samp:`a[:] = v`).
+        A :obj:`mpi_array.globale_expr.GndarrayExpression` value is evaluated into
+        this array (see :func:`mpi_array.globale_expr.evaluate`), a :obj:`gndarray`
+        value is copied (see :meth:`copyfrom`) and a scalar value fills
+        the array (see :meth:`fill`).
+
+        :raises NotImplementedError: If :samp:`{i}` is not :samp:`...` (or :samp:`:`).
         """
         self.rank_logger.debug("__setitem__: i=%s, v=%s", i, v)
+        from . import globale_expr as _globale_expr
+        if not ((i is Ellipsis) or (isinstance(i, slice) and (i == slice(None)))):
+            raise NotImplementedError(
+                "Assignment to the %s elements of a gndarray is not supported, "
+                "only whole array (a[...] = v) assignment is supported." % (i,)
+            )
+        if isinstance(v, _globale_expr.GndarrayExpression):
+            _globale_expr.evaluate(v, out=self)
+        elif isinstance(v, gndarray):
+            if v is not self:
+                self.copyfrom(v)
+        else:
+            self.fill(v)
 
     def __array_ufunc__(self, *args, **kwargs):
         """
@@ -753,27 +2772,264 @@ class gndarray(_NDArrayOperatorsMixin):
                 "END: self.comms_and_distrib.locale_comms.inter_locale_comm.barrier()."
             )
 
+    @property
+    def have_halo_exchange(self):
+        """
+        A :obj:`bool`, :samp:`True` when :meth:`update` requires data exchange, i.e.
+        there are multiple locales, or there are periodic axes.
+        """
+        return \
+            (
+                (self.comms_and_distrib.locale_comms.num_locales > 1)
+                or
+                _np.any(self.distribution.periods)
+            )
+
+    @property
+    def halo_engine(self):
+        """
+        A :obj:`str` indicating the engine used to exchange halo elements
+        in :meth:`update`, one of :attr:`HALO_ENGINE_RMA`, :attr:`HALO_ENGINE_P2P`
+        or :attr:`HALO_ENGINE_RMA_RGET`.
+        Defaults to :func:`get_default_halo_engine`.
+        """
+        if self._halo_engine is None:
+            return get_default_halo_engine()
+        return self._halo_engine
+
+    @halo_engine.setter
+    def halo_engine(self, halo_engine):
+        if halo_engine is not None:
+            check_halo_engine(halo_engine)
+        self._halo_engine = halo_engine
+        self._halo_updater = None
+
+    @property
+    def halo_single_epoch(self):
+        """
+        A :obj:`bool`, if :samp:`True` then :meth:`update` exchanges all
+        halo regions (including edge and corner regions) in a single
+        epoch (e.g. a single :meth:`mpi4py.MPI.Win.Fence` pair), otherwise
+        halo regions are exchanged axis-by-axis (one epoch per axis). Default :samp:`False`.
+        """
+        return self._halo_single_epoch
+
+    @halo_single_epoch.setter
+    def halo_single_epoch(self, single_epoch):
+        self._halo_single_epoch = bool(single_epoch)
+        self._halo_updater = None
+
+    @property
+    def halo_max_message_bytes(self):
+        """
+        An :obj:`int` (or :samp:`None`), halo regions larger than this number of
+        bytes are exchanged (in :meth:`update`) as multiple smaller transfers (chunks).
+        Default :samp:`None`, no chunking.
+        """
+        return self._halo_max_message_bytes
+
+    @halo_max_message_bytes.setter
+    def halo_max_message_bytes(self, max_message_bytes):
+        if (max_message_bytes is not None) and (max_message_bytes < 1):
+            raise ValueError(
+                "Got max_message_bytes=%s, require max_message_bytes >= 1."
+                %
+                (max_message_bytes,)
+            )
+        self._halo_max_message_bytes = max_message_bytes
+        self._halo_updater = None
+
+    @property
+    def halo_dirty_tracking(self):
+        """
+        A :obj:`bool`, if :samp:`True` then :meth:`update` only exchanges halo
+        elements when some locale has written to the array since the previous
+        exchange, i.e. :meth:`update` is a (cheap) collective no-op when the halos
+        are already up to date. Writes by :meth:`fill`, :meth:`fill_h`, :meth:`copyfrom`
+        and ufunc outputs are tracked, writes made directly to the locale array
+        views (e.g. :samp:`lndarray_proxy.view_n`) must be registered
+        with :meth:`mark_dirty`. Default :samp:`False`.
+        """
+        return self._halo_dirty_tracking
+
+    @halo_dirty_tracking.setter
+    def halo_dirty_tracking(self, dirty_tracking):
+        self._halo_dirty_tracking = bool(dirty_tracking)
+
+    @property
+    def write_epoch(self):
+        """
+        An :obj:`int`, incremented (by :meth:`mark_dirty`) on each write to the array.
+        """
+        return self._write_epoch
+
+    def mark_dirty(self):
+        """
+        Registers a write to the elements of this array (on this rank), the next :meth:`update`
+        will exchange halo elements. Need not be called collectively.
+        """
+        self._write_epoch += 1
+
+    def halo_is_locale_clean(self, depth=None):
+        """
+        Returns :samp:`True` if the halo elements (of this rank) have been updated
+        since the last write to this array (on this rank).
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: Halo depth, as returned by :meth:`calc_halo_depth`.
+        :rtype: :obj:`bool`
+        :return: :samp:`True` if there have been no writes since the halo
+           update of :samp:`{depth}` (or a full halo update).
+        """
+        return \
+            (
+                (self._halo_update_epochs.get(None, None) == self._write_epoch)
+                or
+                (self._halo_update_epochs.get(_calc_depth_key(depth), None) == self._write_epoch)
+            )
+
+    def record_halo_update(self, depth=None):
+        """
+        Records that the halo elements of :samp:`{depth}` are up to date
+        with respect to the current :attr:`write_epoch`.
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: Halo depth, as returned by :meth:`calc_halo_depth`.
+        """
+        self._halo_update_epochs[_calc_depth_key(depth)] = self._write_epoch
+
+    def calc_halo_update_required(self, depth=None):
+        """
+        Returns :samp:`True` if a halo update of :samp:`{depth}` requires data exchange.
+        Should be called :samp:`peer_comm` collectively (same result on all ranks).
+        When :attr:`halo_dirty_tracking` is :samp:`True`, a single (boolean) reduction
+        over the :samp:`peer_comm` determines whether any rank has written
+        to the array since the last update.
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: Halo depth, as returned by :meth:`calc_halo_depth`.
+        :rtype: :obj:`bool`
+        :return: :samp:`True` when halo elements need to be exchanged.
+        """
+        required = self.have_halo_exchange and ((depth is None) or bool(_np.any(depth > 0)))
+        if required and self.halo_dirty_tracking:
+            required = \
+                self.locale_comms.peer_comm.allreduce(
+                    not self.halo_is_locale_clean(depth),
+                    op=_mpi.LOR
+                )
+        return required
+
     @property
     def halo_updater(self):
+        if (
+            (self._halo_updater is not None)
+            and
+            (type(self._halo_updater) is not _halo_engine_to_updater_type[self.halo_engine])
+        ):
+            self._halo_updater = None
         if self._halo_updater is None:
-            self._halo_updater = \
-                PerAxisRmaHaloUpdater(
-                    locale_extents=self.distribution.locale_extents,
-                    dtype=self.dtype,
-                    order=self.order,
-                    inter_locale_win=self.rma_window_buffer.inter_locale_win,
-                    dst_buffer=self.lndarray_proxy.lndarray
-                )
+            if self.halo_engine == HALO_ENGINE_P2P:
+                self._halo_updater = \
+                    PerAxisP2pHaloUpdater(
+                        locale_extents=self.distribution.locale_extents,
+                        dtype=self.dtype,
+                        order=self.order,
+                        inter_locale_comm=self.locale_comms.inter_locale_comm,
+                        dst_buffer=self.lndarray_proxy.lndarray,
+                        single_epoch=self.halo_single_epoch,
+                        max_message_bytes=self.halo_max_message_bytes,
+                        periods=self.distribution.periods
+                    )
+            elif self.halo_engine == HALO_ENGINE_RMA_RGET:
+                self._halo_updater = \
+                    PerAxisRmaRgetHaloUpdater(
+                        locale_extents=self.distribution.locale_extents,
+                        dtype=self.dtype,
+                        order=self.order,
+                        inter_locale_win=self.rma_window_buffer.inter_locale_win,
+                        inter_locale_comm=self.locale_comms.inter_locale_comm,
+                        dst_buffer=self.lndarray_proxy.lndarray,
+                        single_epoch=self.halo_single_epoch,
+                        max_message_bytes=self.halo_max_message_bytes,
+                        periods=self.distribution.periods
+                    )
+            else:
+                self._halo_updater = \
+                    PerAxisRmaHaloUpdater(
+                        locale_extents=self.distribution.locale_extents,
+                        dtype=self.dtype,
+                        order=self.order,
+                        inter_locale_win=self.rma_window_buffer.inter_locale_win,
+                        dst_buffer=self.lndarray_proxy.lndarray,
+                        single_epoch=self.halo_single_epoch,
+                        max_message_bytes=self.halo_max_message_bytes,
+                        periods=self.distribution.periods
+                    )
             self._halo_updater.rank_logger = self.rank_logger
             self._halo_updater.root_logger = self.root_logger
 
         return self._halo_updater
 
-    def update(self):
-        """
-        """
-        # If running on single locale then there are no halos to update.
-        if self.comms_and_distrib.locale_comms.num_locales > 1:
+    def calc_halo_depth(self, axes=None, depth=None):
+        """
+        Converts the :samp:`{axes}` and :samp:`{depth}` arguments of :meth:`update`
+        to a :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)` halo depths.
+
+        :type axes: :obj:`int` or sequence of :obj:`int`
+        :param axes: Only update the halos of these axes, :samp:`None` for all axes.
+        :type depth: :obj:`int`, sequence of :obj:`int` or :samp:`(ndim, 2)` shaped array
+        :param depth: Only update the halo elements which lie within this
+           many elements of the non-halo elements, same forms as
+           the :samp:`halo` argument of :func:`mpi_array.comms.create_distribution`.
+           Values larger than the distribution halo are clipped. :samp:`None` for
+           the full halo.
+        :rtype: :obj:`numpy.ndarray`
+        :return: A :samp:`(ndim, 2)` shaped array of :obj:`int`, or :samp:`None`
+           if the full halo is to be updated.
+        """
+        if (axes is None) and (depth is None):
+            return None
+        halo = _np.array(self.distribution.halo, dtype="int64")
+        if depth is None:
+            depth = halo.copy()
+        else:
+            depth = _convert_halo_to_array_form(depth, self.ndim)
+            if _np.any(depth < 0):
+                raise ValueError("Got depth=%s, require depth >= 0." % (depth.tolist(),))
+        if axes is not None:
+            axes = _np.atleast_1d(axes)
+            if _np.any(axes >= self.ndim) or _np.any(axes < -self.ndim):
+                raise ValueError(
+                    "Got axes=%s, require -%s <= axes < %s." % (axes.tolist(), self.ndim, self.ndim)
+                )
+            axis_mask = _np.zeros((self.ndim,), dtype="bool")
+            axis_mask[axes] = True
+            depth[_np.logical_not(axis_mask), :] = 0
+        depth = _np.minimum(depth, halo)
+        if _np.all(depth == halo):
+            depth = None
+
+        return depth
+
+    def update(self, axes=None, depth=None):
+        """
+        Updates the halo (ghost) elements with the values from the
+        owning locales. Should be called :samp:`peer_comm` collectively.
+
+        :type axes: :obj:`int` or sequence of :obj:`int`
+        :param axes: Only update the halos of these axes, :samp:`None` for all axes.
+        :type depth: :obj:`int`, sequence of :obj:`int` or :samp:`(ndim, 2)` shaped array
+        :param depth: Only update halo elements which lie within this many
+           elements of the non-halo elements (per-axis, per-direction when
+           a :samp:`(ndim, 2)` shaped array), :samp:`None` for the full halo.
+           See :meth:`calc_halo_depth`.
+        """
+        depth = self.calc_halo_depth(axes, depth)
+        # If running on single locale then there are no halos to update
+        # (unless halos wrap around periodic axes), and no update is
+        # required if the halos are clean.
+        if self.calc_halo_update_required(depth):
             rank_logger = self.comms_and_distrib.locale_comms.rank_logger
             # Only communicate data between the ranks
             # of self.comms_and_distrib.locale_comms.inter_locale_comm
@@ -784,11 +3040,73 @@ class gndarray(_NDArrayOperatorsMixin):
                 rank_logger.debug(
                     "BEG: update_halos..."
                 )
-                self.halo_updater.update_halos()
+                self.halo_updater.update_halos(depth)
                 rank_logger.debug(
                     "END: update_halos."
                 )
             self.intra_locale_barrier()
+            self.record_halo_update(depth)
+
+    def update_begin(self, axes=None, depth=None):
+        """
+        Initiates (split-phase) halo update, :meth:`update_end` completes
+        the update. Between the calls, computation which does not read
+        the halo elements (and does not modify this array) can be
+        overlapped with the communication. Should be called :samp:`peer_comm` collectively.
+
+        :type axes: :obj:`int` or sequence of :obj:`int`
+        :param axes: See :meth:`update`.
+        :type depth: :obj:`int`, sequence of :obj:`int` or :samp:`(ndim, 2)` shaped array
+        :param depth: See :meth:`update`.
+        :rtype: :obj:`HaloUpdateHandle`
+        :return: Handle which is passed to :meth:`update_end`.
+        """
+        state = None
+        depth = self.calc_halo_depth(axes, depth)
+        active = self.calc_halo_update_required(depth)
+        if active:
+            rank_logger = self.comms_and_distrib.locale_comms.rank_logger
+            self.comms_and_distrib.locale_comms.peer_comm.barrier()
+            if (
+                self.comms_and_distrib.locale_comms.have_valid_inter_locale_comm
+            ):
+                rank_logger.debug(
+                    "BEG: update_halos_begin..."
+                )
+                state = self.halo_updater.update_halos_begin(depth)
+                rank_logger.debug(
+                    "END: update_halos_begin."
+                )
+
+        return HaloUpdateHandle(self, state, active, depth)
+
+    def update_end(self, handle):
+        """
+        Completes the halo update initiated by :meth:`update_begin`.
+        Should be called :samp:`peer_comm` collectively.
+
+        :type handle: :obj:`HaloUpdateHandle`
+        :param handle: The object returned by :meth:`update_begin`.
+        """
+        if handle.array is not self:
+            raise ValueError("Got handle for a different array.")
+        if handle.complete:
+            raise RuntimeError("Halo update handle has already been completed.")
+        if handle.active:
+            if (
+                self.comms_and_distrib.locale_comms.have_valid_inter_locale_comm
+            ):
+                rank_logger = self.comms_and_distrib.locale_comms.rank_logger
+                rank_logger.debug(
+                    "BEG: update_halos_end..."
+                )
+                self.halo_updater.update_halos_end(handle.state, handle.depth)
+                rank_logger.debug(
+                    "END: update_halos_end."
+                )
+            self.intra_locale_barrier()
+            self.record_halo_update(handle.depth)
+        handle.complete = True
 
     def calculate_copyfrom_updates(self, src, casting="same_kind"):
         return \
@@ -798,7 +3116,33 @@ class gndarray(_NDArrayOperatorsMixin):
                 casting
             )
 
-    def copyfrom(self, src, casting="same_kind"):
+    def get_copyfrom_plan(self, src, casting="same_kind"):
+        """
+        Returns the (unbound, see :meth:`RmaRedistributeUpdater.bind`) plan which
+        copies elements of :samp:`{src}` to this array. Plans are cached
+        on the :func:`calc_redistribute_plan_key` key (in a bounded :obj:`PlanCache`),
+        so repeated copies between arrays of the same pair of distributions skip
+        the calculation of the updates. The returned plan can also be passed explicitly
+        to :meth:`copyfrom` (its MPI resources are re-created if it has been
+        evicted from the cache).
+
+        :type src: :obj:`gndarray`
+        :param src: Global array from which elements are copied.
+        :type casting: :obj:`str`
+        :param casting: See :samp:`{casting}` parameter in :func:`numpy.copyto`.
+        :rtype: :obj:`RmaRedistributeUpdater`
+        :return: The (cached) plan.
+        """
+        key = calc_redistribute_plan_key(self, src, casting)
+        plan = _redistribute_plan_cache.find(key)
+        if plan is None:
+            plan = self.calculate_copyfrom_updates(src, casting)
+            plan.unbind()
+            _redistribute_plan_cache.add(key, plan)
+
+        return plan
+
+    def copyfrom(self, src, casting="same_kind", plan=None):
         """
         Copy the elements of the :samp:`{src}` array to corresponding elements of
         the :samp:`{self}` array.
@@ -807,15 +3151,28 @@ class gndarray(_NDArrayOperatorsMixin):
         :param src: Global array from which elements are copied.
         :type casting: :obj:`str`
         :param casting: See :samp:`{casting}` parameter in :func:`numpy.copyto`.
+        :type plan: :obj:`RmaRedistributeUpdater`
+        :param plan: Plan returned by :meth:`get_copyfrom_plan`, if :samp:`None`
+           the (cached) plan is obtained from :meth:`get_copyfrom_plan`.
         """
 
         if not isinstance(src, gndarray):
             raise ValueError(
                 "Got type(src)=%s, expected %s." % (type(src), gndarray)
             )
+        if plan is None:
+            plan = self.get_copyfrom_plan(src, casting)
+        elif plan.casting != casting:
+            raise ValueError(
+                "Got casting=%s, but plan has casting=%s." % (casting, plan.casting)
+            )
 
-        redistribute_updater = self.calculate_copyfrom_updates(src, casting)
-        redistribute_updater.do_update()
+        plan.bind(self, src)
+        try:
+            plan.do_update()
+        finally:
+            plan.unbind()
+        self.mark_dirty()
 
     def all(self, **unused_kwargs):
         return \
@@ -824,6 +3181,30 @@ class gndarray(_NDArrayOperatorsMixin):
                 op=_mpi.BAND
             )
 
+    def sum(self, axis=None, dtype=None, out=None, keepdims=False):
+        """
+        Sum of array elements over the given axis, see :meth:`numpy.ndarray.sum`.
+        """
+        return _np.add.reduce(self, axis=axis, dtype=dtype, out=out, keepdims=keepdims)
+
+    def prod(self, axis=None, dtype=None, out=None, keepdims=False):
+        """
+        Product of array elements over the given axis, see :meth:`numpy.ndarray.prod`.
+        """
+        return _np.multiply.reduce(self, axis=axis, dtype=dtype, out=out, keepdims=keepdims)
+
+    def max(self, axis=None, out=None, keepdims=False):
+        """
+        Maximum of array elements over the given axis, see :meth:`numpy.ndarray.max`.
+        """
+        return _np.maximum.reduce(self, axis=axis, out=out, keepdims=keepdims)
+
+    def min(self, axis=None, out=None, keepdims=False):
+        """
+        Minimum of array elements over the given axis, see :meth:`numpy.ndarray.min`.
+        """
+        return _np.minimum.reduce(self, axis=axis, out=out, keepdims=keepdims)
+
     def fill(self, value):
         """
         Fill the array (excluding ghost elements) with a scalar value.
@@ -832,6 +3213,7 @@ class gndarray(_NDArrayOperatorsMixin):
         :param value: All non-ghost elements will be assigned this value.
         """
         self.lndarray_proxy.fill(value)
+        self.mark_dirty()
         self.intra_locale_barrier()
 
     def fill_h(self, value):
@@ -842,6 +3224,7 @@ class gndarray(_NDArrayOperatorsMixin):
         :param value: All elements will be assigned this value.
         """
         self.lndarray_proxy.fill_h(value)
+        self.mark_dirty()
         self.intra_locale_barrier()
 
     def copy(self, order='C'):
@@ -934,8 +3317,12 @@ class gndarray(_NDArrayOperatorsMixin):
                     comm=self.locale_comms.intra_locale_comm
                 )
 
+            # Calculate the update objects which indicate where to fetch the data,
+            # only on the process which performs the RMA.
+            intra_locale_comm = self.locale_comms.intra_locale_comm
+            cpy2_regions = None
+            inter_locale_win = _mpi.WIN_NULL
             if self.locale_comms.have_valid_inter_locale_comm:
-                # Calculate the update objects which indicate where to fetch the data.
                 update_calculator = \
                     _MpiUpdatesForGet(
                         dst_extent=dst_extent,
@@ -944,20 +3331,58 @@ class gndarray(_NDArrayOperatorsMixin):
                         order=self.order,
                         update_dst_halo=True
                     )
-                update_executor = \
-                    _RmaUpdateExecutor(
-                        inter_win=self.rma_window_buffer.inter_locale_win,
-                        dst_lndarray=locale_ary,
-                        src_inter_win_rank_attr="inter_locale_rank",
-                        rank_logger=self.rank_logger
+                inter_locale_win = self.rma_window_buffer.inter_locale_win
+                cpy2_regions = \
+                    [
+                        (
+                            update.src_extent.inter_locale_rank,
+                            _np.array(update.dst_update_extent.start),
+                            _np.array(update.dst_update_extent.stop)
+                        )
+                        for update in
+                        update_calculator._dst_cpy2_updates[dst_extent.inter_locale_rank]
+                    ]
+            # The direct copy regions are shared with the other locale processes.
+            self.rank_logger.debug("BEG: intra_locale_comm.bcast of locale_get copy regions...")
+            cpy2_regions = intra_locale_comm.bcast(cpy2_regions, 0)
+            self.rank_logger.debug("END: intra_locale_comm.bcast of locale_get copy regions.")
+            update_executor = \
+                _RmaUpdateExecutor(
+                    inter_win=inter_locale_win,
+                    dst_lndarray=locale_ary,
+                    src_inter_win_rank_attr="inter_locale_rank",
+                    rank_logger=self.rank_logger
+                )
+            # Perform the updates, copy locale array data to locale_ary first,
+            # the copy is shared between all the locale processes.
+            updates = \
+                [
+                    _PairExtentUpdate(
+                        dst_extent,
+                        self.distribution.locale_extents[src_inter_locale_rank],
+                        _IndexingExtent(start=start, stop=stop),
+                        _IndexingExtent(start=start, stop=stop)
                     )
-                # Perform the updates, copy locale array data to locale_ary first.
-                updates = update_calculator._dst_cpy2_updates[dst_extent.inter_locale_rank]
-                update_executor.do_direct_cpy2_update(updates, self.lndarray_proxy.lndarray)
+                    for src_inter_locale_rank, start, stop in cpy2_regions
+                ]
+            update_executor.do_direct_cpy2_update(
+                updates,
+                self.lndarray_proxy.lndarray,
+                slab_rank=intra_locale_comm.rank,
+                num_slabs=intra_locale_comm.size
+            )
 
+            if self.locale_comms.have_valid_inter_locale_comm:
                 # Fetch remote data.
                 updates = update_calculator._dst_rget_updates[dst_extent.inter_locale_rank]
                 update_executor.do_locale_rma_update(updates)
+                for updates in \
+                        (
+                            update_calculator._dst_cpy2_updates[dst_extent.inter_locale_rank],
+                            updates
+                        ):
+                    for update in updates:
+                        update.free_data_types()
 
             # All locale processes wait for data fetch to conclude
             self.intra_locale_barrier()
@@ -1005,7 +3430,8 @@ class gndarray(_NDArrayOperatorsMixin):
                     inter_win=self.rma_window_buffer.peer_win,
                     dst_lndarray=locale_ary,
                     src_inter_win_rank_attr="peer_rank",
-                    rank_logger=self.rank_logger
+                    rank_logger=self.rank_logger,
+                    peer_ranks_per_locale=self.distribution.peer_ranks_per_locale
                 )
             # Perform the updates, copy locale array data to locale_ary first.
             updates = update_calculator._dst_cpy2_updates[dst_extent.inter_locale_rank]
@@ -1018,6 +3444,208 @@ class gndarray(_NDArrayOperatorsMixin):
         return locale_ary
 
 
+class HaloGroup(object):
+
+    """
+    Batched halo update for a group of :obj:`gndarray` arrays which share
+    the same distribution (and locale communicators). The halos of all arrays
+    are exchanged together, with a single set of synchronisations (barriers)
+    rather than one set per array, see :obj:`HaloGroupUpdatePlan`.
+    """
+
+    def __init__(self, arrays):
+        """
+        Initialise.
+
+        :type arrays: sequence of :obj:`gndarray`
+        :param arrays: The arrays whose halos are updated, all arrays must have
+           the same distribution, :attr:`gndarray.halo_engine`
+           and :attr:`gndarray.halo_single_epoch`.
+        """
+        object.__init__(self)
+        arrays = tuple(arrays)
+        if len(arrays) == 0:
+            raise ValueError("Got empty sequence of arrays, require at least one array.")
+        self.check_arrays(arrays)
+        self._arrays = arrays
+        self._group_updates = dict()
+
+    def check_arrays(self, arrays):
+        """
+        Raises :obj:`ValueError` if the :samp:`{arrays}` do not share the same
+        distribution, :attr:`gndarray.halo_engine` and :attr:`gndarray.halo_single_epoch`.
+
+        :type arrays: sequence of :obj:`gndarray`
+        :param arrays: The arrays to check.
+        """
+        ary0 = arrays[0]
+        extents0 = tuple(extent.to_tuple() for extent in ary0.distribution.locale_extents)
+        for ary in arrays[1:]:
+            if (
+                (ary.locale_comms is not ary0.locale_comms)
+                or
+                (tuple(extent.to_tuple() for extent in ary.distribution.locale_extents) != extents0)
+                or
+                _np.any(ary.distribution.periods != ary0.distribution.periods)
+            ):
+                raise ValueError("All arrays of a halo group must have the same distribution.")
+            if (
+                (ary.halo_engine != ary0.halo_engine)
+                or
+                (ary.halo_single_epoch != ary0.halo_single_epoch)
+            ):
+                raise ValueError(
+                    "All arrays of a halo group must have the same halo_engine"
+                    +
+                    " and halo_single_epoch, got (%s, %s) and (%s, %s)."
+                    %
+                    (
+                        ary0.halo_engine,
+                        ary0.halo_single_epoch,
+                        ary.halo_engine,
+                        ary.halo_single_epoch
+                    )
+                )
+
+    def free(self):
+        """
+        Frees the group halo update plans.
+        """
+        for _, plan, _, _ in self._group_updates.values():
+            plan.free()
+        self._group_updates = dict()
+
+    def __enter__(self):
+        """
+        For use with :samp:`with` contexts.
+        """
+        return self
+
+    def __exit__(self, type, value, traceback):
+        """
+        For use with :samp:`with` contexts.
+        """
+        self.free()
+        return False
+
+    @property
+    def arrays(self):
+        """
+        The :obj:`tuple` of :obj:`gndarray` arrays in this group.
+        """
+        return self._arrays
+
+    def get_group_update(self, depth=None, arrays=None):
+        """
+        Returns the (cached) :samp:`(plan, comm, dst_buffer)` triple,
+        see :meth:`PerAxisRmaHaloUpdater.calc_halo_group_update_plan`.
+        The cached triple holds references to the updaters (:attr:`gndarray.halo_updater`)
+        of the arrays, the plan is re-calculated when an updater has been replaced
+        (e.g. after a change of :attr:`gndarray.halo_engine`).
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)`
+           halo depths to be updated, :samp:`None` for the full halo.
+        :type arrays: sequence of :obj:`gndarray`
+        :param arrays: Sub-set of :attr:`arrays` to be updated, :samp:`None` for all arrays.
+        :rtype: :obj:`tuple`
+        :return: The :samp:`(plan, comm, dst_buffer)` triple.
+        """
+        if arrays is None:
+            arrays = self._arrays
+        updaters = tuple(ary.halo_updater for ary in arrays)
+        # The arrays (members of this group) are referenced by the group, so their ids
+        # are not re-used.
+        key = (tuple(id(ary) for ary in arrays), _calc_depth_key(depth))
+        group_update = self._group_updates.pop(key, None)
+        if (
+            (group_update is not None)
+            and
+            any(u is not cu for u, cu in zip(updaters, group_update[0]))
+        ):
+            group_update[1].free()
+            group_update = None
+        if group_update is None:
+            self.check_arrays(arrays)
+            group_update = (updaters,) + updaters[0].calc_halo_group_update_plan(updaters, depth)
+        self._group_updates[key] = group_update
+
+        return group_update[1:]
+
+    def update(self, axes=None, depth=None):
+        """
+        Updates the halo (ghost) elements of all arrays in the group.
+        Should be called :samp:`peer_comm` collectively.
+
+        :type axes: :obj:`int` or sequence of :obj:`int`
+        :param axes: See :meth:`gndarray.update`.
+        :type depth: :obj:`int`, sequence of :obj:`int` or :samp:`(ndim, 2)` shaped array
+        :param depth: See :meth:`gndarray.update`.
+        """
+        ary0 = self._arrays[0]
+        depth = ary0.calc_halo_depth(axes, depth)
+        arrays = self.calc_update_required_arrays(depth)
+        if len(arrays) > 0:
+            rank_logger = ary0.locale_comms.rank_logger
+            ary0.locale_comms.peer_comm.barrier()
+            if ary0.locale_comms.have_valid_inter_locale_comm:
+                plan, comm, dst_buffer = self.get_group_update(depth, arrays)
+                rank_logger.debug(
+                    "BEG: group update_halos, num arrays=%s...", len(arrays)
+                )
+                plan.execute(comm, dst_buffer, rank_logger)
+                rank_logger.debug(
+                    "END: group update_halos, num arrays=%s.", len(arrays)
+                )
+            ary0.intra_locale_barrier()
+            for ary in arrays:
+                ary.record_halo_update(depth)
+
+    def calc_update_required_arrays(self, depth=None):
+        """
+        Returns the arrays (of this group) whose halos need to be exchanged, arrays
+        with :attr:`gndarray.halo_dirty_tracking` are excluded when no rank has
+        written to them since their last halo update. Should be
+        called :samp:`peer_comm` collectively, performs (at most) a
+        single reduction for all arrays.
+
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: Halo depth, as returned by :meth:`gndarray.calc_halo_depth`.
+        :rtype: :obj:`list`
+        :return: List of :obj:`gndarray` requiring halo exchange.
+        """
+        ary0 = self._arrays[0]
+        arrays = []
+        if ary0.have_halo_exchange and ((depth is None) or _np.any(depth > 0)):
+            dirty = \
+                _np.array(
+                    [
+                        (not ary.halo_dirty_tracking) or (not ary.halo_is_locale_clean(depth))
+                        for ary in self._arrays
+                    ],
+                    dtype="int32"
+                )
+            if any(ary.halo_dirty_tracking for ary in self._arrays):
+                ary0.locale_comms.peer_comm.Allreduce(_mpi.IN_PLACE, dirty, op=_mpi.MAX)
+            arrays = [ary for ary, d in zip(self._arrays, dirty) if d]
+
+        return arrays
+
+
+#: Cache of :obj:`HaloGroup` objects used by :func:`update_halos`.
+_halo_group_cache = PlanCache(max_size=16)
+
+
+def clear_plan_caches():
+    """
+    Frees all cached (halo exchange and redistribution) communication plans, subsequent
+    communication re-calculates the plans.
+    """
+    _halo_group_cache.clear()
+    _halo_update_plan_cache.clear()
+    _redistribute_plan_cache.clear()
+
+
 def free_all(objects):
     """
     Call the :samp:`free` attribute on all arguments.
@@ -1031,7 +3659,7 @@ def free_all(objects):
             obj.free()
 
 
-def copyto(dst, src, casting="same_kind", **kwargs):
+def copyto(dst, src, casting="same_kind", plan=None, **kwargs):
     """
     Copy the elements of the :samp:`{src}` array to corresponding elements of
     the :samp:`dst` array.
@@ -1042,13 +3670,40 @@ def copyto(dst, src, casting="same_kind", **kwargs):
     :param src: Global array from which elements are copied.
     :type casting: :obj:`str`
     :param casting: See :samp:`{casting}` parameter in :func:`numpy.copyto`.
+    :type plan: :obj:`RmaRedistributeUpdater`
+    :param plan: See :meth:`gndarray.copyfrom`.
     """
     if not isinstance(dst, gndarray):
         raise ValueError(
             "Got type(dst)=%s, expected %s." % (type(dst), gndarray)
         )
 
-    dst.copyfrom(src, casting=casting)
+    dst.copyfrom(src, casting=casting, plan=plan)
+
+
+def update_halos(arrays, axes=None, depth=None):
+    """
+    Updates the halo (ghost) elements of multiple arrays (which share a distribution)
+    as a batch, see :obj:`HaloGroup`. Should be called :samp:`peer_comm` collectively.
+    The group (and its plans) is cached on the identity of the :samp:`{arrays}`, so
+    repeated calls replay the group plans. A cached group holds references to
+    its arrays until it is evicted from the cache (or :func:`clear_plan_caches` is called).
+
+    :type arrays: sequence of :obj:`gndarray`
+    :param arrays: Arrays whose halos are updated.
+    :type axes: :obj:`int` or sequence of :obj:`int`
+    :param axes: See :meth:`gndarray.update`.
+    :type depth: :obj:`int`, sequence of :obj:`int` or :samp:`(ndim, 2)` shaped array
+    :param depth: See :meth:`gndarray.update`.
+    """
+    arrays = tuple(arrays)
+    # The cached group references the arrays, so the ids in the key are not re-used.
+    key = tuple(id(ary) for ary in arrays)
+    group = _halo_group_cache.find(key)
+    if group is None:
+        group = HaloGroup(arrays)
+        _halo_group_cache.add(key, group)
+    group.update(axes=axes, depth=depth)
 
 
 __all__ = [s for s in dir() if not s.startswith('_')]
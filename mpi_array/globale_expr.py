@@ -0,0 +1,636 @@
+"""
+========================================
+The :mod:`mpi_array.globale_expr` Module
+========================================
+
+Deferred (lazy) evaluation of chains of element-wise :obj:`numpy.ufunc`
+calls on :obj:`mpi_array.globale.gndarray` arrays.
+
+Inside a :func:`lazy_mode` context (or when one of the operands is
+a :obj:`GndarrayExpression`, see :func:`lazy`) the
+:samp:`numpy.ufunc.__call__` operations are recorded in an expression
+graph (DAG) instead of being executed. The graph is executed by :func:`evaluate`
+(or by assignment :samp:`out[...] = expr`) in a single pass over the
+:attr:`mpi_array.globale.gndarray.rank_view_n` tile of each rank. The
+tile is processed in blocks (of approximately :samp:`{block_size}` elements)
+so that the temporary arrays of the intermediate nodes stay cache resident,
+no intermediate distributed arrays are allocated and a single
+intra-locale barrier is performed. For example::
+
+   with mpi_array.globale_expr.lazy_mode():
+       expr = (a * b + c) / (a - 1.0)
+   d = mpi_array.globale_expr.evaluate(expr)
+
+The fused evaluation requires that all :obj:`mpi_array.globale.gndarray`
+operands have the same shape as the result and share the locale extents
+of the result, :obj:`numpy.ndarray` and scalar operands are broadcast.
+Expressions which do not satisfy these conditions are evaluated eagerly,
+node by node, using the :mod:`mpi_array.globale_ufunc` implementation.
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+
+   GndarrayExpression - Node of a deferred ufunc expression graph.
+
+Functions
+=========
+
+.. autosummary::
+   :toctree: generated/
+
+   lazy_mode - Context manager in which gndarray ufunc calls are recorded.
+   is_lazy_mode - Whether gndarray ufunc calls are currently recorded.
+   lazy - Wraps an array as a :obj:`GndarrayExpression` leaf node.
+   record_ufunc - Records a ufunc call as a :obj:`GndarrayExpression` node.
+   evaluate - Evaluates a :obj:`GndarrayExpression`.
+   can_fuse - Whether an expression can be evaluated as a single fused pass.
+
+
+"""
+
+from __future__ import absolute_import
+
+import contextlib as _contextlib
+import itertools as _itertools
+import mpi4py.MPI as _mpi
+import numpy as _np
+from numpy.lib.mixins import NDArrayOperatorsMixin as _NDArrayOperatorsMixin
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import logging as _logging
+from . import globale as _globale
+from . import globale_creation as _globale_creation
+from . import globale_ufunc as _globale_ufunc
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+#: Default (approximate) number of elements in a block of a fused evaluation.
+DEFAULT_BLOCK_SIZE = 2 ** 14
+
+_lazy_mode_depth = 0
+
+
+@_contextlib.contextmanager
+def lazy_mode(enable=True):
+    """
+    Context manager within which :obj:`numpy.ufunc` calls on
+    :obj:`mpi_array.globale.gndarray` arrays return :obj:`GndarrayExpression`
+    nodes (rather than being executed). Should be entered collectively.
+
+    :type enable: :obj:`bool`
+    :param enable: If :samp:`False`, ufunc calls are executed eagerly within the context
+       (even if it is nested inside a lazy context).
+    """
+    global _lazy_mode_depth
+    prev_depth = _lazy_mode_depth
+    if enable:
+        _lazy_mode_depth += 1
+    else:
+        _lazy_mode_depth = 0
+    try:
+        yield
+    finally:
+        _lazy_mode_depth = prev_depth
+
+
+def is_lazy_mode():
+    """
+    Returns :samp:`True` if currently inside a :func:`lazy_mode` context.
+
+    :rtype: :obj:`bool`
+    :return: Whether :obj:`numpy.ufunc` calls on :obj:`mpi_array.globale.gndarray`
+       arrays are recorded.
+    """
+    return _lazy_mode_depth > 0
+
+
+class GndarrayExpression(_NDArrayOperatorsMixin):
+
+    """
+    Node of a deferred (lazy) :obj:`numpy.ufunc` expression graph. A node
+    is either a *leaf* (wrapping a :obj:`mpi_array.globale.gndarray`,
+    :obj:`numpy.ndarray` or scalar) or an *operation* node recording
+    a :samp:`ufunc(*inputs, **kwargs)` call.
+    """
+
+    def __init__(self, ufunc=None, inputs=None, kwargs=None, value=None):
+        """
+        Initialise, use :func:`lazy` to create leaf nodes and :func:`record_ufunc`
+        to create operation nodes.
+
+        :type ufunc: :obj:`numpy.ufunc`
+        :param ufunc: The ufunc of an operation node, :samp:`None` for a leaf node.
+        :type inputs: sequence of :obj:`GndarrayExpression`
+        :param inputs: The input (operand) nodes of an operation node.
+        :type kwargs: :obj:`dict`
+        :param kwargs: Keyword arguments passed to the :samp:`{ufunc}` call.
+        :type value: :obj:`mpi_array.globale.gndarray`, :obj:`numpy.ndarray` or scalar
+        :param value: The value of a leaf node.
+        """
+        self._ufunc = ufunc
+        if inputs is None:
+            inputs = tuple()
+        self._inputs = tuple(inputs)
+        if kwargs is None:
+            kwargs = dict()
+        self._kwargs = kwargs
+        self._value = value
+        self._shape = None
+        self._dtype = None
+
+    @property
+    def ufunc(self):
+        """
+        The :obj:`numpy.ufunc` of this node, :samp:`None` for leaf nodes.
+        """
+        return self._ufunc
+
+    @property
+    def inputs(self):
+        """
+        The :obj:`tuple` of input :obj:`GndarrayExpression` nodes.
+        """
+        return self._inputs
+
+    @property
+    def kwargs(self):
+        """
+        The :obj:`dict` of keyword arguments for the :attr:`ufunc` call.
+        """
+        return self._kwargs
+
+    @property
+    def value(self):
+        """
+        The array (or scalar) of a leaf node, :samp:`None` for operation nodes.
+        """
+        return self._value
+
+    @property
+    def is_leaf(self):
+        """
+        A :obj:`bool`, :samp:`True` if this node is a leaf node.
+        """
+        return self._ufunc is None
+
+    @property
+    def is_scalar(self):
+        """
+        A :obj:`bool`, :samp:`True` if this is a leaf node with a scalar (non-array) value.
+        """
+        return self.is_leaf and (_np.ndim(self._value) == 0)
+
+    @property
+    def shape(self):
+        """
+        The (global) shape of the result of this node.
+        """
+        if self._shape is None:
+            if self.is_leaf:
+                self._shape = tuple(_np.shape(self._value))
+            else:
+                self._shape = \
+                    tuple(_globale_ufunc.broadcast_shape(*[i.shape for i in self._inputs]))
+        return self._shape
+
+    @property
+    def ndim(self):
+        """
+        The number of dimensions of the result of this node.
+        """
+        return len(self.shape)
+
+    @property
+    def dtype(self):
+        """
+        The :obj:`numpy.dtype` of the result of this node. Determined by
+        executing the ufunc on single element arrays so that the
+        casting (including value-based scalar casting) matches eager evaluation.
+        """
+        if self._dtype is None:
+            if self.is_leaf:
+                if isinstance(self._value, (_globale.gndarray, _np.ndarray)):
+                    self._dtype = _np.dtype(self._value.dtype)
+                else:
+                    self._dtype = _np.asarray(self._value).dtype
+            else:
+                with _np.errstate(all="ignore"):
+                    sample = \
+                        self._ufunc(
+                            *[i.sample_value() for i in self._inputs],
+                            **self._kwargs
+                        )
+                self._dtype = _np.asarray(sample).dtype
+        return self._dtype
+
+    def sample_value(self):
+        """
+        Returns a value with the type-promotion characteristics of this node's
+        result, used to determine the :attr:`dtype` of operation nodes.
+
+        :rtype: :obj:`numpy.ndarray` or scalar
+        :return: A scalar (for scalar leaves) or a single element array.
+        """
+        if self.is_scalar:
+            value = self._value
+        elif (not self.is_leaf) and all(i.is_scalar for i in self._inputs):
+            value = _np.ones(tuple(), dtype=self.dtype)[()]
+        else:
+            value = _np.ones((1,), dtype=self.dtype)
+        return value
+
+    def iter_nodes(self):
+        """
+        Iterates over the unique nodes of the expression graph rooted at this node,
+        in post-order (inputs before the nodes which consume them).
+
+        :rtype: generator
+        :return: Generator of :obj:`GndarrayExpression` nodes.
+        """
+        visited = set()
+        stack = [(self, False)]
+        while len(stack) > 0:
+            node, inputs_done = stack.pop()
+            if inputs_done:
+                yield node
+            elif id(node) not in visited:
+                visited.add(id(node))
+                stack.append((node, True))
+                for i in reversed(node.inputs):
+                    stack.append((i, False))
+
+    def iter_leaves(self):
+        """
+        Iterates over the unique leaf nodes of the expression graph rooted at this node.
+
+        :rtype: generator
+        :return: Generator of :obj:`GndarrayExpression` leaf nodes.
+        """
+        return (node for node in self.iter_nodes() if node.is_leaf)
+
+    def evaluate(self, out=None, block_size=None):
+        """
+        Evaluates this expression, see :func:`evaluate`.
+        """
+        return evaluate(self, out=out, block_size=block_size)
+
+    def __array_ufunc__(self, ufunc, method, *inputs, **kwargs):
+        """
+        Records :samp:`__call__` ufunc operations, other operations
+        (e.g. :samp:`reduce`) evaluate the expression operands and are executed eagerly.
+        """
+        expr = record_ufunc(ufunc, method, *inputs, **kwargs)
+        if expr is None:
+            with lazy_mode(enable=False):
+                inputs = \
+                    tuple(
+                        evaluate(i) if isinstance(i, GndarrayExpression) else i
+                        for i in inputs
+                    )
+                expr = getattr(ufunc, method)(*inputs, **kwargs)
+        return expr
+
+    def __repr__(self):
+        """
+        Stringify.
+        """
+        if self.is_leaf:
+            if isinstance(self._value, _globale.gndarray):
+                s = "gndarray(shape=%s, dtype=%s)" % (self.shape, self.dtype)
+            elif self.is_scalar:
+                s = repr(self._value)
+            else:
+                s = "ndarray(shape=%s, dtype=%s)" % (self.shape, self.dtype)
+        else:
+            s = "%s(%s)" % (self._ufunc.__name__, ", ".join(repr(i) for i in self._inputs))
+        return s
+
+
+def lazy(value):
+    """
+    Wraps :samp:`{value}` as a :obj:`GndarrayExpression` leaf node, ufunc operations
+    on the returned node are recorded (regardless of :func:`lazy_mode`).
+
+    :type value: :obj:`mpi_array.globale.gndarray`, :obj:`numpy.ndarray` or scalar
+    :param value: Array or scalar.
+    :rtype: :obj:`GndarrayExpression`
+    :return: Leaf node, :samp:`{value}` is returned if it is already
+       a :obj:`GndarrayExpression`.
+    """
+    if not isinstance(value, GndarrayExpression):
+        value = GndarrayExpression(value=value)
+    return value
+
+
+def record_ufunc(ufunc, method, *inputs, **kwargs):
+    """
+    Returns a :obj:`GndarrayExpression` operation node for the :samp:`{ufunc}` call
+    when the call can be deferred, i.e. single output :samp:`__call__` operations
+    (without :samp:`out` or :samp:`where` arguments) which are either called with
+    a :obj:`GndarrayExpression` operand or called within a :func:`lazy_mode` context.
+
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: The ufunc.
+    :type method: :obj:`str`
+    :param method: The ufunc method, e.g. :samp:`"__call__"`.
+    :type inputs: sequence
+    :param inputs: The ufunc operands.
+    :rtype: :obj:`GndarrayExpression`
+    :return: The recorded node, or :samp:`None` if the call is not deferred.
+    """
+    expr = None
+    if (
+        (method == "__call__")
+        and
+        (ufunc.nout == 1)
+        and
+        ("out" not in kwargs)
+        and
+        ("where" not in kwargs)
+        and
+        (
+            is_lazy_mode()
+            or
+            any(isinstance(i, GndarrayExpression) for i in inputs)
+        )
+        and
+        all(
+            isinstance(i, (GndarrayExpression, _globale.gndarray, _np.ndarray))
+            or
+            _np.isscalar(i)
+            for i in inputs
+        )
+    ):
+        expr = GndarrayExpression(ufunc=ufunc, inputs=[lazy(i) for i in inputs], kwargs=kwargs)
+    return expr
+
+
+def _same_locale_extents(gndary0, gndary1):
+    """
+    Returns :samp:`True` if the two arrays have the same shape,
+    congruent :samp:`peer_comm` communicators and the same locale extents.
+    """
+    same = \
+        (
+            (tuple(gndary0.shape) == tuple(gndary1.shape))
+            and
+            (
+                _mpi.Comm.Compare(gndary0.locale_comms.peer_comm, gndary1.locale_comms.peer_comm)
+                in
+                (_mpi.IDENT, _mpi.CONGRUENT)
+            )
+            and
+            (gndary0.distribution.num_locales == gndary1.distribution.num_locales)
+        )
+    if same:
+        for le0, le1 in \
+                zip(gndary0.distribution.locale_extents, gndary1.distribution.locale_extents):
+            if (
+                (le0.peer_rank != le1.peer_rank)
+                or
+                _np.any(le0.start_n != le1.start_n)
+                or
+                _np.any(le0.stop_n != le1.stop_n)
+            ):
+                same = False
+                break
+    return same
+
+
+def can_fuse(expr, out=None):
+    """
+    Returns :samp:`True` if :samp:`{expr}` can be evaluated as a single fused
+    pass over the rank tiles. All :obj:`mpi_array.globale.gndarray` leaves
+    (and :samp:`{out}`) must have the shape of the result and the same locale extents.
+    Only uses globally consistent (distribution) information, so all ranks return
+    the same value.
+
+    :type expr: :obj:`GndarrayExpression`
+    :param expr: Expression.
+    :type out: :obj:`mpi_array.globale.gndarray`
+    :param out: Optional output array.
+    :rtype: :obj:`bool`
+    :return: Whether the expression can be evaluated with a fused pass.
+    """
+    gndarrays = \
+        [
+            leaf.value for leaf in expr.iter_leaves()
+            if isinstance(leaf.value, _globale.gndarray)
+        ]
+    if out is not None:
+        gndarrays.insert(0, out)
+
+    return \
+        (
+            (len(gndarrays) > 0)
+            and
+            (tuple(gndarrays[0].shape) == tuple(expr.shape))
+            and
+            all(_same_locale_extents(gndarrays[0], g) for g in gndarrays[1:])
+        )
+
+
+def _evaluate_eager(expr, out=None):
+    """
+    Evaluates :samp:`{expr}` node by node, each operation node
+    result is a (temporary) :obj:`mpi_array.globale.gndarray`.
+    """
+    values = dict()
+    temporaries = []
+    with lazy_mode(enable=False):
+        for node in expr.iter_nodes():
+            if node.is_leaf:
+                values[id(node)] = node.value
+            else:
+                result = node.ufunc(*[values[id(i)] for i in node.inputs], **node.kwargs)
+                values[id(node)] = result
+                if isinstance(result, _globale.gndarray):
+                    temporaries.append(result)
+
+        result = values[id(expr)]
+        if out is not None:
+            _globale.copyto(out, result)
+            result = out
+        for tmp in temporaries:
+            if tmp is not result:
+                tmp.free()
+    return result
+
+
+def _calc_blocks(tile_shape, block_size):
+    """
+    Returns a :obj:`list` of :obj:`tuple` of :obj:`slice` which partitions
+    an array of shape :samp:`{tile_shape}` into C-ordered blocks, each block
+    having approximately (at most, unless a row exceeds it) :samp:`{block_size}` elements.
+    Also returns the maximum block shape.
+    """
+    tile_shape = tuple(tile_shape)
+    ndim = len(tile_shape)
+    block_size = max(1, block_size)
+    # Find the outermost axis along which chunking is performed, all axes
+    # inner to it are included whole in each block.
+    axis = ndim - 1
+    inner = 1
+    while (axis > 0) and (inner * tile_shape[axis] <= block_size):
+        inner *= tile_shape[axis]
+        axis -= 1
+    if (ndim > 0) and (inner * tile_shape[axis] <= block_size):
+        inner *= tile_shape[axis]
+        axis = -1
+    blocks = []
+    if axis < 0:
+        blocks.append(tuple(slice(0, n) for n in tile_shape))
+        block_shape = tile_shape
+    else:
+        chunk = max(1, block_size // inner)
+        block_shape = (1,) * axis + (min(chunk, tile_shape[axis]),) + tile_shape[axis + 1:]
+        outer_ranges = [range(n) for n in tile_shape[:axis]]
+        for outer_idx in _itertools.product(*outer_ranges):
+            for start in range(0, tile_shape[axis], chunk):
+                blocks.append(
+                    tuple(slice(i, i + 1) for i in outer_idx)
+                    +
+                    (slice(start, min(start + chunk, tile_shape[axis])),)
+                    +
+                    tuple(slice(0, n) for n in tile_shape[axis + 1:])
+                )
+    return blocks, block_shape
+
+
+def _evaluate_fused(expr, out, block_size):
+    """
+    Evaluates :samp:`{expr}` into :samp:`{out}` with a single (blocked) pass
+    over the :attr:`mpi_array.globale.gndarray.rank_view_n` tile of this rank.
+    """
+    rank_logger = _logging.get_rank_logger(__name__ + ".evaluate")
+    # Remote ranks may still be writing the locale arrays of the operands, the
+    # operands have the same locales (see can_fuse) so a single barrier suffices.
+    for node in expr.iter_nodes():
+        if node.is_leaf and isinstance(node.value, _globale.gndarray):
+            node.value.intra_locale_barrier()
+            break
+    rank_region = _globale_ufunc.calc_rank_view_region(out)
+    if rank_region is not None:
+        out_tile = out.view_n[rank_region]
+        locale_start = out.lndarray_proxy.locale_extent.start_n
+        rank_slice = \
+            tuple(
+                slice(locale_start[a] + slc.start, locale_start[a] + slc.stop)
+                for a, slc in enumerate(rank_region)
+            )
+        nodes = list(expr.iter_nodes())
+        tiles = dict()
+        for node in nodes:
+            if node.is_leaf and not node.is_scalar:
+                if isinstance(node.value, _globale.gndarray):
+                    tiles[id(node)] = node.value.view_n[rank_region]
+                else:
+                    tiles[id(node)] = _np.broadcast_to(node.value, out.shape)[rank_slice]
+
+        blocks, block_shape = _calc_blocks(out_tile.shape, block_size)
+        rank_logger.debug(
+            "Fused evaluation of %s nodes over tile shape=%s in %s blocks of shape %s.",
+            len(nodes),
+            out_tile.shape,
+            len(blocks),
+            block_shape
+        )
+        # Scratch buffers for the intermediate (non-root) operation nodes,
+        # re-used for every block.
+        scratch = \
+            {
+                id(node): _np.empty(block_shape, dtype=node.dtype)
+                for node in nodes if (not node.is_leaf) and (node is not expr)
+            }
+        for block in blocks:
+            shape = tuple(slc.stop - slc.start for slc in block)
+            scratch_slice = tuple(slice(0, n) for n in shape)
+            values = dict()
+            for node in nodes:
+                if node.is_scalar:
+                    values[id(node)] = node.value
+                elif node.is_leaf:
+                    values[id(node)] = tiles[id(node)][block]
+                else:
+                    if node is expr:
+                        dst = out_tile[block]
+                    else:
+                        dst = scratch[id(node)][scratch_slice]
+                    node.ufunc(
+                        *[values[id(i)] for i in node.inputs],
+                        out=dst,
+                        **node.kwargs
+                    )
+                    values[id(node)] = dst
+        out.mark_dirty()
+
+    out.intra_locale_barrier()
+
+    return out
+
+
+def evaluate(expr, out=None, block_size=None):
+    """
+    Evaluates the expression :samp:`{expr}`. Should be called collectively
+    (all :samp:`peer_comm` processes of the :obj:`mpi_array.globale.gndarray` operands).
+    When :func:`can_fuse` is :samp:`True` the result is computed in a single blocked
+    pass over each rank's tile of the result with a single intra-locale barrier,
+    otherwise the nodes are evaluated eagerly.
+
+    :type expr: :obj:`GndarrayExpression`
+    :param expr: The expression to evaluate, non-expression values are returned as-is.
+    :type out: :obj:`mpi_array.globale.gndarray`
+    :param out: Optional output array, should have the shape of the expression result
+       (and may also be an operand of the expression).
+    :type block_size: :obj:`int`
+    :param block_size: Approximate number of elements per block in the fused pass,
+       defaults to :attr:`DEFAULT_BLOCK_SIZE`.
+    :rtype: :obj:`mpi_array.globale.gndarray`
+    :return: The result array (:samp:`{out}` if specified).
+    """
+    if not isinstance(expr, GndarrayExpression):
+        return expr
+    if expr.is_leaf:
+        if out is None:
+            return expr.value
+    if (out is not None) and (tuple(out.shape) != tuple(expr.shape)):
+        raise ValueError(
+            "Got out.shape=%s, expected shape=%s of expression result."
+            %
+            (tuple(out.shape), tuple(expr.shape))
+        )
+    if expr.is_leaf:
+        # Copy, rather than apply an identity ufunc (e.g. numpy.positive has no bool loop).
+        if expr.value is not out:
+            _globale.copyto(out, expr.value)
+        return out
+    if block_size is None:
+        block_size = DEFAULT_BLOCK_SIZE
+
+    if can_fuse(expr, out):
+        if out is None:
+            template = \
+                [
+                    leaf.value for leaf in expr.iter_leaves()
+                    if isinstance(leaf.value, _globale.gndarray)
+                ][0]
+            out = \
+                _globale_creation.empty(
+                    dtype=expr.dtype,
+                    comms_and_distrib=template.comms_and_distrib,
+                    intra_partition_dims=template.lndarray_proxy.intra_partition_dims
+                )
+        result = _evaluate_fused(expr, out, block_size)
+    else:
+        result = _evaluate_eager(expr, out)
+
+    return result
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
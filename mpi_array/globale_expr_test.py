@@ -0,0 +1,222 @@
+"""
+=============================================
+The :mod:`mpi_array.globale_expr_test` Module
+=============================================
+
+Module defining :mod:`mpi_array.globale_expr` unit-tests.
+Execute as::
+
+   python -m mpi_array.globale_expr_test
+
+and with parallelism::
+
+   mpirun -n  2 python -m mpi_array.globale_expr_test
+   mpirun -n  4 python -m mpi_array.globale_expr_test
+   mpirun -n 27 python -m mpi_array.globale_expr_test
+
+
+Classes
+=======
+
+.. autosummary::
+   :toctree: generated/
+   :template: autosummary/inherits_TestCase_class.rst
+
+   GndarrayExpressionTest - Tests for :obj:`mpi_array.globale_expr.GndarrayExpression`.
+"""
+from __future__ import absolute_import
+
+import numpy as _np
+
+from .license import license as _license, copyright as _copyright, version as _version
+from . import unittest as _unittest
+from . import logging as _logging  # noqa: E402,F401
+from .comms import LT_NODE, LT_PROCESS, DT_CLONED, DT_SINGLE_LOCALE, DT_BLOCK
+from .globale_expr import GndarrayExpression, lazy_mode, is_lazy_mode, lazy, evaluate, can_fuse
+from .globale import gndarray as _gndarray
+from .globale_creation import zeros as _zeros, asarray as _asarray, empty as _empty
+from .globale import copyto as _copyto
+
+__author__ = "Shane J. Latham"
+__license__ = _license()
+__copyright__ = _copyright()
+__version__ = _version()
+
+
+class GndarrayExpressionTest(_unittest.TestCase):
+
+    """
+    :obj:`unittest.TestCase` for :obj:`mpi_array.globale_expr`.
+    """
+
+    def setUp(self):
+        """
+        Initialise :func:`numpy.random.seed`.
+        """
+        _np.random.seed(1531796313)
+        self._rank_logger = _logging.get_rank_logger(self.id())
+        with _asarray(_np.zeros((100,))) as gary:
+            self.num_node_locales = gary.num_locales
+
+    @property
+    def rank_logger(self):
+        """
+        A :obj:`logging.Logger` object.
+        """
+        return self._rank_logger
+
+    def compare_results(self, npy_result_ary, mpi_result_ary):
+        """
+        Asserts that all elements of the :obj:`numpy.ndarray` :samp:`{npy_result_ary}`
+        equal all elements of the  :obj:`mpi_array.globale.gndarray` :samp:`{mpi_result_ary}`.
+
+        :type npy_result_ary: :obj:`numpy.ndarray`
+        :param npy_result_ary: The expected result.
+        :type mpi_result_ary: :obj:`mpi_array.globale.gndarray`
+        :param mpi_result_ary: The result array of the expression evaluation.
+        """
+        self.assertTrue(isinstance(mpi_result_ary, _gndarray))
+        self.assertEqual(npy_result_ary.dtype, mpi_result_ary.dtype)
+        with \
+                _zeros(
+                    shape=mpi_result_ary.shape,
+                    dtype=mpi_result_ary.dtype,
+                    locale_type=LT_NODE,
+                    distrib_type=DT_CLONED
+                ) as mpi_cln_mpi_result_ary:
+
+            _copyto(dst=mpi_cln_mpi_result_ary, src=mpi_result_ary)
+
+            self.assertSequenceEqual(
+                tuple(npy_result_ary.shape),
+                tuple(mpi_cln_mpi_result_ary.shape)
+            )
+            self.assertTrue(
+                _np.all(npy_result_ary == mpi_cln_mpi_result_ary.lndarray_proxy.view_n)
+            )
+
+    def test_record(self):
+        """
+        Asserts that ufunc calls are recorded inside :func:`mpi_array.globale_expr.lazy_mode`
+        contexts (and for :func:`mpi_array.globale_expr.lazy` operands), and that
+        the expression :samp:`shape` and :samp:`dtype` match eager evaluation.
+        """
+        gshape = (7 * self.num_node_locales + 1, 5)
+        npy_ary_i = _np.random.randint(low=1, high=10, size=gshape)
+        npy_ary_f = _np.random.uniform(low=1.0, high=2.0, size=gshape).astype("float32")
+        with _asarray(npy_ary_i) as gary_i, _asarray(npy_ary_f) as gary_f:
+            self.assertFalse(is_lazy_mode())
+            with lazy_mode():
+                self.assertTrue(is_lazy_mode())
+                expr = gary_i * 2.5
+                self.assertTrue(isinstance(expr, GndarrayExpression))
+                expr_f = 2.0 * _np.sqrt(gary_f)
+                self.assertTrue(isinstance(expr_f, GndarrayExpression))
+                with lazy_mode(enable=False):
+                    self.assertFalse(is_lazy_mode())
+                    with (gary_i + 1) as gary:
+                        self.assertTrue(isinstance(gary, _gndarray))
+            self.assertFalse(is_lazy_mode())
+
+            self.assertSequenceEqual(gshape, expr.shape)
+            self.assertEqual((npy_ary_i * 2.5).dtype, expr.dtype)
+            self.assertEqual((2.0 * _np.sqrt(npy_ary_f)).dtype, expr_f.dtype)
+
+            expr = lazy(gary_i) - gary_f
+            self.assertTrue(isinstance(expr, GndarrayExpression))
+            self.assertTrue(isinstance(gary_f - lazy(gary_i), GndarrayExpression))
+            self.assertEqual((npy_ary_i - npy_ary_f).dtype, expr.dtype)
+            self.assertTrue(evaluate(gary_i) is gary_i)
+            self.assertTrue(evaluate(lazy(gary_i)) is gary_i)
+
+            # Only whole array assignment is supported.
+            self.assertRaises(NotImplementedError, gary_f.__setitem__, slice(0, 5), expr_f)
+            gary_f[...] = gary_f
+            self.compare_results(npy_ary_f, gary_f)
+
+            # Non __call__ ufunc methods evaluate the expression operand.
+            with _np.add.reduce(expr, axis=0) as result:
+                self.compare_results(_np.add.reduce(npy_ary_i - npy_ary_f, axis=0), result)
+
+    def test_fused_evaluate(self):
+        """
+        Asserts that the fused evaluation of an expression (with a shared sub-expression
+        and broadcast :obj:`numpy.ndarray` and scalar operands) produces the same result
+        as :obj:`numpy.ndarray` evaluation, including for assignment and in-place results.
+        """
+        gshape = (13 * self.num_node_locales + 3, 17, 5)
+        npy_ary_a = _np.random.uniform(low=1.0, high=2.0, size=gshape)
+        npy_ary_b = _np.random.uniform(low=-1.0, high=1.0, size=gshape)
+        npy_ary_c = _np.random.randint(low=-10, high=10, size=gshape)
+        npy_row = _np.random.uniform(low=4.0, high=5.0, size=gshape[-1:])
+
+        def func(a, b, c):
+            s = a * b
+            return _np.exp((s + c) / (s - npy_row)) + 2.0
+
+        npy_result = func(npy_ary_a, npy_ary_b, npy_ary_c)
+        for locale_type in (LT_NODE, LT_PROCESS):
+            for distrib_type, halo in ((DT_BLOCK, 2), (DT_CLONED, 0), (DT_SINGLE_LOCALE, 0)):
+                kwargs = dict(locale_type=locale_type, distrib_type=distrib_type, halo=halo)
+                with \
+                        _asarray(npy_ary_a, **kwargs) as gary_a, \
+                        _asarray(npy_ary_b, **kwargs) as gary_b, \
+                        _asarray(npy_ary_c, **kwargs) as gary_c:
+                    with lazy_mode():
+                        expr = func(gary_a, gary_b, gary_c)
+                    self.assertTrue(isinstance(expr, GndarrayExpression))
+                    self.assertTrue(can_fuse(expr))
+                    for block_size in (None, 37, 1):
+                        with evaluate(expr, block_size=block_size) as result:
+                            self.compare_results(npy_result, result)
+
+                    with _empty(gshape, dtype="float64", **kwargs) as out:
+                        out[...] = expr
+                        self.compare_results(npy_result, out)
+
+                    # In-place update of an operand.
+                    gary_a[...] = lazy(gary_a) * gary_b - 1.0
+                    self.compare_results(npy_ary_a * npy_ary_b - 1.0, gary_a)
+
+    def test_eager_evaluate(self):
+        """
+        Asserts that expressions which cannot be fused (operands with different
+        distributions or broadcast :obj:`mpi_array.globale.gndarray` operands) are
+        evaluated eagerly and produce the same result as :obj:`numpy.ndarray` evaluation.
+        """
+        gshape = (11 * self.num_node_locales + 2, 9, 3)
+        npy_ary_a = _np.random.uniform(low=1.0, high=2.0, size=gshape)
+        npy_ary_b = _np.random.uniform(low=-1.0, high=1.0, size=gshape)
+        npy_row = _np.random.uniform(low=-1.0, high=1.0, size=gshape[1:])
+
+        with \
+                _asarray(npy_ary_a, locale_type=LT_PROCESS, distrib_type=DT_BLOCK) as gary_a, \
+                _asarray(npy_ary_b, locale_type=LT_PROCESS, distrib_type=DT_CLONED) as gary_b, \
+                _asarray(npy_row, locale_type=LT_PROCESS, distrib_type=DT_BLOCK) as gary_row:
+            expr = _np.square(lazy(gary_a) - gary_b) * 3.0
+            self.assertEqual(gary_a.num_locales == 1, can_fuse(expr))
+            with evaluate(expr) as result:
+                self.compare_results(_np.square(npy_ary_a - npy_ary_b) * 3.0, result)
+
+            expr = lazy(gary_a) + gary_row
+            self.assertFalse(can_fuse(expr))
+            with evaluate(expr) as result:
+                self.compare_results(npy_ary_a + npy_row, result)
+            with _zeros(gshape, locale_type=LT_NODE, distrib_type=DT_CLONED) as out:
+                out[:] = expr
+                self.compare_results(npy_ary_a + npy_row, out)
+                self.assertRaises(ValueError, evaluate, lazy(gary_row) * 2, out)
+
+        # A leaf expression is copied into the out array, including for bool arrays.
+        npy_ary_bool = npy_ary_a > 1.5
+        with \
+                _asarray(npy_ary_bool, locale_type=LT_PROCESS, distrib_type=DT_BLOCK) as gary, \
+                _zeros(gshape, dtype="bool", locale_type=LT_NODE, distrib_type=DT_BLOCK) as out:
+            self.assertTrue(evaluate(lazy(gary), out=out) is out)
+            self.compare_results(npy_ary_bool, out)
+
+
+_unittest.main(__name__)
+
+
+__all__ = [s for s in dir() if not s.startswith('_')]
@@ -33,6 +33,7 @@ import numpy as _np
 
 from .license import license as _license, copyright as _copyright, version as _version
 from . import globale as _globale
+from . import update as _update
 from . import locale as _locale
 from .indexing import IndexingExtent as _IndexingExtent
 from . import unittest as _unittest
@@ -246,10 +247,17 @@ class GndarrayTest(_unittest.TestCase):
         and :meth:`mpi_array.globale.gndarray.__setitem__` methods.
         """
         with _globale_creation.zeros((20, 20, 20), dtype="int8") as gary:
-            gary[1, 2, 8] = 22
             gary[1:10, 2:4, 4:8]
+            self.assertRaises(NotImplementedError, gary.__setitem__, (1, 2, 8), 22)
             gary[...] = 19
+            self.assertTrue(_np.all(gary.rank_view_n == 19))
             gary[:] = 101
+            self.assertTrue(_np.all(gary.rank_view_n == 101))
+            with _globale_creation.ones((20, 20, 20), dtype="int8") as gary1:
+                gary[...] = gary1
+                self.assertTrue(_np.all(gary.rank_view_n == 1))
+            gary[...] = gary
+            self.assertTrue(_np.all(gary.rank_view_n == 1))
 
     def test_update(self):
         """
@@ -401,6 +409,633 @@ class GndarrayTest(_unittest.TestCase):
                         )
                     )
 
+    def test_update_plan(self):
+        """
+        Test for :attr:`mpi_array.globale.PerAxisRmaHaloUpdater.halo_update_plan`,
+        plan is shared between arrays and is replayed for repeated updates.
+        """
+        halo = 2
+        lshape = (8, 10)
+        gshape = (_mpi.COMM_WORLD.size * lshape[0], lshape[1])
+        cand = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_BLOCK,
+                locale_type=LT_PROCESS,
+                halo=halo
+            )
+        with \
+                _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary0, \
+                _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary1, \
+                _globale_creation.zeros(comms_and_distrib=cand, dtype="float64") as gary2:
+            if gary0.locale_comms.have_valid_inter_locale_comm:
+                plan0 = gary0.halo_updater.halo_update_plan
+                self.assertTrue(plan0 is gary1.halo_updater.halo_update_plan)
+                self.assertTrue(plan0 is not gary2.halo_updater.halo_update_plan)
+                # The distribution part of the plan key is calculated once per updater.
+                plan_key = gary0.halo_updater.halo_update_plan_key
+                self.assertTrue(plan_key is gary0.halo_updater.halo_update_plan_key)
+                self.assertEqual(plan_key, gary1.halo_updater.halo_update_plan_key)
+                self.assertEqual(gary0.ndim, len(plan0.axis_transfers))
+                if gary0.num_locales <= 1:
+                    self.assertEqual(0, plan0.num_transfers)
+
+            for i in range(3):
+                if gary0.locale_comms.have_valid_inter_locale_comm:
+                    val = (gary0.locale_comms.inter_locale_comm.rank + 1) * (i + 1)
+                    gary0.lndarray_proxy.view_n[...] = val
+                gary0.locale_comms.peer_comm.barrier()
+                gary0.update()
+                if gary0.locale_comms.have_valid_inter_locale_comm:
+                    for axis in range(gary0.ndim):
+                        for dir in [gary0.lndarray_proxy.LO, gary0.lndarray_proxy.HI]:
+                            halo_slab = \
+                                gary0.lndarray_proxy.locale_extent.halo_slab_extent(axis, dir)
+                            if _np.product(halo_slab.shape) > 0:
+                                halo_slab = \
+                                    gary0.lndarray_proxy.locale_extent.globale_to_locale_extent_h(
+                                        halo_slab
+                                    )
+                                halo_vals = gary0.lndarray_proxy[halo_slab.to_slice()]
+                                self.assertTrue(_np.all(halo_vals != val))
+                                self.assertTrue(_np.all((halo_vals % (i + 1)) == 0))
+                gary0.locale_comms.peer_comm.barrier()
+                if i == 1:
+                    # Freed plans are re-calculated.
+                    _globale.clear_plan_caches()
+                    if gary0.locale_comms.have_valid_inter_locale_comm:
+                        self.assertTrue(plan0.is_freed)
+                        self.assertFalse(gary0.halo_updater.halo_update_plan.is_freed)
+
+    def test_plan_cache(self):
+        """
+        Test for :obj:`mpi_array.globale.PlanCache`, least recently used plans
+        are evicted (and freed).
+        """
+        class Plan(object):
+
+            def __init__(self):
+                self.num_free = 0
+
+            def free(self):
+                self.num_free += 1
+
+        cache = _globale.PlanCache(max_size=2)
+        plans = [Plan() for i in range(4)]
+        self.assertTrue(cache.find(0) is None)
+        cache.add(0, plans[0])
+        cache.add(1, plans[1])
+        self.assertTrue(cache.find(0) is plans[0])
+        cache.add(2, plans[2])
+        self.assertEqual(2, len(cache))
+        self.assertEqual(1, plans[1].num_free)
+        self.assertTrue(cache.find(1) is None)
+        self.assertTrue(cache.find(0) is plans[0])
+        cache.add(2, plans[3])
+        self.assertEqual(1, plans[2].num_free)
+        cache.max_size = 1
+        self.assertEqual(1, len(cache))
+        self.assertEqual(1, plans[0].num_free)
+        cache.clear()
+        self.assertEqual(0, len(cache))
+        self.assertEqual([1, 1, 1, 1], [p.num_free for p in plans])
+        self.assertRaises(ValueError, _globale.PlanCache, 0)
+
+    def test_update_halo_engine(self):
+        """
+        Test for :meth:`mpi_array.globale.gndarray.update` with
+        the :attr:`mpi_array.globale.HALO_ENGINE_P2P` engine, compares
+        against the :attr:`mpi_array.globale.HALO_ENGINE_RMA` updated halos.
+        """
+        halo = (2, 1, 3)
+        lshape = (6, 8, 7)
+        shape_factor = max([1, int(_np.floor(_np.power(_mpi.COMM_WORLD.size, 1.0 / 3.0)))])
+        gshape = tuple(shape_factor * _np.array(lshape))
+        for locale_type in (LT_PROCESS, LT_NODE):
+            cand = \
+                create_distribution(
+                    shape=gshape,
+                    distrib_type=DT_BLOCK,
+                    locale_type=locale_type,
+                    halo=halo
+                )
+            with \
+                    _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary_rma, \
+                    _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary_p2p:
+
+                self.assertEqual(_globale.get_default_halo_engine(), gary_p2p.halo_engine)
+                gary_rma.halo_engine = _globale.HALO_ENGINE_RMA
+                gary_p2p.halo_engine = _globale.HALO_ENGINE_P2P
+                self.assertEqual(_globale.HALO_ENGINE_P2P, gary_p2p.halo_engine)
+                self.assertRaises(ValueError, setattr, gary_p2p, "halo_engine", "not_an_engine")
+
+                if gary_rma.locale_comms.have_valid_inter_locale_comm:
+                    val = gary_rma.locale_comms.inter_locale_comm.rank + 1
+                    gary_rma.lndarray_proxy.view_n[...] = val
+                    gary_p2p.lndarray_proxy.view_n[...] = val
+                    self.assertTrue(
+                        isinstance(gary_p2p.halo_updater, _globale.PerAxisP2pHaloUpdater)
+                    )
+                gary_rma.locale_comms.peer_comm.barrier()
+
+                gary_rma.update()
+                gary_p2p.update()
+
+                if gary_rma.locale_comms.have_valid_inter_locale_comm:
+                    self.assertTrue(
+                        _np.all(
+                            gary_rma.lndarray_proxy.lndarray
+                            ==
+                            gary_p2p.lndarray_proxy.lndarray
+                        )
+                    )
+                gary_rma.locale_comms.peer_comm.barrier()
+
+    def test_update_single_epoch(self):
+        """
+        Test for :meth:`mpi_array.globale.gndarray.update` with
+        the :attr:`mpi_array.globale.gndarray.halo_single_epoch` mode, compares
+        against the per-axis updated halos.
+        """
+        halo = (2, 1, 3)
+        lshape = (6, 8, 7)
+        shape_factor = max([1, int(_np.floor(_np.power(_mpi.COMM_WORLD.size, 1.0 / 3.0)))])
+        gshape = tuple(shape_factor * _np.array(lshape))
+        cand = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_BLOCK,
+                locale_type=LT_PROCESS,
+                halo=halo
+            )
+        for halo_engine in (_globale.HALO_ENGINE_RMA, _globale.HALO_ENGINE_P2P):
+            with \
+                    _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary0, \
+                    _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary1:
+                self.assertFalse(gary1.halo_single_epoch)
+                gary1.halo_engine = halo_engine
+                gary1.halo_single_epoch = True
+                self.assertTrue(gary1.halo_single_epoch)
+                if gary0.locale_comms.have_valid_inter_locale_comm:
+                    self.assertTrue(gary1.halo_updater.single_epoch)
+                    self.assertTrue(len(gary1.halo_updater.halo_update_plan.exchange_axes) <= 1)
+                    val = gary0.locale_comms.inter_locale_comm.rank + 1
+                    gary0.lndarray_proxy.view_n[...] = val
+                    gary1.lndarray_proxy.view_n[...] = val
+                gary0.locale_comms.peer_comm.barrier()
+
+                gary0.update()
+                gary1.update()
+
+                if gary0.locale_comms.have_valid_inter_locale_comm:
+                    self.assertTrue(
+                        _np.all(gary0.lndarray_proxy.lndarray == gary1.lndarray_proxy.lndarray)
+                    )
+                gary0.locale_comms.peer_comm.barrier()
+
+    def test_update_max_message_bytes(self):
+        """
+        Test for :meth:`mpi_array.globale.gndarray.update` with
+        the :attr:`mpi_array.globale.gndarray.halo_max_message_bytes` (chunked
+        halo transfers), compares against the un-chunked updated halos.
+        """
+        halo = (2, 1, 3)
+        lshape = (6, 8, 7)
+        shape_factor = max([1, int(_np.floor(_np.power(_mpi.COMM_WORLD.size, 1.0 / 3.0)))])
+        gshape = tuple(shape_factor * _np.array(lshape))
+        cand = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_BLOCK,
+                locale_type=LT_PROCESS,
+                halo=halo
+            )
+        halo_engines = \
+            (_globale.HALO_ENGINE_RMA, _globale.HALO_ENGINE_P2P, _globale.HALO_ENGINE_RMA_RGET)
+        for halo_engine in halo_engines:
+            for single_epoch in (False, True):
+                with \
+                        _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary0, \
+                        _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary1:
+                    self.assertEqual(None, gary1.halo_max_message_bytes)
+                    self.assertRaises(ValueError, setattr, gary1, "halo_max_message_bytes", 0)
+                    gary1.halo_engine = halo_engine
+                    gary1.halo_single_epoch = single_epoch
+                    gary1.halo_max_message_bytes = 3 * gary1.dtype.itemsize
+                    self.assertEqual(12, gary1.halo_max_message_bytes)
+                    if gary0.locale_comms.have_valid_inter_locale_comm:
+                        self.assertEqual(3, gary1.halo_updater.max_message_elements)
+                        self.assertTrue(
+                            gary1.halo_updater.halo_update_plan.num_transfers
+                            >=
+                            gary0.halo_updater.halo_update_plan.num_transfers
+                        )
+                        view_n = gary0.lndarray_proxy.view_n
+                        val = \
+                            _np.arange(view_n.size).reshape(view_n.shape) \
+                            + \
+                            100000 * (gary0.locale_comms.inter_locale_comm.rank + 1)
+                        gary0.lndarray_proxy.view_n[...] = val
+                        gary1.lndarray_proxy.view_n[...] = val
+                    gary0.locale_comms.peer_comm.barrier()
+
+                    gary0.update()
+                    gary1.update()
+
+                    if gary0.locale_comms.have_valid_inter_locale_comm:
+                        self.assertTrue(
+                            _np.all(
+                                gary0.lndarray_proxy.lndarray
+                                ==
+                                gary1.lndarray_proxy.lndarray
+                            )
+                        )
+                    gary0.locale_comms.peer_comm.barrier()
+
+    def test_update_periodic(self):
+        """
+        Test for :meth:`mpi_array.globale.gndarray.update` with periodic axes, halo
+        elements which lie outside the globale extent are updated with
+        the (wrapped) elements from the opposite face.
+        """
+        halo = (2, 1, 3)
+        lshape = (6, 8, 7)
+        periods = (True, False, True)
+        shape_factor = max([1, int(_np.floor(_np.power(_mpi.COMM_WORLD.size, 1.0 / 3.0)))])
+        gshape = tuple(shape_factor * _np.array(lshape))
+        halo_engines = \
+            (_globale.HALO_ENGINE_RMA, _globale.HALO_ENGINE_P2P, _globale.HALO_ENGINE_RMA_RGET)
+        for locale_type in (LT_PROCESS, LT_NODE):
+            cand = \
+                create_distribution(
+                    shape=gshape,
+                    distrib_type=DT_BLOCK,
+                    locale_type=locale_type,
+                    halo=halo,
+                    periods=periods
+                )
+            self.assertSequenceEqual(periods, tuple(cand.distribution.periods))
+            for halo_engine in halo_engines:
+                for single_epoch in (False, True):
+                    with _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary:
+                        gary.halo_engine = halo_engine
+                        gary.halo_single_epoch = single_epoch
+                        self.assertTrue(gary.have_halo_exchange)
+                        extent = gary.lndarray_proxy.locale_extent
+                        # Globale index of each locale element (including halo),
+                        # wrapped on periodic axes.
+                        gidx = \
+                            [
+                                (_np.arange(extent.start_h[a], extent.stop_h[a]) % gshape[a])
+                                for a in range(len(gshape))
+                            ]
+                        gidx = _np.meshgrid(*gidx, indexing="ij")
+                        expected = (gidx[0] * gshape[1] + gidx[1]) * gshape[2] + gidx[2] + 1
+                        n_slice = \
+                            tuple(
+                                slice(extent.start_n[a] - extent.start_h[a],
+                                      extent.stop_n[a] - extent.start_h[a])
+                                for a in range(len(gshape))
+                            )
+                        if gary.locale_comms.have_valid_inter_locale_comm:
+                            gary.lndarray_proxy.view_h[...] = -1
+                            gary.lndarray_proxy.view_n[...] = \
+                                expected[n_slice]
+                        gary.locale_comms.peer_comm.barrier()
+
+                        gary.update()
+
+                        self.assertSequenceEqual(
+                            expected.tolist(),
+                            gary.lndarray_proxy.view_h.tolist()
+                        )
+                        gary.locale_comms.peer_comm.barrier()
+
+    def test_update_axes_depth(self):
+        """
+        Test for :meth:`mpi_array.globale.gndarray.update` with the :samp:`axes`
+        and :samp:`depth` arguments, only the halo elements within the depth
+        of the non-halo elements are updated.
+        """
+        halo = 3
+        lshape = (6, 8, 7)
+        shape_factor = max([1, int(_np.floor(_np.power(_mpi.COMM_WORLD.size, 1.0 / 3.0)))])
+        gshape = tuple(shape_factor * _np.array(lshape))
+        halo_engines = \
+            (_globale.HALO_ENGINE_RMA, _globale.HALO_ENGINE_P2P, _globale.HALO_ENGINE_RMA_RGET)
+        axes_and_depths = \
+            (
+                (None, 1),
+                ((0, -1), None),
+                (1, 2),
+                (None, [[1, 0], [0, 2], [2, 1]]),
+            )
+        cand = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_BLOCK,
+                locale_type=LT_PROCESS,
+                halo=halo
+            )
+        for halo_engine in halo_engines:
+            for single_epoch in (False, True):
+                with _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary:
+                    gary.halo_engine = halo_engine
+                    gary.halo_single_epoch = single_epoch
+                    self.assertTrue(gary.calc_halo_depth() is None)
+                    self.assertTrue(gary.calc_halo_depth(axes=(0, 1, 2), depth=5) is None)
+                    self.assertRaises(ValueError, gary.calc_halo_depth, 3, None)
+                    self.assertRaises(ValueError, gary.calc_halo_depth, None, -1)
+                    extent = gary.lndarray_proxy.locale_extent
+                    gidx = _np.meshgrid(
+                        *[_np.arange(extent.start_h[a], extent.stop_h[a]) for a in range(3)],
+                        indexing="ij"
+                    )
+                    values = (gidx[0] * gshape[1] + gidx[1]) * gshape[2] + gidx[2] + 1
+                    n_slice = \
+                        tuple(
+                            slice(extent.start_n[a] - extent.start_h[a],
+                                  extent.stop_n[a] - extent.start_h[a])
+                            for a in range(3)
+                        )
+                    for axes, depth in axes_and_depths:
+                        for split_phase in (False, True):
+                            if gary.locale_comms.have_valid_inter_locale_comm:
+                                gary.lndarray_proxy.view_h[...] = -1
+                                gary.lndarray_proxy.view_n[...] = values[n_slice]
+                            gary.locale_comms.peer_comm.barrier()
+
+                            if split_phase:
+                                gary.update_begin(axes=axes, depth=depth).wait()
+                            else:
+                                gary.update(axes=axes, depth=depth)
+
+                            depth_extent = \
+                                _update.calc_halo_depth_extent(
+                                    extent,
+                                    gary.calc_halo_depth(axes, depth)
+                                )
+                            in_depth = \
+                                _np.all(
+                                    [
+                                        (gidx[a] >= depth_extent.start[a])
+                                        &
+                                        (gidx[a] < depth_extent.stop[a])
+                                        for a in range(3)
+                                    ],
+                                    axis=0
+                                )
+                            self.assertSequenceEqual(
+                                _np.where(in_depth, values, -1).tolist(),
+                                gary.lndarray_proxy.view_h.tolist()
+                            )
+                            gary.locale_comms.peer_comm.barrier()
+
+    def test_update_halos(self):
+        """
+        Test for :func:`mpi_array.globale.update_halos` and :obj:`mpi_array.globale.HaloGroup`,
+        batched halo update of multiple arrays which share a distribution.
+        """
+        halo = (2, 1, 3)
+        lshape = (6, 8, 7)
+        periods = (True, False, True)
+        shape_factor = max([1, int(_np.floor(_np.power(_mpi.COMM_WORLD.size, 1.0 / 3.0)))])
+        gshape = tuple(shape_factor * _np.array(lshape))
+        halo_engines = \
+            (_globale.HALO_ENGINE_RMA, _globale.HALO_ENGINE_P2P, _globale.HALO_ENGINE_RMA_RGET)
+        dtypes = ("int32", "float64", "int16")
+        cand = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_BLOCK,
+                locale_type=LT_PROCESS,
+                halo=halo,
+                periods=periods
+            )
+        self.assertRaises(ValueError, _globale.HaloGroup, [])
+        # Cache smaller than the group, per-array plans are evicted during group updates.
+        max_size = _globale._halo_update_plan_cache.max_size
+        _globale._halo_update_plan_cache.max_size = 2
+        self.addCleanup(setattr, _globale._halo_update_plan_cache, "max_size", max_size)
+        for halo_engine in halo_engines:
+            for single_epoch in (False, True):
+                garys = [_globale_creation.zeros(comms_and_distrib=cand, dtype=d) for d in dtypes]
+                for gary in garys:
+                    gary.halo_engine = halo_engine
+                    gary.halo_single_epoch = single_epoch
+                extent = garys[0].lndarray_proxy.locale_extent
+                hidx = \
+                    _np.meshgrid(
+                        *[_np.arange(extent.start_h[a], extent.stop_h[a]) for a in range(3)],
+                        indexing="ij"
+                    )
+                gidx = [hidx[a] % gshape[a] for a in range(3)]
+                n_slice = \
+                    tuple(
+                        slice(extent.start_n[a] - extent.start_h[a],
+                              extent.stop_n[a] - extent.start_h[a])
+                        for a in range(len(gshape))
+                    )
+                with _globale.HaloGroup(garys) as group:
+                    for depth in (None, 1, None):
+                        expected = []
+                        for i in range(len(garys)):
+                            values = \
+                                ((gidx[0] * gshape[1] + gidx[1]) * gshape[2] + gidx[2] + i + 1)
+                            expected.append(values.astype(dtypes[i]))
+                            if garys[i].locale_comms.have_valid_inter_locale_comm:
+                                garys[i].lndarray_proxy.view_h[...] = -1
+                                garys[i].lndarray_proxy.view_n[...] = values[n_slice]
+                        garys[0].locale_comms.peer_comm.barrier()
+
+                        if depth is None:
+                            _globale.update_halos(garys)
+                        else:
+                            group.update(depth=depth)
+
+                        in_depth = _np.ones(extent.shape_h, dtype="bool")
+                        if depth is not None:
+                            depth_extent = \
+                                _update.calc_halo_depth_extent(
+                                    extent,
+                                    garys[0].calc_halo_depth(None, depth)
+                                )
+                            for a in range(len(gshape)):
+                                in_depth &= \
+                                    (
+                                        (hidx[a] >= depth_extent.start[a])
+                                        &
+                                        (hidx[a] < depth_extent.stop[a])
+                                    )
+                        for i in range(len(garys)):
+                            self.assertSequenceEqual(
+                                _np.where(in_depth, expected[i], -1).tolist(),
+                                garys[i].lndarray_proxy.view_h.tolist()
+                            )
+                        garys[0].locale_comms.peer_comm.barrier()
+
+                # update_halos replays the plans of a cached group.
+                group = _globale._halo_group_cache.find(tuple(id(gary) for gary in garys))
+                self.assertTrue(group is not None)
+                if garys[0].locale_comms.have_valid_inter_locale_comm:
+                    plan = group.get_group_update()[0]
+                    _globale.update_halos(garys)
+                    self.assertTrue(plan is group.get_group_update()[0])
+                    self.assertFalse(plan.is_freed)
+                    # Replaced updaters invalidate the group plan.
+                    for gary in garys:
+                        gary.halo_single_epoch = not single_epoch
+                    self.assertTrue(plan is not group.get_group_update()[0])
+                    self.assertTrue(plan.is_freed)
+                    for gary in garys:
+                        gary.halo_single_epoch = single_epoch
+                else:
+                    _globale.update_halos(garys)
+
+                garys[1].halo_single_epoch = not single_epoch
+                self.assertRaises(ValueError, _globale.HaloGroup, garys)
+                self.assertRaises(ValueError, group.get_group_update)
+                _globale.free_all(garys)
+                _globale.clear_plan_caches()
+
+    def test_update_dirty_tracking(self):
+        """
+        Test for :attr:`mpi_array.globale.gndarray.halo_dirty_tracking`, :meth:`update`
+        only exchanges halos when the array has been written since the last update.
+        """
+        halo = 2
+        lshape = (6, 8)
+        shape_factor = max([1, int(_np.floor(_np.power(_mpi.COMM_WORLD.size, 1.0 / 2.0)))])
+        gshape = tuple(shape_factor * _np.array(lshape))
+        cand = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_BLOCK,
+                locale_type=LT_PROCESS,
+                halo=halo,
+                periods=True
+            )
+        with \
+                _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary, \
+                _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary1:
+            self.assertFalse(gary.halo_dirty_tracking)
+            gary.halo_dirty_tracking = True
+            gary1.halo_dirty_tracking = True
+
+            def halo_is_updated(ary, value):
+                view_h = ary.lndarray_proxy.view_h
+                return \
+                    ary.locale_comms.peer_comm.allreduce(
+                        bool(_np.all(view_h == value)),
+                        op=_mpi.LAND
+                    )
+
+            def clobber_halo(ary):
+                if ary.locale_comms.have_valid_inter_locale_comm:
+                    ary.lndarray_proxy.view_h[...] = -1
+                    ary.lndarray_proxy.view_n[...] = 3
+                ary.locale_comms.peer_comm.barrier()
+
+            gary.fill(3)
+            epoch = gary.write_epoch
+            self.assertTrue(gary.calc_halo_update_required())
+            gary.update()
+            self.assertTrue(halo_is_updated(gary, 3))
+            self.assertFalse(gary.calc_halo_update_required())
+
+            # Unregistered write, update is a no-op.
+            clobber_halo(gary)
+            gary.update()
+            self.assertEqual(epoch, gary.write_epoch)
+            self.assertFalse(halo_is_updated(gary, 3))
+
+            # Registered write, halos exchanged.
+            gary.mark_dirty()
+            gary.update()
+            self.assertTrue(halo_is_updated(gary, 3))
+
+            # Partial depth update does not clean the full halo.
+            clobber_halo(gary)
+            gary.mark_dirty()
+            gary.update(depth=1)
+            self.assertFalse(gary.calc_halo_update_required(gary.calc_halo_depth(depth=1)))
+            self.assertTrue(gary.calc_halo_update_required())
+            gary.update()
+            self.assertTrue(halo_is_updated(gary, 3))
+            self.assertFalse(gary.calc_halo_update_required(gary.calc_halo_depth(depth=1)))
+
+            # copyfrom and ufunc outputs mark the array dirty.
+            epoch = gary.write_epoch
+            gary1.fill(3)
+            gary.copyfrom(gary1)
+            self.assertTrue(gary.write_epoch > epoch)
+            epoch = gary.write_epoch
+            _np.add(gary1, 0, out=gary)
+            self.assertTrue(gary.write_epoch > epoch)
+
+            # Batched update only exchanges for dirty arrays.
+            gary.update()
+            gary1.update()
+            clobber_halo(gary)
+            clobber_halo(gary1)
+            gary1.mark_dirty()
+            with _globale.HaloGroup([gary, gary1]) as group:
+                self.assertSequenceEqual([gary1, ], group.calc_update_required_arrays())
+                group.update()
+                self.assertSequenceEqual([], group.calc_update_required_arrays())
+            self.assertFalse(halo_is_updated(gary, 3))
+            self.assertTrue(halo_is_updated(gary1, 3))
+
+            # No tracking, always exchanged.
+            gary.halo_dirty_tracking = False
+            gary.update()
+            self.assertTrue(halo_is_updated(gary, 3))
+
+    def test_update_begin_end(self):
+        """
+        Test for :meth:`mpi_array.globale.gndarray.update_begin`
+        and :meth:`mpi_array.globale.gndarray.update_end`.
+        """
+        halo = (1, 2, 3)
+        lshape = (7, 6, 8)
+        shape_factor = max([1, int(_np.floor(_np.power(_mpi.COMM_WORLD.size, 1.0 / 3.0)))])
+        gshape = tuple(shape_factor * _np.array(lshape))
+        cand = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_BLOCK,
+                locale_type=LT_PROCESS,
+                halo=halo
+            )
+        for halo_engine in (_globale.HALO_ENGINE_RMA, _globale.HALO_ENGINE_P2P):
+            with \
+                    _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary0, \
+                    _globale_creation.zeros(comms_and_distrib=cand, dtype="int32") as gary1:
+                gary1.halo_engine = halo_engine
+                if gary0.locale_comms.have_valid_inter_locale_comm:
+                    val = gary0.locale_comms.inter_locale_comm.rank + 1
+                    gary0.lndarray_proxy.view_n[...] = val
+                    gary1.lndarray_proxy.view_n[...] = val
+                gary0.locale_comms.peer_comm.barrier()
+
+                gary0.update()
+                handle = gary1.update_begin()
+                self.assertTrue(isinstance(handle, _globale.HaloUpdateHandle))
+                self.assertFalse(handle.complete)
+                # Overlapped computation
+                rank_sum = _np.sum(gary1.rank_view_n)
+                gary1.update_end(handle)
+                self.assertTrue(handle.complete)
+                self.assertEqual(_np.sum(gary1.rank_view_n), rank_sum)
+                self.assertRaises(RuntimeError, gary1.update_end, handle)
+                self.assertRaises(ValueError, gary0.update_end, handle)
+
+                if gary0.locale_comms.have_valid_inter_locale_comm:
+                    self.assertTrue(
+                        _np.all(gary0.lndarray_proxy.lndarray == gary1.lndarray_proxy.lndarray)
+                    )
+                gary0.locale_comms.peer_comm.barrier()
+
     def test_all(self):
         """
         Tests for :meth:`mpi_array.globale.gndarray.all`.
@@ -771,6 +1406,262 @@ class GndarrayTest(_unittest.TestCase):
             self.assertRaises(ValueError, _globale.copyto, [1, ], gary)
             self.assertRaises(ValueError, _globale.copyto, [1, ], [1, ])
 
+    def test_copyto_plan(self):
+        """
+        Tests for :meth:`mpi_array.globale.gndarray.get_copyfrom_plan`, plans
+        are cached and re-used for arrays of the same distributions.
+        """
+        lshape = (16, 16)
+        gshape = (_mpi.COMM_WORLD.size * lshape[0], _mpi.COMM_WORLD.size * lshape[1])
+
+        cand_node_slab = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_SLAB,
+                axis=0,
+                locale_type=LT_NODE,
+                halo=2
+            )
+
+        cand_proc_blok = \
+            create_distribution(
+                shape=gshape,
+                distrib_type=DT_BLOCK,
+                locale_type=LT_PROCESS,
+                halo=1
+            )
+
+        with \
+                _globale_creation.zeros(comms_and_distrib=cand_node_slab, dtype="int32")\
+                as gary_node_slab, \
+                _globale_creation.zeros(comms_and_distrib=cand_proc_blok, dtype="int32")\
+                as gary_proc_blok, \
+                _globale_creation.zeros(comms_and_distrib=cand_proc_blok, dtype="int32")\
+                as gary_proc_blok1, \
+                _globale_creation.zeros(comms_and_distrib=cand_proc_blok, dtype="float64")\
+                as gary_proc_blok2:
+
+            plan = gary_proc_blok.get_copyfrom_plan(gary_node_slab)
+            self.assertTrue(plan is gary_proc_blok.get_copyfrom_plan(gary_node_slab))
+            self.assertTrue(plan is gary_proc_blok1.get_copyfrom_plan(gary_node_slab))
+            plan1 = gary_node_slab.get_copyfrom_plan(gary_proc_blok)
+            self.assertEqual(plan is plan1, plan.plan_key == plan1.plan_key)
+            self.assertTrue(plan is not gary_proc_blok2.get_copyfrom_plan(gary_node_slab))
+            self.assertTrue(
+                plan is not gary_proc_blok.get_copyfrom_plan(gary_node_slab, casting="unsafe")
+            )
+            self.assertEqual(
+                _globale.calc_redistribute_plan_key(gary_proc_blok1, gary_node_slab),
+                plan.plan_key
+            )
+
+            for i in range(3):
+                gary_node_slab.rank_view_n[...] = \
+                    gary_node_slab.comms_and_distrib.this_locale.inter_locale_rank + i
+                _globale.copyto(gary_proc_blok, gary_node_slab, plan=plan)
+                gary_proc_blok1.copyfrom(gary_node_slab)
+                self.assertTrue(_np.all(gary_proc_blok.view_n == gary_proc_blok1.view_n))
+                gary_node_slab.fill(-1)
+                gary_node_slab.copyfrom(gary_proc_blok1)
+                self.assertTrue(
+                    _np.all(
+                        gary_node_slab.rank_view_n
+                        ==
+                        (gary_node_slab.comms_and_distrib.this_locale.inter_locale_rank + i)
+                    )
+                )
+
+            # Clearing the cache frees the plan resources, a held plan remains usable.
+            _globale.clear_plan_caches()
+            self.assertEqual(0, len(_globale._redistribute_plan_cache))
+            self.assertTrue(plan is not gary_proc_blok.get_copyfrom_plan(gary_node_slab))
+            gary_node_slab.rank_view_n[...] = \
+                gary_node_slab.comms_and_distrib.this_locale.inter_locale_rank + 7
+            gary_proc_blok.fill(-1)
+            _globale.copyto(gary_proc_blok, gary_node_slab, plan=plan)
+            gary_proc_blok1.copyfrom(gary_node_slab)
+            self.assertTrue(_np.all(gary_proc_blok.view_n == gary_proc_blok1.view_n))
+
+            self.assertRaises(
+                ValueError,
+                gary_proc_blok2.copyfrom,
+                gary_node_slab,
+                "same_kind",
+                plan
+            )
+            self.assertRaises(
+                ValueError,
+                gary_proc_blok.copyfrom,
+                gary_node_slab,
+                "unsafe",
+                plan
+            )
+
+    def test_copyto_redistribute_engine(self):
+        """
+        Tests for :meth:`mpi_array.globale.gndarray.copyfrom` with
+        the :samp:`rma` (:samp:`Lock_all`/:samp:`Rget` and per-rank :samp:`Lock`/:samp:`Get`)
+        and :samp:`alltoallw` redistribution engines.
+        """
+        lshape = (8, 12)
+        gshape = (_mpi.COMM_WORLD.size * lshape[0], _mpi.COMM_WORLD.size * lshape[1])
+
+        cands = \
+            (
+                create_distribution(gshape, distrib_type=DT_SLAB, axis=0, locale_type=LT_PROCESS),
+                create_distribution(gshape, distrib_type=DT_SLAB, axis=1, locale_type=LT_PROCESS),
+                create_distribution(gshape, distrib_type=DT_BLOCK, locale_type=LT_NODE, halo=2)
+            )
+        self.assertRaises(ValueError, _globale.set_default_redistribute_engine, "bad")
+        self.assertEqual(
+            _globale.REDISTRIBUTE_ENGINE_AUTO,
+            _globale.get_default_redistribute_engine()
+        )
+        values = _np.arange(_np.product(gshape), dtype="int32").reshape(gshape)
+        with \
+                _globale_creation.zeros(comms_and_distrib=cands[0], dtype="int32") as gary0, \
+                _globale_creation.zeros(comms_and_distrib=cands[1], dtype="int32") as gary1, \
+                _globale_creation.zeros(comms_and_distrib=cands[2], dtype="int32") as gary2, \
+                _globale_creation.zeros(comms_and_distrib=cands[2], dtype="float64") as gary3:
+
+            gary0.view_n[...] = values[gary0.lndarray_proxy.locale_extent.to_slice_n()]
+            plan = gary1.get_copyfrom_plan(gary0)
+            density = plan.calc_communication_density()
+            self.assertTrue(0.0 <= density <= 1.0)
+            if gary0.locale_comms.num_locales > 1:
+                # Slab to slab (transpose) redistribution, every pair of locales communicate.
+                self.assertEqual(1.0, density)
+                self.assertEqual(_globale.REDISTRIBUTE_ENGINE_ALLTOALLW, plan.calc_engine())
+
+            self.assertRaises(ValueError, setattr, plan, "engine", "bad")
+            engines_and_lock_alls = \
+                tuple(
+                    (engine, lock_all)
+                    for engine in _globale._redistribute_engines
+                    for lock_all in (True, False)
+                )
+            for engine, lock_all in engines_and_lock_alls:
+                for dst, src in ((gary1, gary0), (gary2, gary1), (gary3, gary2), (gary0, gary3)):
+                    dst_plan = dst.get_copyfrom_plan(src, casting="unsafe")
+                    dst_plan.engine = engine
+                    dst_plan.rma_lock_all = lock_all
+                    try:
+                        dst.fill(-1)
+                        dst.copyfrom(src, casting="unsafe")
+                        if engine == _globale.REDISTRIBUTE_ENGINE_ALLTOALLW:
+                            self.assertEqual(
+                                dst.dtype == src.dtype,
+                                dst_plan.calc_engine() == _globale.REDISTRIBUTE_ENGINE_ALLTOALLW
+                            )
+                    finally:
+                        dst_plan.engine = None
+                        dst_plan.rma_lock_all = True
+                    self.assertTrue(
+                        _np.all(dst.view_n == values[dst.lndarray_proxy.locale_extent.to_slice_n()])
+                    )
+
+    def test_copyto_redistribute_sync(self):
+        """
+        Tests for :meth:`mpi_array.globale.gndarray.copyfrom` with
+        the :samp:`barrier` and :samp:`pscw` redistribution synchronisation.
+        """
+        lshape = (8, 12)
+        gshape = (_mpi.COMM_WORLD.size * lshape[0], _mpi.COMM_WORLD.size * lshape[1])
+
+        cands = \
+            (
+                create_distribution(gshape, distrib_type=DT_SLAB, axis=0, locale_type=LT_PROCESS),
+                create_distribution(gshape, distrib_type=DT_SLAB, axis=1, locale_type=LT_NODE),
+                create_distribution(gshape, distrib_type=DT_BLOCK, locale_type=LT_PROCESS, halo=2)
+            )
+        self.assertRaises(ValueError, _globale.set_default_redistribute_sync, "bad")
+        self.assertEqual(
+            _globale.REDISTRIBUTE_SYNC_BARRIER,
+            _globale.get_default_redistribute_sync()
+        )
+        values = _np.arange(_np.product(gshape), dtype="int32").reshape(gshape)
+        with \
+                _globale_creation.zeros(comms_and_distrib=cands[0], dtype="int32") as gary0, \
+                _globale_creation.zeros(comms_and_distrib=cands[1], dtype="int32") as gary1, \
+                _globale_creation.zeros(comms_and_distrib=cands[2], dtype="int32") as gary2, \
+                _globale_creation.zeros(comms_and_distrib=cands[2], dtype="float64") as gary3:
+
+            gary0.view_n[...] = values[gary0.lndarray_proxy.locale_extent.to_slice_n()]
+            gary0.intra_locale_barrier()
+            plan = gary1.get_copyfrom_plan(gary0)
+            self.assertRaises(ValueError, setattr, plan, "sync", "bad")
+
+            syncs_and_engines = \
+                tuple(
+                    (sync, engine)
+                    for sync in _globale._redistribute_syncs
+                    for engine in (
+                        _globale.REDISTRIBUTE_ENGINE_RMA,
+                        _globale.REDISTRIBUTE_ENGINE_ALLTOALLW
+                    )
+                )
+            for sync, engine in syncs_and_engines:
+                for dst, src in ((gary1, gary0), (gary2, gary1), (gary3, gary2), (gary0, gary3)):
+                    dst_plan = dst.get_copyfrom_plan(src, casting="unsafe")
+                    dst_plan.sync = sync
+                    dst_plan.engine = engine
+                    try:
+                        dst.fill(-1)
+                        dst.copyfrom(src, casting="unsafe")
+                        self.assertEqual(
+                            (dst.dtype == src.dtype) and (sync == _globale.REDISTRIBUTE_SYNC_PSCW),
+                            dst_plan.calc_sync() == _globale.REDISTRIBUTE_SYNC_PSCW
+                        )
+                    finally:
+                        dst_plan.sync = None
+                        dst_plan.engine = None
+                    self.assertTrue(
+                        _np.all(dst.view_n == values[dst.lndarray_proxy.locale_extent.to_slice_n()])
+                    )
+
+            _globale.set_default_redistribute_sync(_globale.REDISTRIBUTE_SYNC_PSCW)
+            try:
+                self.assertEqual(_globale.REDISTRIBUTE_SYNC_PSCW, plan.calc_sync())
+                gary2.fill(-1)
+                gary2.copyfrom(gary0)
+                self.assertTrue(
+                    _np.all(gary2.view_n == values[gary2.lndarray_proxy.locale_extent.to_slice_n()])
+                )
+            finally:
+                _globale.set_default_redistribute_sync(_globale.REDISTRIBUTE_SYNC_BARRIER)
+
+    def test_copyto_streamed_cast(self):
+        """
+        Tests for :meth:`mpi_array.globale.gndarray.copyfrom` with different
+        :samp:`dtype` arrays, where the remote regions are streamed in chunks
+        (see :obj:`mpi_array.update.MpiPairExtentUpdateDifferentDtypes`).
+        """
+        lshape = (8, 12)
+        gshape = (_mpi.COMM_WORLD.size * lshape[0], _mpi.COMM_WORLD.size * lshape[1])
+        values = _np.arange(_np.product(gshape), dtype="float64").reshape(gshape)
+
+        cand0 = create_distribution(gshape, distrib_type=DT_SLAB, axis=0, locale_type=LT_PROCESS)
+        cand1 = create_distribution(gshape, distrib_type=DT_SLAB, axis=1, locale_type=LT_PROCESS)
+        with \
+                _globale_creation.zeros(comms_and_distrib=cand0, dtype="float64") as src, \
+                _globale_creation.zeros(comms_and_distrib=cand1, dtype="float32") as dst:
+            src.view_n[...] = values[src.lndarray_proxy.locale_extent.to_slice_n()]
+            src.intra_locale_barrier()
+            for lock_all in (True, False):
+                plan = dst.calculate_copyfrom_updates(src)
+                self.assertRaises(ValueError, setattr, plan, "max_chunk_elements", 0)
+                plan.max_chunk_elements = 5
+                plan.unbind()
+                plan.rma_lock_all = lock_all
+                for i in range(2):
+                    # The chunk data types are re-used by the second copy.
+                    dst.fill(-1)
+                    dst.copyfrom(src, plan=plan)
+                    self.assertTrue(
+                        _np.all(dst.view_n == values[dst.lndarray_proxy.locale_extent.to_slice_n()])
+                    )
+                plan.free()
+
 
 _unittest.main(__name__)
 
@@ -12,6 +12,7 @@ Classes
    :toctree: generated/
 
    GndarrayArrayUfuncExecutor - Creates :obj:`gndarray` outputs and forwards to `numpy.ufunc`.
+   LocaleGroupComm - A cached sub-communicator of a group of locales.
 
 Functions
 =========
@@ -24,6 +25,16 @@ Functions
    broadcast_shape - Calculates broadcast shape from sequence of shape arguments.
    shape_extend_dims - Prepend ones to 1D *shape* sequence to make it a specified dimension.
    gndarray_array_ufunc - A :obj:`numpy.ndarray` like distributed array.
+   get_ufunc_mpi_op - Returns the :obj:`mpi4py.MPI.Op` equivalent of a :obj:`numpy.ufunc`.
+   ufunc_is_associative - Whether a :obj:`numpy.ufunc` can be evaluated as a distributed reduction.
+   ufunc_comm_reduce - Combines arrays over a communicator with a :obj:`numpy.ufunc`.
+   ufunc_comm_allreduce - Combines arrays over a communicator, result on all ranks.
+   ufunc_comm_exscan - Exclusive prefix combination over a communicator with a :obj:`numpy.ufunc`.
+   calc_rank_view_region - The :samp:`view_n` region of the :samp:`rank_view_n` tile of a rank.
+   calc_at_coordinates - Converts :meth:`numpy.ufunc.at` indices to globale element coordinates.
+   calc_extent_owners - Index of the grid extent which contains each coordinate.
+   calc_reduceat_segments - Segment ranges reduced by :meth:`numpy.ufunc.reduceat`.
+   ufunc_segment_reduce - Reduces arbitrary :samp:`[start, stop)` segments along an axis.
 
 
 """
@@ -31,6 +42,7 @@ Functions
 from __future__ import absolute_import
 
 import sys as _sys
+import functools as _functools
 import numpy as _np
 import mpi4py.MPI as _mpi
 
@@ -38,7 +50,12 @@ from .license import license as _license, copyright as _copyright, version as _v
 from . import logging as _logging  # noqa: E402,F401
 from . import globale_creation as _globale_creation
 from . import comms as _comms
+from . import types as _types
 from .distribution import ScalarLocaleExtent, ScalarGlobaleExtent, LocaleExtent, GlobaleExtent
+from .distribution import Distribution as _Distribution
+from .distribution import ClonedDistribution as _ClonedDistribution
+from .indexing import HaloIndexingExtent as _HaloIndexingExtent
+from .update import calc_extents_are_disjoint as _calc_extents_are_disjoint
 
 __author__ = "Shane J. Latham"
 __license__ = _license()
@@ -528,6 +545,495 @@ def check_equivalent_inter_locale_comms(
                 )
 
 
+#: Pairs of :samp:`(mpi4py.MPI.Op, dtype_kinds)` for the (associative) :obj:`numpy.ufunc`
+#: functions which can be evaluated as distributed reductions and scans,
+#: the :obj:`mpi4py.MPI.Op` is only used for arrays whose :attr:`numpy.dtype.kind`
+#: is in :samp:`dtype_kinds`.
+_ufunc_mpi_ops = \
+    {
+        _np.add: (_mpi.SUM, "iufc"),
+        _np.multiply: (_mpi.PROD, "iufc"),
+        _np.maximum: (_mpi.MAX, "iu"),
+        _np.minimum: (_mpi.MIN, "iu"),
+        _np.fmax: (_mpi.MAX, "iu"),
+        _np.fmin: (_mpi.MIN, "iu"),
+        _np.logical_and: (_mpi.LAND, "b"),
+        _np.logical_or: (_mpi.LOR, "b"),
+        _np.logical_xor: (_mpi.LXOR, "b"),
+        _np.bitwise_and: (_mpi.BAND, "biu"),
+        _np.bitwise_or: (_mpi.BOR, "biu"),
+        _np.bitwise_xor: (_mpi.BXOR, "biu"),
+    }
+
+
+def get_ufunc_mpi_op(ufunc, dtype):
+    """
+    Returns the predefined :obj:`mpi4py.MPI.Op` which performs
+    the same reduction as :samp:`{ufunc}` for elements of type :samp:`{dtype}`.
+
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: A binary ufunc.
+    :type dtype: :obj:`numpy.dtype`
+    :param dtype: The array element type.
+    :rtype: :obj:`mpi4py.MPI.Op`
+    :return: The MPI reduction operation, :samp:`None` if there is no equivalent
+       predefined operation (e.g. :samp:`numpy.maximum` for floating point types,
+       because of :samp:`NaN` propagation).
+
+    Example::
+
+       >>> import numpy as np
+       >>> import mpi4py.MPI as MPI
+       >>> get_ufunc_mpi_op(np.add, "int32") == MPI.SUM
+       True
+       >>> get_ufunc_mpi_op(np.maximum, "float64") is None
+       True
+    """
+    op = None
+    op_and_kinds = _ufunc_mpi_ops.get(ufunc, None)
+    if (op_and_kinds is not None) and (_np.dtype(dtype).kind in op_and_kinds[1]):
+        op = op_and_kinds[0]
+    return op
+
+
+def ufunc_is_associative(ufunc):
+    """
+    Returns :samp:`True` if the :samp:`{ufunc}` binary operation is associative
+    (and commutative), i.e. reductions and scans can be evaluated piecewise
+    and the pieces combined in any grouping.
+
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: A binary ufunc.
+    :rtype: :obj:`bool`
+    :return: :samp:`True` if :samp:`{ufunc}` can be evaluated as a distributed reduction.
+
+    Example::
+
+       >>> import numpy as np
+       >>> ufunc_is_associative(np.add)
+       True
+       >>> ufunc_is_associative(np.subtract)
+       False
+    """
+    return ufunc in _ufunc_mpi_ops.keys()
+
+
+def ufunc_comm_reduce(comm, ufunc, array, root=0):
+    """
+    Combines the :samp:`{array}` arrays of all :samp:`{comm}` ranks using
+    the :samp:`{ufunc}` binary operation. Uses :meth:`mpi4py.MPI.Comm.Reduce`
+    when :func:`get_ufunc_mpi_op` returns a predefined operation, otherwise
+    the arrays are gathered to the :samp:`{root}` rank and combined
+    with :samp:`{ufunc}` (in rank order).
+
+    :type comm: :obj:`mpi4py.MPI.Comm`
+    :param comm: Reduce over the ranks of this communicator.
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: A binary ufunc.
+    :type array: :obj:`numpy.ndarray`
+    :param array: This rank's contribution to the reduction, all ranks
+       must have the same shape and dtype.
+    :type root: :obj:`int`
+    :param root: Rank of :samp:`{comm}` which receives the result.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The combined array on the :samp:`{root}` rank, :samp:`None` on other ranks.
+    """
+    array = _np.ascontiguousarray(array)
+    op = get_ufunc_mpi_op(ufunc, array.dtype)
+    result = None
+    if op is not None:
+        datatype = _types.to_datatype(array.dtype)
+        if comm.rank == root:
+            result = _np.empty_like(array)
+        comm.Reduce([array, datatype], [result, datatype], op=op, root=root)
+    else:
+        arrays = comm.gather(array, root=root)
+        if comm.rank == root:
+            result = \
+                _functools.reduce(
+                    lambda a0, a1: ufunc(a0, a1, dtype=array.dtype),
+                    arrays
+                )
+            result = _np.asarray(result, dtype=array.dtype)
+
+    return result
+
+
+def ufunc_comm_allreduce(comm, ufunc, array):
+    """
+    Like :func:`ufunc_comm_reduce`, but all :samp:`{comm}` ranks receive the
+    combined array. Uses :meth:`mpi4py.MPI.Comm.Allreduce` when :func:`get_ufunc_mpi_op`
+    returns a predefined operation, otherwise the arrays are all-gathered
+    and combined with :samp:`{ufunc}` (in rank order).
+
+    :type comm: :obj:`mpi4py.MPI.Comm`
+    :param comm: Reduce over the ranks of this communicator.
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: A binary ufunc.
+    :type array: :obj:`numpy.ndarray`
+    :param array: This rank's contribution to the reduction, all ranks
+       must have the same shape and dtype.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The combined array.
+    """
+    array = _np.ascontiguousarray(array)
+    op = get_ufunc_mpi_op(ufunc, array.dtype)
+    if op is not None:
+        datatype = _types.to_datatype(array.dtype)
+        result = _np.empty_like(array)
+        comm.Allreduce([array, datatype], [result, datatype], op=op)
+    else:
+        arrays = comm.allgather(array)
+        result = \
+            _functools.reduce(
+                lambda a0, a1: ufunc(a0, a1, dtype=array.dtype),
+                arrays
+            )
+        result = _np.asarray(result, dtype=array.dtype)
+
+    return result
+
+
+def ufunc_comm_exscan(comm, ufunc, array):
+    """
+    Exclusive prefix combination of the :samp:`{array}` arrays over
+    the :samp:`{comm}` ranks using the :samp:`{ufunc}` binary operation. Uses
+    :meth:`mpi4py.MPI.Comm.Exscan` when :func:`get_ufunc_mpi_op` returns a predefined
+    operation, otherwise the arrays are all-gathered and combined with :samp:`{ufunc}`.
+
+    :type comm: :obj:`mpi4py.MPI.Comm`
+    :param comm: Scan over the ranks of this communicator.
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: A binary ufunc.
+    :type array: :obj:`numpy.ndarray`
+    :param array: This rank's contribution to the scan, all ranks
+       must have the same shape and dtype.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The combination of the arrays of ranks :samp:`0, 1, ..., comm.rank - 1`,
+       :samp:`None` on rank :samp:`0`.
+    """
+    array = _np.ascontiguousarray(array)
+    op = get_ufunc_mpi_op(ufunc, array.dtype)
+    result = None
+    if op is not None:
+        datatype = _types.to_datatype(array.dtype)
+        result = _np.empty_like(array)
+        comm.Exscan([array, datatype], [result, datatype], op=op)
+    else:
+        arrays = comm.allgather(array)
+        if comm.rank > 0:
+            result = \
+                _functools.reduce(
+                    lambda a0, a1: ufunc(a0, a1, dtype=array.dtype),
+                    arrays[0:comm.rank]
+                )
+            result = _np.asarray(result, dtype=array.dtype)
+    if comm.rank == 0:
+        result = None
+
+    return result
+
+
+def calc_rank_view_region(gndary):
+    """
+    Returns the :obj:`tuple` of :obj:`slice` which indicates the region
+    of :attr:`mpi_array.globale.gndarray.view_n` which is
+    the :attr:`mpi_array.globale.gndarray.rank_view_n` tile of this rank.
+
+    :type gndary: :obj:`mpi_array.globale.gndarray`
+    :param gndary: Array whose rank tile region is returned.
+    :rtype: :obj:`tuple`
+    :return: Tuple of :obj:`slice` (locale :samp:`view_n` indices),
+       :samp:`None` if this rank's tile is empty.
+    """
+    rank_region = None
+    if _np.product(gndary.rank_view_n.shape) > 0:
+        view_start = \
+            tuple(
+                slc.start
+                for slc in gndary.lndarray_proxy.intra_partition.lndarray_view_slice_n
+            )
+        rank_region = \
+            tuple(
+                slice(slc.start - view_start[a], slc.stop - view_start[a])
+                for a, slc in enumerate(gndary.lndarray_proxy.rank_view_slice_n)
+            )
+
+    return rank_region
+
+
+def calc_at_coordinates(shape, indices):
+    """
+    Converts the :samp:`{indices}` argument of :meth:`numpy.ufunc.at` into
+    the (flattened) coordinates of the selected elements of an array
+    of shape :samp:`{shape}`. Negative indices are wrapped, axes which
+    are not indexed are selected in full.
+
+    :type shape: sequence of :obj:`int`
+    :param shape: Shape of the indexed array.
+    :type indices: :obj:`int`, array-like or :obj:`tuple` of these
+    :param indices: Integer index (or tuple of integer indices, one per leading axis).
+    :rtype: :obj:`tuple`
+    :return: A :samp:`(coords, selection_shape)` pair, :samp:`coords` is
+       a :samp:`(num_elements, len({shape}))` shaped :samp:`int64` array and
+       :samp:`selection_shape` is the shape of :samp:`numpy.empty({shape})[{indices}]`.
+    :raises IndexError: For too many indices, non-integer indices
+       or out of bounds indices.
+
+    Example::
+
+       >>> coords, selection_shape = calc_at_coordinates((4, 3), ([0, -1],))
+       >>> selection_shape
+       (2, 3)
+       >>> coords.tolist()
+       [[0, 0], [0, 1], [0, 2], [3, 0], [3, 1], [3, 2]]
+    """
+    shape = tuple(shape)
+    ndim = len(shape)
+    if not isinstance(indices, tuple):
+        indices = (indices,)
+    if len(indices) > ndim:
+        raise IndexError(
+            "Too many indices (=%s) for array with ndim=%s." % (len(indices), ndim)
+        )
+    indices = tuple(_np.asarray(index) for index in indices)
+    for index in indices:
+        if index.dtype.kind not in ("i", "u"):
+            raise IndexError(
+                "Arrays used as indices must be of integer type, got dtype=%s." % (index.dtype,)
+            )
+    if len(indices) > 0:
+        indices = _np.broadcast_arrays(*indices)
+        index_shape = indices[0].shape
+    else:
+        index_shape = ()
+    trailing_shape = shape[len(indices):]
+    selection_shape = tuple(index_shape) + tuple(trailing_shape)
+
+    coords = _np.empty((int(_np.product(selection_shape)), ndim), dtype="int64")
+    for a in range(len(indices)):
+        index = indices[a].astype("int64")
+        index = _np.where(index < 0, index + shape[a], index)
+        if (index.size > 0) and ((_np.min(index) < 0) or (_np.max(index) >= shape[a])):
+            raise IndexError(
+                "Index out of bounds for axis %s with size %s." % (a, shape[a])
+            )
+        index = index.reshape(index.shape + (1,) * len(trailing_shape))
+        coords[:, a] = _np.broadcast_to(index, selection_shape).ravel()
+    for a in range(len(indices), ndim):
+        index = _np.arange(shape[a], dtype="int64").reshape((shape[a],) + (1,) * (ndim - a - 1))
+        coords[:, a] = _np.broadcast_to(index, selection_shape).ravel()
+
+    return coords, selection_shape
+
+
+def calc_extent_owners(coords, starts, stops):
+    """
+    Returns the index of the extent which contains each of the :samp:`{coords}`.
+    The non-empty extents should not overlap and should tile a (cartesian) grid,
+    e.g. the locale extents of a block distribution or the :samp:`rank_view_n`
+    tiles of a locale. Each coordinate is located with :func:`numpy.searchsorted`
+    on the per-axis extent boundaries, so the cost is :samp:`O(len({coords}))`
+    searches rather than a comparison with every extent.
+
+    :type coords: :obj:`numpy.ndarray`
+    :param coords: A :samp:`(num_coords, ndim)` shaped array of element coordinates.
+    :type starts: :obj:`numpy.ndarray`
+    :param starts: A :samp:`(num_extents, ndim)` shaped array of extent start indices.
+    :type stops: :obj:`numpy.ndarray`
+    :param stops: A :samp:`(num_extents, ndim)` shaped array of extent stop indices.
+    :rtype: :obj:`numpy.ndarray`
+    :return: A :samp:`(num_coords,)` shaped :samp:`int64` array of indices
+       into :samp:`{starts}`, :samp:`-1` for coordinates which are not in
+       any (non-empty) extent.
+
+    Example::
+
+       >>> starts = _np.array([[0, 0], [0, 0], [0, 3], [4, 0], [4, 3]])
+       >>> stops = _np.array([[4, 3], [0, 0], [4, 8], [6, 3], [6, 8]])
+       >>> calc_extent_owners(_np.array([[0, 0], [3, 7], [5, 2], [6, 0]]), starts, stops).tolist()
+       [0, 2, 3, -1]
+    """
+    coords = _np.asarray(coords, dtype="int64")
+    starts = _np.asarray(starts, dtype="int64")
+    stops = _np.asarray(stops, dtype="int64")
+    ndim = coords.shape[1]
+    owners = _np.full((coords.shape[0],), -1, dtype="int64")
+    nonempty = _np.flatnonzero(_np.all(stops > starts, axis=1))
+    if (len(nonempty) <= 0) or (coords.shape[0] <= 0):
+        return owners
+    starts = starts[nonempty]
+    stops = stops[nonempty]
+
+    # Grid cells of the per-axis boundaries, each extent covers a block of cells.
+    bounds = \
+        tuple(
+            _np.unique(_np.concatenate((starts[:, a], stops[:, a])))
+            for a in range(ndim)
+        )
+    cell_owners = _np.full(tuple(len(b) - 1 for b in bounds), -1, dtype="int64")
+    for i in range(len(nonempty)):
+        cell_owners[
+            tuple(
+                slice(
+                    _np.searchsorted(bounds[a], starts[i, a]),
+                    _np.searchsorted(bounds[a], stops[i, a])
+                )
+                for a in range(ndim)
+            )
+        ] = nonempty[i]
+
+    cells = \
+        tuple(
+            _np.searchsorted(bounds[a], coords[:, a], side="right") - 1
+            for a in range(ndim)
+        )
+    inside = _np.ones((coords.shape[0],), dtype="bool")
+    for a in range(ndim):
+        inside &= (cells[a] >= 0) & (cells[a] < (len(bounds[a]) - 1))
+    owners[inside] = cell_owners[tuple(c[inside] for c in cells)]
+
+    return owners
+
+
+def calc_reduceat_segments(indices, size):
+    """
+    Returns the :samp:`[start, stop)` ranges (along the reduced axis) of the
+    segments which are reduced by :samp:`numpy.ufunc.reduceat(array, {indices})`.
+    When :samp:`{indices}[i] >= {indices}[i + 1]` the segment is the single
+    element :samp:`{indices}[i]` and the last segment extends to :samp:`{size}`.
+
+    :type indices: sequence of :obj:`int`
+    :param indices: The :meth:`numpy.ufunc.reduceat` indices.
+    :type size: :obj:`int`
+    :param size: Length of the reduced axis.
+    :rtype: :obj:`tuple`
+    :return: A :samp:`(starts, stops)` pair of :samp:`int64` arrays.
+    :raises IndexError: For non-integer, non 1D or out of bounds indices.
+
+    Example::
+
+       >>> starts, stops = calc_reduceat_segments([0, 4, 4, 6, 2], 8)
+       >>> starts.tolist()
+       [0, 4, 4, 6, 2]
+       >>> stops.tolist()
+       [4, 5, 6, 7, 8]
+    """
+    indices = _np.asarray(indices)
+    if (indices.ndim != 1) or (indices.dtype.kind not in ("i", "u")):
+        raise IndexError(
+            "Expected 1D integer indices, got ndim=%s, dtype=%s." % (indices.ndim, indices.dtype)
+        )
+    starts = indices.astype("int64")
+    if (starts.size > 0) and ((_np.min(starts) < 0) or (_np.max(starts) >= size)):
+        raise IndexError("Index out of bounds for axis with size %s." % (size,))
+    stops = _np.full_like(starts, size)
+    stops[:-1] = _np.where(starts[:-1] < starts[1:], starts[1:], starts[:-1] + 1)
+
+    return starts, stops
+
+
+def ufunc_segment_reduce(ufunc, array, starts, stops, axis=0, dtype=None):
+    """
+    Reduces the :samp:`[{starts}[i], {stops}[i])` (non-empty) segments of :samp:`{array}`
+    along the :samp:`{axis}` axis. Segments may be in any order and may overlap. The
+    segments which end before the end of the axis are reduced with a single
+    :meth:`numpy.ufunc.reduceat` call (by interleaving the starts and stops).
+
+    :type ufunc: :obj:`numpy.ufunc`
+    :param ufunc: A binary ufunc.
+    :type array: :obj:`numpy.ndarray`
+    :param array: Array which is reduced.
+    :type starts: sequence of :obj:`int`
+    :param starts: Segment start indices.
+    :type stops: sequence of :obj:`int`
+    :param stops: Segment stop indices, :samp:`{starts}[i] < {stops}[i]`.
+    :type axis: :obj:`int`
+    :param axis: The reduced axis.
+    :type dtype: :obj:`numpy.dtype`
+    :param dtype: The :samp:`dtype` argument for :meth:`numpy.ufunc.reduceat`.
+    :rtype: :obj:`numpy.ndarray`
+    :return: Array with the :samp:`{axis}` axis of length :samp:`len({starts})`.
+
+    Example::
+
+       >>> import numpy as np
+       >>> ufunc_segment_reduce(np.add, np.arange(8), [0, 2, 3, 7], [8, 3, 6, 8]).tolist()
+       [28, 2, 12, 7]
+    """
+    starts = _np.asarray(starts, dtype="int64")
+    stops = _np.asarray(stops, dtype="int64")
+    size = array.shape[axis]
+    if dtype is None:
+        dtype = ufunc.reduce(_np.zeros((1,), dtype=array.dtype)).dtype
+    result_shape = list(array.shape)
+    result_shape[axis] = len(starts)
+    result = _np.empty(tuple(result_shape), dtype=dtype)
+
+    def axis_slice(slc):
+        return (slice(None),) * axis + (slc,)
+
+    inner = _np.flatnonzero(stops < size)
+    if len(inner) > 0:
+        interleaved = _np.empty((2 * len(inner),), dtype="int64")
+        interleaved[0::2] = starts[inner]
+        interleaved[1::2] = stops[inner]
+        reduced = ufunc.reduceat(array, interleaved, axis=axis, dtype=dtype)
+        result[axis_slice(inner)] = reduced[axis_slice(slice(0, None, 2))]
+    for i in _np.flatnonzero(stops >= size):
+        segment = array[axis_slice(slice(starts[i], size))]
+        result[axis_slice(slice(i, i + 1))] = \
+            ufunc.reduce(segment, axis=axis, dtype=dtype, keepdims=True)
+
+    return result
+
+
+class LocaleGroupComm(object):
+
+    """
+    A sub-communicator (see :meth:`mpi4py.MPI.Comm.Split`) of
+    an :samp:`inter_locale_comm`, the locales of a group (e.g. the locales which
+    are combined in a reduction, see
+    :meth:`GndarrayArrayUfuncExecutor.calc_reduce_locale_groups`). Instances
+    are cached (with a :obj:`mpi_array.comms.CommsCache`) so that the
+    communicator is only created once for each distinct grouping.
+    """
+
+    def __init__(self, comm, rank_logger=None):
+        """
+        Construct.
+
+        :type comm: :obj:`mpi4py.MPI.Comm`
+        :param comm: The group communicator, :samp:`mpi4py.MPI.COMM_NULL` on locales
+           which are not in a group.
+        :type rank_logger: :obj:`logging.Logger`
+        :param rank_logger: Logger for debug messages.
+        """
+        self._comm = comm
+        if rank_logger is None:
+            rank_logger = \
+                _logging.get_rank_logger(str(__name__ + "." + self.__class__.__name__))
+        self._rank_logger = rank_logger
+
+    @property
+    def comm(self):
+        """
+        The :obj:`mpi4py.MPI.Comm` group communicator.
+        """
+        return self._comm
+
+    @property
+    def rank_logger(self):
+        """
+        A :obj:`logging.Logger` for debug messages.
+        """
+        return self._rank_logger
+
+
+#: Cache of :obj:`LocaleGroupComm` objects, keyed on :samp:`(inter_locale_comm, groups)`.
+_locale_group_comms_cache = _comms.CommsCache()
+
+
 class GndarrayArrayUfuncExecutor(object):
 
     """
@@ -557,7 +1063,18 @@ class GndarrayArrayUfuncExecutor(object):
         self._array_like_obj = array_like_obj
         self._ufunc = ufunc
         self._method = method
-        self._inputs = convert_to_array_like(inputs)
+        if method == "at":
+            # The indices argument of ufunc.at is an index expression, not an array.
+            self._inputs = \
+                (
+                    convert_to_array_like(inputs[0:1])
+                    +
+                    tuple(inputs[1:2])
+                    +
+                    convert_to_array_like(inputs[2:])
+                )
+        else:
+            self._inputs = convert_to_array_like(inputs)
         self._kwargs = kwargs
         self._outputs = None
         if "out" in self._kwargs.keys():
@@ -979,6 +1496,9 @@ class GndarrayArrayUfuncExecutor(object):
                 gndarray_outputs[0].lndarray_proxy.locale_extent
             )
 
+        # The output array halos are now out of date.
+        for o in gndarray_outputs:
+            o.mark_dirty()
         gndarray_outputs[0].intra_locale_barrier()
 
         # return the outputs
@@ -988,33 +1508,1134 @@ class GndarrayArrayUfuncExecutor(object):
 
     def execute_accumulate(self):
         """
-        Not implemented.
+        Distributed :meth:`numpy.ufunc.accumulate` along a single axis. Each rank
+        accumulates its :attr:`mpi_array.globale.gndarray.rank_view_n` tile, the
+        carry-in for each tile is then the combination of:
+
+        #. the last (along the axis) elements of the preceding tiles in the locale,
+           read directly from the shared memory locale array, and
+        #. the locale carry-in, calculated with an :meth:`mpi4py.MPI.Comm.Exscan`
+           (see :func:`ufunc_comm_exscan`) over the locales which span
+           the accumulated axis.
+
+        :rtype: :obj:`mpi_array.globale.gndarray`
+        :return: The accumulation result, :samp:`NotImplemented` if the
+           input is not a :obj:`mpi_array.globale.gndarray` or the :attr:`ufunc` is
+           not associative (see :func:`ufunc_is_associative`).
         """
-        return NotImplemented
+        from .globale import gndarray as _gndarray
+        from .globale import copyto as _copyto
+
+        gndary = self.inputs[0]
+        if (not isinstance(gndary, _gndarray)) or (not ufunc_is_associative(self.ufunc)):
+            return NotImplemented
+
+        ndim = gndary.ndim
+        axis = self._kwargs.get("axis", 0)
+        if (axis < -ndim) or (axis >= ndim):
+            raise ValueError("Got axis=%s out of bounds for ndim=%s." % (axis, ndim))
+        axis = axis % ndim
+        out = self._outputs
+        if isinstance(out, tuple):
+            out = out[0] if len(out) > 0 else None
+        dtype = \
+            self.ufunc.accumulate(
+                _np.zeros((1,), dtype=gndary.dtype),
+                dtype=self._kwargs.get("dtype", None)
+            ).dtype
+        rank_logger = gndary.rank_logger
+        intra_locale_comm = self.intra_locale_comm
+
+        result = \
+            _globale_creation.empty(
+                dtype=dtype,
+                comms_and_distrib=gndary.comms_and_distrib,
+                intra_partition_dims=gndary.lndarray_proxy.intra_partition_dims
+            )
+
+        # Remote ranks may still be writing the locale arrays.
+        gndary.intra_locale_barrier()
+        rank_region = self.get_rank_view_region(result)
+        if rank_region is not None:
+            self.ufunc.accumulate(
+                gndary.rank_view_n,
+                axis=axis,
+                dtype=dtype,
+                out=result.rank_view_n
+            )
+        rank_regions = intra_locale_comm.allgather(rank_region)
+        result.intra_locale_barrier()
+
+        def last_elements(region):
+            """
+            The (keepdims) last elements along :samp:`axis` of a tile region.
+            """
+            region = list(region)
+            region[axis] = slice(region[axis].stop - 1, region[axis].stop)
+            return result.view_n[tuple(region)]
+
+        def is_same_column(region0, region1):
+            return \
+                _np.all(
+                    tuple(
+                        (region0[a].start, region0[a].stop) == (region1[a].start, region1[a].stop)
+                        for a in range(ndim)
+                        if a != axis
+                    )
+                )
+
+        # Carry-in from the preceding tiles within this locale.
+        rank_carry = None
+        if rank_region is not None:
+            for region in rank_regions:
+                if (
+                    (region is not None)
+                    and
+                    (region[axis].stop <= rank_region[axis].start)
+                    and
+                    is_same_column(region, rank_region)
+                ):
+                    if rank_carry is None:
+                        rank_carry = _np.array(last_elements(region))
+                    else:
+                        self.ufunc(rank_carry, last_elements(region), out=rank_carry)
+
+        # Locale total (along the axis), combined from the last elements of all the tiles.
+        locale_total = None
+        locale_shape = _np.array(result.lndarray_proxy.locale_extent.shape_n)
+        if (intra_locale_comm.rank == 0) and (_np.product(locale_shape) > 0):
+            total_shape = locale_shape.copy()
+            total_shape[axis] = 1
+            locale_total = _np.empty(tuple(total_shape), dtype=dtype)
+            column_regions = dict()
+            for region in rank_regions:
+                if region is not None:
+                    key = tuple((region[a].start, region[a].stop) for a in range(ndim) if a != axis)
+                    if key not in column_regions.keys():
+                        column_regions[key] = []
+                    column_regions[key].append(region)
+            for key in column_regions.keys():
+                regions = sorted(column_regions[key], key=lambda r: r[axis].start)
+                total_region = list(regions[0])
+                total_region[axis] = slice(0, 1)
+                total_region = tuple(total_region)
+                locale_total[total_region] = last_elements(regions[0])
+                for region in regions[1:]:
+                    self.ufunc(
+                        locale_total[total_region],
+                        last_elements(region),
+                        out=locale_total[total_region]
+                    )
+        result.intra_locale_barrier()
+
+        # Carry-in from the preceding locales along the axis.
+        locale_carry = None
+        inter_locale_comm = self.inter_locale_comm
+        if inter_locale_comm != _mpi.COMM_NULL:
+            groups, owners = self.calc_reduce_locale_groups(gndary.distribution, (axis,))
+            # The group ranks are ordered along the axis.
+            orders = \
+                _np.array(
+                    tuple(e.start_n[axis] for e in result.distribution.locale_extents),
+                    dtype="int64"
+                )
+            group_comm = self.get_locale_group_comm(gndary, groups, orders)
+            if group_comm != _mpi.COMM_NULL:
+                rank_logger.debug("BEG: ufunc_comm_exscan over %s locales...", group_comm.size)
+                locale_carry = ufunc_comm_exscan(group_comm, self.ufunc, locale_total)
+                rank_logger.debug("END: ufunc_comm_exscan over %s locales.", group_comm.size)
+        locale_carry = intra_locale_comm.bcast(locale_carry, root=0)
+
+        # Apply the carry-in to this rank's tile.
+        if rank_region is not None:
+            carry = rank_carry
+            if locale_carry is not None:
+                carry_region = list(rank_region)
+                carry_region[axis] = slice(0, 1)
+                locale_carry = locale_carry[tuple(carry_region)]
+                if carry is None:
+                    carry = locale_carry
+                else:
+                    self.ufunc(locale_carry, carry, out=carry)
+            if carry is not None:
+                self.ufunc(carry, result.rank_view_n, out=result.rank_view_n)
+        result.mark_dirty()
+        result.intra_locale_barrier()
+
+        if out is not None:
+            _copyto(out, result)
+            result.free()
+            result = out
+
+        return result
+
+    def get_reduce_axes(self, ndim):
+        """
+        Returns the :samp:`axis` keyword argument as a :obj:`tuple` of
+        non-negative axis indices.
+
+        :type ndim: :obj:`int`
+        :param ndim: Dimension of the array being reduced.
+        :rtype: :obj:`tuple`
+        :return: Sorted (non-negative) indices of the reduced axes.
+        :raises ValueError: If an axis is out of bounds or repeated.
+        """
+        axis = self._kwargs.get("axis", 0)
+        if axis is None:
+            axes = tuple(range(ndim))
+        else:
+            if not hasattr(axis, "__iter__"):
+                axis = (axis,)
+            axes = tuple(int(a) for a in axis)
+            if _np.any(tuple((a < -ndim) or (a >= ndim) for a in axes)):
+                raise ValueError("Got axis=%s out of bounds for ndim=%s." % (axis, ndim))
+            axes = tuple(sorted(a % ndim for a in axes))
+            if len(set(axes)) != len(axes):
+                raise ValueError("Got repeated axis in axis=%s." % (axis,))
+
+        return axes
+
+    def get_rank_view_region(self, gndary):
+        """
+        Returns the :obj:`tuple` of :obj:`slice` which indicates the region
+        of :attr:`mpi_array.globale.gndarray.view_n` which is
+        the :attr:`mpi_array.globale.gndarray.rank_view_n` tile of this rank.
+        See :func:`calc_rank_view_region`.
+
+        :type gndary: :obj:`mpi_array.globale.gndarray`
+        :param gndary: Array whose rank tile region is returned.
+        :rtype: :obj:`tuple`
+        :return: Tuple of :obj:`slice` (locale :samp:`view_n` indices),
+           :samp:`None` if this rank's tile is empty.
+        """
+        return calc_rank_view_region(gndary)
+
+    def calc_locale_reduce(self, gndary, axes, dtype):
+        """
+        Reduces the locale array of :samp:`{gndary}` along the :samp:`{axes}`.
+        Each rank reduces its :attr:`mpi_array.globale.gndarray.rank_view_n` tile,
+        the per-rank partial results are then combined (by the rank :samp:`0`
+        process of :attr:`intra_locale_comm`) via a shared memory buffer.
+
+        :type gndary: :obj:`mpi_array.globale.gndarray`
+        :param gndary: Array to be reduced.
+        :type axes: :obj:`tuple` of :obj:`int`
+        :param axes: Axes which are reduced.
+        :type dtype: :obj:`numpy.dtype`
+        :param dtype: The element type of the reduction result.
+        :rtype: :obj:`numpy.ndarray`
+        :return: On the :samp:`intra_locale_comm.rank == 0` process, the locale reduction
+           (with :samp:`keepdims=True` shape), :samp:`None` on other processes or
+           if the locale extent is empty.
+        """
+        intra_locale_comm = self.intra_locale_comm
+        locale_shape = _np.array(gndary.lndarray_proxy.locale_extent.shape_n)
+        partial_shape = locale_shape.copy()
+        partial_shape[list(axes)] = 1
+
+        # Slice of this rank's tile in the partial result (relative to the view_n array).
+        rank_region = self.get_rank_view_region(gndary)
+        if rank_region is not None:
+            rank_region = \
+                tuple(
+                    slice(0, 1) if a in axes else rank_region[a]
+                    for a in range(len(rank_region))
+                )
+
+        # The buffer allocation is collective over peer_comm when there is a single
+        # process per locale, so it happens even when the locale extent is empty.
+        partial = None
+        rank_logger = gndary.rank_logger
+        rank_logger.debug("BEG: alloc_locale_buffer for locale reduce...")
+        rma_window_buffer = \
+            gndary.locale_comms.alloc_locale_buffer(
+                shape=(intra_locale_comm.size,) + tuple(partial_shape),
+                dtype=dtype
+            )
+        rank_logger.debug("END: alloc_locale_buffer for locale reduce.")
+        if _np.product(locale_shape) > 0:
+            partials = \
+                _np.ndarray(
+                    shape=rma_window_buffer.shape,
+                    dtype=dtype,
+                    buffer=rma_window_buffer.buffer
+                )
+            if rank_region is not None:
+                self.ufunc.reduce(
+                    gndary.rank_view_n,
+                    axis=axes,
+                    dtype=dtype,
+                    out=partials[(intra_locale_comm.rank,) + rank_region],
+                    keepdims=True
+                )
+            rank_regions = intra_locale_comm.gather(rank_region, root=0)
+            gndary.intra_locale_barrier()
+            if intra_locale_comm.rank == 0:
+                partial = _np.empty(tuple(partial_shape), dtype=dtype)
+                combined_regions = set()
+                for r in range(len(rank_regions)):
+                    region = rank_regions[r]
+                    if region is not None:
+                        key = tuple((slc.start, slc.stop) for slc in region)
+                        if key in combined_regions:
+                            self.ufunc(partial[region], partials[r][region], out=partial[region])
+                        else:
+                            partial[region] = partials[r][region]
+                            combined_regions.add(key)
+            gndary.intra_locale_barrier()
+        rma_window_buffer.free()
+
+        return partial
+
+    def calc_reduce_locale_groups(self, distrib, axes):
+        """
+        Groups the locales of :samp:`{distrib}` which span the reduced axes,
+        the locales in a group have identical extents on the non-reduced axes.
+        For a *cloned* distribution (overlapping locale extents) every locale is
+        in its own group.
+
+        :type distrib: :obj:`mpi_array.distribution.Distribution`
+        :param distrib: Distribution of the array being reduced.
+        :type axes: :obj:`tuple` of :obj:`int`
+        :param axes: Axes which are reduced.
+        :rtype: :obj:`tuple`
+        :return: A :samp:`(groups, owners)` pair of :samp:`(num_locales,)` shaped
+           arrays, :samp:`groups[r]` is the group index of inter-locale rank :samp:`r`
+           (:samp:`-1` for empty locale extents) and :samp:`owners[r]` is :samp:`True` if
+           :samp:`r` is the lowest inter-locale rank in its group.
+        """
+        START_STR = LocaleExtent.START_N_STR
+        STOP_STR = LocaleExtent.STOP_N_STR
+        s_ext = distrib.struct_locale_extents
+        num_locales = len(s_ext)
+        not_empty = _np.product(s_ext[STOP_STR] - s_ext[START_STR], axis=1) > 0
+        groups = _np.full((num_locales,), -1, dtype="int64")
+        if _calc_extents_are_disjoint(distrib.locale_extents):
+            keep = [a for a in range(s_ext[START_STR].shape[1]) if a not in axes]
+            keys = \
+                _np.concatenate(
+                    (s_ext[START_STR][:, keep], s_ext[STOP_STR][:, keep]),
+                    axis=1
+                )[not_empty]
+            if keys.shape[0] > 0:
+                groups[not_empty] = _np.unique(keys, axis=0, return_inverse=True)[1].ravel()
+        else:
+            groups[not_empty] = _np.arange(num_locales)[not_empty]
+        owners = _np.zeros((num_locales,), dtype="bool")
+        unique_groups, first_idx = _np.unique(groups, return_index=True)
+        owners[first_idx[unique_groups >= 0]] = True
+
+        return groups, owners
+
+    def get_locale_group_comm(self, gndary, groups, orders=None):
+        """
+        Returns the :attr:`inter_locale_comm` sub-communicator of the locales which
+        are in the same group (see :meth:`calc_reduce_locale_groups`) as this locale.
+        The sub-communicators are cached, the :meth:`mpi4py.MPI.Comm.Split`
+        (collective over :attr:`inter_locale_comm`) only happens the first time
+        a :samp:`({groups}, {orders})` grouping is requested. Only call on processes
+        where :attr:`inter_locale_comm` is not :samp:`mpi4py.MPI.COMM_NULL`.
+
+        :type gndary: :obj:`mpi_array.globale.gndarray`
+        :param gndary: Array whose locales are grouped.
+        :type groups: :obj:`numpy.ndarray`
+        :param groups: Group index of each inter-locale rank (:samp:`-1` for no group).
+        :type orders: :obj:`numpy.ndarray`
+        :param orders: Split key of each inter-locale rank, orders the ranks
+           of the group communicator. If :samp:`None`, the group ranks are
+           ordered by inter-locale rank.
+        :rtype: :obj:`mpi4py.MPI.Comm`
+        :return: The group communicator, :samp:`mpi4py.MPI.COMM_NULL` if this
+           locale is not in a group.
+        """
+        inter_locale_comm = self.inter_locale_comm
+        key = (inter_locale_comm, groups, orders)
+        group_comm = _locale_group_comms_cache.find(key)
+        if group_comm is None:
+            this_inter_locale_rank = gndary.comms_and_distrib.this_locale.inter_locale_rank
+            group = groups[this_inter_locale_rank]
+            order = this_inter_locale_rank
+            if orders is not None:
+                order = int(orders[this_inter_locale_rank])
+            gndary.rank_logger.debug("BEG: inter_locale_comm.Split for locale group...")
+            group_comm = \
+                LocaleGroupComm(
+                    inter_locale_comm.Split(
+                        group if group >= 0 else _mpi.UNDEFINED,
+                        order
+                    ),
+                    gndary.rank_logger
+                )
+            gndary.rank_logger.debug("END: inter_locale_comm.Split for locale group.")
+            _locale_group_comms_cache.add(key, group_comm)
+
+        return group_comm.comm
+
+    def create_reduce_output(self, gndary, axes, keepdims, dtype, groups, owners):
+        """
+        Creates the :obj:`mpi_array.globale.gndarray` which holds the result of
+        an axis reduction. Each group of locales (see :meth:`calc_reduce_locale_groups`)
+        stores its result on the owner locale, other locales have empty extents.
+
+        :rtype: :obj:`mpi_array.globale.gndarray`
+        :return: Uninitialised reduction output array.
+        """
+        distrib = gndary.distribution
+        ndim = gndary.ndim
+        keep = [a for a in range(ndim) if (a not in axes) or keepdims]
+        result_shape = _np.array(gndary.shape)
+        result_shape[list(axes)] = 1
+        result_shape = tuple(result_shape[keep])
+
+        if _calc_extents_are_disjoint(distrib.locale_extents):
+            locale_extents = []
+            for r in range(len(owners)):
+                start = _np.zeros((len(keep),), dtype="int64")
+                stop = start.copy()
+                if owners[r]:
+                    extent = distrib.locale_extents[r]
+                    start = _np.array(extent.start_n)
+                    stop = _np.array(extent.stop_n)
+                    start[list(axes)] = 0
+                    stop[list(axes)] = 1
+                    start, stop = start[keep], stop[keep]
+                locale_extents.append(_HaloIndexingExtent(start=start, stop=stop))
+            result_distrib = \
+                _Distribution(
+                    globale_extent=result_shape,
+                    locale_extents=locale_extents,
+                    inter_locale_rank_to_peer_rank=distrib._inter_locale_rank_to_peer_rank
+                )
+        else:
+            result_distrib = \
+                _ClonedDistribution(
+                    globale_extent=result_shape,
+                    num_locales=len(owners),
+                    inter_locale_rank_to_peer_rank=distrib._inter_locale_rank_to_peer_rank
+                )
+        result_distrib.peer_ranks_per_locale = distrib.peer_ranks_per_locale
+
+        return \
+            _globale_creation.empty(
+                result_shape,
+                dtype=dtype,
+                comms_and_distrib=_comms.CommsAndDistribution(
+                    gndary.locale_comms,
+                    result_distrib,
+                    gndary.comms_and_distrib.this_locale
+                )
+            )
 
     def execute_reduce(self):
         """
-        Not implemented.
+        Distributed :meth:`numpy.ufunc.reduce`. The reduction is hierarchical, each
+        rank reduces its :attr:`mpi_array.globale.gndarray.rank_view_n` tile, the
+        tile results are combined in the locale shared memory and finally
+        the locale results are combined over the (cached, see :meth:`get_locale_group_comm`)
+        sub-communicator of the locales which span the reduced axes. Reducing
+        over all axes combines the locale results with a single
+        :meth:`mpi4py.MPI.Comm.Allreduce` and returns a :obj:`numpy` scalar (or array
+        when :samp:`keepdims=True`) on all processes, otherwise the locale results are
+        combined with :meth:`mpi4py.MPI.Comm.Reduce` and
+        a :obj:`mpi_array.globale.gndarray` is returned. Zero-size arrays are reduced
+        with :meth:`numpy.ufunc.reduce` (giving the identity or
+        raising :obj:`ValueError`).
+
+        :rtype: :obj:`object`
+        :return: The reduction result, :samp:`NotImplemented` if the
+           input is not a :obj:`mpi_array.globale.gndarray`, the :attr:`ufunc` is
+           not associative (see :func:`ufunc_is_associative`) or the :samp:`where`
+           keyword is specified.
         """
-        return NotImplemented
+        from .globale import gndarray as _gndarray
+        from .globale import copyto as _copyto
+
+        gndary = self.inputs[0]
+        if (
+            (not isinstance(gndary, _gndarray))
+            or
+            (not ufunc_is_associative(self.ufunc))
+            or
+            (
+                ("where" in self._kwargs.keys())
+                and
+                (self._kwargs["where"] is not True)
+            )
+        ):
+            return NotImplemented
+
+        axes = self.get_reduce_axes(gndary.ndim)
+        keepdims = self._kwargs.get("keepdims", False)
+        initial = self._kwargs.get("initial", None)
+        out = self._outputs
+        if isinstance(out, tuple):
+            out = out[0] if len(out) > 0 else None
+        dtype = \
+            self.ufunc.reduce(
+                _np.zeros((1,), dtype=gndary.dtype),
+                dtype=self._kwargs.get("dtype", None)
+            ).dtype
+        rank_logger = gndary.rank_logger
+        is_full_reduce = len(axes) == gndary.ndim
+
+        if _np.product(gndary.shape) <= 0:
+            return self.execute_zero_size_reduce(gndary, axes, keepdims, initial, dtype, out)
+
+        # Remote ranks may still be writing the locale arrays.
+        gndary.intra_locale_barrier()
+        partial = self.calc_locale_reduce(gndary, axes, dtype)
+
+        groups, owners = self.calc_reduce_locale_groups(gndary.distribution, axes)
+
+        inter_locale_comm = self.inter_locale_comm
+        if inter_locale_comm != _mpi.COMM_NULL:
+            group_comm = self.get_locale_group_comm(gndary, groups)
+            if group_comm != _mpi.COMM_NULL:
+                if is_full_reduce:
+                    rank_logger.debug(
+                        "BEG: ufunc_comm_allreduce over %s locales...", group_comm.size
+                    )
+                    partial = ufunc_comm_allreduce(group_comm, self.ufunc, partial)
+                    rank_logger.debug(
+                        "END: ufunc_comm_allreduce over %s locales.", group_comm.size
+                    )
+                else:
+                    rank_logger.debug(
+                        "BEG: ufunc_comm_reduce over %s locales...", group_comm.size
+                    )
+                    partial = ufunc_comm_reduce(group_comm, self.ufunc, partial, root=0)
+                    rank_logger.debug(
+                        "END: ufunc_comm_reduce over %s locales.", group_comm.size
+                    )
+            if (partial is not None) and (initial is not None):
+                partial = self.ufunc(initial, partial, dtype=dtype)
+            if is_full_reduce and _np.any(groups < 0):
+                # Locales with empty extents are not in a group.
+                rank_logger.debug("BEG: inter_locale_comm.bcast of reduction...")
+                partial = inter_locale_comm.bcast(partial, root=_np.nonzero(owners)[0][0])
+                rank_logger.debug("END: inter_locale_comm.bcast of reduction.")
+
+        if is_full_reduce:
+            # Full reduction, all processes get the result.
+            partial = self.intra_locale_comm.bcast(partial, root=0)
+            result = partial if keepdims else partial.reshape(())[()]
+            if out is not None:
+                result = self.assign_full_reduce_output(out, result)
+        else:
+            result = self.create_reduce_output(gndary, axes, keepdims, dtype, groups, owners)
+            if (partial is not None) and (_np.product(result.view_n.shape) > 0):
+                result.view_n[...] = partial.reshape(result.view_n.shape)
+            result.intra_locale_barrier()
+            if out is not None:
+                _copyto(out, result)
+                result.free()
+                result = out
+
+        return result
+
+    def assign_full_reduce_output(self, out, result):
+        """
+        Assigns the (same on all processes) :samp:`{result}` of a reduction over
+        all axes to the :samp:`{out}` array.
+
+        :type out: :obj:`numpy.ndarray` or :obj:`mpi_array.globale.gndarray`
+        :param out: The output array, each rank of a :obj:`mpi_array.globale.gndarray`
+           assigns its :attr:`mpi_array.globale.gndarray.rank_view_n` tile.
+        :type result: :obj:`numpy.ndarray` or scalar
+        :param result: The reduction result.
+        :rtype: :obj:`numpy.ndarray` or :obj:`mpi_array.globale.gndarray`
+        :return: :samp:`{out}`.
+        """
+        from .globale import gndarray as _gndarray
+
+        if isinstance(out, _gndarray):
+            out.rank_view_n[...] = result
+            out.mark_dirty()
+            out.intra_locale_barrier()
+        else:
+            out[...] = result
+
+        return out
+
+    def execute_zero_size_reduce(self, gndary, axes, keepdims, initial, dtype, out):
+        """
+        Reduction of a zero-size :samp:`{gndary}` array, the result
+        is calculated (on all processes) by :meth:`numpy.ufunc.reduce` of a
+        zero-size :obj:`numpy.ndarray`, it is the :samp:`{initial}` value (or the
+        identity of :attr:`ufunc`). A non-scalar result is returned as a cloned
+        distribution :obj:`mpi_array.globale.gndarray`.
+
+        :rtype: :obj:`object`
+        :return: The reduction result.
+        :raises ValueError: If :samp:`{initial}` is :samp:`None` and
+           the :attr:`ufunc` has no identity.
+        """
+        from .globale import copyto as _copyto
+
+        kwargs = dict(axis=axes, dtype=dtype, keepdims=keepdims)
+        if initial is not None:
+            kwargs["initial"] = initial
+        npy_result = \
+            self.ufunc.reduce(_np.empty(gndary.shape, dtype=gndary.dtype), **kwargs)
+        if len(axes) == gndary.ndim:
+            result = npy_result
+            if out is not None:
+                result = self.assign_full_reduce_output(out, result)
+        else:
+            result = self.create_cloned_output(gndary, npy_result.shape, dtype)
+            if self.intra_locale_comm.rank == 0:
+                result.view_n[...] = npy_result
+            result.intra_locale_barrier()
+            if out is not None:
+                _copyto(out, result)
+                result.free()
+                result = out
+
+        return result
+
+    def create_reduceat_output(self, gndary, axis, dtype, seg_starts):
+        """
+        Creates the :obj:`mpi_array.globale.gndarray` which holds the result of
+        a :meth:`numpy.ufunc.reduceat`. For disjoint locale extents, each locale
+        stores the segments which start (along :samp:`{axis}`) in its locale extent,
+        otherwise (cloned) each locale stores all the segments.
+
+        :type gndary: :obj:`mpi_array.globale.gndarray`
+        :param gndary: Array being reduced.
+        :type axis: :obj:`int`
+        :param axis: The reduced axis.
+        :type dtype: :obj:`numpy.dtype`
+        :param dtype: Element type of the result.
+        :type seg_starts: :obj:`numpy.ndarray`
+        :param seg_starts: The (non-decreasing) segment start indices.
+        :rtype: :obj:`mpi_array.globale.gndarray`
+        :return: Uninitialised reduceat output array.
+        """
+        distrib = gndary.distribution
+        result_shape = list(gndary.shape)
+        result_shape[axis] = len(seg_starts)
+        result_shape = tuple(result_shape)
+
+        if _calc_extents_are_disjoint(distrib.locale_extents):
+            locale_extents = []
+            for extent in distrib.locale_extents:
+                start = _np.zeros((len(result_shape),), dtype="int64")
+                stop = start.copy()
+                if _np.product(extent.shape_n) > 0:
+                    seg_range = \
+                        _np.searchsorted(
+                            seg_starts,
+                            (extent.start_n[axis], extent.stop_n[axis]),
+                            side="left"
+                        )
+                    if seg_range[1] > seg_range[0]:
+                        start = _np.array(extent.start_n)
+                        stop = _np.array(extent.stop_n)
+                        start[axis], stop[axis] = seg_range
+                locale_extents.append(_HaloIndexingExtent(start=start, stop=stop))
+            result_distrib = \
+                _Distribution(
+                    globale_extent=result_shape,
+                    locale_extents=locale_extents,
+                    inter_locale_rank_to_peer_rank=distrib._inter_locale_rank_to_peer_rank
+                )
+        else:
+            return self.create_cloned_output(gndary, result_shape, dtype)
+        result_distrib.peer_ranks_per_locale = distrib.peer_ranks_per_locale
+
+        return \
+            _globale_creation.empty(
+                result_shape,
+                dtype=dtype,
+                comms_and_distrib=_comms.CommsAndDistribution(
+                    gndary.locale_comms,
+                    result_distrib,
+                    gndary.comms_and_distrib.this_locale
+                )
+            )
+
+    def create_cloned_output(self, gndary, shape, dtype):
+        """
+        Creates a cloned-distribution :obj:`mpi_array.globale.gndarray` (each
+        locale stores the entire array) which has the same locales
+        (and :attr:`mpi_array.globale.gndarray.locale_comms`) as :samp:`{gndary}`.
+
+        :type gndary: :obj:`mpi_array.globale.gndarray`
+        :param gndary: The locales of this array are the locales of the returned array.
+        :type shape: sequence of :obj:`int`
+        :param shape: Shape of the returned array.
+        :type dtype: :obj:`numpy.dtype`
+        :param dtype: Element type of the returned array.
+        :rtype: :obj:`mpi_array.globale.gndarray`
+        :return: Uninitialised cloned-distribution array.
+        """
+        distrib = gndary.distribution
+        result_distrib = \
+            _ClonedDistribution(
+                globale_extent=tuple(shape),
+                num_locales=len(distrib.locale_extents),
+                inter_locale_rank_to_peer_rank=distrib._inter_locale_rank_to_peer_rank
+            )
+        result_distrib.peer_ranks_per_locale = distrib.peer_ranks_per_locale
+
+        return \
+            _globale_creation.empty(
+                tuple(shape),
+                dtype=dtype,
+                comms_and_distrib=_comms.CommsAndDistribution(
+                    gndary.locale_comms,
+                    result_distrib,
+                    gndary.comms_and_distrib.this_locale
+                )
+            )
+
+    def execute_cloned_reduceat(self, gndary, axis, dtype):
+        """
+        Fallback :meth:`numpy.ufunc.reduceat` for indices which are not
+        non-decreasing (e.g. :samp:`(4, 2)`). The input is copied to
+        a cloned-distribution array and each locale evaluates
+        the :meth:`numpy.ufunc.reduceat` of the entire array. This requires
+        a locale to have memory for the entire input and output arrays.
+
+        :type gndary: :obj:`mpi_array.globale.gndarray`
+        :param gndary: Array being reduced.
+        :type axis: :obj:`int`
+        :param axis: The reduced axis.
+        :type dtype: :obj:`numpy.dtype`
+        :param dtype: Element type of the result.
+        :rtype: :obj:`mpi_array.globale.gndarray`
+        :return: Cloned-distribution reduceat result.
+        """
+        from .globale import copyto as _copyto
+
+        result_shape = list(gndary.shape)
+        result_shape[axis] = len(self.inputs[1])
+        cln_ary = self.create_cloned_output(gndary, gndary.shape, gndary.dtype)
+        _copyto(cln_ary, gndary)
+        result = self.create_cloned_output(gndary, result_shape, dtype)
+        if self.intra_locale_comm.rank == 0:
+            result.view_n[...] = \
+                self.ufunc.reduceat(cln_ary.view_n, self.inputs[1], axis=axis, dtype=dtype)
+        result.intra_locale_barrier()
+        cln_ary.free()
+
+        return result
 
     def execute_reduceat(self):
         """
-        Not implemented.
+        Distributed :meth:`numpy.ufunc.reduceat` for non-decreasing indices (e.g. the
+        segment offsets of sorted labels). Segments can straddle locale boundaries.
+        Each locale reduces (with :func:`ufunc_segment_reduce`, the segments are
+        shared out over the locale processes) the parts of the segments which
+        start in its locale extent and writes them to the output. A locale has at
+        most one partial (continuation) segment which started in a preceding
+        locale along the axis, the partial result is reduced by the process
+        which holds the :attr:`inter_locale_comm` and sent (point-to-point, typically
+        to the neighbouring locale) to the locale which owns the segment, where it
+        is combined into the output. Other indices are evaluated
+        by :meth:`execute_cloned_reduceat`.
+
+        :rtype: :obj:`mpi_array.globale.gndarray`
+        :return: The reduceat result, :samp:`NotImplemented` if the
+           input is not a :obj:`mpi_array.globale.gndarray` or the :attr:`ufunc` is
+           not associative (see :func:`ufunc_is_associative`).
         """
-        return NotImplemented
+        from .globale import gndarray as _gndarray
+        from .globale import copyto as _copyto
+
+        gndary = self.inputs[0]
+        if (not isinstance(gndary, _gndarray)) or (not ufunc_is_associative(self.ufunc)):
+            return NotImplemented
+
+        ndim = gndary.ndim
+        axis = self._kwargs.get("axis", 0)
+        if (axis < -ndim) or (axis >= ndim):
+            raise ValueError("Got axis=%s out of bounds for ndim=%s." % (axis, ndim))
+        axis = axis % ndim
+        seg_starts, seg_stops = calc_reduceat_segments(self.inputs[1], gndary.shape[axis])
+        out = self._outputs
+        if isinstance(out, tuple):
+            out = out[0] if len(out) > 0 else None
+        dtype = \
+            self.ufunc.reduce(
+                _np.zeros((1,), dtype=gndary.dtype),
+                dtype=self._kwargs.get("dtype", None)
+            ).dtype
+        if _np.any(seg_starts[1:] < seg_starts[:-1]):
+            result = self.execute_cloned_reduceat(gndary, axis, dtype)
+            if out is not None:
+                _copyto(out, result)
+                result.free()
+                result = out
+            return result
+
+        rank_logger = gndary.rank_logger
+        intra_locale_comm = self.intra_locale_comm
+
+        result = self.create_reduceat_output(gndary, axis, dtype, seg_starts)
+
+        def axis_slice(slc):
+            return (slice(None),) * axis + (slc,)
+
+        # Remote ranks may still be writing the locale arrays.
+        gndary.intra_locale_barrier()
+
+        # Reduce the segments which start in this locale, the locale
+        # processes each reduce a contiguous range of the segments.
+        locale_extent = gndary.lndarray_proxy.locale_extent
+        seg_offset = result.lndarray_proxy.locale_extent.start_n[axis]
+        inter_locale_comm = self.inter_locale_comm
+        head_partial = None
+        if _np.product(locale_extent.shape_n) > 0:
+            start = locale_extent.start_n[axis]
+            stop = locale_extent.stop_n[axis]
+            segs = _np.flatnonzero((seg_starts < stop) & (seg_stops > start))
+            if (len(segs) > 0) and (seg_starts[segs[0]] < start):
+                # Only the first segment can be a continuation, it is reduced by
+                # the process which sends it to the owner locale.
+                if inter_locale_comm != _mpi.COMM_NULL:
+                    head_partial = \
+                        ufunc_segment_reduce(
+                            self.ufunc,
+                            gndary.view_n,
+                            (0,),
+                            (min(seg_stops[segs[0]], stop) - start,),
+                            axis=axis,
+                            dtype=dtype
+                        )
+                    head_partial = _np.ascontiguousarray(head_partial)
+                segs = segs[1:]
+            segs = _np.array_split(segs, intra_locale_comm.size)[intra_locale_comm.rank]
+            if len(segs) > 0:
+                partial = \
+                    ufunc_segment_reduce(
+                        self.ufunc,
+                        gndary.view_n,
+                        seg_starts[segs] - start,
+                        _np.minimum(seg_stops[segs], stop) - start,
+                        axis=axis,
+                        dtype=dtype
+                    )
+                result.view_n[axis_slice(segs - seg_offset)] = partial
+        result.intra_locale_barrier()
+
+        # Send the continuation partials to the locales which own the segments.
+        if (
+            (inter_locale_comm != _mpi.COMM_NULL)
+            and
+            _calc_extents_are_disjoint(gndary.distribution.locale_extents)
+        ):
+            distrib = gndary.distribution
+            groups = self.calc_reduce_locale_groups(distrib, (axis,))[0]
+            this_inter_locale_rank = gndary.comms_and_distrib.this_locale.inter_locale_rank
+            group = groups[this_inter_locale_rank]
+            group_locales = _np.flatnonzero((groups == group) & (group >= 0))
+            group_starts = \
+                _np.array(tuple(distrib.locale_extents[r].start_n[axis] for r in group_locales))
+            group_stops = \
+                _np.array(tuple(distrib.locale_extents[r].stop_n[axis] for r in group_locales))
+            requests = []
+            for r, r_start in zip(group_locales, group_starts):
+                seg = _np.searchsorted(seg_starts, r_start, side="left") - 1
+                is_empty = _np.product(distrib.locale_extents[r].shape_n) <= 0
+                if is_empty or (seg < 0) or (seg_stops[seg] <= r_start):
+                    continue
+                owner = \
+                    group_locales[
+                        (group_starts <= seg_starts[seg]) & (seg_starts[seg] < group_stops)
+                    ][0]
+                if r == this_inter_locale_rank:
+                    rank_logger.debug("BEG: inter_locale_comm.Isend of reduceat partial...")
+                    requests.append(
+                        inter_locale_comm.Isend([head_partial.view("B"), _mpi.BYTE], dest=owner)
+                    )
+                    rank_logger.debug("END: inter_locale_comm.Isend of reduceat partial.")
+                elif owner == this_inter_locale_rank:
+                    row = result.view_n[axis_slice(slice(seg - seg_offset, seg - seg_offset + 1))]
+                    recv_partial = _np.empty(row.shape, dtype=dtype)
+                    rank_logger.debug("BEG: inter_locale_comm.Recv of reduceat partial...")
+                    inter_locale_comm.Recv([recv_partial.view("B"), _mpi.BYTE], source=r)
+                    rank_logger.debug("END: inter_locale_comm.Recv of reduceat partial.")
+                    self.ufunc(row, recv_partial, out=row)
+            _mpi.Request.Waitall(requests)
+
+        # The result array halos are now out of date.
+        result.mark_dirty()
+        result.intra_locale_barrier()
+        if out is not None:
+            _copyto(out, result)
+            result.free()
+            result = out
+
+        return result
+
+    def calc_peer_rank_view_extents(self, gndary):
+        """
+        Returns the globale extents of the :attr:`mpi_array.globale.gndarray.rank_view_n`
+        tiles of all the peer ranks. Collective over :samp:`{gndary}.locale_comms.peer_comm`.
+
+        :type gndary: :obj:`mpi_array.globale.gndarray`
+        :param gndary: Array whose tile extents are returned.
+        :rtype: :obj:`numpy.ndarray`
+        :return: A :samp:`(peer_comm.size, 2, ndim)` shaped array, element :samp:`[r, 0]`
+           is the (non-halo) globale start index and element :samp:`[r, 1]` is
+           the globale stop index of the tile of peer rank :samp:`r`. Empty tiles
+           have :samp:`start == stop == 0`.
+        """
+        peer_comm = gndary.locale_comms.peer_comm
+        rank_extent = _np.zeros((2, gndary.ndim), dtype="int64")
+        rank_region = self.get_rank_view_region(gndary)
+        if rank_region is not None:
+            locale_start = _np.array(gndary.lndarray_proxy.locale_extent.start_n, dtype="int64")
+            rank_extent[0] = locale_start + tuple(slc.start for slc in rank_region)
+            rank_extent[1] = locale_start + tuple(slc.stop for slc in rank_region)
+        peer_rank_extents = _np.zeros((peer_comm.size, 2, gndary.ndim), dtype="int64")
+        gndary.rank_logger.debug("BEG: peer_comm.Allgather of rank_view_n extents...")
+        peer_comm.Allgather(rank_extent, peer_rank_extents)
+        gndary.rank_logger.debug("END: peer_comm.Allgather of rank_view_n extents.")
+
+        return peer_rank_extents
 
     def execute_at(self):
         """
-        Not implemented.
+        Distributed (unbuffered, in-place) :meth:`numpy.ufunc.at`. Each peer rank
+        contributes its own :samp:`(indices, values)` pairs, the pairs can
+        select elements on any locale. The pairs are bucketed by
+        the peer rank whose :attr:`mpi_array.globale.gndarray.rank_view_n` tile
+        holds the element (see :meth:`calc_peer_rank_view_extents`
+        and :func:`calc_extent_owners`; pairs are sent to every locale
+        holding a copy of the element for cloned distributions)
+        and exchanged with a single :meth:`mpi4py.MPI.Comm.Alltoallv` over
+        the :samp:`peer_comm`. Each rank then applies :meth:`numpy.ufunc.at`
+        to its tile. Values are cast (:samp:`casting="same_kind"`) to
+        the :samp:`dtype` of the array.
+
+        :rtype: :samp:`None`
+        :return: :samp:`None`, or :samp:`NotImplemented` if the first
+           input is not a :obj:`mpi_array.globale.gndarray`.
         """
-        return NotImplemented
+        from .globale import gndarray as _gndarray
+
+        gndary = self.inputs[0]
+        if not isinstance(gndary, _gndarray):
+            return NotImplemented
+        indices = self.inputs[1]
+        values = None
+        if len(self.inputs) > 2:
+            values = self.inputs[2]
+        if (self.ufunc.nin > 1) and (values is None):
+            raise ValueError("Second operand needed for ufunc=%s." % (self.ufunc,))
+        if (self.ufunc.nin == 1) and (values is not None):
+            raise ValueError("Second operand provided for unary ufunc=%s." % (self.ufunc,))
+
+        ndim = gndary.ndim
+        peer_comm = gndary.locale_comms.peer_comm
+        rank_logger = gndary.rank_logger
+        coords, selection_shape = calc_at_coordinates(gndary.shape, indices)
+        if values is not None:
+            values = \
+                _np.ascontiguousarray(
+                    _np.broadcast_to(_np.asarray(values), selection_shape).ravel()
+                ).astype(gndary.dtype, casting="same_kind")
+
+        # Bucket the pairs by the peer rank which owns the element, first find
+        # the locale extent (locales of a cloned distribution share the extent)
+        # then the rank tile within each locale holding the extent.
+        peer_rank_extents = self.calc_peer_rank_view_extents(gndary)
+        distrib = gndary.distribution
+        locale_extents = \
+            _np.array(
+                tuple(
+                    tuple(e.start_n) + tuple(e.stop_n)
+                    for e in distrib.locale_extents
+                ),
+                dtype="int64"
+            ).reshape((distrib.num_locales, 2 * ndim))
+        locale_extents, locale_extent_indices = \
+            _np.unique(locale_extents, axis=0, return_inverse=True)
+        locale_extent_indices = locale_extent_indices.ravel()
+        pair_extent_indices = \
+            calc_extent_owners(coords, locale_extents[:, :ndim], locale_extents[:, ndim:])
+        pair_order = _np.argsort(pair_extent_indices, kind="stable")
+        extent_pair_stops = \
+            _np.cumsum(
+                _np.bincount(
+                    pair_extent_indices + 1,
+                    minlength=len(locale_extents) + 1
+                )
+            )
+        dst_ranks = []
+        src_pairs = []
+        for inter_locale_rank in range(distrib.num_locales):
+            i = locale_extent_indices[inter_locale_rank]
+            locale_pairs = pair_order[extent_pair_stops[i]:extent_pair_stops[i + 1]]
+            locale_peer_ranks = \
+                _np.array(distrib.peer_ranks_per_locale[inter_locale_rank], dtype="int64")
+            tile_owners = \
+                calc_extent_owners(
+                    coords[locale_pairs],
+                    peer_rank_extents[locale_peer_ranks, 0],
+                    peer_rank_extents[locale_peer_ranks, 1]
+                )
+            dst_ranks.append(locale_peer_ranks[tile_owners[tile_owners >= 0]])
+            src_pairs.append(locale_pairs[tile_owners >= 0])
+        dst_ranks = _np.concatenate(dst_ranks)
+        pair_indices = _np.concatenate(src_pairs)[_np.argsort(dst_ranks, kind="stable")]
+        send_counts = _np.bincount(dst_ranks, minlength=peer_comm.size).astype("int64")
+        recv_counts = _np.zeros_like(send_counts)
+        rank_logger.debug("BEG: peer_comm.Alltoall of ufunc.at pair counts...")
+        peer_comm.Alltoall(send_counts, recv_counts)
+        rank_logger.debug("END: peer_comm.Alltoall of ufunc.at pair counts.")
+
+        def calc_displs(counts):
+            return _np.concatenate(((0,), _np.cumsum(counts)[:-1]))
+
+        send_coords = _np.ascontiguousarray(coords[pair_indices])
+        recv_coords = _np.zeros((_np.sum(recv_counts), ndim), dtype="int64")
+        rank_logger.debug("BEG: peer_comm.Alltoallv of ufunc.at coordinates...")
+        peer_comm.Alltoallv(
+            [send_coords, (send_counts * ndim, calc_displs(send_counts * ndim)), _mpi.INT64_T],
+            [recv_coords, (recv_counts * ndim, calc_displs(recv_counts * ndim)), _mpi.INT64_T]
+        )
+        rank_logger.debug("END: peer_comm.Alltoallv of ufunc.at coordinates.")
+        recv_values = None
+        if values is not None:
+            itemsize = values.dtype.itemsize
+            send_values = _np.ascontiguousarray(values[pair_indices])
+            recv_values = _np.zeros((_np.sum(recv_counts),), dtype=values.dtype)
+            rank_logger.debug("BEG: peer_comm.Alltoallv of ufunc.at values...")
+            peer_comm.Alltoallv(
+                [
+                    send_values.view("B"),
+                    (send_counts * itemsize, calc_displs(send_counts * itemsize)),
+                    _mpi.BYTE
+                ],
+                [
+                    recv_values.view("B"),
+                    (recv_counts * itemsize, calc_displs(recv_counts * itemsize)),
+                    _mpi.BYTE
+                ]
+            )
+            rank_logger.debug("END: peer_comm.Alltoallv of ufunc.at values.")
+
+        # Apply the received pairs to this rank's tile (in peer rank order).
+        if recv_coords.shape[0] > 0:
+            peer_rank = peer_comm.rank
+            rank_coords = recv_coords - peer_rank_extents[peer_rank, 0]
+            rank_indices = tuple(rank_coords[:, a] for a in range(ndim))
+            if recv_values is None:
+                self.ufunc.at(gndary.rank_view_n, rank_indices)
+            else:
+                self.ufunc.at(gndary.rank_view_n, rank_indices, recv_values)
+
+        # The array halos are now out of date.
+        gndary.mark_dirty()
+        gndary.intra_locale_barrier()
+
+    def create_outer_outputs(self, outputs, result_shape, result_types):
+        """
+        Returns list of output :obj:`mpi_array.globale.gndarray` instances
+        for :meth:`execute_outer`. When :samp:`{outputs}` is not specified
+        the outputs are block distributed over the locales of :attr:`array_like_obj`.
+
+        :type outputs: :samp:`None` or :obj:`tuple` of :obj:`mpi_array.globale.gndarray`
+        :param outputs: Output arrays passed in as the :samp:`out` argument
+           of the :obj:`numpy.ufunc`.
+        :type result_shape: sequence of :obj:`int`
+        :param result_shape: The shape of all output arrays.
+        :type result_types: sequence of :samp:`numpy.dtype`
+        :param result_types: The :samp:`dtype` of each output array.
+        :rtype: :obj:`tuple` of :obj:`mpi_array.globale.gndarray`
+        :return: A tuple of :samp:`len(result_types)` elements.
+        """
+        if (outputs is None) or (len(outputs) <= 0):
+            outputs = ()
+        else:
+            check_equivalent_inter_locale_comms(outputs)
+        outputs = \
+            (
+                tuple(outputs)
+                +
+                tuple(
+                    _globale_creation.empty(
+                        result_shape,
+                        dtype=result_types[i],
+                        peer_comm=self.peer_comm,
+                        intra_locale_comm=self.intra_locale_comm,
+                        inter_locale_comm=self.inter_locale_comm
+                    )
+                    for i in range(len(outputs), len(result_types))
+                )
+            )
+        return outputs
 
     def execute_outer(self):
         """
-        Not implemented.
+        Distributed :meth:`numpy.ufunc.outer`. The outputs are (by default) block
+        distributed, each locale fetches (once, with
+        :meth:`mpi_array.globale.gndarray.locale_get`) only the portions of the
+        two inputs required for its output locale extent, then each rank
+        calls :meth:`numpy.ufunc.outer` for its output tile.
+
+        :rtype: :obj:`mpi_array.globale.gndarray`
+        :return: The outer product result (a :obj:`tuple` for multiple output ufuncs).
         """
-        return NotImplemented
+        from .globale import gndarray as _gndarray
+
+        inp0, inp1 = self.inputs
+        ndim0 = inp0.ndim
+        result_shape = tuple(inp0.shape) + tuple(inp1.shape)
+        result_types = ufunc_result_type(self.ufunc.types, self.inputs, self.outputs, self.casting)
+        self.array_like_obj.rank_logger.debug(
+            "result_shape=%s, result_types=%s", result_shape, result_types
+        )
+        gndarray_outputs = self.create_outer_outputs(self.outputs, result_shape, result_types)
+        out_gndarray = gndarray_outputs[0]
+
+        # Make sure remote ranks have finished writing the inputs before fetching.
+        gndarray_inputs = tuple(i for i in self.inputs if isinstance(i, _gndarray))
+        if len(gndarray_inputs) > 0:
+            for i in gndarray_inputs:
+                i.initialise_windows()
+            out_gndarray.inter_locale_barrier()
+
+        out_locale_extent = out_gndarray.lndarray_proxy.locale_extent
+        if _np.product(out_locale_extent.shape_n) > 0:
+            out_locale_slice = \
+                tuple(
+                    slice(out_locale_extent.start_n[a], out_locale_extent.stop_n[a])
+                    for a in range(len(result_shape))
+                )
+            inp_locale_arys = []
+            for inp, slice_tuple in \
+                    ((inp0, out_locale_slice[:ndim0]), (inp1, out_locale_slice[ndim0:])):
+                if isinstance(inp, _gndarray):
+                    inp_locale_arys.append(inp.locale_get(slice_tuple))
+                else:
+                    inp_locale_arys.append(inp[slice_tuple])
+
+            # Slice the locale inputs to match the peer-rank portion of the output.
+            out_peer_rank_slice = out_gndarray.lndarray_proxy.intra_partition.rank_view_slice_n
+            out_peer_rank_slice = out_locale_extent.locale_to_globale_slice_h(out_peer_rank_slice)
+            out_peer_rank_slice = out_locale_extent.globale_to_locale_slice_n(out_peer_rank_slice)
+            if _np.product(out_gndarray.view_n[out_peer_rank_slice].shape) > 0:
+                kwargs = dict()
+                kwargs.update(self._kwargs)
+                kwargs["out"] = tuple(o.view_n[out_peer_rank_slice] for o in gndarray_outputs)
+                self.ufunc.outer(
+                    inp_locale_arys[0][out_peer_rank_slice[:ndim0]],
+                    inp_locale_arys[1][out_peer_rank_slice[ndim0:]],
+                    **kwargs
+                )
+
+        # The output array halos are now out of date.
+        for o in gndarray_outputs:
+            o.mark_dirty()
+        out_gndarray.intra_locale_barrier()
+
+        if len(gndarray_outputs) == 1:
+            gndarray_outputs = gndarray_outputs[0]
+        return gndarray_outputs
 
     def execute(self):
         """
@@ -1032,7 +2653,18 @@ gndarray_ufunc_executor_factory = GndarrayArrayUfuncExecutor
 def gndarray_array_ufunc(array_like_obj, ufunc, method, *inputs, **kwargs):
     """
     The implementation for  :meth:`mpi_array.globale.gndarray.__array_ufunc__`.
+    Returns :obj:`NotImplemented` when one of the :samp:`{inputs}` is
+    a :obj:`mpi_array.globale_expr.GndarrayExpression` (which then records the call)
+    and returns a recorded :obj:`mpi_array.globale_expr.GndarrayExpression`
+    within a :func:`mpi_array.globale_expr.lazy_mode` context.
     """
+    from . import globale_expr as _globale_expr
+    if any(isinstance(i, _globale_expr.GndarrayExpression) for i in inputs):
+        return NotImplemented
+    expr = _globale_expr.record_ufunc(ufunc, method, *inputs, **kwargs)
+    if expr is not None:
+        return expr
+
     ufunc_executor = \
         gndarray_ufunc_executor_factory(
             array_like_obj,
@@ -24,6 +24,9 @@ Classes
 
    UfuncResultTypeTest - Tests for :func:`mpi_array.globale_ufunc.ufunc_result_type` function.
    BroadcastShapeTest - Tests for :func:`mpi_array.globale_ufunc.broadcast_shape` function.
+   CalcAtCoordinatesTest - Tests for :func:`mpi_array.globale_ufunc.calc_at_coordinates` function.
+   CalcExtentOwnersTest - Tests for :func:`mpi_array.globale_ufunc.calc_extent_owners` function.
+   SegmentReduceTest - Tests for :func:`mpi_array.globale_ufunc.ufunc_segment_reduce` function.
    GndarrayUfuncTest - Tests for :func:`mpi_array.globale_ufunc.gndarray_array_ufunc` function.
    ToGndarrayConverter - Base class for :obj:`numpy.ndarray` to :obj:`mpi_array.globale.gndarray`.
 """
@@ -38,7 +41,10 @@ from .comms import LT_NODE, LT_PROCESS, DT_CLONED, DT_SINGLE_LOCALE, DT_BLOCK  #
 from . import comms as _comms
 from . import distribution as _distribution
 from .globale_ufunc import broadcast_shape, ufunc_result_type, get_extents
-from .globale_ufunc import check_equivalent_inter_locale_comms
+from .globale_ufunc import check_equivalent_inter_locale_comms, calc_at_coordinates
+from .globale_ufunc import calc_extent_owners
+from .globale_ufunc import calc_reduceat_segments, ufunc_segment_reduce
+from . import globale_ufunc as _globale_ufunc
 from .globale import gndarray as _gndarray
 from .globale_creation import ones as _ones, zeros as _zeros, asarray as _asarray
 from .globale_creation import empty as _empty
@@ -252,6 +258,124 @@ class BroadcastShapeTest(_unittest.TestCase):
         self.assertSequenceEqual((4, 5), broadcast_shape((5, ), (1, 5), (4, 1)))
 
 
+class CalcAtCoordinatesTest(_unittest.TestCase):
+
+    """
+    :obj:`unittest.TestCase` for :func:`mpi_array.globale_ufunc.calc_at_coordinates`.
+    """
+
+    def test_coordinates(self):
+        """
+        Asserts that the coordinates select the same elements as :obj:`numpy.ndarray` indexing.
+        """
+        shape = (5, 4, 3)
+        npy_ary = _np.arange(_np.product(shape)).reshape(shape)
+        for indices in \
+                (
+                    ([0, 4, -1, 4],),
+                    ([0, 4, 2], [3, 0, -2]),
+                    ([[0, 1], [2, 3]], [0, 1], [2]),
+                    (2, 1, 0),
+                    ()
+                ):
+            coords, selection_shape = calc_at_coordinates(shape, indices)
+            self.assertSequenceEqual(npy_ary[indices].shape, selection_shape)
+            self.assertSequenceEqual(
+                npy_ary[indices].ravel().tolist(),
+                npy_ary[tuple(coords.T)].tolist()
+            )
+        coords, selection_shape = calc_at_coordinates((7,), _np.array([6, 0, 6]))
+        self.assertSequenceEqual([[6], [0], [6]], coords.tolist())
+
+    def test_index_errors(self):
+        """
+        Asserts that :obj:`IndexError` is raised for invalid indices.
+        """
+        self.assertRaises(IndexError, calc_at_coordinates, (5, 4), ([0], [0], [0]))
+        self.assertRaises(IndexError, calc_at_coordinates, (5, 4), ([0.0],))
+        self.assertRaises(IndexError, calc_at_coordinates, (5, 4), ([5],))
+        self.assertRaises(IndexError, calc_at_coordinates, (5, 4), ([0], [-5]))
+
+
+class CalcExtentOwnersTest(_unittest.TestCase):
+
+    """
+    :obj:`unittest.TestCase` for :func:`mpi_array.globale_ufunc.calc_extent_owners`.
+    """
+
+    def test_owners(self):
+        """
+        Asserts that the owners match a brute force comparison with every extent.
+        """
+        shape = (9, 7, 4)
+        # Irregular grid of extents (in shuffled order) plus some empty extents.
+        splits = ((0, 2, 3, 9), (0, 5, 7), (0, 4))
+        starts = []
+        stops = []
+        for i in range(len(splits[0]) - 1):
+            for j in range(len(splits[1]) - 1):
+                starts.append((splits[0][i], splits[1][j], splits[2][0]))
+                stops.append((splits[0][i + 1], splits[1][j + 1], splits[2][1]))
+        starts += [(3, 3, 3), (0, 0, 0)]
+        stops += [(3, 3, 3), (0, 0, 0)]
+        order = _np.random.permutation(len(starts))
+        starts = _np.array(starts)[order]
+        stops = _np.array(stops)[order]
+
+        coords = _np.array(tuple(_np.ndindex(shape)))
+        owners = calc_extent_owners(coords, starts, stops)
+        expected = _np.full((coords.shape[0],), -1)
+        for i in range(len(starts)):
+            expected[_np.all((coords >= starts[i]) & (coords < stops[i]), axis=1)] = i
+        self.assertSequenceEqual(expected.tolist(), owners.tolist())
+        self.assertTrue(_np.all(owners >= 0))
+
+        coords = _np.array([[0, 0, 0], [9, 0, 0], [-1, 0, 0], [8, 6, 3]])
+        self.assertSequenceEqual(
+            [-1, -1, -1, -1],
+            calc_extent_owners(coords, starts[:0], stops[:0]).tolist()
+        )
+        owners = calc_extent_owners(coords, starts, stops)
+        self.assertSequenceEqual([False, True, True, False], (owners < 0).tolist())
+        self.assertEqual(0, len(calc_extent_owners(coords[:0], starts, stops)))
+
+
+class SegmentReduceTest(_unittest.TestCase):
+
+    """
+    :obj:`unittest.TestCase` for :func:`mpi_array.globale_ufunc.calc_reduceat_segments`
+    and :func:`mpi_array.globale_ufunc.ufunc_segment_reduce`.
+    """
+
+    def test_reduceat_equivalence(self):
+        """
+        Asserts that segment reduction of the :func:`calc_reduceat_segments`
+        segments is equivalent to :meth:`numpy.ufunc.reduceat`.
+        """
+        npy_ary = _np.random.randint(low=-50, high=50, size=(19, 6, 4))
+        for indices in ([0, 3, 3, 7, 18], [5], [0, 18, 18], [2, 9, 15], [7, 2, 11, 4]):
+            for axis in (0, 1):
+                ary = _np.moveaxis(npy_ary, 0, axis)
+                starts, stops = calc_reduceat_segments(indices, ary.shape[axis])
+                for ufunc in (_np.add, _np.maximum):
+                    self.assertTrue(
+                        _np.all(
+                            ufunc.reduceat(ary, indices, axis=axis)
+                            ==
+                            ufunc_segment_reduce(ufunc, ary, starts, stops, axis=axis)
+                        )
+                    )
+
+    def test_index_errors(self):
+        """
+        Asserts that :obj:`IndexError` is raised for invalid indices.
+        """
+        self.assertRaises(IndexError, calc_reduceat_segments, [0, 8], 8)
+        self.assertRaises(IndexError, calc_reduceat_segments, [-1, 2], 8)
+        self.assertRaises(IndexError, calc_reduceat_segments, [[0, 2]], 8)
+        self.assertRaises(IndexError, calc_reduceat_segments, [0.0, 2.0], 8)
+
+
 class ToGndarrayConverter(object):
 
     """
@@ -814,17 +938,238 @@ class GndarrayUfuncTest(_unittest.TestCase):
                     (gary0, gary1)
                 )
 
-    def test_not_implemented(self):
-        uf = _np.add
-        with _empty((50, 50, 50), locale_type=LT_NODE) as gary0:
+    def test_reduce(self):
+        """
+        Asserts that :meth:`numpy.ufunc.reduce` for :obj:`mpi_array.globale.gndarray`
+        arguments produces same results as for :obj:`numpy.ndarray` arguments.
+        """
+        per_axis_size_factor = int(_np.floor(_np.sqrt(float(self.num_node_locales))))
+        gshape = (11 * per_axis_size_factor + 1, 13 * per_axis_size_factor + 3, 5)
+        npy_ary = _np.random.randint(low=-50, high=50, size=gshape)
+        npy_ary_f = _np.random.uniform(low=-1.0, high=1.0, size=gshape)
+
+        def add_reduce_axis1(ary):
+            return _np.add.reduce(ary, axis=1)
+
+        def add_reduce_axes02_keepdims(ary):
+            return _np.add.reduce(ary, axis=(0, 2), keepdims=True)
+
+        def maximum_reduce_axis0(ary):
+            return _np.maximum.reduce(ary, axis=0)
+
+        self.do_multi_distribution_tests(add_reduce_axis1, npy_ary)
+        self.do_multi_distribution_tests(add_reduce_axes02_keepdims, npy_ary)
+        self.do_multi_distribution_tests(maximum_reduce_axis0, npy_ary_f)
+
+        for distrib_type in (DT_BLOCK, DT_CLONED, DT_SINGLE_LOCALE):
+            with \
+                    _asarray(npy_ary, locale_type=LT_PROCESS, distrib_type=distrib_type, halo=1) \
+                    as gary, \
+                    _asarray(npy_ary_f, locale_type=LT_NODE, distrib_type=distrib_type) \
+                    as gary_f:
+                self.assertEqual(npy_ary.sum(), _np.add.reduce(gary, axis=None))
+                self.assertEqual(npy_ary.sum(), _np.sum(gary))
+                self.assertEqual(
+                    _np.sum(npy_ary, dtype="int16"),
+                    _np.sum(gary, dtype="int16")
+                )
+                self.assertEqual(npy_ary.min(), _np.minimum.reduce(gary, axis=None))
+                self.assertEqual(npy_ary_f.max(), _np.maximum.reduce(gary_f, axis=None))
+                self.assertSequenceEqual(
+                    (1, 1, 1),
+                    _np.add.reduce(gary, axis=None, keepdims=True).shape
+                )
+                self.assertEqual(
+                    npy_ary.sum() + 7,
+                    _np.add.reduce(gary, axis=None, initial=7)
+                )
+                self.assertAlmostEqual(npy_ary_f.sum(), _np.sum(gary_f))
+                self.assertEqual(npy_ary.max(), gary.max())
+                with gary.sum(axis=2) as gary_sum:
+                    self.assertSequenceEqual(npy_ary.shape[0:2], tuple(gary_sum.shape))
+
+                # The locale group communicators are created once per grouping.
+                with gary.sum(axis=2):
+                    num_group_comms = len(_globale_ufunc._locale_group_comms_cache.lookup)
+                with gary.sum(axis=2):
+                    self.assertEqual(
+                        num_group_comms,
+                        len(_globale_ufunc._locale_group_comms_cache.lookup)
+                    )
+
+                # Full reduction into a gndarray output.
+                with \
+                        _zeros(
+                            (1, 1, 1),
+                            dtype=npy_ary.dtype,
+                            locale_type=LT_PROCESS,
+                            distrib_type=distrib_type
+                        ) as gary_out:
+                    self.assertTrue(
+                        _np.add.reduce(gary, axis=None, keepdims=True, out=gary_out) is gary_out
+                    )
+                    with _asarray(_np.sum(npy_ary, keepdims=True)) as mpi_cln_npy_result_ary:
+                        self.compare_results(mpi_cln_npy_result_ary, gary_out)
+
+        # Zero-size inputs.
+        npy_ary = _np.zeros((0, gshape[1]), dtype="float64")
+        for distrib_type in (DT_CLONED, DT_SINGLE_LOCALE):
+            with _asarray(npy_ary, locale_type=LT_PROCESS, distrib_type=distrib_type) as gary:
+                self.assertEqual(0, _np.add.reduce(gary, axis=None))
+                self.assertEqual(-1, _np.maximum.reduce(gary, axis=None, initial=-1))
+                self.assertRaises(ValueError, _np.maximum.reduce, gary, axis=None)
+                with \
+                        _np.multiply.reduce(gary, axis=0) as gary_prod, \
+                        _asarray(_np.multiply.reduce(npy_ary, axis=0)) as mpi_cln_npy_result_ary:
+                    self.compare_results(mpi_cln_npy_result_ary, gary_prod)
 
-            for method in ["reduce", "accumulate", "reduceat", "at", "outer"]:
-                self.assertRaises(
-                    TypeError,
-                    getattr(uf, method),
-                    gary0,
-                    5.0
+    def test_accumulate(self):
+        """
+        Asserts that :meth:`numpy.ufunc.accumulate` for :obj:`mpi_array.globale.gndarray`
+        arguments produces same results as for :obj:`numpy.ndarray` arguments.
+        """
+        per_axis_size_factor = int(_np.floor(_np.sqrt(float(self.num_node_locales))))
+        gshape = (11 * per_axis_size_factor + 1, 13 * per_axis_size_factor + 3, 5)
+        npy_ary = _np.random.randint(low=-50, high=50, size=gshape)
+        npy_ary_f = _np.random.uniform(low=-1.0, high=1.0, size=gshape)
+
+        def add_accumulate_axis0(ary):
+            return _np.add.accumulate(ary, axis=0)
+
+        def add_accumulate_axis1(ary):
+            return _np.add.accumulate(ary, axis=1)
+
+        def maximum_accumulate_axis2(ary):
+            return _np.maximum.accumulate(ary, axis=-1)
+
+        self.do_multi_distribution_tests(add_accumulate_axis0, npy_ary)
+        self.do_multi_distribution_tests(add_accumulate_axis1, npy_ary)
+        self.do_multi_distribution_tests(maximum_accumulate_axis2, npy_ary_f)
+        self.do_multi_distribution_tests(_np.add.accumulate, npy_ary[:, :, 0].copy())
+
+        with _asarray(npy_ary, locale_type=LT_NODE, distrib_type=DT_BLOCK) as gary:
+            # The locale group communicators are created once per grouping.
+            with _np.add.accumulate(gary, axis=1):
+                num_group_comms = len(_globale_ufunc._locale_group_comms_cache.lookup)
+            with _np.add.accumulate(gary, axis=1):
+                self.assertEqual(
+                    num_group_comms,
+                    len(_globale_ufunc._locale_group_comms_cache.lookup)
+                )
+            self.assertRaises(TypeError, _np.subtract.accumulate, gary, axis=0)
+            self.assertRaises(TypeError, _np.subtract.reduce, gary, axis=0)
+
+    def test_outer(self):
+        """
+        Asserts that :meth:`numpy.ufunc.outer` for :obj:`mpi_array.globale.gndarray`
+        arguments produces same results as for :obj:`numpy.ndarray` arguments.
+        """
+        npy_x = _np.random.uniform(low=-1.0, high=1.0, size=(37 * self.num_node_locales + 5,))
+        npy_y = _np.random.uniform(low=-1.0, high=1.0, size=(29 * self.num_node_locales + 3,))
+        npy_result = _np.subtract.outer(npy_x, npy_y)
+
+        for locale_type in (LT_NODE, LT_PROCESS):
+            for x_distrib_type, y_distrib_type in \
+                    ((DT_BLOCK, DT_BLOCK), (DT_BLOCK, DT_CLONED), (DT_SINGLE_LOCALE, DT_BLOCK)):
+                with \
+                        _asarray(npy_x, locale_type=locale_type, distrib_type=x_distrib_type) \
+                        as gary_x, \
+                        _asarray(npy_y, locale_type=locale_type, distrib_type=y_distrib_type) \
+                        as gary_y, \
+                        _asarray(npy_result) as cln_npy_result:
+                    with _np.subtract.outer(gary_x, gary_y) as gary_result:
+                        self.assertTrue(isinstance(gary_result, _gndarray))
+                        self.compare_results(cln_npy_result, gary_result)
+                    with _np.subtract.outer(gary_x, npy_y) as gary_result:
+                        self.compare_results(cln_npy_result, gary_result)
+
+    def test_at(self):
+        """
+        Asserts that :meth:`numpy.ufunc.at` for a :obj:`mpi_array.globale.gndarray`
+        produces the same result as for a :obj:`numpy.ndarray` when the
+        :samp:`(indices, values)` pairs of all peer ranks are applied.
+        """
+        gshape = (17 * self.num_node_locales + 3, 11, 5)
+        npy_ary = _np.random.randint(low=-50, high=50, size=gshape)
+
+        def rank_pairs(peer_rank):
+            random_state = _np.random.RandomState(peer_rank + 71)
+            num_pairs = 40 + 7 * peer_rank
+            indices = \
+                tuple(
+                    random_state.randint(low=-gshape[a], high=gshape[a], size=(num_pairs,))
+                    for a in range(len(gshape))
                 )
+            values = random_state.randint(low=-5, high=5, size=(num_pairs,))
+            return indices, values
+
+        for locale_type in (LT_NODE, LT_PROCESS):
+            for distrib_type in (DT_BLOCK, DT_CLONED, DT_SINGLE_LOCALE):
+                with \
+                        _asarray(npy_ary, locale_type=locale_type, distrib_type=distrib_type) \
+                        as gary:
+                    peer_comm = gary.locale_comms.peer_comm
+                    npy_result = npy_ary.copy()
+                    for r in range(peer_comm.size):
+                        _np.add.at(npy_result, *rank_pairs(r))
+                    self.assertTrue(_np.add.at(gary, *rank_pairs(peer_comm.rank)) is None)
+                    with _asarray(npy_result) as cln_npy_result:
+                        self.compare_results(cln_npy_result, gary)
+
+                    # Partial (leading axis) indices, scalar values and a unary ufunc.
+                    indices = ([0, gshape[0] - 1, 0],)
+                    if peer_comm.rank != 0:
+                        indices = (_np.zeros((0,), dtype="int64"),)
+                    _np.add.at(npy_result, ([0, gshape[0] - 1, 0],), 3)
+                    _np.negative.at(npy_result, ([0, gshape[0] - 1, 0],))
+                    _np.add.at(gary, indices, 3)
+                    _np.negative.at(gary, indices)
+                    with _asarray(npy_result) as cln_npy_result:
+                        self.compare_results(cln_npy_result, gary)
+
+        with _asarray(npy_ary, locale_type=LT_NODE, distrib_type=DT_BLOCK) as gary:
+            self.assertRaises(IndexError, _np.add.at, gary, (gshape[0],), 1)
+            self.assertRaises(TypeError, _np.add.at, gary, ([0],), 1.5)
+
+    def test_reduceat(self):
+        """
+        Asserts that :meth:`numpy.ufunc.reduceat` for :obj:`mpi_array.globale.gndarray`
+        arguments produces same results as for :obj:`numpy.ndarray` arguments, including
+        segments which straddle (and span) locale extents.
+        """
+        per_axis_size_factor = int(_np.floor(_np.sqrt(float(self.num_node_locales))))
+        gshape = (23 * per_axis_size_factor + 1, 13 * per_axis_size_factor + 3, 5)
+        npy_ary = _np.random.randint(low=-50, high=50, size=gshape)
+        npy_ary_f = _np.random.uniform(low=-1.0, high=1.0, size=gshape)
+        labels = _np.sort(_np.random.randint(low=0, high=9, size=(gshape[0],)))
+        label_indices = _np.concatenate(((0,), _np.flatnonzero(_np.diff(labels)) + 1))
+        dup_indices = _np.array((0, 1, 1, 4, gshape[1] - 1, gshape[1] - 1))
+
+        def add_reduceat_labels_axis0(ary):
+            return _np.add.reduceat(ary, label_indices, axis=0)
+
+        def add_reduceat_spanning_axis0(ary):
+            return _np.add.reduceat(ary, (1, gshape[0] - 2), axis=0)
+
+        def maximum_reduceat_dups_axis1(ary):
+            return _np.maximum.reduceat(ary, dup_indices, axis=1)
+
+        def add_reduceat_single_segment_axis0(ary):
+            # Fewer segments than locales, some locales own no output segments.
+            return _np.add.reduceat(ary, (gshape[0] // 2,), axis=0)
+
+        def add_reduceat_decreasing_axis0(ary):
+            return _np.add.reduceat(ary, (4, 2, gshape[0] - 3, 1), axis=0)
+
+        self.do_multi_distribution_tests(add_reduceat_labels_axis0, npy_ary)
+        self.do_multi_distribution_tests(add_reduceat_spanning_axis0, npy_ary)
+        self.do_multi_distribution_tests(maximum_reduceat_dups_axis1, npy_ary_f)
+        self.do_multi_distribution_tests(add_reduceat_single_segment_axis0, npy_ary)
+        self.do_multi_distribution_tests(add_reduceat_decreasing_axis0, npy_ary)
+
+        with _asarray(npy_ary, locale_type=LT_NODE, distrib_type=DT_BLOCK) as gary:
+            self.assertRaises(TypeError, _np.subtract.reduceat, gary, (0, 2), axis=0)
+            self.assertRaises(IndexError, _np.add.reduceat, gary, (0, gshape[0]), axis=0)
 
 
 _unittest.main(__name__)
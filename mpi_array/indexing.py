@@ -14,6 +14,8 @@ Classes and Functions
    IndexingExtent - Index range for a tile of a decomposition.
    HaloIndexingExtent - Index range, with ghost elements, for a tile of a decomposition.
    calc_intersection_split - decompose an extent based on intersection with another extent.
+   calc_coalesced_extents - merge adjacent extents into larger extents.
+   calc_box_intersections - vectorised intersections of all pairs from two sets of boxes.
 
 """
 from __future__ import absolute_import
@@ -219,6 +221,45 @@ class IndexingExtent(object):
 
         return lo, hi
 
+    def split_for_max_elements(self, max_elements):
+        """
+        Partitions this extent into extents which each have no more
+        than :samp:`{max_elements}` elements. Cuts are made across the lowest
+        index axes first, so that (for C order memory layout) each partition
+        is (as near as possible) a contiguous chunk of the extent.
+
+        :type max_elements: :obj:`int`
+        :param max_elements: Maximum number of elements in each partition,
+           if :samp:`None` then no partitioning is performed.
+        :rtype: :obj:`list` of :obj:`IndexingExtent`
+        :return: List of extents (in C order) forming a partition of this extent.
+        """
+        shape = self.shape
+        if (max_elements is None) or (_np.product(shape) <= max_elements):
+            return [self, ]
+        if max_elements < 1:
+            raise ValueError("Got max_elements=%s, require max_elements >= 1." % (max_elements,))
+
+        # Find the lowest index axis a for which shape[a+1:] fits into max_elements
+        a = self.ndim - 1
+        while (a > 0) and (_np.product(shape[a:]) <= max_elements):
+            a -= 1
+        inner = _np.product(shape[a + 1:])
+        chunk = max(1, max_elements // inner)
+
+        extents = []
+        for outer_idx in _np.ndindex(*(shape[0:a])):
+            start = self.start.copy()
+            stop = self.stop.copy()
+            start[0:a] += _np.array(outer_idx, dtype=start.dtype)
+            stop[0:a] = start[0:a] + 1
+            for i in range(self.start[a], self.stop[a], chunk):
+                start[a] = i
+                stop[a] = min(i + chunk, self.stop[a])
+                extents.append(IndexingExtent(start=start.copy(), stop=stop.copy()))
+
+        return extents
+
     def calc_intersection_split(self, other):
         """
         Returns :samp:`(leftovers, intersection)` pair, where :samp:`intersection`
@@ -763,4 +804,128 @@ def calc_intersection_split(
     return leftovers, updates
 
 
+def calc_box_intersections(starts0, stops0, starts1, stops1, max_block_elements=2 ** 22):
+    """
+    Vectorised calculation of the (non-empty) intersections of
+    all pairs of boxes from two sets of boxes. Pairs are evaluated with
+    :mod:`numpy` broadcasting, in blocks of rows of the first set so that
+    temporary arrays have no more than (approximately) :samp:`{max_block_elements}` elements.
+
+    :type starts0: :obj:`numpy.ndarray`
+    :param starts0: :samp:`(N0, ndim)` shaped array of box start indices.
+    :type stops0: :obj:`numpy.ndarray`
+    :param stops0: :samp:`(N0, ndim)` shaped array of box stop indices.
+    :type starts1: :obj:`numpy.ndarray`
+    :param starts1: :samp:`(N1, ndim)` shaped array of box start indices.
+    :type stops1: :obj:`numpy.ndarray`
+    :param stops1: :samp:`(N1, ndim)` shaped array of box stop indices.
+    :type max_block_elements: :obj:`int`
+    :param max_block_elements: Bounds the size of temporary arrays.
+    :rtype: :obj:`tuple`
+    :return: A :samp:`(indices0, indices1, starts, stops)` tuple, :samp:`indices0[k]`
+       and :samp:`indices1[k]` are the indices of a pair of intersecting boxes
+       and :samp:`starts[k]` and :samp:`stops[k]` are the bounds of the intersection.
+       Pairs are ordered by :samp:`indices0` then by :samp:`indices1`.
+
+    Example::
+
+       >>> indices0, indices1, starts, stops = \\
+       ...     calc_box_intersections(
+       ...         [[0, 0]], [[4, 4]],
+       ...         [[0, 0], [2, 2], [4, 4]], [[2, 2], [6, 6], [8, 8]]
+       ...     )
+       >>> indices0.tolist(), indices1.tolist(), starts.tolist(), stops.tolist()
+       ([0, 0], [0, 1], [[0, 0], [2, 2]], [[2, 2], [4, 4]])
+    """
+    starts0 = _np.asarray(starts0)
+    stops0 = _np.asarray(stops0)
+    starts1 = _np.asarray(starts1)
+    stops1 = _np.asarray(stops1)
+    ndim = starts0.shape[1]
+    block = max(1, max_block_elements // max(1, starts1.shape[0] * ndim))
+
+    indices0 = [_np.zeros((0,), dtype="int64"), ]
+    indices1 = [_np.zeros((0,), dtype="int64"), ]
+    starts = [_np.zeros((0, ndim), dtype=starts0.dtype), ]
+    stops = [_np.zeros((0, ndim), dtype=stops0.dtype), ]
+    for b in range(0, starts0.shape[0], block):
+        isect_starts = _np.maximum(starts0[b:b + block, _np.newaxis, :], starts1[_np.newaxis, :, :])
+        isect_stops = _np.minimum(stops0[b:b + block, _np.newaxis, :], stops1[_np.newaxis, :, :])
+        i0, i1 = _np.nonzero(_np.all(isect_stops > isect_starts, axis=2))
+        indices0.append(i0 + b)
+        indices1.append(i1)
+        starts.append(isect_starts[i0, i1])
+        stops.append(isect_stops[i0, i1])
+
+    return \
+        (
+            _np.concatenate(indices0),
+            _np.concatenate(indices1),
+            _np.concatenate(starts),
+            _np.concatenate(stops)
+        )
+
+
+def _calc_merged_extent(extent0, extent1):
+    """
+    Returns the :obj:`IndexingExtent` which is the union of :samp:`{extent0}`
+    and :samp:`{extent1}` when the union is a box (i.e. the extents are
+    adjacent along one axis and have the same range on all other axes),
+    returns :samp:`None` otherwise.
+    """
+    start0, stop0 = _np.array(extent0.start), _np.array(extent0.stop)
+    start1, stop1 = _np.array(extent1.start), _np.array(extent1.stop)
+    diff_axes = _np.where((start0 != start1) | (stop0 != stop1))[0]
+    merged = None
+    if len(diff_axes) == 1:
+        a = diff_axes[0]
+        if (stop0[a] == start1[a]) or (stop1[a] == start0[a]):
+            merged = \
+                IndexingExtent(
+                    start=_np.minimum(start0, start1),
+                    stop=_np.maximum(stop0, stop1)
+                )
+    return merged
+
+
+def calc_coalesced_extents(extents):
+    """
+    Merges pairs of adjacent (non-overlapping) extents, whose union is
+    a box, until no further merges are possible.
+
+    Example::
+
+       >>> calc_coalesced_extents(
+       ...     [
+       ...         IndexingExtent(start=(0, 0), stop=(4, 2)),
+       ...         IndexingExtent(start=(0, 2), stop=(4, 5)),
+       ...         IndexingExtent(start=(4, 0), stop=(6, 5)),
+       ...         IndexingExtent(start=(8, 0), stop=(9, 5))
+       ...     ]
+       ... )
+       [IndexingExtent(start=(0, 0), stop=(6, 5)), IndexingExtent(start=(8, 0), stop=(9, 5))]
+
+    :type extents: sequence of :obj:`IndexingExtent`
+    :param extents: Non-overlapping extents.
+    :rtype: :obj:`list` of :obj:`IndexingExtent`
+    :return: The coalesced extents, covering the same indices as :samp:`{extents}`.
+    """
+    extents = list(extents)
+    merged_some = True
+    while merged_some:
+        merged_some = False
+        for i in range(len(extents)):
+            for j in range(i + 1, len(extents)):
+                merged = _calc_merged_extent(extents[i], extents[j])
+                if merged is not None:
+                    extents[i] = merged
+                    extents.pop(j)
+                    merged_some = True
+                    break
+            if merged_some:
+                break
+
+    return extents
+
+
 __all__ = [s for s in dir() if not s.startswith('_')]
@@ -29,6 +29,7 @@ from .license import license as _license, copyright as _copyright, version as _v
 from . import unittest as _unittest
 from . import logging as _logging  # noqa: E402,F401
 from .indexing import IndexingExtent, HaloIndexingExtent, calc_intersection_split
+from .indexing import calc_coalesced_extents, calc_box_intersections
 
 
 __author__ = "Shane J. Latham"
@@ -227,6 +228,39 @@ class IndexingExtentTest(_unittest.TestCase):
         self.assertEqual(IndexingExtent(start=(10, 3), stop=(32, 19)), lo)
         self.assertEqual(IndexingExtent(start=(10, 19), stop=(32, 20)), hi)
 
+    def test_split_for_max_elements(self):
+        """
+        Test for :meth:`mpi_array.indexing.IndexingExtent.split_for_max_elements`.
+        """
+        ie = IndexingExtent(start=(2, 3, 5), stop=(6, 10, 9))
+
+        self.assertEqual([ie, ], ie.split_for_max_elements(None))
+        self.assertEqual([ie, ], ie.split_for_max_elements(112))
+        self.assertEqual([ie, ], ie.split_for_max_elements(1000))
+        self.assertRaises(ValueError, ie.split_for_max_elements, 0)
+
+        splt = ie.split_for_max_elements(56)
+        self.assertEqual(2, len(splt))
+        self.assertEqual(IndexingExtent(start=(2, 3, 5), stop=(4, 10, 9)), splt[0])
+        self.assertEqual(IndexingExtent(start=(4, 3, 5), stop=(6, 10, 9)), splt[1])
+
+        splt = ie.split_for_max_elements(30)
+        self.assertEqual(4, len(splt))
+        self.assertEqual(IndexingExtent(start=(3, 3, 5), stop=(4, 10, 9)), splt[1])
+
+        splt = ie.split_for_max_elements(3)
+        self.assertEqual(4 * 7 * 2, len(splt))
+        self.assertEqual(IndexingExtent(start=(2, 3, 5), stop=(3, 4, 8)), splt[0])
+        self.assertEqual(IndexingExtent(start=(2, 3, 8), stop=(3, 4, 9)), splt[1])
+
+        for max_elements in (1, 2, 3, 5, 7, 13, 28, 29, 55):
+            counts = _np.zeros(ie.shape, dtype="int64")
+            for e in ie.split_for_max_elements(max_elements):
+                self.assertTrue(_np.product(e.shape) <= max_elements)
+                e_slice = tuple(slice(b, s) for b, s in zip(e.start - ie.start, e.stop - ie.start))
+                counts[e_slice] += 1
+            self.assertTrue(_np.all(counts == 1))
+
     def test_calc_intersection_split(self):
         """
         Test for :meth:`mpi_array.indexing.IndexingExtent.calc_intersection_split`.
@@ -286,6 +320,66 @@ class IndexingExtentTest(_unittest.TestCase):
         self.assertEqual(IndexingExtent(start=(20, 50), stop=(40, 60)), leftovers[2])
         self.assertEqual(IndexingExtent(start=(20, 80), stop=(40, 100)), leftovers[3])
 
+    def test_calc_coalesced_extents(self):
+        """
+        Test for :func:`mpi_array.indexing.calc_coalesced_extents`.
+        """
+        extents = \
+            [
+                IndexingExtent(start=(0, 0), stop=(2, 4)),
+                IndexingExtent(start=(0, 4), stop=(2, 8)),
+                IndexingExtent(start=(2, 0), stop=(4, 8)),
+                IndexingExtent(start=(5, 0), stop=(6, 8)),
+                IndexingExtent(start=(6, 1), stop=(7, 8)),
+            ]
+        coalesced = calc_coalesced_extents(extents)
+        self.assertEqual(3, len(coalesced))
+        self.assertTrue(IndexingExtent(start=(0, 0), stop=(4, 8)) in coalesced)
+        self.assertTrue(IndexingExtent(start=(5, 0), stop=(6, 8)) in coalesced)
+        self.assertTrue(IndexingExtent(start=(6, 1), stop=(7, 8)) in coalesced)
+        self.assertEqual(
+            sum(_np.product(e.shape) for e in extents),
+            sum(_np.product(e.shape) for e in coalesced)
+        )
+
+        self.assertSequenceEqual([], calc_coalesced_extents([]))
+        self.assertSequenceEqual(extents[3:4], calc_coalesced_extents(extents[3:4]))
+
+    def test_calc_box_intersections(self):
+        """
+        Test for :func:`mpi_array.indexing.calc_box_intersections`, compares
+        against :meth:`mpi_array.indexing.IndexingExtent.calc_intersection`.
+        """
+        random_state = _np.random.RandomState(345)
+        starts0 = random_state.randint(0, 32, size=(17, 3))
+        stops0 = starts0 + random_state.randint(0, 12, size=(17, 3))
+        starts1 = random_state.randint(0, 32, size=(23, 3))
+        stops1 = starts1 + random_state.randint(0, 12, size=(23, 3))
+
+        expected = []
+        for i in range(len(starts0)):
+            for j in range(len(starts1)):
+                isect = \
+                    IndexingExtent(start=starts0[i], stop=stops0[i]).calc_intersection(
+                        IndexingExtent(start=starts1[j], stop=stops1[j])
+                    )
+                if (isect is not None) and (_np.product(isect.shape) > 0):
+                    expected.append((i, j, tuple(isect.start), tuple(isect.stop)))
+        self.assertTrue(len(expected) > 0)
+
+        for max_block_elements in (1, 100, 2 ** 22):
+            indices0, indices1, starts, stops = \
+                calc_box_intersections(
+                    starts0, stops0, starts1, stops1, max_block_elements=max_block_elements
+                )
+            self.assertSequenceEqual(
+                expected,
+                [
+                    (indices0[k], indices1[k], tuple(starts[k]), tuple(stops[k]))
+                    for k in range(len(indices0))
+                ]
+            )
+
 
 class HaloIndexingExtentTest(_unittest.TestCase):
 
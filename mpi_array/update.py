@@ -18,9 +18,27 @@ Classes and Functions
    PairExtentUpdate - Describes sub-extent source and sub-extent destination.
    MpiPairExtentUpdate - Extends :obj:`PairExtentUpdate` with MPI data type factory.
    MpiPairExtentUpdateDifferentDtypes - Over-rides :meth:`MpiPairExtentUpdate.do_get`.
+   ChunkBufferPool - Reusable buffers for streaming update regions in chunks.
+   get_chunk_buffer_pool - The per process :obj:`ChunkBufferPool`.
+   MpiPairExtentUpdateGroup - Multiple :obj:`MpiPairExtentUpdate` regions in a single transfer.
+   iter_pair_extent_updates - Iterate updates, expanding :obj:`MpiPairExtentUpdateGroup` groups.
    HaloSingleExtentUpdate - Describes sub-extent for halo region update.
    MpiHaloSingleExtentUpdate - Extends :obj:`HaloSingleExtentUpdate` with MPI data type factory.
+   HalosUpdate - Per-axis halo region updates for a single locale.
+   MpiHalosUpdate - Extends :obj:`HalosUpdate` to create :obj:`MpiHaloSingleExtentUpdate` updates.
+   SingleEpochHalosUpdate - Halo region updates (including edge and corner) for a single locale.
+   MpiSingleEpochHalosUpdate - Extends :obj:`SingleEpochHalosUpdate` with MPI data types.
+   calc_slab_extent - Slab of a partition of an extent (for parallel direct copies).
+   calc_globale_shape - Shape of the globale extent partitioned by locale extents.
+   calc_periodic_shifts - Offsets of periodic images of a locale extent.
+   calc_halo_depth_extent - Locale extent with halo reduced to a specified depth.
+   calc_extents_are_disjoint - Whether a sequence of extents have no overlapping elements.
+   calc_intersection_updates - Vectorised intersection of destination and source extents.
    UpdatesForRedistribute - Calculate sequence of overlapping extents between two distributions.
+   RmaTransferCostModel - Heuristic latency/bandwidth fit used to size groups of RMA fetches.
+   get_rma_transfer_cost_model - The per process :obj:`RmaTransferCostModel`.
+   calc_target_schedule - Locale interleaved (round-robin) ordering of RMA targets.
+   calc_rank_to_locale - Maps peer rank to locale index.
    RmaUpdateExecutor - Execute updates using one-sided RMA fetch.
 """
 from __future__ import absolute_import
@@ -28,11 +46,15 @@ from __future__ import absolute_import
 import mpi4py.MPI as _mpi
 import collections as _collections
 import copy as _copy
+import itertools as _itertools
 import numpy as _np
 
 from .license import license as _license, copyright as _copyright, version as _version
 from .indexing import HaloIndexingExtent
+from .indexing import IndexingExtent as _IndexingExtent
 from .indexing import calc_intersection_split as _calc_intersection_split
+from .indexing import calc_coalesced_extents as _calc_coalesced_extents
+from .indexing import calc_box_intersections as _calc_box_intersections
 from . import types as _types
 
 __author__ = "Shane J. Latham"
@@ -99,7 +121,40 @@ class ExtentUpdate(object):
         return self._src.locale_extent
 
 
-def pair_extent_update_copyto(peu, dst_array, src_array, casting):
+def calc_slab_extent(extent, slab_rank, num_slabs):
+    """
+    Returns the :samp:`{slab_rank}` slab of a partition of :samp:`{extent}` into :samp:`{num_slabs}`
+    slabs. The slabs are cut across the lowest index axis which has at
+    least :samp:`{num_slabs}` elements (the longest axis when there is no such axis), so that
+    (for C order memory layout) each slab is a (as near as possible) contiguous chunk.
+    Slabs may be empty (zero elements) when :samp:`{extent}` is small.
+
+    :type extent: :obj:`mpi_array.indexing.IndexingExtent`
+    :param extent: Extent to partition.
+    :type slab_rank: :obj:`int`
+    :param slab_rank: Index of the slab, :samp:`0 <= {slab_rank} < {num_slabs}`.
+    :type num_slabs: :obj:`int`
+    :param num_slabs: Number of slabs in the partition.
+    :rtype: :obj:`mpi_array.indexing.IndexingExtent`
+    :return: The slab extent.
+    """
+    if num_slabs <= 1:
+        return extent
+    shape = extent.shape
+    axes = [a for a in range(len(shape)) if shape[a] >= num_slabs]
+    if len(axes) > 0:
+        axis = axes[0]
+    else:
+        axis = int(_np.argmax(shape))
+    start = _np.array(extent.start, copy=True)
+    stop = _np.array(extent.stop, copy=True)
+    start[axis] = extent.start[axis] + (shape[axis] * slab_rank) // num_slabs
+    stop[axis] = extent.start[axis] + (shape[axis] * (slab_rank + 1)) // num_slabs
+
+    return _IndexingExtent(start=start, stop=stop)
+
+
+def pair_extent_update_copyto(peu, dst_array, src_array, casting, slab_rank=0, num_slabs=1):
     """
     Copies the :samp:`{peu}.src_update_extent` region from :samp:`{src_array}`
     to the :samp:`{peu}.dst_update_extent` region of :samp:`{dst_array}`
@@ -113,10 +168,19 @@ def pair_extent_update_copyto(peu, dst_array, src_array, casting):
     :param src_array: Source for copy.
     :type casting: :obj:`str`
     :param casting: Indicates casting regime, see :func:`numpy.casting`.
+    :type slab_rank: :obj:`int`
+    :param slab_rank: Only copy this slab of the regions (see :func:`calc_slab_extent`),
+       so that multiple processes (sharing the memory
+       of :samp:`{dst_array}` and :samp:`{src_array}`) can copy the regions in parallel.
+    :type num_slabs: :obj:`int`
+    :param num_slabs: Number of slabs.
     """
-    src_slice = peu.src_extent.globale_to_locale_extent_h(peu.src_update_extent).to_slice()
-    dst_slice = peu.dst_extent.globale_to_locale_extent_h(peu.dst_update_extent).to_slice()
-    _np.copyto(dst_array[dst_slice], src_array[src_slice], casting=casting)
+    src_update_extent = calc_slab_extent(peu.src_update_extent, slab_rank, num_slabs)
+    dst_update_extent = calc_slab_extent(peu.dst_update_extent, slab_rank, num_slabs)
+    if _np.product(src_update_extent.shape) > 0:
+        src_slice = peu.src_extent.globale_to_locale_extent_h(src_update_extent).to_slice()
+        dst_slice = peu.dst_extent.globale_to_locale_extent_h(dst_update_extent).to_slice()
+        _np.copyto(dst_array[dst_slice], src_array[src_slice], casting=casting)
 
 
 class PairExtentUpdate(ExtentUpdate):
@@ -132,12 +196,13 @@ class PairExtentUpdate(ExtentUpdate):
             ExtentAndRegion(src_extent, src_update_extent)
         )
 
-    def copyto(self, dst_array, src_array, casting):
+    def copyto(self, dst_array, src_array, casting, slab_rank=0, num_slabs=1):
         """
         Copies the :attr:`src_update_extent` region from :samp:`{src_array}`
-        to the :attr:`dst_update_extent` region of :samp:`{dst_array}`
+        to the :attr:`dst_update_extent` region of :samp:`{dst_array}`,
+        see :func:`pair_extent_update_copyto`.
         """
-        pair_extent_update_copyto(self, dst_array, src_array, casting)
+        pair_extent_update_copyto(self, dst_array, src_array, casting, slab_rank, num_slabs)
 
     @property
     def dst_update_extent(self):
@@ -206,8 +271,21 @@ class MpiExtentAndRegion(ExtentAndRegion):
 
     @property
     def mpi_data_type(self):
+        if (self._mpi_data_type is None) and (self._dtype is not None):
+            # Re-create a data type released by free_mpi_data_type.
+            self._mpi_data_type, self._mpi_order, self._parent_mpi_data_type = \
+                self.create_data_type(self._dtype, self._order)
         return self._mpi_data_type
 
+    def free_mpi_data_type(self):
+        """
+        Frees the :attr:`mpi_data_type`, the data type is re-created (for the same
+        :samp:`dtype` and :samp:`order`) on the next access of :attr:`mpi_data_type`.
+        """
+        if self._mpi_data_type is not None:
+            self._mpi_data_type.Free()
+        self._mpi_data_type = None
+
 
 class MpiPairExtentUpdate(ExtentUpdate):
 
@@ -274,12 +352,21 @@ class MpiPairExtentUpdate(ExtentUpdate):
         self._dst.initialise_mpi_data_type(dst_dtype, dst_order)
         self._src.initialise_mpi_data_type(src_dtype, src_order)
 
-    def copyto(self, dst_array, src_array, casting):
+    def free_data_types(self):
+        """
+        Frees the :attr:`dst_data_type` and :attr:`src_data_type` data types,
+        new instances are created on the next access of the attributes.
+        """
+        self._dst.free_mpi_data_type()
+        self._src.free_mpi_data_type()
+
+    def copyto(self, dst_array, src_array, casting, slab_rank=0, num_slabs=1):
         """
         Copies the :attr:`src_update_extent` region from :samp:`{src_array}`
-        to the :attr:`dst_update_extent` region of :samp:`{dst_array}`
+        to the :attr:`dst_update_extent` region of :samp:`{dst_array}`,
+        see :func:`pair_extent_update_copyto`.
         """
-        pair_extent_update_copyto(self, dst_array, src_array, casting)
+        pair_extent_update_copyto(self, dst_array, src_array, casting, slab_rank, num_slabs)
 
     @property
     def dst_update_extent(self):
@@ -424,14 +511,249 @@ class MpiPairExtentUpdate(ExtentUpdate):
             )
 
 
+class MpiPairExtentUpdateGroup(object):
+
+    """
+    Group of :obj:`MpiPairExtentUpdate` updates (same source and destination
+    locales and same :samp:`dtype`) which are transferred with a single :samp:`Get`
+    using struct (:meth:`mpi4py.MPI.Datatype.Create_struct`) data types
+    which combine the sub-array data types of the individual updates.
+    """
+
+    def __init__(self, updates):
+        """
+        Initialise.
+
+        :type updates: sequence of :obj:`MpiPairExtentUpdate`
+        :param updates: Updates with common :attr:`dst_extent` and :attr:`src_extent`.
+        """
+        object.__init__(self)
+        self._updates = tuple(updates)
+        self._dst_data_type = None
+        self._src_data_type = None
+        self._header_str = self._updates[0]._header_str
+
+    @property
+    def updates(self):
+        """
+        The :obj:`tuple` of :obj:`MpiPairExtentUpdate` updates in this group.
+        """
+        return self._updates
+
+    @property
+    def dst_extent(self):
+        """
+        The locale :obj:`LocaleExtent` which is to receive sub-array updates.
+        """
+        return self._updates[0].dst_extent
+
+    @property
+    def src_extent(self):
+        """
+        The locale :obj:`CartLocaleExtent` from which the sub-array updates are read.
+        """
+        return self._updates[0].src_extent
+
+    def create_struct_data_type(self, data_types):
+        """
+        Returns a committed struct :obj:`mpi4py.MPI.Datatype` which combines
+        the (buffer relative) :samp:`{data_types}`.
+        """
+        data_type = \
+            _mpi.Datatype.Create_struct(
+                [1, ] * len(data_types),
+                [0, ] * len(data_types),
+                list(data_types)
+            )
+        data_type.Commit()
+        return data_type
+
+    @property
+    def dst_data_type(self):
+        """
+        A struct :obj:`mpi4py.MPI.Datatype` for the destination regions of all updates.
+        """
+        if self._dst_data_type is None:
+            self._dst_data_type = \
+                self.create_struct_data_type([u.dst_data_type for u in self._updates])
+        return self._dst_data_type
+
+    @property
+    def src_data_type(self):
+        """
+        A struct :obj:`mpi4py.MPI.Datatype` for the source regions of all updates.
+        """
+        if self._src_data_type is None:
+            self._src_data_type = \
+                self.create_struct_data_type([u.src_data_type for u in self._updates])
+        return self._src_data_type
+
+    def copyto(self, dst_array, src_array, casting, slab_rank=0, num_slabs=1):
+        """
+        Copies the regions of all updates, see :meth:`MpiPairExtentUpdate.copyto`.
+        """
+        for update in self._updates:
+            update.copyto(dst_array, src_array, casting, slab_rank, num_slabs)
+
+    def do_get(self, mpi_win, target_src_rank, origin_dst_buffer):
+        """
+        Fetches all regions with a single :meth:`mpi4py.MPI.Win.Get`,
+        see :meth:`MpiPairExtentUpdate.do_get`.
+        """
+        mpi_win.Get(
+            [origin_dst_buffer, 1, self.dst_data_type],
+            target_src_rank,
+            [0, 1, self.src_data_type]
+        )
+
+    def do_rget(self, mpi_win, target_src_rank, origin_dst_buffer):
+        """
+        Fetches all regions with a single :meth:`mpi4py.MPI.Win.Rget`,
+        see :meth:`MpiPairExtentUpdate.do_rget`.
+        """
+        return \
+            mpi_win.Rget(
+                [origin_dst_buffer, 1, self.dst_data_type],
+                target_src_rank,
+                [0, 1, self.src_data_type]
+            )
+
+    def conclude(self):
+        """
+        """
+        for update in self._updates:
+            update.conclude()
+
+    def free(self):
+        """
+        Frees the struct data types and the data types of the :attr:`updates`, data
+        types are re-created on demand.
+        """
+        for data_type in (self._dst_data_type, self._src_data_type):
+            if data_type is not None:
+                data_type.Free()
+        self._dst_data_type = None
+        self._src_data_type = None
+        for update in self._updates:
+            update.free_data_types()
+
+    def __str__(self):
+        """
+        Stringify.
+        """
+        return "\n".join(str(update) for update in self._updates)
+
+
+def iter_pair_extent_updates(updates):
+    """
+    Generator which yields the individual pair extent updates of :samp:`{updates}`,
+    the elements of :obj:`MpiPairExtentUpdateGroup` groups are expanded.
+
+    :type updates: sequence
+    :param updates: Sequence of :obj:`PairExtentUpdate` and :obj:`MpiPairExtentUpdateGroup`.
+    """
+    for update in updates:
+        if isinstance(update, MpiPairExtentUpdateGroup):
+            for group_update in update.updates:
+                yield group_update
+        else:
+            yield update
+
+
+class ChunkBufferPool(object):
+
+    """
+    Pool of reusable (flat) buffers used to stream update regions
+    chunk-by-chunk (see :obj:`MpiPairExtentUpdateDifferentDtypes`).
+    """
+
+    def __init__(self, num_buffers=2):
+        """
+        Initialise.
+
+        :type num_buffers: :obj:`int`
+        :param num_buffers: Number of buffers per :obj:`numpy.dtype`, two buffers
+           allow the fetch of one chunk to overlap the cast of another.
+        """
+        object.__init__(self)
+        self._num_buffers = num_buffers
+        self._buffers = dict()
+
+    @property
+    def num_buffers(self):
+        """
+        An :obj:`int`, the number of buffers per :obj:`numpy.dtype`.
+        """
+        return self._num_buffers
+
+    def get_buffers(self, dtype, num_elements):
+        """
+        Returns a :obj:`list` of :attr:`num_buffers` 1D :obj:`numpy.ndarray` buffers,
+        each buffer has at least :samp:`{num_elements}` elements.
+        The same buffers are returned by subsequent calls (unless
+        larger buffers are required).
+
+        :type dtype: :obj:`numpy.dtype`
+        :param dtype: Element type of the buffers.
+        :type num_elements: :obj:`int`
+        :param num_elements: Minimum number of elements in each buffer.
+        :rtype: :obj:`list` of :obj:`numpy.ndarray`
+        :return: The buffers.
+        """
+        dtype = _np.dtype(dtype)
+        buffers = self._buffers.get(dtype, None)
+        if (buffers is None) or (buffers[0].size < num_elements):
+            buffers = \
+                [_np.empty((num_elements,), dtype=dtype) for b in range(self._num_buffers)]
+            self._buffers[dtype] = buffers
+        return buffers
+
+    def clear(self):
+        """
+        Releases all buffers.
+        """
+        self._buffers = dict()
+
+
+#: The :obj:`ChunkBufferPool` used by :obj:`MpiPairExtentUpdateDifferentDtypes`.
+_chunk_buffer_pool = ChunkBufferPool()
+
+
+def get_chunk_buffer_pool():
+    """
+    Returns the :obj:`ChunkBufferPool` used by :obj:`MpiPairExtentUpdateDifferentDtypes`
+    to stream update regions.
+
+    :rtype: :obj:`ChunkBufferPool`
+    :return: The buffer pool.
+    """
+    return _chunk_buffer_pool
+
+
 class MpiPairExtentUpdateDifferentDtypes(MpiPairExtentUpdate):
 
     """
     Over-rides :meth:`MpiPairExtentUpdate.do_get` to buffer-copy and
     subsequent casting when source and destination arrays have different :obj:`numpy.dtype`.
+    Regions with more than :attr:`max_chunk_elements` elements are streamed in
+    chunks through the (reusable) buffers of a :obj:`ChunkBufferPool`,
+    the fetch of chunk :samp:`k + 1` overlaps the cast of chunk :samp:`k`.
+    Streaming uses :meth:`mpi4py.MPI.Win.Rget` and so requires a passive target epoch.
+    The chunk data types are created once (see :meth:`get_chunk_data_types`) and
+    freed by :meth:`free_data_types`.
     """
 
-    def __init__(self, dst_extent, src_extent, dst_update_extent, src_update_extent):
+    #: Default value for :attr:`max_chunk_elements`.
+    default_max_chunk_elements = 2 ** 16
+
+    def __init__(
+        self,
+        dst_extent,
+        src_extent,
+        dst_update_extent,
+        src_update_extent,
+        max_chunk_elements=default_max_chunk_elements
+    ):
         """
         """
         MpiPairExtentUpdate.__init__(
@@ -443,13 +765,170 @@ class MpiPairExtentUpdateDifferentDtypes(MpiPairExtentUpdate):
         )
         self._buffer = None
         self._dst_buffer = None
+        self._chunk_data_types = None
+        self.max_chunk_elements = max_chunk_elements
+        self._buffer_pool = get_chunk_buffer_pool()
+        self._chunk = None
+
+    @property
+    def max_chunk_elements(self):
+        """
+        An :obj:`int`, regions with more elements than this are streamed
+        in chunks. If :samp:`None`, the whole region is fetched into a
+        single temporary buffer.
+        """
+        return self._max_chunk_elements
+
+    @max_chunk_elements.setter
+    def max_chunk_elements(self, max_chunk_elements):
+        if (max_chunk_elements is not None) and (max_chunk_elements < 1):
+            raise ValueError(
+                "Got max_chunk_elements=%s, require max_chunk_elements >= 1."
+                %
+                (max_chunk_elements,)
+            )
+        self._max_chunk_elements = max_chunk_elements
+        self.free_chunk_data_types()
+
+    def calc_chunk_extents(self):
+        """
+        Returns the :obj:`list` of (globale) :obj:`IndexingExtent` chunks
+        of the :attr:`src_update_extent`, see :meth:`IndexingExtent.split_for_max_elements`.
+
+        :rtype: :obj:`list` of :obj:`IndexingExtent`
+        :return: The chunks, in C order.
+        """
+        extent = \
+            _IndexingExtent(
+                start=self._src.region_extent.start,
+                stop=self._src.region_extent.stop
+            )
+        return extent.split_for_max_elements(self._max_chunk_elements)
+
+    def get_chunk_data_types(self):
+        """
+        Returns the source (sub-array) data types of the chunks, the data types
+        are created on the first call and re-used by subsequent streamed fetches.
+
+        :rtype: :obj:`list`
+        :return: The :samp:`(chunk_extent, data_type)` pair for each chunk
+           of :meth:`calc_chunk_extents`.
+        """
+        if self._chunk_data_types is None:
+            self._chunk_data_types = \
+                [
+                    (
+                        chunk_extent,
+                        MpiExtentAndRegion(self._src.locale_extent, chunk_extent).create_data_type(
+                            self._src._dtype,
+                            self._src._order
+                        )[0]
+                    )
+                    for chunk_extent in self.calc_chunk_extents()
+                ]
+        return self._chunk_data_types
+
+    def free_chunk_data_types(self):
+        """
+        Frees the data types of :meth:`get_chunk_data_types`.
+        """
+        if self._chunk_data_types is not None:
+            for chunk_extent, data_type in self._chunk_data_types:
+                data_type.Free()
+        self._chunk_data_types = None
+
+    def free_data_types(self):
+        """
+        Frees the :attr:`dst_data_type`, :attr:`src_data_type` and the chunk
+        data types (see :meth:`get_chunk_data_types`).
+        """
+        MpiPairExtentUpdate.free_data_types(self)
+        self.free_chunk_data_types()
+
+    def do_chunk_rget(self, mpi_win, target_src_rank, chunk_extent, data_type, buffer):
+        """
+        Starts the :meth:`mpi4py.MPI.Win.Rget` of the :samp:`{chunk_extent}` sub-region
+        (with source sub-array :samp:`{data_type}`) of the :attr:`src_update_extent`
+        into :samp:`{buffer}`.
+
+        :rtype: :obj:`tuple`
+        :return: The :samp:`(request, buffer, chunk_extent)` chunk state.
+        """
+        num_elements = int(_np.product(chunk_extent.shape))
+        buffer = buffer[0:num_elements]
+        request = \
+            mpi_win.Rget(
+                [buffer, num_elements, self._src._parent_mpi_data_type],
+                target_src_rank,
+                [0, 1, data_type]
+            )
+        return (request, buffer, chunk_extent)
+
+    def conclude_chunk(self, chunk):
+        """
+        Waits for the chunk request (started by :meth:`do_chunk_rget`) and casts
+        the chunk elements into the destination buffer.
+        """
+        request, buffer, chunk_extent = chunk
+        request.Wait()
+        shift = self._dst.region_extent.start - self._src.region_extent.start
+        dst_chunk_extent = \
+            _IndexingExtent(start=chunk_extent.start + shift, stop=chunk_extent.stop + shift)
+        dst_slice = self._dst.locale_extent.globale_to_locale_extent_h(dst_chunk_extent).to_slice()
+        _np.copyto(
+            self._dst_buffer[dst_slice],
+            buffer.reshape(chunk_extent.shape),
+            casting=self.casting
+        )
+
+    def do_streamed_rget(self, mpi_win, target_src_rank, origin_dst_buffer):
+        """
+        Streams the update region in chunks (see :meth:`calc_chunk_extents`), all but
+        the last chunk are fetched (using the buffers of the :obj:`ChunkBufferPool`) and
+        cast before returning. The last chunk is fetched into a chunk sized
+        buffer owned by this update and is cast by :meth:`conclude`.
+
+        :rtype: :obj:`mpi4py.MPI.Request`
+        :return: The request for the last chunk.
+        """
+        self._dst_buffer = origin_dst_buffer
+        chunk_data_types = self.get_chunk_data_types()
+        buffers = self._buffer_pool.get_buffers(self._src._dtype, self._max_chunk_elements)
+        chunk = None
+        for k in range(len(chunk_data_types)):
+            chunk_extent, data_type = chunk_data_types[k]
+            if k < (len(chunk_data_types) - 1):
+                buffer = buffers[k % len(buffers)]
+            else:
+                buffer = _np.empty((_np.product(chunk_extent.shape),), dtype=self._src._dtype)
+            next_chunk = \
+                self.do_chunk_rget(mpi_win, target_src_rank, chunk_extent, data_type, buffer)
+            if chunk is not None:
+                self.conclude_chunk(chunk)
+            chunk = next_chunk
+        self._chunk = chunk
+
+        return chunk[0]
+
+    def calc_is_streamed(self):
+        """
+        Returns :samp:`True` when the update region has more
+        than :attr:`max_chunk_elements` elements.
+        """
+        return \
+            (
+                (self._max_chunk_elements is not None)
+                and
+                (_np.product(self._src.region_extent.shape) > self._max_chunk_elements)
+            )
 
     def do_get(self, mpi_win, target_src_rank, origin_dst_buffer):
         """
         Performs calls :meth:`mpi4py.MPI.Win.Get` method of :samp:`mpi_win`
         to perform the RMA data-transfer. Uses a locally allocated buffer
         to receive the data and then uses :func:`numpy.copyto` to convert
-        the :attr:`src_dtype` to the :attr:`dst_dtype`.
+        the :attr:`src_dtype` to the :attr:`dst_dtype`. Large regions
+        are streamed (see :meth:`do_streamed_rget`).
 
         :type mpi_win: :obj:`mpi4py.MPI.Win.Get`
         :param mpi_win: Window used to retrieve update region for array.
@@ -459,19 +938,25 @@ class MpiPairExtentUpdateDifferentDtypes(MpiPairExtentUpdate):
         :param origin_dst_buffer: The destination memory for the update, size of buffer
            should correspond to the size of the :attr:`dst_extent`.
         """
-        self._buffer = _np.empty(shape=self._src.region_extent.shape, dtype=self._src._dtype)
-        self._dst_buffer = origin_dst_buffer
+        if self.calc_is_streamed():
+            self.do_streamed_rget(mpi_win, target_src_rank, origin_dst_buffer)
+        else:
+            self._buffer = _np.empty(shape=self._src.region_extent.shape, dtype=self._src._dtype)
+            self._dst_buffer = origin_dst_buffer
 
-        mpi_win.Get(
-            [self._buffer, _np.product(self._buffer.shape),
-             self._src._parent_mpi_data_type],
-            target_src_rank,
-            [0, 1, self.src_data_type]
-        )
+            mpi_win.Get(
+                [self._buffer, _np.product(self._buffer.shape),
+                 self._src._parent_mpi_data_type],
+                target_src_rank,
+                [0, 1, self.src_data_type]
+            )
 
     def do_rget(self, mpi_win, target_src_rank, origin_dst_buffer):
         """
         """
+        if self.calc_is_streamed():
+            return self.do_streamed_rget(mpi_win, target_src_rank, origin_dst_buffer)
+
         self._buffer = _np.empty(shape=self._src.region_extent.shape, dtype=self._src._dtype)
         self._dst_buffer = origin_dst_buffer
 
@@ -487,28 +972,103 @@ class MpiPairExtentUpdateDifferentDtypes(MpiPairExtentUpdate):
     def conclude(self):
         """
         """
-        origin_dst_buffer_slice = \
-            self._dst.locale_extent.globale_to_locale_extent_h(self._dst.region_extent).to_slice()
-        _np.copyto(
-            self._dst_buffer[origin_dst_buffer_slice],
-            self._buffer,
-            casting=self.casting
-        )
+        if self._chunk is not None:
+            self.conclude_chunk(self._chunk)
+            self._chunk = None
+        else:
+            origin_dst_buffer_slice = \
+                self._dst.locale_extent.globale_to_locale_extent_h(
+                    self._dst.region_extent
+                ).to_slice()
+            _np.copyto(
+                self._dst_buffer[origin_dst_buffer_slice],
+                self._buffer,
+                casting=self.casting
+            )
         self._buffer = None
         self._dst_buffer = None
 
 
+def _shift_extent(extent, shift):
+    """
+    Returns :samp:`{extent}` offset by :samp:`{shift}`, returns :samp:`{extent}`
+    when :samp:`{shift}` is :samp:`None` or all zero.
+    """
+    if (shift is None) or _np.all(_np.asarray(shift) == 0):
+        return extent
+    return _IndexingExtent(start=extent.start + shift, stop=extent.stop + shift)
+
+
+def calc_globale_shape(locale_extents):
+    """
+    Returns the shape of the (no halo) globale extent which is
+    partitioned by :samp:`{locale_extents}`.
+
+    :type locale_extents: sequence of :obj:`mpi_array.distribution.LocaleExtent`
+    :param locale_extents: Extents of a partition.
+    :rtype: :obj:`numpy.ndarray`
+    :return: The per-axis globale shape.
+    """
+    return \
+        (
+            _np.max([e.stop_n for e in locale_extents], axis=0)
+            -
+            _np.min([e.start_n for e in locale_extents], axis=0)
+        )
+
+
+def calc_periodic_shifts(periods, globale_shape):
+    """
+    Returns the per-axis offsets of the periodic images (of a locale extent)
+    which are adjacent to the globale extent, including the zero offset.
+
+    :type periods: sequence of :obj:`bool`
+    :param periods: Per-axis periodicity, if :samp:`None` no axes are periodic.
+    :type globale_shape: sequence of :obj:`int`
+    :param globale_shape: Shape of the globale extent.
+    :rtype: :obj:`list` of :obj:`numpy.ndarray`
+    :return: List of shift vectors, the zero shift is first.
+    """
+    globale_shape = _np.asarray(globale_shape)
+    ndim = len(globale_shape)
+    if periods is None:
+        periods = _np.zeros((ndim,), dtype="bool")
+    axis_multiples = [(0, -1, 1) if periods[a] else (0,) for a in range(ndim)]
+    return \
+        [
+            _np.array(m, dtype="int64") * globale_shape
+            for m in _itertools.product(*axis_multiples)
+        ]
+
+
 class HaloSingleExtentUpdate(ExtentUpdate):
 
     """
     Source and destination indexing info for updating a halo portion.
     """
 
-    def __init__(self, dst_extent, src_extent, update_extent):
+    def __init__(self, dst_extent, src_extent, update_extent, src_update_extent=None):
+        """
+        Initialise.
+
+        :type dst_extent: :obj:`mpi_array.distribution.LocaleExtent`
+        :param dst_extent: Locale extent which receives the halo update.
+        :type src_extent: :obj:`mpi_array.distribution.LocaleExtent`
+        :param src_extent: Locale extent from which the halo update is read.
+        :type update_extent: :obj:`IndexingExtent`
+        :param update_extent: The halo region (globale indices) of :samp:`{dst_extent}`.
+        :type src_update_extent: :obj:`IndexingExtent`
+        :param src_update_extent: The region (globale indices) of :samp:`{src_extent}`
+           which is copied to :samp:`{update_extent}`. Differs from :samp:`{update_extent}`
+           for halo regions which wrap around a periodic boundary. If :samp:`None`,
+           same as :samp:`{update_extent}`.
+        """
+        if src_update_extent is None:
+            src_update_extent = update_extent
         ExtentUpdate.__init__(
             self,
             ExtentAndRegion(dst_extent, update_extent),
-            ExtentAndRegion(src_extent, update_extent)
+            ExtentAndRegion(src_extent, src_update_extent)
         )
 
     @property
@@ -516,6 +1076,13 @@ class HaloSingleExtentUpdate(ExtentUpdate):
         """
         The :obj:`IndexingExtent` indicating the halo sub-array which is to be updated.
         """
+        return self._dst.region_extent
+
+    @property
+    def src_update_extent(self):
+        """
+        The :obj:`IndexingExtent` indicating the source sub-array of the update.
+        """
         return self._src.region_extent
 
 
@@ -528,11 +1095,16 @@ class MpiHaloSingleExtentUpdate(ExtentUpdate):
     transfer of sub-array data.
     """
 
-    def __init__(self, dst_extent, src_extent, update_extent):
+    def __init__(self, dst_extent, src_extent, update_extent, src_update_extent=None):
+        """
+        Initialise, see :meth:`HaloSingleExtentUpdate.__init__`.
+        """
+        if src_update_extent is None:
+            src_update_extent = update_extent
         ExtentUpdate.__init__(
             self,
             MpiExtentAndRegion(dst_extent, update_extent),
-            MpiExtentAndRegion(src_extent, update_extent)
+            MpiExtentAndRegion(src_extent, src_update_extent)
         )
         self._str_format = \
             "%8s, %20s, %20s, %20s, %20s, %8s, %20s, %20s, %20s, %20s, %20s, %20s, %16s"
@@ -574,6 +1146,14 @@ class MpiHaloSingleExtentUpdate(ExtentUpdate):
         self._dst.initialise_mpi_data_type(dtype=dtype, order=order)
         self._src.initialise_mpi_data_type(dtype=dtype, order=order)
 
+    def free_data_types(self):
+        """
+        Frees the :attr:`dst_data_type` and :attr:`src_data_type` data types,
+        new instances are created on the next access of the attributes.
+        """
+        self._dst.free_mpi_data_type()
+        self._src.free_mpi_data_type()
+
     @property
     def dst_data_type(self):
         """
@@ -599,6 +1179,13 @@ class MpiHaloSingleExtentUpdate(ExtentUpdate):
         """
         The :obj:`IndexingExtent` indicating the halo sub-array which is to be updated.
         """
+        return self._dst.region_extent
+
+    @property
+    def src_update_extent(self):
+        """
+        The :obj:`IndexingExtent` indicating the source sub-array of the update.
+        """
         return self._src.region_extent
 
     def __str__(self):
@@ -621,8 +1208,8 @@ class MpiHaloSingleExtentUpdate(ExtentUpdate):
                     self.src_extent.cart_rank,
                     self.src_extent.start_h,
                     self.src_extent.stop_h,
-                    self.src_extent.globale_to_locale_h(self.update_extent.start),
-                    self.src_extent.globale_to_locale_h(self.update_extent.stop),
+                    self.src_extent.globale_to_locale_h(self.src_update_extent.start),
+                    self.src_extent.globale_to_locale_h(self.src_update_extent.stop),
                     self.update_extent.start,
                     self.update_extent.stop,
                     mpi_dtype
@@ -630,6 +1217,27 @@ class MpiHaloSingleExtentUpdate(ExtentUpdate):
             )
 
 
+def calc_halo_depth_extent(extent, depth):
+    """
+    Returns the extent of the non-halo elements of :samp:`{extent}` plus
+    the halo elements which lie within :samp:`{depth}` of the non-halo elements.
+
+    :type extent: :obj:`mpi_array.indexing.HaloIndexingExtent`
+    :param extent: Extent (with halo).
+    :type depth: :obj:`numpy.ndarray`
+    :param depth: A :samp:`(ndim, 2)` shaped array of per-axis :samp:`(lo, hi)` depths,
+       depths larger than the :samp:`{extent}` halo are clipped to the halo.
+    :rtype: :obj:`mpi_array.indexing.IndexingExtent`
+    :return: The reduced depth extent.
+    """
+    depth = _np.asarray(depth)
+    return \
+        _IndexingExtent(
+            start=_np.maximum(extent.start_h, extent.start_n - depth[:, HaloIndexingExtent.LO]),
+            stop=_np.minimum(extent.stop_h, extent.stop_n + depth[:, HaloIndexingExtent.HI])
+        )
+
+
 class HalosUpdate(object):
 
     """
@@ -643,7 +1251,14 @@ class HalosUpdate(object):
     #: The "high index" indices.
     HI = HaloIndexingExtent.HI
 
-    def __init__(self, dst_rank, rank_to_extents_map):
+    def __init__(
+        self,
+        dst_rank,
+        rank_to_extents_map,
+        max_elements=None,
+        periods=None,
+        depth=None
+    ):
         """
         Construct.
 
@@ -655,10 +1270,30 @@ class HalosUpdate(object):
            pairs for all ranks :samp:`r` (of :samp:`cart_comm`), where :samp:`extent`
            is a :obj:`CartLocaleExtent` object indicating the indexing extent
            (tile) on MPI rank :samp:`r.`
-        """
+        :type max_elements: :obj:`int`
+        :param max_elements: Halo regions with more than this many elements are split
+           into multiple updates (messages), :samp:`None` for no splitting.
+        :type periods: sequence of :obj:`bool`
+        :param periods: Per-axis periodicity, halo regions on periodic axes wrap
+           around the globale boundary. If :samp:`None`, no axes are periodic.
+        :type depth: :obj:`numpy.ndarray`
+        :param depth: A :samp:`(ndim, 2)` shaped array, only halo elements within
+           :samp:`depth[a, LO]` (and :samp:`depth[a, HI]`) elements of the non-halo
+           elements are updated on axis :samp:`a`. If :samp:`None`, all halo elements
+           are updated.
+        """
+        self._max_elements = max_elements
+        self._periods = periods
+        self._depth = depth
         self.initialise(dst_rank, rank_to_extents_map)
 
-    def create_single_extent_update(self, dst_extent, src_extent, halo_extent):
+    def create_single_extent_update(
+        self,
+        dst_extent,
+        src_extent,
+        halo_extent,
+        src_halo_extent=None
+    ):
         """
         Factory method for creating instances of type :obj:`HaloSingleExtentUpdate`.
 
@@ -668,56 +1303,265 @@ class HalosUpdate(object):
         :param src_extent: The source locale extent for obtaining halo element update.
         :type halo_extent: :obj:`IndexingExtent`
         :param halo_extent: The extent indicating the sub-array of halo elements.
+        :type src_halo_extent: :obj:`IndexingExtent`
+        :param src_halo_extent: The extent indicating the source sub-array,
+           if :samp:`None` same as :samp:`{halo_extent}`.
 
         :rtype: :obj:`HaloSingleExtentUpdate`
         :return: Returns new instance of :obj:`HaloSingleExtentUpdate`.
         """
-        return HaloSingleExtentUpdate(dst_extent, src_extent, halo_extent)
+        return HaloSingleExtentUpdate(dst_extent, src_extent, halo_extent, src_halo_extent)
 
-    def calc_halo_intersection(self, dst_extent, src_extent, axis, dir):
+    def calc_halo_intersection(self, dst_extent, src_extent, axis, dir, shift=None):
         """
         Calculates the intersection of :samp:`{dst_extent}` halo slab with
         the update region of :samp:`{src_extent}`.
 
         :type dst_extent: :obj:`CartLocaleExtent`
-        :param dst_extent: Halo slab indicated by :samp:`{axis}` and :samp:`{dir}`
-           taken from this extent.
+        :param dst_extent: Halo slab indicated by :samp:`{axis}` and :samp:`{dir}`
+           taken from this extent.
+        :type src_extent: :obj:`CartLocaleExtent`
+        :param src_extent: This extent, minus the halo in the :samp:`{axis}` dimension,
+           is intersected with the halo slab.
+        :type axis: :obj:`int`
+        :param axis: Axis dimension indicating slab.
+        :type dir: :attr:`LO` or :attr:`HI`
+        :param dir: :attr:`LO` for low-index slab or :attr:`HI` for high-index slab.
+        :type shift: sequence of :obj:`int`
+        :param shift: Per-axis offset added to the :samp:`{src_extent}` update region
+           (the periodic image of :samp:`{src_extent}`), :samp:`None` for no offset.
+        :rtype: :obj:`IndexingExtent`
+        :return: Overlap extent of :samp:{dst_extent} halo-slab and
+           the :samp:`{src_extent}` update region, restricted to :attr:`depth`.
+        """
+        intersection = \
+            dst_extent.halo_slab_extent(axis, dir).calc_intersection(
+                _shift_extent(src_extent.no_halo_extent(axis), shift)
+            )
+        if (intersection is not None) and (self.depth is not None):
+            intersection = \
+                intersection.calc_intersection(calc_halo_depth_extent(dst_extent, self.depth))
+        return intersection
+
+    @property
+    def max_elements(self):
+        """
+        An :obj:`int` (or :samp:`None`), the maximum number of elements
+        in a single halo update.
+        """
+        return self._max_elements
+
+    @property
+    def periods(self):
+        """
+        A :samp:`(ndim,)` shaped array of :obj:`bool` indicating the periodic axes.
+        """
+        return self._periods
+
+    @property
+    def depth(self):
+        """
+        A :samp:`(ndim, 2)` shaped array (or :samp:`None`) indicating the
+        per-axis :samp:`(lo, hi)` depth of the updated halo elements.
+        """
+        return self._depth
+
+    def split_extent_for_max_elements(self, update, max_elements=None):
+        """
+        Partitions the :attr:`HaloSingleExtentUpdate.update_extent` of the specified
+        update into smaller extents with number of elements no more
+        than :samp:`{max_elements}`, returns an update for each partition.
+
+        :type update: :obj:`HaloSingleExtentUpdate`
+        :param update: The update to be split.
+        :type max_elements: :obj:`int`
+        :param max_elements: Each partition of the returned split has no more
+           than this many elements. If :samp:`None`, uses :attr:`max_elements`.
+        :rtype: :obj:`list` of :obj:`HaloSingleExtentUpdate`
+        :return: List of updates whose update extents form a partition
+           of :samp:`{update}.update_extent` with each extent having no
+           more than :samp:`{max_elements}` elements.
+        """
+        if max_elements is None:
+            max_elements = self.max_elements
+        split_extents = update.update_extent.split_for_max_elements(max_elements)
+        if len(split_extents) > 1:
+            src_offset = update.src_update_extent.start - update.update_extent.start
+            updates = \
+                [
+                    self.create_single_extent_update(
+                        update.dst_extent,
+                        update.src_extent,
+                        e,
+                        _shift_extent(e, src_offset)
+                    )
+                    for e in split_extents
+                ]
+        else:
+            updates = [update, ]
+        return updates
+
+    def initialise(self, dst_rank, rank_to_extents_map):
+        """
+        Calculates the ranks and regions required to update the
+        halo regions of the :samp:`dst_rank` MPI rank.
+
+        :type dst_rank: :obj:`int`
+        :param dst_rank: The MPI rank (:samp:`cart_comm`) of the MPI
+           process which is to receive the halo updates.
+        :type rank_to_extents_map: :obj:`dict`
+        :param rank_to_extents_map: Dictionary of :samp:`(r, extent)`
+           pairs for all ranks :samp:`r` (of :samp:`cart_comm`), where :samp:`extent`
+           is a :obj:`CartLocaleExtent` object indicating the indexing extent
+           (tile) on MPI rank :samp:`r.`
+        """
+        self._dst_rank = dst_rank
+        self._dst_extent = rank_to_extents_map[dst_rank]
+        ndim = self._dst_extent.ndim
+        self._updates = [[[], []] for a in range(ndim)]
+        if hasattr(rank_to_extents_map, "keys"):
+            ranks = rank_to_extents_map.keys()
+        else:
+            ranks = range(0, len(rank_to_extents_map))
+        cart_coord_to_extents_dict = \
+            {
+                tuple(rank_to_extents_map[r].cart_coord): rank_to_extents_map[r]
+                for r in ranks
+            }
+        periods = self.periods
+        if periods is None:
+            periods = _np.zeros((ndim,), dtype="bool")
+        globale_shape = calc_globale_shape([rank_to_extents_map[r] for r in ranks])
+        cart_coord = self._dst_extent.cart_coord
+        cart_shape = self._dst_extent.cart_shape
+        for dir in [self.LO, self.HI]:
+            step = -1 if dir == self.LO else 1
+            for a in range(ndim):
+                if periods[a]:
+                    # Neighbours wrap around, up to (and including) the periodic image
+                    # of the dst locale itself.
+                    i_range = range(step, step * (cart_shape[a] + 1), step)
+                elif dir == self.LO:
+                    i_range = range(-1, -cart_coord[a] - 1, -1)
+                else:
+                    i_range = range(1, cart_shape[a] - cart_coord[a], 1)
+                for i in i_range:
+                    src_cart_coord = _np.array(cart_coord, copy=True)
+                    src_cart_coord[a] += i
+                    shift = _np.zeros((ndim,), dtype="int64")
+                    shift[a] = (src_cart_coord[a] // cart_shape[a]) * globale_shape[a]
+                    src_cart_coord[a] %= cart_shape[a]
+                    src_extent = cart_coord_to_extents_dict[tuple(src_cart_coord)]
+                    halo_extent = \
+                        self.calc_halo_intersection(self._dst_extent, src_extent, a, dir, shift)
+                    if halo_extent is not None:
+                        self._updates[a][dir] += \
+                            self.split_extent_for_max_elements(
+                                self.create_single_extent_update(
+                                    self._dst_extent,
+                                    src_extent,
+                                    halo_extent,
+                                    _shift_extent(halo_extent, -shift)
+                                )
+                        )
+                    else:
+                        break
+
+    @property
+    def updates_per_axis(self):
+        """
+        A :attr:`ndim` length list of pair elements, each element of the pair
+        is a list of :obj:`HaloSingleExtentUpdate` objects.
+        """
+        return self._updates
+
+
+class MpiHalosUpdate(HalosUpdate):
+
+    """
+    Indexing info for updating the halo regions of a single tile
+    on MPI rank :samp:`self.dst_rank`.
+    Over-rides the :meth:`create_single_extent_update` to
+    return :obj:`MpiHaloSingleExtentUpdate` instances.
+    """
+
+    def create_single_extent_update(
+        self,
+        dst_extent,
+        src_extent,
+        halo_extent,
+        src_halo_extent=None
+    ):
+        """
+        Factory method for creating instances of type :obj:`MpiHaloSingleExtentUpdate`.
+
+        :type dst_extent: :obj:`IndexingExtent`
+        :param dst_extent: The destination locale extent for halo element update.
+        :type src_extent: :obj:`IndexingExtent`
+        :param src_extent: The source locale extent for obtaining halo element update.
+        :type halo_extent: :obj:`IndexingExtent`
+        :param halo_extent: The extent indicating the sub-array of halo elements.
+        :type src_halo_extent: :obj:`IndexingExtent`
+        :param src_halo_extent: The extent indicating the source sub-array,
+           if :samp:`None` same as :samp:`{halo_extent}`.
+
+        :rtype: :obj:`MpiHaloSingleExtentUpdate`
+        :return: Returns new instance of :obj:`MpiHaloSingleExtentUpdate`.
+        """
+        return MpiHaloSingleExtentUpdate(dst_extent, src_extent, halo_extent, src_halo_extent)
+
+    def free_data_types(self):
+        """
+        Frees the MPI data types of all the (per-axis) updates.
+        """
+        for lo_hi_updates_pair in self.updates_per_axis:
+            for update in lo_hi_updates_pair[self.LO] + lo_hi_updates_pair[self.HI]:
+                update.free_data_types()
+
+
+class SingleEpochHalosUpdate(HalosUpdate):
+
+    """
+    Indexing info for updating the halo regions of a single locale
+    on MPI rank :samp:`self.dst_rank`, where all halo regions (including edge and corner
+    regions) are fetched directly from the non-halo region of the owning locale. Unlike
+    the per-axis :obj:`HalosUpdate`, the updates do not depend on one another and
+    can be performed in a single access epoch. Over-rides :meth:`HalosUpdate.initialise`,
+    the updates are the :attr:`updates` and :attr:`remote_updates` lists.
+    """
+
+    def calc_region_intersection(self, dst_extent, src_extent, shift=None):
+        """
+        Calculates the intersection of the :samp:`{dst_extent}` halo extent with
+        the non-halo extent of :samp:`{src_extent}`.
+
+        :type dst_extent: :obj:`CartLocaleExtent`
+        :param dst_extent: The extent (including halo) which receives the update.
         :type src_extent: :obj:`CartLocaleExtent`
-        :param src_extent: This extent, minus the halo in the :samp:`{axis}` dimension,
-           is intersected with the halo slab.
-        :type axis: :obj:`int`
-        :param axis: Axis dimension indicating slab.
-        :type dir: :attr:`LO` or :attr:`HI`
-        :param dir: :attr:`LO` for low-index slab or :attr:`HI` for high-index slab.
+        :param src_extent: The non-halo part of this extent is intersected.
+        :type shift: sequence of :obj:`int`
+        :param shift: Per-axis offset added to the :samp:`{src_extent}` non-halo
+           extent (the periodic image of :samp:`{src_extent}`), :samp:`None` for no offset.
         :rtype: :obj:`IndexingExtent`
-        :return: Overlap extent of :samp:{dst_extent} halo-slab and
-           the :samp:`{src_extent}` update region.
+        :return: Overlap extent, :samp:`None` if there is no overlap.
         """
+        if self.depth is not None:
+            dst_update_extent = calc_halo_depth_extent(dst_extent, self.depth)
+        else:
+            dst_update_extent = _IndexingExtent(start=dst_extent.start_h, stop=dst_extent.stop_h)
         return \
-            dst_extent.halo_slab_extent(axis, dir).calc_intersection(
-                src_extent.no_halo_extent(axis)
+            dst_update_extent.calc_intersection(
+                _shift_extent(
+                    _IndexingExtent(start=src_extent.start_n, stop=src_extent.stop_n),
+                    shift
+                )
             )
 
-    def split_extent_for_max_elements(self, extent, max_elements=None):
-        """
-        Partitions the specified extent into smaller extents with number
-        of elements no more than :samp:`{max_elements}`.
-
-        :type extent: :obj:`CartLocaleExtent`
-        :param extent: The extent to be split.
-        :type max_elements: :obj:`int`
-        :param max_elements: Each partition of the returned split has no more
-           than this many elements.
-        :rtype: :obj:`list` of :obj:`CartLocaleExtent`
-        :return: List of extents forming a partition of :samp:`{extent}`
-           with each extent having no more than :samp:`{max_element}` elements.
-        """
-        return [extent, ]
-
     def initialise(self, dst_rank, rank_to_extents_map):
         """
         Calculates the ranks and regions required to update the
-        halo regions of the :samp:`dst_rank` MPI rank.
+        halo regions of the :samp:`dst_rank` MPI rank, and the
+        halo regions of other ranks which are sourced from :samp:`dst_rank`.
 
         :type dst_rank: :obj:`int`
         :param dst_rank: The MPI rank (:samp:`cart_comm`) of the MPI
@@ -730,73 +1574,181 @@ class HalosUpdate(object):
         """
         self._dst_rank = dst_rank
         self._dst_extent = rank_to_extents_map[dst_rank]
-        self._updates = [[[], []]] * self._dst_extent.ndim
+        self._updates = []
+        self._remote_updates = []
         if hasattr(rank_to_extents_map, "keys"):
-            ranks = rank_to_extents_map.keys()
+            ranks = sorted(rank_to_extents_map.keys())
         else:
             ranks = range(0, len(rank_to_extents_map))
-        cart_coord_to_extents_dict = \
-            {
-                tuple(rank_to_extents_map[r].cart_coord): rank_to_extents_map[r]
-                for r in ranks
-            }
-        for dir in [self.LO, self.HI]:
-            for a in range(self._dst_extent.ndim):
-                if dir == self.LO:
-                    i_range = range(-1, -self._dst_extent.cart_coord[a] - 1, -1)
-                else:
-                    i_range = \
-                        range(1, self._dst_extent.cart_shape[a] - self._dst_extent.cart_coord[a], 1)
-                for i in i_range:
-                    src_cart_coord = _np.array(self._dst_extent.cart_coord, copy=True)
-                    src_cart_coord[a] += i
-                    src_extent = cart_coord_to_extents_dict[tuple(src_cart_coord)]
-                    halo_extent = self.calc_halo_intersection(self._dst_extent, src_extent, a, dir)
-                    if halo_extent is not None:
-                        self._updates[a][dir] += \
-                            self.split_extent_for_max_elements(
-                                self.create_single_extent_update(
-                                    self._dst_extent,
-                                    src_extent,
-                                    halo_extent
-                                )
+        shifts = \
+            calc_periodic_shifts(
+                self.periods,
+                calc_globale_shape([rank_to_extents_map[r] for r in ranks])
+            )
+        for r in ranks:
+            other_extent = rank_to_extents_map[r]
+            for shift in shifts:
+                if (r == dst_rank) and _np.all(shift == 0):
+                    continue
+                halo_extent = self.calc_region_intersection(self._dst_extent, other_extent, shift)
+                if halo_extent is not None:
+                    self._updates += \
+                        self.split_extent_for_max_elements(
+                            self.create_single_extent_update(
+                                self._dst_extent,
+                                other_extent,
+                                halo_extent,
+                                _shift_extent(halo_extent, -shift)
+                            )
+                        )
+                halo_extent = self.calc_region_intersection(other_extent, self._dst_extent, shift)
+                if halo_extent is not None:
+                    self._remote_updates += \
+                        self.split_extent_for_max_elements(
+                            self.create_single_extent_update(
+                                other_extent,
+                                self._dst_extent,
+                                halo_extent,
+                                _shift_extent(halo_extent, -shift)
+                            )
                         )
-                    else:
-                        break
 
     @property
     def updates_per_axis(self):
         """
-        A :attr:`ndim` length list of pair elements, each element of the pair
-        is a list of :obj:`HaloSingleExtentUpdate` objects.
+        Always :samp:`None`, the updates are not partitioned per axis (see :attr:`updates`).
+        """
+        return None
+
+    @property
+    def updates(self):
+        """
+        A :obj:`list` of :obj:`HaloSingleExtentUpdate` objects, the updates
+        of the :samp:`dst_rank` halo regions.
         """
         return self._updates
 
+    @property
+    def remote_updates(self):
+        """
+        A :obj:`list` of :obj:`HaloSingleExtentUpdate` objects, the updates
+        of the halo regions of other ranks which are sourced from
+        the :samp:`dst_rank` non-halo region (ordered by destination rank).
+        """
+        return self._remote_updates
 
-class MpiHalosUpdate(HalosUpdate):
+
+class MpiSingleEpochHalosUpdate(SingleEpochHalosUpdate, MpiHalosUpdate):
 
     """
-    Indexing info for updating the halo regions of a single tile
-    on MPI rank :samp:`self.dst_rank`.
-    Over-rides the :meth:`create_single_extent_update` to
-    return :obj:`MpiHaloSingleExtentUpdate` instances.
+    A :obj:`SingleEpochHalosUpdate` which creates :obj:`MpiHaloSingleExtentUpdate`
+    instances (see :meth:`MpiHalosUpdate.create_single_extent_update`).
     """
 
-    def create_single_extent_update(self, dst_extent, src_extent, halo_extent):
+    def free_data_types(self):
         """
-        Factory method for creating instances of type :obj:`MpiHaloSingleExtentUpdate`.
+        Frees the MPI data types of the :attr:`updates` and :attr:`remote_updates`.
+        """
+        for update in self.updates + self.remote_updates:
+            update.free_data_types()
 
-        :type dst_extent: :obj:`IndexingExtent`
-        :param dst_extent: The destination locale extent for halo element update.
-        :type src_extent: :obj:`IndexingExtent`
-        :param src_extent: The source locale extent for obtaining halo element update.
-        :type halo_extent: :obj:`IndexingExtent`
-        :param halo_extent: The extent indicating the sub-array of halo elements.
 
-        :rtype: :obj:`MpiHaloSingleExtentUpdate`
-        :return: Returns new instance of :obj:`MpiHaloSingleExtentUpdate`.
-        """
-        return MpiHaloSingleExtentUpdate(dst_extent, src_extent, halo_extent)
+def _calc_extent_bounds(extents, update_halo=False):
+    """
+    Returns :samp:`(starts, stops)` pair of :samp:`(len(extents), ndim)` shaped arrays.
+    """
+    if update_halo:
+        starts = _np.array([e.start_h for e in extents])
+        stops = _np.array([e.stop_h for e in extents])
+    else:
+        starts = _np.array([e.start_n for e in extents])
+        stops = _np.array([e.stop_n for e in extents])
+    return starts, stops
+
+
+def calc_extents_are_disjoint(extents):
+    """
+    Returns :samp:`True` if the (non-halo) regions of the :samp:`{extents}`
+    have no elements in common.
+
+    :type extents: sequence of :obj:`mpi_array.indexing.HaloIndexingExtent`
+    :param extents: Extents to check.
+    :rtype: :obj:`bool`
+    :return: :samp:`True` if no pair of extents intersect.
+    """
+    if len(extents) <= 1:
+        return True
+    starts, stops = _calc_extent_bounds(extents)
+    indices0, indices1, isect_starts, isect_stops = \
+        _calc_box_intersections(starts, stops, starts, stops)
+
+    return bool(_np.all(indices0 == indices1))
+
+
+def calc_intersection_updates(dst_extents, src_extents, update_factory, update_dst_halo):
+    """
+    Vectorised equivalent of repeatedly splitting each of the :samp:`{dst_extents}` by
+    each of the :samp:`{src_extents}` using
+    :func:`mpi_array.indexing.calc_intersection_split`. The intersections of all
+    the destination-source pairs are calculated in bulk
+    using :func:`mpi_array.indexing.calc_box_intersections` and
+    the :samp:`{update_factory}` is only called for the non-empty intersections.
+    The :samp:`{src_extents}` should be disjoint (see :func:`calc_extents_are_disjoint`),
+    otherwise some destination elements are updated from multiple source extents.
+
+    :type dst_extents: sequence of :obj:`mpi_array.indexing.HaloIndexingExtent`
+    :param dst_extents: Extents which are to receive updates.
+    :type src_extents: sequence of :obj:`mpi_array.indexing.HaloIndexingExtent`
+    :param src_extents: Extents which provide the updates.
+    :type update_factory: callable :obj:`object`
+    :param update_factory: Called as :samp:`update_factory(dst_extent, src_extent, intersection)`
+       to create the :obj:`list` of updates for a non-empty intersection.
+    :type update_dst_halo: :obj:`bool`
+    :param update_dst_halo: If true, then the halo of the destination extents is
+       included when calculating the intersections.
+    :rtype: :obj:`tuple`
+    :return: Returns :obj:`tuple` pair of :samp:`(leftovers, updates)`, where :samp:`leftovers`
+       is the :obj:`list` of elements of :samp:`{dst_extents}` which are not entirely covered
+       by the :samp:`{src_extents}` and :samp:`updates` is a :obj:`list`
+       of :samp:`(dst_extent, dst_updates)` pairs ordered by source extent.
+    """
+    if (len(dst_extents) <= 0) or (len(src_extents) <= 0):
+        return list(dst_extents), []
+
+    dst_starts, dst_stops = _calc_extent_bounds(dst_extents, update_dst_halo)
+    src_starts, src_stops = _calc_extent_bounds(src_extents)
+    dst_indices, src_indices, isect_starts, isect_stops = \
+        _calc_box_intersections(dst_starts, dst_stops, src_starts, src_stops)
+
+    # Bincount of intersection volumes gives the number of covered elements
+    # of each of the destination extents.
+    dst_covered = \
+        _np.bincount(
+            dst_indices,
+            weights=_np.product(isect_stops - isect_starts, axis=1),
+            minlength=len(dst_extents)
+        )
+    leftovers = \
+        [
+            dst_extents[i]
+            for i in _np.nonzero(dst_covered < _np.product(dst_stops - dst_starts, axis=1))[0]
+        ]
+
+    updates = []
+    for k in _np.lexsort((dst_indices, src_indices)):
+        dst_extent = dst_extents[dst_indices[k]]
+        updates.append(
+            (
+                dst_extent,
+                update_factory(
+                    dst_extent,
+                    src_extents[src_indices[k]],
+                    _IndexingExtent(start=isect_starts[k], stop=isect_stops[k])
+                )
+            )
+        )
+
+    return leftovers, updates
 
 
 class UpdatesForRedistribute(object):
@@ -911,6 +1863,83 @@ class UpdatesForRedistribute(object):
                 self.update_dst_halo
             )
 
+    def create_pair_extent_update_group(self, updates):
+        """
+        Factory method which combines the :samp:`{updates}` (which have common
+        source and destination locales) into transfers. Returns :samp:`{updates}`, over-ridden
+        in sub-classes to create (e.g.) :obj:`MpiPairExtentUpdateGroup` instances.
+
+        :type updates: sequence of :obj:`PairExtentUpdate`
+        :param updates: Updates with common source and destination locales.
+        :rtype: :obj:`list`
+        :return: Updates which perform the transfer of :samp:`{updates}`.
+        """
+        return list(updates)
+
+    def calc_coalesced_updates(self, updates, group=False):
+        """
+        Merges the :samp:`{updates}` which have common source and destination
+        locales and whose update regions are adjacent boxes into single (larger box)
+        updates (see :func:`mpi_array.indexing.calc_coalesced_extents`).
+
+        :type updates: sequence of :obj:`PairExtentUpdate`
+        :param updates: Updates to coalesce.
+        :type group: :obj:`bool`
+        :param group: If :samp:`True`, the (remaining) multiple updates of each
+           source-destination pair are combined using :meth:`create_pair_extent_update_group`.
+        :rtype: :obj:`list`
+        :return: The coalesced updates.
+        """
+        pair_updates = _collections.OrderedDict()
+        for update in updates:
+            key = (update.dst_extent.inter_locale_rank, update.src_extent.inter_locale_rank)
+            if key not in pair_updates.keys():
+                pair_updates[key] = []
+            pair_updates[key].append(update)
+
+        coalesced_updates = []
+        for key in pair_updates.keys():
+            p_updates = pair_updates[key]
+            if len(p_updates) > 1:
+                extents = \
+                    _calc_coalesced_extents(
+                        [
+                            _IndexingExtent(
+                                start=u.dst_update_extent.start,
+                                stop=u.dst_update_extent.stop
+                            )
+                            for u in p_updates
+                        ]
+                    )
+                if len(extents) < len(p_updates):
+                    dst_extent = p_updates[0].dst_extent
+                    src_extent = p_updates[0].src_extent
+                    p_updates = \
+                        sum(
+                            (
+                                self.create_pair_extent_update(dst_extent, src_extent, extent)
+                                for extent in extents
+                            ),
+                            []
+                        )
+                if group and (len(p_updates) > 1):
+                    p_updates = self.create_pair_extent_update_group(p_updates)
+            coalesced_updates += p_updates
+
+        return coalesced_updates
+
+    def coalesce_updates(self):
+        """
+        Coalesces the direct copy updates and the remote (RMA) updates,
+        see :meth:`calc_coalesced_updates`.
+        """
+        for dst_rank in self._dst_cpy2_updates.keys():
+            self._dst_cpy2_updates[dst_rank] = \
+                self.calc_coalesced_updates(self._dst_cpy2_updates[dst_rank])
+        for dst_rank in self._dst_rget_updates.keys():
+            self._dst_rget_updates[dst_rank] = \
+                self.calc_coalesced_updates(self._dst_rget_updates[dst_rank], group=True)
+
     def get_cpy2_src_extents(self, dst_inter_locale_rank):
         """
         """
@@ -953,6 +1982,37 @@ class UpdatesForRedistribute(object):
 
     def initialise_rget_updates(self):
         """
+        Calculates the remote (RMA) updates for the extents remaining in the
+        destination queue. When the source locale extents are disjoint, the
+        intersections are calculated in bulk using :func:`calc_intersection_updates`,
+        otherwise each destination extent is sequentially split by each source extent.
+        """
+        src_extents = self._src_distrib.locale_extents
+        if calc_extents_are_disjoint(src_extents):
+            dst_leftovers, dst_updates = \
+                calc_intersection_updates(
+                    tuple(self._dst_extent_queue),
+                    src_extents,
+                    self.create_pair_extent_update,
+                    self.update_dst_halo
+                )
+            for dst_extent, updates in dst_updates:
+                self._dst_rget_updates[dst_extent.inter_locale_rank] += updates
+            self._dst_extent_queue.clear()
+            self._dst_extent_queue.extend(dst_leftovers)
+        else:
+            self.initialise_sequential_rget_updates()
+
+        if len(self._dst_extent_queue) > 0:
+            self._dst_cad.rank_logger.warning(
+                "Non-empty leftover queue=%s",
+                self._dst_extent_queue
+            )
+
+    def initialise_sequential_rget_updates(self):
+        """
+        Calculates the remote (RMA) updates by splitting each of the destination
+        queue extents by each of the source locale extents in turn.
         """
         for src_rank in range(len(self._src_distrib.locale_extents)):
             src_extent = self._src_distrib.locale_extents[src_rank]
@@ -968,12 +2028,6 @@ class UpdatesForRedistribute(object):
             if len(self._dst_extent_queue) <= 0:
                 break
 
-        if len(self._dst_extent_queue) > 0:
-            self._dst_cad.rank_logger.warning(
-                "Non-empty leftover queue=%s",
-                self._dst_extent_queue
-            )
-
     def check_updates(self):
         """
         Runs consistency checks on the calculated updates, assumes that
@@ -987,7 +2041,7 @@ class UpdatesForRedistribute(object):
 
         all_updates = \
             tuple(self._dst_cpy2_updates.values()) + tuple(self._dst_rget_updates.values())
-        all_updates = tuple(i for i in itertools.chain(*all_updates))
+        all_updates = tuple(iter_pair_extent_updates(itertools.chain(*all_updates)))
         total_dst_update_elems = 0
         total_src_update_elems = 0
         for i in range(len(all_updates)):
@@ -1001,6 +2055,7 @@ class UpdatesForRedistribute(object):
                     msg += \
                         (
                             "Got intersecting updates, intersection=%s, updates:\n%s\n%s\n\n"
+                            %
                             (isect, u0, u1)
                         )
 
@@ -1036,6 +2091,7 @@ class UpdatesForRedistribute(object):
         """
         self.initialise_cpy2_updates()
         self.initialise_rget_updates()
+        self.coalesce_updates()
 
     def initialise(self):
         """
@@ -1160,6 +2216,37 @@ class UpdatesForGet(object):
 
     def initialise_rget_updates(self):
         """
+        Calculates the remote (RMA) updates for the extents remaining in the
+        destination queue. When the source locale extents are disjoint, the
+        intersections are calculated in bulk using :func:`calc_intersection_updates`,
+        otherwise each destination extent is sequentially split by each source extent.
+        """
+        src_extents = self._src_distrib.locale_extents
+        if calc_extents_are_disjoint(src_extents):
+            dst_leftovers, dst_updates = \
+                calc_intersection_updates(
+                    tuple(self._dst_extent_queue),
+                    src_extents,
+                    self.create_pair_extent_update,
+                    self._update_dst_halo
+                )
+            for dst_extent, updates in dst_updates:
+                self._dst_rget_updates[dst_extent.inter_locale_rank] += updates
+            self._dst_extent_queue.clear()
+            self._dst_extent_queue.extend(dst_leftovers)
+        else:
+            self.initialise_sequential_rget_updates()
+
+        if len(self._dst_extent_queue) > 0:
+            self._dst_cad.rank_logger.warning(
+                "Non-empty leftover queue=%s",
+                self._dst_extent_queue
+            )
+
+    def initialise_sequential_rget_updates(self):
+        """
+        Calculates the remote (RMA) updates by splitting each of the destination
+        queue extents by each of the source locale extents in turn.
         """
         for src_rank in range(len(self._src_distrib.locale_extents)):
             src_extent = self._src_distrib.locale_extents[src_rank]
@@ -1174,11 +2261,6 @@ class UpdatesForGet(object):
             self._dst_extent_queue.extend(all_dst_leftovers)
             if len(self._dst_extent_queue) <= 0:
                 break
-        if len(self._dst_extent_queue) > 0:
-            self._dst_cad.rank_logger.warning(
-                "Non-empty leftover queue=%s",
-                self._dst_extent_queue
-            )
 
     def initialise_updates(self):
         """
@@ -1262,6 +2344,185 @@ class MpiUpdatesForGet(UpdatesForGet):
         return peu_list
 
 
+class RmaTransferCostModel(object):
+
+    """
+    Rough heuristic (not a per-transfer performance model) for sizing the groups
+    of targets which :obj:`RmaUpdateExecutor` fetches from concurrently. A linear
+    :samp:`latency + nbytes / bandwidth` relation is fitted (least squares) to
+    the measured wall time of whole groups (including
+    the :meth:`mpi4py.MPI.Win.Lock`/:meth:`mpi4py.MPI.Win.Unlock` synchronisation
+    of every target in the group) against the total bytes of the group. The
+    individual transfers of a group overlap and their times are not observable,
+    so the fitted :samp:`latency` is an effective per-group synchronisation
+    overhead and :samp:`bandwidth` an effective aggregate bandwidth, both
+    depend on the group sizes used for the measurements.
+    """
+
+    def __init__(self, min_group_size=1, max_group_size=256, default_group_size=32):
+        """
+        Initialise.
+
+        :type min_group_size: :obj:`int`
+        :param min_group_size: Lower bound for :meth:`calc_group_size`.
+        :type max_group_size: :obj:`int`
+        :param max_group_size: Upper bound for :meth:`calc_group_size`.
+        :type default_group_size: :obj:`int`
+        :param default_group_size: Group size returned by :meth:`calc_group_size`
+           before the model has been fitted.
+        """
+        object.__init__(self)
+        self._min_group_size = min_group_size
+        self._max_group_size = max_group_size
+        self._default_group_size = default_group_size
+        self.reset()
+
+    def reset(self):
+        """
+        Discards all recorded measurements.
+        """
+        self._num_samples = 0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xx = 0.0
+        self._sum_xy = 0.0
+
+    def record(self, nbytes, seconds):
+        """
+        Records a measured (group) transfer.
+
+        :type nbytes: :obj:`int`
+        :param nbytes: Total number of bytes transferred by the group.
+        :type seconds: :obj:`float`
+        :param seconds: Elapsed wall time of the group, including the synchronisation.
+        """
+        self._num_samples += 1
+        self._sum_x += nbytes
+        self._sum_y += seconds
+        self._sum_xx += float(nbytes) * nbytes
+        self._sum_xy += float(nbytes) * seconds
+
+    @property
+    def num_samples(self):
+        """
+        An :obj:`int`, number of measurements recorded.
+        """
+        return self._num_samples
+
+    def calc_latency_and_bandwidth(self):
+        """
+        Returns the fitted (effective, see :obj:`RmaTransferCostModel`)
+        :samp:`(latency, bandwidth)` pair (seconds, bytes per second),
+        :samp:`(None, None)` when there are insufficient (distinct) measurements.
+
+        :rtype: :obj:`tuple`
+        :return: :samp:`(latency, bandwidth)` pair.
+        """
+        latency, bandwidth = None, None
+        n = self._num_samples
+        denominator = n * self._sum_xx - self._sum_x * self._sum_x
+        if (n > 1) and (denominator > 0):
+            slope = (n * self._sum_xy - self._sum_x * self._sum_y) / denominator
+            if slope > 0:
+                latency = max((0.0, (self._sum_y - slope * self._sum_x) / n))
+                bandwidth = 1.0 / slope
+
+        return latency, bandwidth
+
+    def calc_group_size(self, bytes_per_target):
+        """
+        Returns the number of targets to fetch from concurrently. This is
+        (heuristically) the number of :samp:`{bytes_per_target}` transfers required
+        to cover the effective latency-bandwidth product, i.e. enough concurrent transfers
+        to amortise the per-group synchronisation overhead, without flooding targets with
+        bandwidth bound requests.
+
+        :type bytes_per_target: :obj:`float`
+        :param bytes_per_target: Average number of bytes fetched from each target.
+        :rtype: :obj:`int`
+        :return: Group size, in the range :samp:`[min_group_size, max_group_size]`.
+        """
+        group_size = self._default_group_size
+        latency, bandwidth = self.calc_latency_and_bandwidth()
+        if latency is not None:
+            group_size = int(_np.ceil(latency * bandwidth / max((bytes_per_target, 1.0))))
+
+        return int(min((max((group_size, self._min_group_size)), self._max_group_size)))
+
+
+#: Per process :obj:`RmaTransferCostModel`, shared by :obj:`RmaUpdateExecutor` instances.
+_rma_transfer_cost_model = RmaTransferCostModel()
+
+
+def get_rma_transfer_cost_model():
+    """
+    Returns the (per process) :obj:`RmaTransferCostModel` used
+    by :obj:`RmaUpdateExecutor` instances.
+
+    :rtype: :obj:`RmaTransferCostModel`
+    :return: The shared cost model.
+    """
+    return _rma_transfer_cost_model
+
+
+def calc_target_schedule(target_ranks, origin_rank, rank_to_locale=None):
+    """
+    Returns an ordering of :samp:`{target_ranks}` which interleaves
+    targets of different locales (round-robin over locales), shifted by :samp:`{origin_rank}`
+    so that different origins start with different locales (and different
+    ranks within a locale). Avoids origins simultaneously flooding the same node.
+
+    :type target_ranks: sequence of :obj:`int`
+    :param target_ranks: Target (window) ranks.
+    :type origin_rank: :obj:`int`
+    :param origin_rank: The (window) rank of the origin.
+    :type rank_to_locale: :obj:`dict`
+    :param rank_to_locale: Maps target rank to locale index, :samp:`None` means
+       each target is a separate locale.
+    :rtype: :obj:`list`
+    :return: The ordered target ranks.
+    """
+    if rank_to_locale is None:
+        rank_to_locale = dict()
+    locale_to_ranks = _collections.defaultdict(list)
+    for rank in sorted(target_ranks):
+        locale_to_ranks[rank_to_locale.get(rank, ("rank", rank))].append(rank)
+    locales = sorted(locale_to_ranks.keys(), key=lambda locale: min(locale_to_ranks[locale]))
+    num_locales = len(locales)
+    schedule = []
+    if num_locales > 0:
+        shift = origin_rank % num_locales
+        queues = []
+        for locale in locales[shift:] + locales[:shift]:
+            ranks = locale_to_ranks[locale]
+            rank_shift = (origin_rank // num_locales) % len(ranks)
+            queues.append(_collections.deque(ranks[rank_shift:] + ranks[:rank_shift]))
+        while len(queues) > 0:
+            for queue in queues:
+                schedule.append(queue.popleft())
+            queues = [queue for queue in queues if len(queue) > 0]
+
+    return schedule
+
+
+def calc_rank_to_locale(peer_ranks_per_locale):
+    """
+    Returns a :obj:`dict` mapping peer rank to locale index.
+
+    :type peer_ranks_per_locale: sequence
+    :param peer_ranks_per_locale: See :attr:`mpi_array.comms.LocaleComms.peer_ranks_per_locale`.
+    :rtype: :obj:`dict`
+    :return: Maps peer rank to the index of the locale which contains it.
+    """
+    rank_to_locale = dict()
+    if peer_ranks_per_locale is not None:
+        for locale_idx in range(len(peer_ranks_per_locale)):
+            for rank in _np.asarray(peer_ranks_per_locale[locale_idx]).ravel():
+                rank_to_locale[int(rank)] = locale_idx
+
+    return rank_to_locale
+
+
 class RmaUpdateExecutor(object):
     """
     Performs one-sided fetch of data from remote (source) locale arrays to
@@ -1274,7 +2535,10 @@ class RmaUpdateExecutor(object):
         dst_lndarray,
         src_inter_win_rank_attr,
         rank_logger=None,
-        casting="same_kind"
+        casting="same_kind",
+        lock_all=False,
+        peer_ranks_per_locale=None,
+        cost_model=None
     ):
         """
         """
@@ -1282,10 +2546,14 @@ class RmaUpdateExecutor(object):
         self._dst_lndarray = dst_lndarray
         self._casting = casting
         self._inter_win = inter_win
-        self._num_requests_per_group = 32
-        self._random_state = None
+        self._max_requests_in_flight = 1024
         self._rank_logger = rank_logger
         self._src_inter_win_rank_attr = src_inter_win_rank_attr
+        self._lock_all = lock_all
+        self._rank_to_locale = calc_rank_to_locale(peer_ranks_per_locale)
+        if cost_model is None:
+            cost_model = get_rma_transfer_cost_model()
+        self._cost_model = cost_model
 
     def get_src_win_rank(self, src_extent):
         """
@@ -1312,6 +2580,20 @@ class RmaUpdateExecutor(object):
         """
         return self._dst_lndarray
 
+    @property
+    def lock_all(self):
+        """
+        A :obj:`bool`, if :samp:`True` :meth:`do_locale_rma_update` fetches
+        all updates with :meth:`mpi4py.MPI.Win.Rget` requests in a
+        single :meth:`mpi4py.MPI.Win.Lock_all` epoch (see :meth:`do_locale_rget_update`),
+        otherwise fetches with :meth:`mpi4py.MPI.Win.Get` with a lock per target rank.
+        """
+        return self._lock_all
+
+    @lock_all.setter
+    def lock_all(self, lock_all):
+        self._lock_all = lock_all
+
     @property
     def rank_logger(self):
         """
@@ -1326,39 +2608,171 @@ class RmaUpdateExecutor(object):
         self._rank_logger = logger
 
     @property
-    def random_state(self):
+    def cost_model(self):
         """
-        A :obj:`numpy.random.RandomState` instance, used to permute target
-        rank ordering to alleviate swamping single rank with *get* requests
-        from multiple source ranks.
+        The :obj:`RmaTransferCostModel` used to size target groups.
         """
-        if (
-            (self._random_state is None)
-            and
-            (self._inter_win is not None)
-            and
-            (self._inter_win != _mpi.WIN_NULL)
-        ):
-            seed_str = str(2 ** 31)[1:]
-            rank_str = str(self._inter_win.group.rank + 1)
-            seed_str = rank_str + seed_str[len(rank_str):]
-            seed_str = seed_str[0:-len(rank_str)] + rank_str[::-1]
-            self._random_state = _np.random.RandomState(seed=int(seed_str))
+        return self._cost_model
+
+    def calc_update_nbytes(self, update):
+        """
+        Returns the number of bytes fetched by :samp:`{update}`.
+
+        :type update: :obj:`MpiPairExtentUpdate`
+        :param update: Update.
+        :rtype: :obj:`int`
+        :return: Number of bytes.
+        """
+        return \
+            sum(
+                int(_np.product(u.src_update_extent.shape))
+                for u in iter_pair_extent_updates((update,))
+            ) * self._dst_lndarray.itemsize
+
+    def calc_target_schedule(self, src_win_ranks):
+        """
+        Returns the order in which the :samp:`{src_win_ranks}` targets are
+        fetched from, see :func:`calc_target_schedule`.
 
-        return self._random_state
+        :type src_win_ranks: sequence of :obj:`int`
+        :param src_win_ranks: Target ranks of :attr:`inter_win`.
+        :rtype: :obj:`list`
+        :return: Ordered target ranks.
+        """
+        return \
+            calc_target_schedule(
+                src_win_ranks,
+                self._inter_win.group.rank,
+                self._rank_to_locale
+            )
 
-    def do_direct_cpy2_update(self, updates, src_lndarray):
+    def do_direct_cpy2_update(self, updates, src_lndarray, slab_rank=0, num_slabs=1):
         """
         Does direct copy update to :attr:`dst_lndarray` from the
-        specified :samp:`{src_lndarray}` array.
+        specified :samp:`{src_lndarray}` array. When :samp:`{num_slabs} > 1`, only
+        the :samp:`{slab_rank}` slab of each update region is copied, so that
+        the (:samp:`intra_locale_comm`) processes which share the memory of
+        the arrays can perform the copy in parallel.
 
         :type updates: sequence of :obj:`PairExtentUpdate`
         :param updates: Sequence of destination and source extents.
         :type src_lndarray: :obj:`numpy.ndarray`
         :param src_lndarray: Elements copied from this array.
+        :type slab_rank: :obj:`int`
+        :param slab_rank: Slab copied by this process, see :func:`calc_slab_extent`.
+        :type num_slabs: :obj:`int`
+        :param num_slabs: Number of processes copying slabs.
         """
         for single_update in updates:
-            single_update.copyto(self._dst_lndarray, src_lndarray, casting=self._casting)
+            single_update.copyto(
+                self._dst_lndarray,
+                src_lndarray,
+                casting=self._casting,
+                slab_rank=slab_rank,
+                num_slabs=num_slabs
+            )
+
+    def wait_any(self, requests, in_flight_updates):
+        """
+        Waits for completion of one of the :samp:`{requests}` and
+        calls :meth:`MpiPairExtentUpdate.conclude` of the corresponding update.
+        The completed request and update are removed from the lists.
+
+        :type requests: :obj:`list` of :obj:`mpi4py.MPI.Request`
+        :param requests: Outstanding :meth:`mpi4py.MPI.Win.Rget` requests.
+        :type in_flight_updates: :obj:`list` of :obj:`MpiPairExtentUpdate`
+        :param in_flight_updates: The update corresponding to each element of
+           :samp:`{requests}`.
+        """
+        idx = _mpi.Request.Waitany(requests)
+        requests.pop(idx)
+        in_flight_updates.pop(idx).conclude()
+
+    def do_locale_rget_update(self, updates):
+        """
+        Performs RMA to get elements from remote (source) locales to
+        update the (destination) locale extent array. All updates
+        are fetched using :meth:`MpiPairExtentUpdate.do_rget` in a
+        single :meth:`mpi4py.MPI.Win.Lock_all` epoch, updates are
+        concluded (e.g. cast) as each request completes.
+
+        :type updates: sequence of :obj:`PairExtentUpdate`
+        :param updates: Sequence of destination and source extents.
+        """
+        if (
+            (self._inter_win is not None)
+            and
+            (self._inter_win != _mpi.WIN_NULL)
+        ):
+            update_dict = _collections.defaultdict(list)
+            for single_update in updates:
+                update_dict[self.get_src_win_rank(single_update.src_extent)].append(
+                    single_update
+                )
+            src_win_ranks = self.calc_target_schedule(tuple(update_dict.keys()))
+
+            self.rank_logger.debug("BEG: Lock_all, rget from src_win_ranks: %s", src_win_ranks)
+            self._inter_win.Lock_all(_mpi.MODE_NOCHECK)
+            requests = []
+            in_flight_updates = []
+            for src_win_rank in src_win_ranks:
+                for single_update in update_dict[src_win_rank]:
+                    if len(requests) >= self._max_requests_in_flight:
+                        self.wait_any(requests, in_flight_updates)
+                    self.rank_logger.debug(
+                        "Getting update:\n%s\n%s",
+                        single_update._header_str,
+                        single_update
+                    )
+                    requests.append(
+                        single_update.do_rget(
+                            self._inter_win,
+                            src_win_rank,
+                            self._dst_lndarray
+                        )
+                    )
+                    in_flight_updates.append(single_update)
+            while len(requests) > 0:
+                self.wait_any(requests, in_flight_updates)
+            self._inter_win.Unlock_all()
+            self.rank_logger.debug("END: Lock_all, rget from src_win_ranks: %s", src_win_ranks)
+
+    def do_locale_pscw_update(self, updates, access_group):
+        """
+        Performs RMA to get elements from remote (source) locales to
+        update the (destination) locale extent array. All updates
+        are fetched using :meth:`MpiPairExtentUpdate.do_get` in a
+        single (generalized active target) :meth:`mpi4py.MPI.Win.Start`
+        access epoch, the matching :meth:`mpi4py.MPI.Win.Post` exposure
+        epochs are the responsibility of the target processes.
+
+        :type updates: sequence of :obj:`PairExtentUpdate`
+        :param updates: Sequence of destination and source extents.
+        :type access_group: :obj:`mpi4py.MPI.Group`
+        :param access_group: Group of the target ranks of :samp:`{updates}`.
+        """
+        if (
+            (self._inter_win is not None)
+            and
+            (self._inter_win != _mpi.WIN_NULL)
+        ):
+            self.rank_logger.debug("BEG: Start, access_group.size=%s...", access_group.size)
+            self._inter_win.Start(access_group)
+            for single_update in updates:
+                self.rank_logger.debug(
+                    "Getting update:\n%s\n%s",
+                    single_update._header_str,
+                    single_update
+                )
+                single_update.do_get(
+                    self._inter_win,
+                    self.get_src_win_rank(single_update.src_extent),
+                    self._dst_lndarray
+                )
+            self._inter_win.Complete()
+            self.rank_logger.debug("END: Complete, access_group.size=%s.", access_group.size)
+            for single_update in updates:
+                single_update.conclude()
 
     def do_locale_rma_update(self, updates):
         """
@@ -1368,7 +2782,9 @@ class RmaUpdateExecutor(object):
         :type updates: sequence of :obj:`PairExtentUpdate`
         :param updates: Sequence of destination and source extents.
         """
-        if (
+        if self._lock_all:
+            self.do_locale_rget_update(updates)
+        elif (
             (self._inter_win is not None)
             and
             (self._inter_win != _mpi.WIN_NULL)
@@ -1378,27 +2794,34 @@ class RmaUpdateExecutor(object):
                 update_dict[self.get_src_win_rank(single_update.src_extent)].append(
                     single_update
                 )
-            src_win_ranks = self.random_state.permutation(tuple(update_dict.keys()))
-
-            src_win_ranks_per_group = self._num_requests_per_group
-            if len(src_win_ranks) > src_win_ranks_per_group:
-                src_win_rank_sub_groups = \
-                    _np.array_split(
-                        src_win_ranks,
-                        (len(src_win_ranks) - 1) // src_win_ranks_per_group + 1
+            src_win_ranks = self.calc_target_schedule(tuple(update_dict.keys()))
+            target_nbytes = \
+                dict(
+                    (
+                        src_win_rank,
+                        sum(self.calc_update_nbytes(u) for u in update_dict[src_win_rank])
                     )
-            else:
-                src_win_rank_sub_groups = (src_win_ranks,)
+                    for src_win_rank in src_win_ranks
+                )
+
             group_idx = 1
-            for src_win_ranks in src_win_rank_sub_groups:
+            while len(src_win_ranks) > 0:
+                group_size = \
+                    self._cost_model.calc_group_size(
+                        sum(target_nbytes[r] for r in src_win_ranks) / float(len(src_win_ranks))
+                    )
+                group_src_win_ranks = src_win_ranks[:group_size]
+                src_win_ranks = src_win_ranks[group_size:]
                 self.rank_logger.debug(
-                    "BEG: Getting updates from src_win_ranks group %4d of %4d ranks: %s",
+                    "BEG: Getting updates from src_win_ranks group %4d (%4d ranks): %s",
                     group_idx,
-                    len(src_win_rank_sub_groups),
-                    src_win_ranks
+                    len(group_src_win_ranks),
+                    group_src_win_ranks
                 )
-                for src_win_rank in src_win_ranks:
+                start_time = _mpi.Wtime()
+                for src_win_rank in group_src_win_ranks:
                     self._inter_win.Lock(src_win_rank, _mpi.LOCK_SHARED)
+                for src_win_rank in group_src_win_ranks:
                     for single_update in update_dict[src_win_rank]:
                         self.rank_logger.debug(
                             "Getting update:\n%s\n%s",
@@ -1410,15 +2833,21 @@ class RmaUpdateExecutor(object):
                             src_win_rank,
                             self._dst_lndarray
                         )
+                for src_win_rank in group_src_win_ranks:
                     self._inter_win.Unlock(src_win_rank)
+                self._cost_model.record(
+                    sum(target_nbytes[r] for r in group_src_win_ranks),
+                    _mpi.Wtime() - start_time
+                )
+                for src_win_rank in group_src_win_ranks:
                     for single_update in update_dict[src_win_rank]:
                         single_update.conclude()
 
                 self.rank_logger.debug(
-                    "END: Getting updates from src_win_ranks group %4d of %4d ranks: %s",
+                    "END: Getting updates from src_win_ranks group %4d (%4d ranks): %s",
                     group_idx,
-                    len(src_win_rank_sub_groups),
-                    src_win_ranks
+                    len(group_src_win_ranks),
+                    group_src_win_ranks
                 )
                 group_idx += 1
 
@@ -17,9 +17,15 @@ Classes
    :template: autosummary/inherits_TestCase_class.rst
 
    MpiPairExtentUpdateTest - Tests for :obj:`mpi_array.update.MpiPairExtentUpdate`.
+   MpiPairExtentUpdateGroupTest - Tests for :obj:`mpi_array.update.MpiPairExtentUpdateGroup`.
+   MpiPairExtentUpdateDifferentDtypesTest - Tests for chunked (streamed) casting fetches.
    MpiHaloSingleExtentUpdateTest - Tests :obj:`mpi_array.update.MpiHaloSingleExtentUpdate`.
    HalosUpdateTest - Test mpi_array.update.HalosUpdate`.
+   SingleEpochHalosUpdateTest - Test :obj:`mpi_array.update.SingleEpochHalosUpdate`.
    UpdatesForRedistributeTest -Tests :obj:`mpi_array.update.UpdatesForRedistribute`.
+   RmaTransferCostModelTest - Tests :obj:`mpi_array.update.RmaTransferCostModel`.
+   CalcTargetScheduleTest - Tests :func:`mpi_array.update.calc_target_schedule`.
+   CalcSlabExtentTest - Tests :func:`mpi_array.update.calc_slab_extent`.
 
 """
 from __future__ import absolute_import
@@ -34,8 +40,13 @@ from . import logging as _logging  # noqa: E402,F401
 
 from .indexing import IndexingExtent
 from .distribution import CartLocaleExtent, GlobaleExtent, BlockPartition
-from .update import MpiHaloSingleExtentUpdate, HalosUpdate
-from .update import MpiPairExtentUpdate, UpdatesForRedistribute
+from .update import MpiHaloSingleExtentUpdate, HalosUpdate, SingleEpochHalosUpdate
+from .update import MpiHalosUpdate, MpiSingleEpochHalosUpdate
+from .update import MpiPairExtentUpdate, UpdatesForRedistribute, calc_halo_depth_extent
+from .update import RmaTransferCostModel, calc_target_schedule, calc_rank_to_locale
+from .update import MpiPairExtentUpdateGroup, iter_pair_extent_updates
+from .update import MpiPairExtentUpdateDifferentDtypes, ChunkBufferPool, calc_slab_extent
+from .update import calc_extents_are_disjoint
 
 __author__ = "Shane J. Latham"
 __license__ = _license()
@@ -132,6 +143,186 @@ class MpiPairExtentUpdateTest(_unittest.TestCase):
         self.assertTrue(u.src_data_type is not sdt)
 
 
+class MpiPairExtentUpdateGroupTest(_unittest.TestCase):
+
+    """
+    Tests for :obj:`mpi_array.update.MpiPairExtentUpdateGroup`.
+    """
+
+    def setUp(self):
+        self.se = \
+            CartLocaleExtent(
+                peer_rank=0,
+                inter_locale_rank=0,
+                cart_coord=(0,),
+                cart_shape=(1,),
+                globale_extent=GlobaleExtent(stop=(100,)),
+                slice=(slice(0, 100),),
+                halo=((10, 10),)
+            )
+        self.de = \
+            CartLocaleExtent(
+                peer_rank=0,
+                inter_locale_rank=0,
+                cart_coord=(0,),
+                cart_shape=(1,),
+                globale_extent=GlobaleExtent(stop=(100,)),
+                slice=(slice(0, 100),),
+                halo=((4, 4),)
+            )
+        self.update_extents = \
+            (
+                IndexingExtent(start=(10,), stop=(20,)),
+                IndexingExtent(start=(50,), stop=(60,)),
+                IndexingExtent(start=(90,), stop=(100,)),
+            )
+
+    def test_do_get(self):
+        """
+        Tests :meth:`mpi_array.update.MpiPairExtentUpdateGroup.do_get` fetches
+        the same elements as :meth:`mpi_array.update.MpiPairExtentUpdateGroup.copyto`.
+        """
+        updates = []
+        for e in self.update_extents:
+            u = MpiPairExtentUpdate(self.de, self.se, e, e)
+            u.initialise_data_types(
+                dst_dtype="int32",
+                src_dtype="int32",
+                dst_order="C",
+                src_order="C"
+            )
+            updates.append(u)
+        group = MpiPairExtentUpdateGroup(updates)
+        self.assertTrue(group.dst_extent is self.de)
+        self.assertTrue(group.src_extent is self.se)
+        self.assertSequenceEqual(updates, group.updates)
+        self.assertSequenceEqual(updates, tuple(iter_pair_extent_updates([group, ])))
+        self.assertTrue(len(str(group)) > 0)
+
+        src = _np.arange(1, 121, dtype="int32")
+        dst_get = _np.zeros((108,), dtype="int32")
+        dst_cpy = _np.zeros((108,), dtype="int32")
+
+        win = _mpi.Win.Create(src, src.itemsize, comm=_mpi.COMM_SELF)
+        try:
+            win.Fence()
+            group.do_get(win, 0, dst_get)
+            win.Fence()
+        finally:
+            win.Free()
+            group.free()
+        group.copyto(dst_cpy, src, "same_kind")
+
+        self.assertEqual(30, _np.sum(dst_get != 0))
+        self.assertTrue(_np.all(dst_get == dst_cpy))
+
+
+class MpiPairExtentUpdateDifferentDtypesTest(_unittest.TestCase):
+
+    """
+    Tests for :obj:`mpi_array.update.MpiPairExtentUpdateDifferentDtypes`.
+    """
+
+    def setUp(self):
+        self.se = \
+            CartLocaleExtent(
+                peer_rank=0,
+                inter_locale_rank=0,
+                cart_coord=(0, 0),
+                cart_shape=(1, 1),
+                globale_extent=GlobaleExtent(stop=(20, 16)),
+                slice=(slice(0, 20), slice(0, 16)),
+                halo=((2, 2), (2, 2))
+            )
+        self.de = \
+            CartLocaleExtent(
+                peer_rank=0,
+                inter_locale_rank=0,
+                cart_coord=(0, 0),
+                cart_shape=(1, 1),
+                globale_extent=GlobaleExtent(stop=(20, 16)),
+                slice=(slice(0, 20), slice(0, 16)),
+                halo=((0, 0), (0, 0))
+            )
+        self.ue = IndexingExtent(start=(3, 2), stop=(17, 13))
+
+    def create_update(self, max_chunk_elements):
+        u = MpiPairExtentUpdateDifferentDtypes(self.de, self.se, self.ue, self.ue)
+        u.initialise_data_types(
+            dst_dtype="float32",
+            src_dtype="float64",
+            dst_order="C",
+            src_order="C"
+        )
+        u.casting = "same_kind"
+        u.max_chunk_elements = max_chunk_elements
+        return u
+
+    def test_chunk_buffer_pool(self):
+        """
+        Tests for :obj:`mpi_array.update.ChunkBufferPool`.
+        """
+        pool = ChunkBufferPool()
+        self.assertEqual(2, pool.num_buffers)
+        buffers = pool.get_buffers("float64", 10)
+        self.assertEqual(2, len(buffers))
+        self.assertTrue(buffers[0] is not buffers[1])
+        self.assertTrue(all(b.size >= 10 for b in buffers))
+        self.assertTrue(pool.get_buffers("float64", 5)[0] is buffers[0])
+        self.assertTrue(pool.get_buffers("float64", 20)[0].size >= 20)
+        self.assertEqual(_np.dtype("int16"), pool.get_buffers("int16", 5)[0].dtype)
+        pool.clear()
+        self.assertTrue(pool.get_buffers("float64", 5)[0] is not buffers[0])
+
+    def test_streamed_get(self):
+        """
+        Tests the chunked (streamed) fetch
+        of :meth:`mpi_array.update.MpiPairExtentUpdateDifferentDtypes.do_get`
+        and :meth:`mpi_array.update.MpiPairExtentUpdateDifferentDtypes.do_rget`
+        gives the same result as the single buffer fetch.
+        """
+        u = self.create_update(None)
+        self.assertRaises(ValueError, setattr, u, "max_chunk_elements", 0)
+        self.assertFalse(u.calc_is_streamed())
+        self.assertEqual(1, len(u.calc_chunk_extents()))
+        u.max_chunk_elements = 7
+        self.assertTrue(u.calc_is_streamed())
+        chunk_extents = u.calc_chunk_extents()
+        self.assertTrue(len(chunk_extents) > 2)
+        self.assertTrue(all(_np.product(e.shape) <= 7 for e in chunk_extents))
+
+        src = _np.random.uniform(size=self.se.shape_h)
+        win = _mpi.Win.Create(src, src.itemsize, comm=_mpi.COMM_SELF)
+        try:
+            dst_expected = _np.zeros(self.de.shape_h, dtype="float32")
+            u = self.create_update(None)
+            win.Lock(0, _mpi.LOCK_SHARED)
+            u.do_get(win, 0, dst_expected)
+            win.Unlock(0)
+            u.conclude()
+            self.assertTrue(_np.any(dst_expected != 0))
+
+            for max_chunk_elements in (1, 7, 11, 50):
+                dst = _np.zeros(self.de.shape_h, dtype="float32")
+                u = self.create_update(max_chunk_elements)
+                win.Lock(0, _mpi.LOCK_SHARED)
+                u.do_get(win, 0, dst)
+                win.Unlock(0)
+                u.conclude()
+                self.assertTrue(_np.all(dst == dst_expected))
+
+                dst = _np.zeros(self.de.shape_h, dtype="float32")
+                u = self.create_update(max_chunk_elements)
+                win.Lock_all()
+                request = u.do_rget(win, 0, dst)
+                request.Wait()
+                u.conclude()
+                win.Unlock_all()
+                self.assertTrue(_np.all(dst == dst_expected))
+        finally:
+            win.Free()
+
+
 class MpiHaloSingleExtentUpdateTest(_unittest.TestCase):
 
     """
@@ -263,6 +454,253 @@ class HalosUpdateTest(_unittest.TestCase):
         self.assertTrue(self.se is hu.updates_per_axis[0][0][0].src_extent)
         self.assertEqual(self.ue, hu.updates_per_axis[0][0][0].update_extent)
 
+    def test_free_data_types(self):
+        """
+        Tests for :meth:`mpi_array.update.MpiHalosUpdate.free_data_types`.
+        """
+        rank_to_extent_dict = \
+            {
+                self.se.cart_rank: self.se,
+                self.de.cart_rank: self.de
+            }
+        hu = MpiHalosUpdate(self.de.cart_rank, rank_to_extent_dict, max_elements=4)
+        updates = hu.updates_per_axis[0][0]
+        self.assertEqual(3, len(updates))
+        data_types = []
+        for u in updates:
+            u.initialise_data_types(dtype="int32", order="C")
+            data_types += [u.dst_data_type, u.src_data_type]
+        hu.free_data_types()
+        for data_type in data_types:
+            self.assertEqual(_mpi.DATATYPE_NULL, data_type)
+
+    def test_split_extent_for_max_elements(self):
+        """
+        Tests for :meth:`mpi_array.distribution.HalosUpdate.split_extent_for_max_elements`.
+        """
+        rank_to_extent_dict = \
+            {
+                self.se.cart_rank: self.se,
+                self.de.cart_rank: self.de
+            }
+        hu = HalosUpdate(self.de.cart_rank, rank_to_extent_dict, max_elements=4)
+        self.assertEqual(4, hu.max_elements)
+        updates = hu.updates_per_axis[0][0]
+        self.assertEqual(3, len(updates))
+        self.assertEqual(IndexingExtent(start=(90,), stop=(94,)), updates[0].update_extent)
+        self.assertEqual(IndexingExtent(start=(94,), stop=(98,)), updates[1].update_extent)
+        self.assertEqual(IndexingExtent(start=(98,), stop=(100,)), updates[2].update_extent)
+        for u in updates:
+            self.assertTrue(self.de is u.dst_extent)
+            self.assertTrue(self.se is u.src_extent)
+
+        self.assertEqual(1, len(hu.split_extent_for_max_elements(updates[0])))
+        self.assertEqual(4, len(hu.split_extent_for_max_elements(updates[0], 1)))
+
+    def test_construct_periodic(self):
+        """
+        Tests for :meth:`mpi_array.distribution.HalosUpdate.__init__` with
+        periodic axis, halos wrap around to the opposite-face locale.
+        """
+        distrib = BlockPartition((200,), (2,), {(0,): 0, (1,): 1}, halo=10, periods=True)
+        rank_to_extents = distrib.locale_extents
+        lo_extent, hi_extent = rank_to_extents[0], rank_to_extents[1]
+
+        hu = HalosUpdate(1, rank_to_extents, periods=(True,))
+        self.assertEqual(1, len(hu.updates_per_axis[0][hu.LO]))
+        self.assertEqual(1, len(hu.updates_per_axis[0][hu.HI]))
+        lo_update = hu.updates_per_axis[0][hu.LO][0]
+        self.assertEqual(self.ue, lo_update.update_extent)
+        self.assertEqual(self.ue, lo_update.src_update_extent)
+        hi_update = hu.updates_per_axis[0][hu.HI][0]
+        self.assertTrue(lo_extent is hi_update.src_extent)
+        self.assertEqual(IndexingExtent(start=(200,), stop=(210,)), hi_update.update_extent)
+        self.assertEqual(IndexingExtent(start=(0,), stop=(10,)), hi_update.src_update_extent)
+
+        hu = HalosUpdate(0, rank_to_extents, periods=(True,))
+        lo_update = hu.updates_per_axis[0][hu.LO][0]
+        self.assertTrue(hi_extent is lo_update.src_extent)
+        self.assertEqual(IndexingExtent(start=(-10,), stop=(0,)), lo_update.update_extent)
+        self.assertEqual(IndexingExtent(start=(190,), stop=(200,)), lo_update.src_update_extent)
+
+        hu = HalosUpdate(0, rank_to_extents)
+        self.assertEqual(0, len(hu.updates_per_axis[0][hu.LO]))
+
+        hu = HalosUpdate(1, rank_to_extents, max_elements=3, periods=(True,))
+        hi_updates = hu.updates_per_axis[0][hu.HI]
+        self.assertEqual(4, len(hi_updates))
+        self.assertEqual(IndexingExtent(start=(203,), stop=(206,)), hi_updates[1].update_extent)
+        self.assertEqual(IndexingExtent(start=(3,), stop=(6,)), hi_updates[1].src_update_extent)
+
+    def test_construct_depth(self):
+        """
+        Tests for :meth:`mpi_array.distribution.HalosUpdate.__init__` with
+        reduced :samp:`depth`, only halo elements within the depth are updated.
+        """
+        gshape = (64, 48)
+        dims = (2, 2)
+        cc2cr = {(i, j): i * dims[1] + j for i in range(dims[0]) for j in range(dims[1])}
+        distrib = BlockPartition(gshape, dims, cc2cr, halo=3)
+        rank_to_extents = distrib.locale_extents
+        depth = _np.array([[1, 0], [0, 0]])
+
+        hu = HalosUpdate(cc2cr[(1, 1)], rank_to_extents, depth=depth)
+        self.assertEqual(1, len(hu.updates_per_axis[0][hu.LO]))
+        self.assertEqual(0, len(hu.updates_per_axis[0][hu.HI]))
+        self.assertEqual(0, len(hu.updates_per_axis[1][hu.LO]))
+        self.assertEqual(0, len(hu.updates_per_axis[1][hu.HI]))
+        self.assertEqual(
+            IndexingExtent(start=(31, 24), stop=(32, 48)),
+            hu.updates_per_axis[0][hu.LO][0].update_extent
+        )
+
+        hu = HalosUpdate(cc2cr[(0, 0)], rank_to_extents, depth=_np.array([[2, 2], [1, 1]]))
+        self.assertEqual(
+            IndexingExtent(start=(32, 0), stop=(34, 25)),
+            hu.updates_per_axis[0][hu.HI][0].update_extent
+        )
+        self.assertEqual(
+            IndexingExtent(start=(0, 24), stop=(34, 25)),
+            hu.updates_per_axis[1][hu.HI][0].update_extent
+        )
+
+        hu = HalosUpdate(cc2cr[(0, 0)], rank_to_extents, depth=_np.zeros((2, 2), dtype="int64"))
+        self.assertEqual(0, sum(len(u[hu.LO]) + len(u[hu.HI]) for u in hu.updates_per_axis))
+
+
+class SingleEpochHalosUpdateTest(_unittest.TestCase):
+
+    """
+    Tests for :obj:`mpi_array.update.SingleEpochHalosUpdate`.
+    """
+
+    def test_construct(self):
+        """
+        Tests for :meth:`mpi_array.update.SingleEpochHalosUpdate.__init__`,
+        edge and corner halo regions are updated directly from the owning locale.
+        """
+        gshape = (64, 48)
+        dims = (2, 2)
+        cc2cr = {(i, j): i * dims[1] + j for i in range(dims[0]) for j in range(dims[1])}
+        distrib = BlockPartition(gshape, dims, cc2cr, halo=2)
+        rank_to_extents = distrib.locale_extents
+
+        for rank in range(distrib.num_locales):
+            hu = SingleEpochHalosUpdate(rank, rank_to_extents)
+            # Each locale has halo regions from the other 3 locales (2 faces and 1 corner).
+            self.assertEqual(3, len(hu.updates))
+            self.assertEqual(3, len(hu.remote_updates))
+            dst_extent = rank_to_extents[rank]
+            num_halo_elems = _np.product(dst_extent.shape_h) - _np.product(dst_extent.shape_n)
+            self.assertEqual(
+                num_halo_elems,
+                sum(_np.product(u.update_extent.shape) for u in hu.updates)
+            )
+            for u in hu.updates:
+                self.assertTrue(u.dst_extent is dst_extent)
+                self.assertNotEqual(rank, u.src_extent.cart_rank)
+            for u in hu.remote_updates:
+                self.assertTrue(u.src_extent is dst_extent)
+            corner_updates = \
+                [
+                    u for u in hu.updates
+                    if _np.all(u.src_extent.cart_coord != dst_extent.cart_coord)
+                ]
+            self.assertEqual(1, len(corner_updates))
+            self.assertSequenceEqual((2, 2), tuple(corner_updates[0].update_extent.shape))
+
+            hu_split = SingleEpochHalosUpdate(rank, rank_to_extents, max_elements=16)
+            self.assertTrue(len(hu_split.updates) > len(hu.updates))
+            self.assertEqual(len(hu_split.updates), len(hu_split.remote_updates))
+            self.assertTrue(
+                _np.all([_np.product(u.update_extent.shape) <= 16 for u in hu_split.updates])
+            )
+            self.assertEqual(
+                num_halo_elems,
+                sum(_np.product(u.update_extent.shape) for u in hu_split.updates)
+            )
+
+    def test_construct_periodic(self):
+        """
+        Tests for :meth:`mpi_array.update.SingleEpochHalosUpdate.__init__` with
+        periodic axes, all halo regions (including the wrap-around regions) are updated.
+        """
+        gshape = (64, 48)
+        dims = (2, 1)
+        periods = (True, True)
+        cc2cr = {(i, j): i * dims[1] + j for i in range(dims[0]) for j in range(dims[1])}
+        distrib = BlockPartition(gshape, dims, cc2cr, halo=2, periods=periods)
+        rank_to_extents = distrib.locale_extents
+
+        for rank in range(distrib.num_locales):
+            hu = SingleEpochHalosUpdate(rank, rank_to_extents, periods=periods)
+            dst_extent = rank_to_extents[rank]
+            self.assertSequenceEqual([2, 2], dst_extent.halo[1].tolist())
+            num_halo_elems = _np.product(dst_extent.shape_h) - _np.product(dst_extent.shape_n)
+            self.assertEqual(
+                num_halo_elems,
+                sum(_np.product(u.update_extent.shape) for u in hu.updates)
+            )
+            self.assertEqual(len(hu.updates), len(hu.remote_updates))
+            for u in hu.updates:
+                self.assertSequenceEqual(
+                    (u.src_update_extent.start % gshape).tolist(),
+                    (u.update_extent.start % gshape).tolist()
+                )
+                self.assertTrue(
+                    _np.all(u.src_update_extent.start >= u.src_extent.start_n)
+                    and
+                    _np.all(u.src_update_extent.stop <= u.src_extent.stop_n)
+                )
+
+    def test_construct_depth(self):
+        """
+        Tests for :meth:`mpi_array.update.SingleEpochHalosUpdate.__init__` with
+        reduced :samp:`depth`, edge and corner regions are trimmed to the depth.
+        """
+        gshape = (64, 48)
+        dims = (2, 2)
+        cc2cr = {(i, j): i * dims[1] + j for i in range(dims[0]) for j in range(dims[1])}
+        distrib = BlockPartition(gshape, dims, cc2cr, halo=3)
+        rank_to_extents = distrib.locale_extents
+        depth = _np.array([[1, 2], [0, 1]])
+
+        for rank in range(distrib.num_locales):
+            hu = SingleEpochHalosUpdate(rank, rank_to_extents, depth=depth)
+            dst_extent = rank_to_extents[rank]
+            depth_extent = calc_halo_depth_extent(dst_extent, depth)
+            self.assertEqual(
+                _np.product(depth_extent.shape) - _np.product(dst_extent.shape_n),
+                sum(_np.product(u.update_extent.shape) for u in hu.updates)
+            )
+            for u in hu.updates:
+                self.assertEqual(u.update_extent, depth_extent.calc_intersection(u.update_extent))
+            for u in hu.remote_updates:
+                self.assertEqual(
+                    u.update_extent,
+                    calc_halo_depth_extent(u.dst_extent, depth).calc_intersection(u.update_extent)
+                )
+
+    def test_free_data_types(self):
+        """
+        Tests for :meth:`mpi_array.update.MpiSingleEpochHalosUpdate.free_data_types`,
+        the committed data types of all updates are freed.
+        """
+        gshape = (64, 48)
+        dims = (2, 2)
+        cc2cr = {(i, j): i * dims[1] + j for i in range(dims[0]) for j in range(dims[1])}
+        distrib = BlockPartition(gshape, dims, cc2cr, halo=2)
+
+        hu = MpiSingleEpochHalosUpdate(0, distrib.locale_extents)
+        data_types = []
+        for u in hu.updates + hu.remote_updates:
+            u.initialise_data_types(dtype="int32", order="C")
+            data_types += [u.dst_data_type, u.src_data_type]
+        self.assertEqual(4 * len(hu.updates), len(data_types))
+        hu.free_data_types()
+        for data_type in data_types:
+            self.assertEqual(_mpi.DATATYPE_NULL, data_type)
+
 
 class UpdatesForRedistributeTest(_unittest.TestCase):
 
@@ -368,6 +806,204 @@ class UpdatesForRedistributeTest(_unittest.TestCase):
         u4r.check_updates()
         self.rank_logger.info("END: u4r.check_updates()...")
 
+    def test_coalesce_updates(self):
+        """
+        Tests :meth:`mpi_array.update.UpdatesForRedistribute.calc_coalesced_updates`.
+        """
+        gshape = (16, 8)
+        d_dims = (1, 1)
+        d_cc2cr = {(0, 0): 0}
+        d = BlockPartition(gshape, d_dims, d_cc2cr, inter_locale_rank_to_peer_rank=[0, ])
+        d.peer_ranks_per_locale = _np.zeros((1, 1), dtype="int64")
+
+        u4r = UpdatesForRedistribute(d, d)
+        u4r.check_updates()
+
+        dst_extent = d.locale_extents[0]
+        src_extent = d.locale_extents[0]
+        updates = \
+            sum(
+                (
+                    u4r.create_pair_extent_update(dst_extent, src_extent, e)
+                    for e in (
+                        IndexingExtent(start=(4, 0), stop=(8, 8)),
+                        IndexingExtent(start=(10, 0), stop=(16, 8)),
+                        IndexingExtent(start=(0, 0), stop=(4, 8)),
+                    )
+                ),
+                []
+            )
+        coalesced_updates = u4r.calc_coalesced_updates(updates)
+        self.assertEqual(2, len(coalesced_updates))
+        self.assertSequenceEqual(
+            [
+                IndexingExtent(start=(0, 0), stop=(8, 8)),
+                IndexingExtent(start=(10, 0), stop=(16, 8)),
+            ],
+            [
+                IndexingExtent(start=u.dst_update_extent.start, stop=u.dst_update_extent.stop)
+                for u in coalesced_updates
+            ]
+        )
+        self.assertEqual(2, len(u4r.calc_coalesced_updates(updates, group=True)))
+
+        updates = updates[1:2]
+        coalesced_updates = u4r.calc_coalesced_updates(updates)
+        self.assertEqual(1, len(coalesced_updates))
+        self.assertTrue(coalesced_updates[0] is updates[0])
+
+    def test_vectorised_rget_updates(self):
+        """
+        Tests that the (vectorised)
+        :meth:`mpi_array.update.UpdatesForRedistribute.initialise_rget_updates`
+        calculates the same updates as
+        :meth:`mpi_array.update.UpdatesForRedistribute.initialise_sequential_rget_updates`.
+        """
+        gshape = (60, 44)
+        distribs = []
+        for dims in ((4, 3), (5, 2)):
+            num_locales = _np.product(dims)
+            coords = [tuple(c) for c in _np.array(_np.unravel_index(range(num_locales), dims)).T]
+            d = \
+                BlockPartition(
+                    gshape,
+                    dims,
+                    {coords[r]: r for r in range(num_locales)},
+                    inter_locale_rank_to_peer_rank=_np.arange(num_locales)
+                )
+            d.peer_ranks_per_locale = _np.arange(num_locales).reshape((num_locales, 1))
+            distribs.append(d)
+        self.assertTrue(calc_extents_are_disjoint(distribs[1].locale_extents))
+        self.assertFalse(
+            calc_extents_are_disjoint(
+                (distribs[1].locale_extents[0], distribs[1].locale_extents[0])
+            )
+        )
+
+        def calc_pair_elements(u4r):
+            pair_elements = dict()
+            for u in iter_pair_extent_updates(sum(u4r._dst_rget_updates.values(), [])):
+                key = (u.dst_extent.inter_locale_rank, u.src_extent.inter_locale_rank)
+                pair_elements[key] = \
+                    pair_elements.get(key, 0) + _np.product(u.dst_update_extent.shape)
+            return pair_elements
+
+        u4r = UpdatesForRedistribute(distribs[0], distribs[1])
+        u4r.check_updates()
+        self.assertEqual(0, len(u4r._dst_extent_queue))
+        vectorised_pair_elements = calc_pair_elements(u4r)
+
+        u4r._dst_extent_queue.extend(distribs[0].locale_extents)
+        u4r._dst_rget_updates.clear()
+        u4r.initialise_sequential_rget_updates()
+        u4r.coalesce_updates()
+        u4r.check_updates()
+
+        self.assertEqual(calc_pair_elements(u4r), vectorised_pair_elements)
+
+
+class RmaTransferCostModelTest(_unittest.TestCase):
+
+    """
+    Tests for :obj:`mpi_array.update.RmaTransferCostModel`.
+    """
+
+    def test_fit(self):
+        """
+        Test :meth:`mpi_array.update.RmaTransferCostModel.calc_latency_and_bandwidth`.
+        """
+        model = RmaTransferCostModel()
+        self.assertEqual((None, None), model.calc_latency_and_bandwidth())
+        model.record(1000, 1.0e-5 + 1000 / 1.0e9)
+        self.assertEqual((None, None), model.calc_latency_and_bandwidth())
+        for nbytes in (10, 10000, 100000, 1000000):
+            model.record(nbytes, 1.0e-5 + nbytes / 1.0e9)
+        self.assertEqual(5, model.num_samples)
+        latency, bandwidth = model.calc_latency_and_bandwidth()
+        self.assertAlmostEqual(1.0e-5, latency)
+        self.assertAlmostEqual(1.0, bandwidth / 1.0e9)
+        model.reset()
+        self.assertEqual(0, model.num_samples)
+
+    def test_group_size(self):
+        """
+        Test :meth:`mpi_array.update.RmaTransferCostModel.calc_group_size`.
+        """
+        model = RmaTransferCostModel(min_group_size=2, max_group_size=64, default_group_size=32)
+        self.assertEqual(32, model.calc_group_size(1000))
+        for nbytes in (0, 1000000):
+            model.record(nbytes, 1.0e-5 + nbytes / 1.0e9)
+        # latency * bandwidth = 10000 bytes.
+        self.assertEqual(10, model.calc_group_size(1100))
+        self.assertEqual(2, model.calc_group_size(1000000))
+        self.assertEqual(64, model.calc_group_size(1))
+
+
+class CalcTargetScheduleTest(_unittest.TestCase):
+
+    """
+    Tests for :func:`mpi_array.update.calc_target_schedule`.
+    """
+
+    def test_interleave(self):
+        """
+        Targets of different locales are interleaved.
+        """
+        rank_to_locale = calc_rank_to_locale(_np.array([[0, 1, 2], [3, 4, 5], [6, 7, 8]]))
+        self.assertEqual(2, rank_to_locale[8])
+        self.assertEqual(1, rank_to_locale[3])
+        targets = (8, 0, 1, 3, 4, 6, 2)
+        schedule = calc_target_schedule(targets, 0, rank_to_locale)
+        self.assertSequenceEqual([0, 3, 6, 1, 4, 8, 2], schedule)
+        schedule = calc_target_schedule(targets, 1, rank_to_locale)
+        self.assertSequenceEqual([3, 6, 0, 4, 8, 1, 2], schedule)
+        schedule = calc_target_schedule(targets, 3, rank_to_locale)
+        self.assertSequenceEqual([1, 4, 8, 2, 3, 6, 0], schedule)
+
+    def test_shift(self):
+        """
+        Without locale information, origins start at different targets.
+        """
+        targets = tuple(range(8))
+        first_targets = set()
+        for origin_rank in range(8):
+            schedule = calc_target_schedule(targets, origin_rank)
+            self.assertSequenceEqual(sorted(targets), sorted(schedule))
+            first_targets.add(schedule[0])
+        self.assertEqual(8, len(first_targets))
+        self.assertSequenceEqual([], calc_target_schedule([], 3))
+
+
+class CalcSlabExtentTest(_unittest.TestCase):
+
+    """
+    Tests for :func:`mpi_array.update.calc_slab_extent`.
+    """
+
+    def test_partition(self):
+        """
+        Tests the slabs of :func:`mpi_array.update.calc_slab_extent` partition the extent.
+        """
+        extent = IndexingExtent(start=(3, 5, 2), stop=(7, 15, 9))
+        self.assertTrue(calc_slab_extent(extent, 0, 1) is extent)
+        for num_slabs in (2, 3, 4, 5, 7, 11, 100):
+            counts = _np.zeros(extent.shape, dtype="int64")
+            for slab_rank in range(num_slabs):
+                slab = calc_slab_extent(extent, slab_rank, num_slabs)
+                self.assertTrue(_np.all(slab.start >= extent.start))
+                self.assertTrue(_np.all(slab.stop <= extent.stop))
+                slc = \
+                    tuple(
+                        slice(b, e)
+                        for b, e in zip(slab.start - extent.start, slab.stop - extent.start)
+                    )
+                counts[slc] += 1
+            self.assertTrue(_np.all(counts == 1))
+        slab = calc_slab_extent(extent, 1, 4)
+        self.assertSequenceEqual((1, 10, 7), tuple(slab.shape))
+        slab = calc_slab_extent(extent, 1, 5)
+        self.assertSequenceEqual((4, 2, 7), tuple(slab.shape))
+
 
 _unittest.main(__name__)
 